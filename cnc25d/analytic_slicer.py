@@ -0,0 +1,400 @@
+# analytic_slicer.py
+# slices a 3D assembly of extruded figures without FreeCAD booleans
+# created by agent on 2026/10/16
+#
+# (C) Copyright 2026 agent
+#
+# This file is part of the Cnc25D Python package.
+#
+# Cnc25D is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Cnc25D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cnc25D.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+analytic_slicer.py is an alternative to export_2d.export_xyz_to_dxf() for the assemblies of extruded figures (the 3D assembly configurations of figures_to_freecad_assembly()).
+Each plank is placed by a 4x4 matrix, so a slice plane is always parallel or orthogonal to the figure plane of a plank:
+ - parallel: the section is the figure itself
+ - orthogonal: the section is a set of rectangles computed from the intersections of the cut line with the lines and arcs of the figure
+The planks are not fused: the sections of two touching planks are drawn side by side.
+The slices are laid out with their gauges like export_xyz_to_dxf() does and written in a DXF file.
+"""
+
+################################################################
+# python behavior
+################################################################
+
+from __future__ import division # to get float division
+
+################################################################
+# import
+################################################################
+
+import math
+import multiprocessing
+import os
+import tempfile
+import argparse
+import numpy
+#
+import design_help # just for get_effective_args()
+import positioning_matrix
+import mesh_extrusion # for arc_center_and_sweep()
+import outline_backends # for write_figure_in_dxf_stream()
+import cnc25d_error
+
+################################################################
+# global variable
+################################################################
+
+# the slice directions of export_xyz_to_dxf(): (name, sliced axis, drawing horizontal axis, drawing vertical axis)
+slice_directions = (('xy', 2, 0, 1), ('xz', 1, 0, 2), ('yz', 0, 1, 2))
+# the planks of the assembly sliced by the processes of the pool (set by sub_init_slice_worker())
+worker_planks = []
+
+################################################################
+# cut line of a figure
+################################################################
+
+def sub_segment_crossings(ai_p, ai_e, ai_axis, ai_cut):
+  """ return the list of the other coordinates where the line segment (ai_p, ai_e) crosses the line coordinate[ai_axis]=ai_cut
+      half-open rule: a vertex on the cut line is counted with the segment that leaves it below the line
+  """
+  o = 1-ai_axis
+  r_crossings = []
+  if((ai_p[ai_axis]<=ai_cut)!=(ai_e[ai_axis]<=ai_cut)):
+    t = (ai_cut-ai_p[ai_axis])/(ai_e[ai_axis]-ai_p[ai_axis])
+    r_crossings.append(ai_p[o]+t*(ai_e[o]-ai_p[o]))
+  return(r_crossings)
+
+def sub_arc_crossings(ai_p, ai_m, ai_e, ai_axis, ai_cut):
+  """ return the list of the other coordinates where the arc (ai_p, ai_m, ai_e) crosses the line coordinate[ai_axis]=ai_cut
+      the arc is split at its extrema along ai_axis, so each sub-arc is monotonic and crosses the line at most once
+  """
+  arc = mesh_extrusion.arc_center_and_sweep(ai_p[0], ai_p[1], ai_m[0], ai_m[1], ai_e[0], ai_e[1])
+  if(arc==None):
+    return(sub_segment_crossings(ai_p, ai_e, ai_axis, ai_cut))
+  (cx, cy, radius, a_start, sweep) = arc
+  center = (cx, cy)
+  o = 1-ai_axis
+  # angles of the extrema along ai_axis: 0 and pi for x, pi/2 and 3*pi/2 for y
+  extremum_angle = ai_axis*math.pi/2
+  splits = []
+  k_min = int(math.floor((min(a_start, a_start+sweep)-extremum_angle)/math.pi))
+  k_max = int(math.ceil((max(a_start, a_start+sweep)-extremum_angle)/math.pi))
+  for k in range(k_min, k_max+1):
+    t = (extremum_angle+k*math.pi-a_start)/sweep
+    if((t>0)and(t<1)):
+      splits.append(t)
+  splits.sort()
+  ts = [0]+splits+[1]
+  points = [ai_p]
+  for t in splits:
+    a = a_start+t*sweep
+    points.append((cx+radius*math.cos(a), cy+radius*math.sin(a)))
+  points.append(ai_e)
+  r_crossings = []
+  for i in range(len(points)-1):
+    if((points[i][ai_axis]<=ai_cut)!=(points[i+1][ai_axis]<=ai_cut)):
+      a_mid = a_start+(ts[i]+ts[i+1])/2*sweep
+      side = (math.sin(a_mid), math.cos(a_mid))[ai_axis] # side of the sub-arc along the other axis
+      half_chord = math.sqrt(max(0, radius**2-(ai_cut-center[ai_axis])**2))
+      r_crossings.append(center[o]+math.copysign(half_chord, side))
+  return(r_crossings)
+
+def figure_cut_intervals(ai_figure, ai_axis, ai_cut):
+  """ return the list of intervals (min, max) of the other coordinate where the line coordinate[ai_axis]=ai_cut is inside the material of the format-B figure ai_figure
+      the material is found with the even-odd rule, so the holes are removed from the outer outline
+  """
+  o = 1-ai_axis
+  crossings = []
+  for i_ol in ai_figure:
+    if(not isinstance(i_ol[0], (list,tuple))): # circle
+      half_chord_2 = i_ol[2]**2-(ai_cut-i_ol[ai_axis])**2
+      if(half_chord_2>0):
+        crossings.extend([i_ol[o]-math.sqrt(half_chord_2), i_ol[o]+math.sqrt(half_chord_2)])
+      continue
+    for i in range(1, len(i_ol)):
+      p = (i_ol[i-1][-2], i_ol[i-1][-1])
+      e = (i_ol[i][-2], i_ol[i][-1])
+      if(len(i_ol[i])==4):
+        crossings.extend(sub_arc_crossings(p, (i_ol[i][0], i_ol[i][1]), e, ai_axis, ai_cut))
+      else:
+        crossings.extend(sub_segment_crossings(p, e, ai_axis, ai_cut))
+  crossings.sort()
+  if(len(crossings)%2!=0):
+    print("WARN919: Warning, odd number of crossings ({:d}) at the cut {:0.3f}. The figure is probably not closed".format(len(crossings), ai_cut))
+    crossings = crossings[:-1]
+  r_intervals = [ (crossings[i], crossings[i+1]) for i in range(0, len(crossings), 2) if(crossings[i+1]>crossings[i]) ]
+  return(r_intervals)
+
+################################################################
+# plank section
+################################################################
+
+def assembly_planks(ai_figure_assembly, ai_zero_x=0, ai_zero_y=0, ai_zero_z=0):
+  """ convert the 3D assembly configuration ai_figure_assembly into a list of planks (figure, size_z, matrix)
+      the matrix places the figure coordinates into the assembly coordinates shifted by (-ai_zero_x, -ai_zero_y, -ai_zero_z)
+  """
+  if(len(ai_figure_assembly)<1):
+    raise cnc25d_error.Cnc25dBackendError("ERR923: the assembly must contain at least one figure")
+  r_planks = []
+  for conf in ai_figure_assembly:
+    if(len(conf)!=11):
+      raise cnc25d_error.Cnc25dBackendError("ERR924: Error len of the assembly configuration {:d} must be 11".format(len(conf)))
+    (part_figure, zero_x, zero_y, size_x, size_y, size_z, flip, orientation, translate_x, translate_y, translate_z) = conf
+    plank_matrix = positioning_matrix.place_plank_matrix(size_x, size_y, size_z, flip, orientation, translate_x-ai_zero_x, translate_y-ai_zero_y, translate_z-ai_zero_z)
+    plank_matrix = numpy.dot(plank_matrix, positioning_matrix.translation_matrix(-1*zero_x, -1*zero_y, 0))
+    plank_matrix[0:3,0:3] = numpy.round(plank_matrix[0:3,0:3]) # the rotations are multiples of 90 degrees
+    r_planks.append((part_figure, size_z, plank_matrix))
+  return(r_planks)
+
+def plank_section(ai_plank, ai_axis, ai_depth, ai_u_axis, ai_v_axis):
+  """ return the section (list of format-B outlines) of the plank ai_plank by the plane coordinate[ai_axis]=ai_depth
+      the section is drawn in the plane (coordinate[ai_u_axis], coordinate[ai_v_axis])
+  """
+  (figure, size_z, matrix) = ai_plank
+  rot = matrix[0:3,0:3]
+  # the figure axis that is orthogonal to the slice plane
+  cut_axis = int(numpy.flatnonzero(rot[ai_axis])[0])
+  cut = (ai_depth-matrix[ai_axis,3])/rot[ai_axis,cut_axis]
+  u_row = matrix[ai_u_axis]
+  v_row = matrix[ai_v_axis]
+  r_section = []
+  if(cut_axis==2): # the slice plane is parallel to the figure: the section is the figure
+    if((cut<0)or(cut>size_z)):
+      return(r_section)
+    u_offset = u_row[2]*cut+u_row[3]
+    v_offset = v_row[2]*cut+v_row[3]
+    def uv(x, y):
+      return((u_row[0]*x+u_row[1]*y+u_offset, v_row[0]*x+v_row[1]*y+v_offset))
+    for i_ol in figure:
+      if(not isinstance(i_ol[0], (list,tuple))): # circle
+        r_section.append(uv(i_ol[0], i_ol[1])+(i_ol[2],))
+        continue
+      ol = []
+      for seg in i_ol:
+        if(len(seg)==4):
+          ol.append(uv(seg[0], seg[1])+uv(seg[2], seg[3]))
+        else:
+          ol.append(uv(seg[0], seg[1]))
+      r_section.append(ol)
+  else: # the slice plane is orthogonal to the figure: rectangles of height size_z
+    o = 1-cut_axis
+    for (c_min, c_max) in figure_cut_intervals(figure, cut_axis, cut):
+      ol = []
+      for (c, z) in ((c_min, 0), (c_max, 0), (c_max, size_z), (c_min, size_z), (c_min, 0)):
+        point = [0, 0, z, 1]
+        point[cut_axis] = cut
+        point[o] = c
+        ol.append((numpy.dot(u_row, point), numpy.dot(v_row, point)))
+      r_section.append(ol)
+  return(r_section)
+
+def assembly_section(ai_planks, ai_axis, ai_depth, ai_u_axis, ai_v_axis):
+  """ return the section (list of format-B outlines) of all the planks by the plane coordinate[ai_axis]=ai_depth
+  """
+  r_section = []
+  for plank in ai_planks:
+    r_section.extend(plank_section(plank, ai_axis, ai_depth, ai_u_axis, ai_v_axis))
+  return(r_section)
+
+################################################################
+# xyz slices
+################################################################
+
+def sub_init_slice_worker(ai_planks):
+  """ store the planks in the process of the pool, so they are transferred once and not with each slice
+  """
+  global worker_planks
+  worker_planks = ai_planks
+
+def sub_slice_job(ai_job):
+  """ compute the section of the slice ai_job = (axis, depth, u_axis, v_axis, u_shift, v_shift) with the planks of the worker
+      This function is executed by the processes of the multiprocessing.Pool of xyz_slices_to_dxf()
+  """
+  (axis, depth, u_axis, v_axis, u_shift, v_shift) = ai_job
+  r_section = []
+  for i_ol in assembly_section(worker_planks, axis, depth, u_axis, v_axis):
+    if(not isinstance(i_ol[0], (list,tuple))): # circle
+      r_section.append((i_ol[0]+u_shift, i_ol[1]+v_shift, i_ol[2]))
+    else:
+      r_section.append([ tuple(seg[k]+(u_shift, v_shift)[k%2] for k in range(len(seg))) for seg in i_ol ])
+  return(r_section)
+
+def sub_rectangle(ai_position_x, ai_position_y, ai_size_x, ai_size_y):
+  """ return the rectangle outline used by the gauges (same as export_2d.draw_rectangle())
+  """
+  (x0, y0, x1, y1) = (ai_position_x, ai_position_y, ai_position_x+ai_size_x, ai_position_y+ai_size_y)
+  r_rectangle = [(x0, y0), (x1, y0), (x1, y1), (x0, y1), (x0, y0)]
+  return(r_rectangle)
+
+def sub_gauge(ai_drawing_length, ai_drawing_height, ai_representation_max, ai_representation_value, ai_position_x, ai_position_y):
+  """ return the two outlines of the gauge (same as export_2d.draw_gauge())
+  """
+  gauge_value = ai_drawing_length*ai_representation_value/ai_representation_max
+  r_gauge = []
+  r_gauge.append(sub_rectangle(ai_position_x-ai_drawing_height/2, ai_position_y, ai_drawing_length+ai_drawing_height, ai_drawing_height))
+  r_gauge.append(sub_rectangle(ai_position_x, ai_position_y+ai_drawing_height/4, gauge_value, ai_drawing_height/2))
+  return(r_gauge)
+
+def xyz_slices_to_dxf(ai_figure_assembly, ai_slice_xyz, ai_output_filename, ai_jobs=1):
+  """ slice the 3D assembly configuration ai_figure_assembly in the three directions and write the slices with their gauges in the DXF file ai_output_filename
+      ai_slice_xyz = (size_x, size_y, size_z, zero_x, zero_y, zero_z, xy_slice_list, xz_slice_list, yz_slice_list) as for design_output.freecad_object_output_file()
+      the slices are computed by ai_jobs processes (0: one per CPU)
+  """
+  if(len(ai_slice_xyz)!=9):
+    raise cnc25d_error.Cnc25dBackendError("ERR925: Error, len(ai_slice_xyz) {:d} must be 9".format(len(ai_slice_xyz)))
+  (size_x, size_y, size_z, zero_x, zero_y, zero_z) = ai_slice_xyz[0:6]
+  sizes = (size_x, size_y, size_z)
+  planks = assembly_planks(ai_figure_assembly, zero_x, zero_y, zero_z)
+  # same layout as export_2d.export_xyz_to_dxf()
+  space = max(size_x/5, size_y/5, size_z/5)
+  figure = []
+  job_list = []
+  layout = {'xy': (2*size_z+7*space, 2*size_z+6*space), 'xz': (1*size_z+4*space, 1*size_z+3*space), 'yz': (space, 0)}
+  for ((name, axis, u_axis, v_axis), depth_list) in zip(slice_directions, ai_slice_xyz[6:9]):
+    (v_shift, gauge_y) = layout[name]
+    u_step = sizes[u_axis]+2*space
+    for i in range(len(depth_list)):
+      figure.extend(sub_gauge(sizes[u_axis], space/2, sizes[axis], depth_list[i], i*u_step, gauge_y))
+      job_list.append((axis, depth_list[i], u_axis, v_axis, i*u_step, v_shift))
+  jobs = ai_jobs
+  if(jobs==0):
+    jobs = multiprocessing.cpu_count()
+  jobs = min(jobs, len(job_list))
+  print("Slice analytically the 3D assembly into the DXF file {:s} ({:d} slices)".format(ai_output_filename, len(job_list)))
+  if(jobs<2):
+    sub_init_slice_worker(planks)
+    sections = map(sub_slice_job, job_list)
+  else:
+    slice_pool = multiprocessing.Pool(processes=jobs, initializer=sub_init_slice_worker, initargs=(planks,))
+    try:
+      sections = slice_pool.map(sub_slice_job, job_list)
+    finally:
+      slice_pool.close()
+      slice_pool.join()
+  for section in sections:
+    figure.extend(section)
+  outline_backends.write_figure_in_dxf_stream(figure, ai_output_filename) # DXF R12 like export_xyz_to_dxf()
+  return(0)
+
+################################################################
+# ******** test API ***********
+################################################################
+
+def sub_points_in_polygons(ai_points, ai_polygons):
+  """ return the boolean array of the points ai_points (numpy array (m,2)) that are inside the polygons ai_polygons with the even-odd rule
+  """
+  x = ai_points[:,0][:,numpy.newaxis]
+  y = ai_points[:,1][:,numpy.newaxis]
+  crossing_nb = numpy.zeros(ai_points.shape[0], dtype=numpy.int64)
+  for polygon in ai_polygons:
+    (x1, y1) = (polygon[:,0][numpy.newaxis,:], polygon[:,1][numpy.newaxis,:])
+    (x2, y2) = (numpy.roll(polygon[:,0], -1)[numpy.newaxis,:], numpy.roll(polygon[:,1], -1)[numpy.newaxis,:])
+    straddle = ((y1>y)!=(y2>y))
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+      x_cross = x1+(y-y1)*(x2-x1)/(y2-y1)
+    crossing_nb += (straddle&(x<x_cross)).sum(axis=1)
+  r_inside = (crossing_nb%2==1)
+  return(r_inside)
+
+def analytic_slicer_test1():
+  """ slice an assembly of planks in the three directions and compare the sections with the material of the planks, sampled on a grid
+      the material of a plank is found by placing the grid points back into the figure coordinates
+  """
+  r_test = 1
+  # a plank with an arc, a circle hole and an outline hole
+  as_figure = [
+    [[0,0], [30,0], [40,10, 30,20], [0,20], [0,0]],
+    [10,10,4],
+    [[20,5], [26,5], [26,15], [20,15], [20,5]]]
+  as_height = 5.0
+  # (part_figure, zero_x, zero_y, size_x, size_y, size_z, flip, orientation, translate_x, translate_y, translate_z)
+  as_assembly = [
+    (as_figure, 0, 0, 40, 20, as_height, 'i', 'xy', 0, 0, 0),
+    (as_figure, 0, 0, 40, 20, as_height, 'x', 'xz', 0, 30, 10),
+    (as_figure, 0, 0, 40, 20, as_height, 'y', 'yz', 50, 0, 0),
+    (as_figure, 0, 0, 40, 20, as_height, 'z', 'zx', 60, 30, 10)]
+  # cut intervals of the figure
+  interval_checks = (
+    ('y=10', 1, 10, [(0, 6), (14, 20), (26, 40)]),
+    ('y=17', 1, 17, [(0, 30+math.sqrt(100-49))]),
+    ('x=35', 0, 35, [(10-math.sqrt(100-25), 10+math.sqrt(100-25))]))
+  for (name, axis, cut, expected) in interval_checks:
+    intervals = figure_cut_intervals(as_figure, axis, cut)
+    if((len(intervals)!=len(expected))or(numpy.abs(numpy.array(intervals)-numpy.array(expected)).max()>1e-9)):
+      print("ERR: analytic_slicer the cut intervals at {:s} are {:s} instead of {:s}".format(name, str(intervals), str(expected)))
+      r_test = 0
+  # sections against the sampled material
+  planks = assembly_planks(as_assembly)
+  figure_polygons = [ mesh_extrusion.outline_to_polygon(ol, 1e-4) for ol in as_figure ]
+  grid = numpy.arange(-5.123, 100, 1.371)
+  (grid_u, grid_v) = numpy.meshgrid(grid, grid)
+  grid_uv = numpy.column_stack((grid_u.ravel(), grid_v.ravel()))
+  for (name, axis, u_axis, v_axis) in slice_directions:
+    for depth in (1.3, 7.7, 12.1, 33.3, 55.5):
+      section_polygons = [ mesh_extrusion.outline_to_polygon(ol, 1e-4) for ol in assembly_section(planks, axis, depth, u_axis, v_axis) ]
+      in_section = sub_points_in_polygons(grid_uv, section_polygons)
+      points = numpy.zeros((grid_uv.shape[0], 3))
+      points[:,axis] = depth
+      points[:,u_axis] = grid_uv[:,0]
+      points[:,v_axis] = grid_uv[:,1]
+      in_material = numpy.zeros(grid_uv.shape[0], dtype=numpy.bool_)
+      for (figure, size_z, matrix) in planks:
+        local_points = positioning_matrix.transform_points(numpy.linalg.inv(matrix), points)
+        in_material |= ((local_points[:,2]>0)&(local_points[:,2]<size_z)&sub_points_in_polygons(local_points[:,0:2], figure_polygons))
+      mismatch_nb = int((in_section!=in_material).sum())
+      if(mismatch_nb>0):
+        print("ERR: analytic_slicer the slice {:s} at {:0.2f} differs from the material in {:d} points (over {:d} in the material)".format(name, depth, mismatch_nb, int(in_material.sum())))
+        r_test = 0
+  # DXF layout
+  (tmp_fd, tmp_dxf) = tempfile.mkstemp(suffix='.dxf')
+  os.close(tmp_fd)
+  xyz_slices_to_dxf(as_assembly, (110, 50, 50, 0, 0, 0, [2.5, 12.5], [5, 35], [10, 55]), tmp_dxf)
+  ifh = open(tmp_dxf, 'r')
+  dxf_content = ifh.read()
+  ifh.close()
+  os.remove(tmp_dxf)
+  if(not dxf_content.endswith("0\nEOF\n")):
+    print("ERR: analytic_slicer the DXF file of the slices is not complete")
+    r_test = 0
+  print("analytic_slicer_test1: {:s}".format("OK" if r_test else "FAILED"))
+  return(r_test)
+
+################################################################
+# ******** command line interface ***********
+################################################################
+
+def analytic_slicer_cli(ai_args=""):
+  """ command line interface to run this script in standalone
+  """
+  as_parser = argparse.ArgumentParser(description='Test the analytic_slicer API.')
+  as_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
+    help='Run analytic_slicer_test1()')
+  effective_args = design_help.get_effective_args(ai_args)
+  as_args = as_parser.parse_args(effective_args)
+  r_asc = 0
+  print("dbg111: start testing analytic_slicer.py")
+  if(as_args.sw_test1):
+    r_asc = analytic_slicer_test1()
+  print("dbg999: end of script")
+  return(r_asc)
+
+################################################################
+# main
+################################################################
+
+if __name__ == "__main__":
+  #analytic_slicer_cli()
+  analytic_slicer_cli("--test1")
+
@@ -30,7 +30,7 @@ The main function displays in a Tk-interface the bagel parts, or generates the d
 ################################################################
 
 import cnc25d_api
-cnc25d_api.importing_freecad()
+#cnc25d_api.importing_freecad() # FreeCAD is imported on first use by lazy_import
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -46,7 +46,7 @@ import sys, argparse
 #import re # to detect .dxf or .svg
 #import Tkinter # to display the outline in a small GUI
 #
-import Part
+from lazy_import import Part
 #from FreeCAD import Base
 # 3rd parties
 #import svgwrite
@@ -110,22 +110,19 @@ def bagel_constraint_check(c):
   # bagel_axle_diameter
   c['bagel_axle_radius'] = c['bagel_axle_diameter']/2.0
   if(c['bagel_axle_radius']<radian_epsilon):
-    print("ERR152: Error, bagel_axle_radius {:0.3f} is too small".format(c['bagel_axle_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR152: Error, bagel_axle_radius {:0.3f} is too small".format(c['bagel_axle_radius']))
   # bagel_axle_internal_diameter
   c['bagel_axle_internal_radius'] = c['bagel_axle_internal_diameter']/2.0
   if(c['bagel_axle_internal_radius']==0):
     c['bagel_axle_internal_radius'] = 2*c['bagel_axle_radius']
   if(c['bagel_axle_internal_radius']<c['bagel_axle_radius']):
-    print("ERR159: Error, bagel_axle_internal_radius {:0.3f} must be bigger than bagel_axle_radius {:0.3f}".format(c['bagel_axle_internal_radius'], c['bagel_axle_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR159: Error, bagel_axle_internal_radius {:0.3f} must be bigger than bagel_axle_radius {:0.3f}".format(c['bagel_axle_internal_radius'], c['bagel_axle_radius']))
   # bagel_axle_external_diameter
   c['bagel_axle_external_radius'] = c['bagel_axle_external_diameter']/2.0
   if(c['bagel_axle_external_radius']==0):
     c['bagel_axle_external_radius'] = 2*c['bagel_axle_internal_radius']
   if(c['bagel_axle_external_radius']<c['bagel_axle_internal_radius']+radian_epsilon):
-    print("ERR166: Error, bagel_axle_external_radius {:0.3f} must be bigger than bagel_axle_internal_radius {:0.3f}".format(c['bagel_axle_external_radius'], c['bagel_axle_internal_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR166: Error, bagel_axle_external_radius {:0.3f} must be bigger than bagel_axle_internal_radius {:0.3f}".format(c['bagel_axle_external_radius'], c['bagel_axle_internal_radius']))
   # axle_hole_nb
   c['axle_hole_radius'] = 0.0
   c['axle_hole_position_radius'] = 0.0
@@ -133,35 +130,28 @@ def bagel_constraint_check(c):
     # axle_hole_diameter
     c['axle_hole_radius'] = c['axle_hole_diameter']/2.0
     if(c['axle_hole_radius']<radian_epsilon):
-      print("ERR173: Error, axle_hole_radius {:0.3f} must be strictly positive".format(c['axle_hole_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR173: Error, axle_hole_radius {:0.3f} must be strictly positive".format(c['axle_hole_radius']))
     # axle_hole_position_diameter
     c['axle_hole_position_radius'] = c['axle_hole_position_diameter']/2.0
     if(c['axle_hole_position_radius']==0.0):
       c['axle_hole_position_radius'] = (c['bagel_axle_internal_radius']+c['bagel_axle_external_radius'])/2.0
     if(c['axle_hole_position_radius'] < c['bagel_axle_internal_radius']+c['axle_hole_radius']+radian_epsilon):
-      print("ERR180: Error: axle_hole_position_radius {:0.3f} is too small compare to bagel_axle_internal_radius {:0.3f} and axle_hole_radius {:0.3f}".format(c['axle_hole_position_radius'], c['bagel_axle_internal_radius'], c['axle_hole_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR180: Error: axle_hole_position_radius {:0.3f} is too small compare to bagel_axle_internal_radius {:0.3f} and axle_hole_radius {:0.3f}".format(c['axle_hole_position_radius'], c['bagel_axle_internal_radius'], c['axle_hole_radius']))
     if(c['axle_hole_position_radius'] > c['bagel_axle_external_radius']-c['axle_hole_radius']-radian_epsilon):
-      print("ERR183: Error: axle_hole_position_radius {:0.3f} is too big compare to bagel_axle_external_radius {:0.3f} and axle_hole_radius {:0.3f}".format(c['axle_hole_position_radius'], c['bagel_axle_external_radius'], c['axle_hole_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR183: Error: axle_hole_position_radius {:0.3f} is too big compare to bagel_axle_external_radius {:0.3f} and axle_hole_radius {:0.3f}".format(c['axle_hole_position_radius'], c['bagel_axle_external_radius'], c['axle_hole_radius']))
     # axle_hole_angle
   # external_bagel_thickness
   if(c['external_bagel_thickness']<radian_epsilon):
-    print("ERR188: Error, external_bagel_thickness {:0.3f} is too small".format(c['external_bagel_thickness']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR188: Error, external_bagel_thickness {:0.3f} is too small".format(c['external_bagel_thickness']))
   # middle_bagel_thickness
   if(c['middle_bagel_thickness']<radian_epsilon):
-    print("ERR192: Error, middle_bagel_thickness {:0.3f} is too small".format(c['middle_bagel_thickness']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR192: Error, middle_bagel_thickness {:0.3f} is too small".format(c['middle_bagel_thickness']))
   # internal_bagel_thickness
   if(c['internal_bagel_thickness']<radian_epsilon):
-    print("ERR196: Error, internal_bagel_thickness {:0.3f} is too small".format(c['internal_bagel_thickness']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR196: Error, internal_bagel_thickness {:0.3f} is too small".format(c['internal_bagel_thickness']))
   # bagel_extra_cut_thickness
   if(abs(c['bagel_extra_cut_thickness'])>c['bagel_axle_radius']/2.0):
-    print("ERR212: Error, bagel_extra_cut_thickness {:0.3f} is too big compare to bagel_axle_radius {:0.3f}".format(c['bagel_extra_cut_thickness'], c['bagel_axle_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR212: Error, bagel_extra_cut_thickness {:0.3f} is too big compare to bagel_axle_radius {:0.3f}".format(c['bagel_extra_cut_thickness'], c['bagel_axle_radius']))
   return(c)
 
 ################################################################
@@ -374,9 +364,9 @@ class bagel(cnc25d_api.bare_design):
 
 # this works with python and freecad :)
 if __name__ == "__main__":
-  FreeCAD.Console.PrintMessage("bagel.py says hello!\n")
+  print("bagel.py says hello!")
   my_bagel = bagel()
-  my_bagel.cli()
+  cnc25d_api.cli_shim(my_bagel.cli)
   if(cnc25d_api.interpretor_is_freecad()):
     my_bagel.apply_cli("--bagel_extra_cut_thickness 1.0")
     #my_bagel.outline_display()
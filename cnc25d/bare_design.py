@@ -33,10 +33,76 @@ import sys, argparse
 import re # to detect .dxf or .svg
 from datetime import datetime
 import os
+import collections # OrderedDict for the 2D-figure cache
+import hashlib # to hash the constraint
+import cPickle as pickle # to persist the 2D-figures
 #
 import outline_backends
 import design_help
 import design_output
+import freecad_pool
+import design_profile
+import headless_display
+import cnc25d_error
+
+################################################################
+# global variable
+################################################################
+
+cache_2d_memo_max_size = 16 # number of constraint sets kept in memory per design instance
+source_hash_memo = None # see source_hash()
+output_formats_2d = ('svg', 'svgz', 'dxf')
+output_formats_3d = ('brep', 'stl')
+
+################################################################
+# 2D-figure copy
+################################################################
+
+def copy_figure(ai_figure):
+  """ return a copy of the figure list and of its outline lists, so the caller can modify them (e.g. outline_close()) without corrupting the cache
+      the segments and the circles are tuples, they are shared
+  """
+  r_figure = [ (list(outline) if(isinstance(outline, list)) else outline) for outline in ai_figure ]
+  return(r_figure)
+
+################################################################
+# constraint hash
+################################################################
+
+def sub_constraint_normalize(ai_value):
+  """ convert a constraint value into a string that does not depend on the dictionary ordering
+  """
+  if(isinstance(ai_value, dict)):
+    r_txt = '{' + ', '.join([ "{:s}: {:s}".format(repr(k), sub_constraint_normalize(ai_value[k])) for k in sorted(ai_value.keys()) ]) + '}'
+  elif(isinstance(ai_value, (list, tuple))):
+    r_txt = '[' + ', '.join([ sub_constraint_normalize(v) for v in ai_value ]) + ']'
+  else:
+    r_txt = repr(ai_value)
+  return(r_txt)
+
+def constraint_hash(ai_constraint):
+  """ return a stable hash (sha1 hex string) of the constraint dictionary
+      two constraint dictionaries with the same keys and values get the same hash, whatever the insertion ordering
+  """
+  r_hash = hashlib.sha1(sub_constraint_normalize(ai_constraint)).hexdigest()
+  return(r_hash)
+
+def source_hash():
+  """ return the sha1 hex string of the Python sources of the cnc25d package
+      it changes with the geometry code, so it identifies the code version of the persisted 2D-figures. It is computed once per process
+  """
+  global source_hash_memo
+  if(source_hash_memo==None):
+    source_dir = os.path.dirname(os.path.abspath(__file__))
+    sha = hashlib.sha1()
+    for filename in sorted(os.listdir(source_dir)):
+      if(re.search('\.py$', filename)):
+        sha.update(filename)
+        ifh = open(os.path.join(source_dir, filename), 'rb')
+        sha.update(ifh.read())
+        ifh.close()
+    source_hash_memo = sha.hexdigest()
+  return(source_hash_memo)
 
 ################################################################
 # bare_design class
@@ -79,13 +145,25 @@ class bare_design:
     self.slice3d_configurations = None
     self.freecad_function_pts = None
     self.fc_obj_slice3d_conf = None
+    # 2D-figure cache
+    self.constraint_hash = None
+    self.A_figures_hash = None
+    self.cache_2d_memo = collections.OrderedDict()
+    self.cache_2d_enable = True
+    self.cache_2d_dir = ''
+    self.B_figures = {}
+    self.ideal_figures = {}
+    # parallel export
+    self.export_jobs = 1
+    self.fuse_mode = 'sequential'
 
   def set_constraint_constructor(self, f_constraint_constructor):
     """ create the design constraint list
     """
-    init_parser = argparse.ArgumentParser(description='Command Line Interface of {:s}'.format(self.design_name))
-    self.parser = f_constraint_constructor(init_parser)
-    self.reference_constraint = vars(self.parser.parse_args([]))
+    with design_profile.stage('constraint_construction'):
+      init_parser = argparse.ArgumentParser(description='Command Line Interface of {:s}'.format(self.design_name))
+      self.parser = f_constraint_constructor(init_parser)
+      self.reference_constraint = vars(self.parser.parse_args([]))
     self.current_input_constraint = self.reference_constraint.copy()
     self.constraint = self.reference_constraint.copy()
     self.f_design_constraint_constructor = f_constraint_constructor # needed for the function get_constraint_constructor()
@@ -175,8 +253,22 @@ class bare_design:
     """
     self.current_input_constraint = self.reference_constraint.copy()
     self.constraint = self.reference_constraint.copy()
+    self.update_constraint_hash()
     return(self.constraint)
 
+  def update_constraint_hash(self):
+    """ compute the hash of the checked constraint and invalidate the A-figures if the constraint has changed
+    """
+    new_hash = constraint_hash(self.constraint)
+    if(new_hash!=self.constraint_hash):
+      self.constraint_hash = new_hash
+      self.A_figures = None
+      self.figure_heights = None
+      self.A_figures_hash = None
+      self.B_figures = {}
+      self.ideal_figures = {}
+    return(self.constraint_hash)
+
 
   def apply_constraint(self, constraint):
     """ set the dictionary constraint to the design
@@ -188,8 +280,7 @@ class bare_design:
     new_contraint_value = 0
     for k in constraint.keys():
       if(not k in rc.keys()):
-        print("ERR177: Error, contraint {:k} is not part of the design".format(k))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dDesignError("ERR177: Error, contraint {:k} is not part of the design".format(k))
       if(c[k] != constraint[k]):
         new_contraint_value += 1
         c[k] = constraint[k] #equivalent to c.update(constraint)
@@ -208,7 +299,9 @@ class bare_design:
       print("WARN134: Warning, the function f_constraint_check has not been set!")
       self.constraint = c
     else:
-      self.constraint = self.f_constraint_check(c)
+      with design_profile.stage('f_constraint_check'):
+        self.constraint = self.f_constraint_check(c)
+    self.update_constraint_hash()
     self.cli_str = "" # delete the cli_str when constraint come from dictionary
     return(self.constraint)
 
@@ -228,7 +321,8 @@ class bare_design:
     """
     effective_args = cli_str.split()
     effective_args_in_txt = "{:s} cli string: ".format(self.design_name) + ' '.join(effective_args)
-    arg_c = vars(self.parser.parse_args(effective_args))
+    with design_profile.stage('constraint_construction'):
+      arg_c = vars(self.parser.parse_args(effective_args))
     rc = self.reference_constraint
     c = {}
     for k in arg_c.keys(): # extract only the contraint different from the default constraint
@@ -280,44 +374,135 @@ class bare_design:
     """ generate the design info
     """
     if(self.f_info==None):
-      print("ERR160: Error, the function f_info has not been set!")
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dDesignError("ERR160: Error, the function f_info has not been set!")
     r_txt = "\nDESIGN INFO for {:s}\n{:s}\n".format(self.design_name, self.cli_str)
     r_txt += "{:s}".format(self.f_info(self.constraint))
     return(r_txt)
 
-  def apply_2d_constructor(self):
-    """ internal method that execute the f_2d_constructor function
+  def update_2d_figures(self):
+    """ internal method that sets self.A_figures and self.figure_heights for the current constraint
     """
     if(self.f_2d_constructor==None):
-      print("ERR169: Error, the function f_2d_constructor has not been set!")
-      sys.exit(2)
-    (figs, fig_heights) = self.f_2d_constructor(self.constraint) # generate all figures
-    self.A_figures = figs
-    self.figure_heights = fig_heights
+      raise cnc25d_error.Cnc25dDesignError("ERR169: Error, the function f_2d_constructor has not been set!")
+    if(self.constraint_hash==None):
+      self.update_constraint_hash()
+    if((not self.cache_2d_enable)or(self.A_figures_hash!=self.constraint_hash)):
+      (figs, fig_heights) = self.load_2d_cache()
+      self.A_figures = figs
+      self.figure_heights = fig_heights
+      self.A_figures_hash = self.constraint_hash
     #print("dbg191: self.A_figures.keys():", self.A_figures.keys())
-    return((self.A_figures, self.figure_heights))
+
+  def apply_2d_constructor(self):
+    """ internal method that execute the f_2d_constructor function
+    """
+    self.update_2d_figures()
+    r_figs = self.A_figures.copy()
+    for f in r_figs.keys():
+      r_figs[f] = copy_figure(r_figs[f])
+    return((r_figs, self.figure_heights.copy()))
+
+  def set_2d_cache(self, ai_enable=True, ai_cache_dir=''):
+    """ configure the cache of the 2D-figures
+        ai_enable: if False, f_2d_constructor is executed at each request
+        ai_cache_dir: if not empty, the A-figures are also written in this directory and reused by the next runs
+    """
+    self.cache_2d_enable = ai_enable
+    self.cache_2d_dir = ai_cache_dir
+    self.clear_2d_cache()
+
+  def clear_2d_cache(self):
+    """ forget the A-figures generated so far (the files of the cache directory are kept)
+    """
+    self.cache_2d_memo = collections.OrderedDict()
+    self.A_figures_hash = None
+    self.B_figures = {}
+    self.ideal_figures = {}
+
+  def get_2d_cache_filename(self):
+    """ return the file name used to persist the A-figures of the current constraint
+        the source hash of the cnc25d package is part of the name, so the files of an older code version are not reused
+    """
+    r_filename = os.path.join(self.cache_2d_dir, "{:s}_{:s}_{:s}.pkl".format(self.design_name, source_hash()[:12], self.constraint_hash))
+    return(r_filename)
+
+  def load_2d_cache(self):
+    """ return the A-figures and heights of the current constraint from the memory cache, from the cache directory or by executing f_2d_constructor
+    """
+    if(self.cache_2d_enable and (self.constraint_hash in self.cache_2d_memo)):
+      return(self.cache_2d_memo[self.constraint_hash])
+    r_2d = None
+    if(self.cache_2d_enable and (self.cache_2d_dir!='')):
+      cache_filename = self.get_2d_cache_filename()
+      if(os.path.isfile(cache_filename)):
+        try:
+          ifh = open(cache_filename, 'rb')
+          try:
+            r_2d = pickle.load(ifh)
+          finally:
+            ifh.close()
+        except Exception as err: # a truncated or stale file is a cache miss
+          print("WARN948: Warning, the 2D-figure cache file {:s} can not be loaded ({:s}: {:s}). The figures are generated again".format(cache_filename, err.__class__.__name__, str(err)))
+          r_2d = None
+    if(r_2d==None):
+      with design_profile.stage('f_2d_constructor'):
+        r_2d = self.f_2d_constructor(self.constraint) # generate all figures
+      if(self.cache_2d_enable and (self.cache_2d_dir!='')):
+        design_help.mkdir_p(self.cache_2d_dir)
+        ofh = open(self.get_2d_cache_filename(), 'wb')
+        pickle.dump(r_2d, ofh, pickle.HIGHEST_PROTOCOL)
+        ofh.close()
+    if(self.cache_2d_enable):
+      self.cache_2d_memo[self.constraint_hash] = r_2d
+      if(len(self.cache_2d_memo)>cache_2d_memo_max_size):
+        self.cache_2d_memo.popitem(last=False) # forget the oldest constraint set
+    return(r_2d)
 
   def get_A_figure(self, figure_id=""):
     """ generate the figure figure_id and return it at the A-format
         if figure_id is empty, the first figure of the figure dictionary is selected
     """
-    self.apply_2d_constructor()
+    self.update_2d_figures()
     if(figure_id==''):
       figure_id = self.A_figures.keys()[0]
     #print("dbg194: figure_id:", figure_id)
     if(not figure_id in self.A_figures.keys()):
-      print("ERR156: Error, figure_id {:s} is not in the figure list [{:s}]".format(figure_id, ' '.join(self.A_figures.keys())))
-      sys.exit(2)
-    r_fig = self.A_figures[figure_id]
+      raise cnc25d_error.Cnc25dDesignError("ERR156: Error, figure_id {:s} is not in the figure list [{:s}]".format(figure_id, ' '.join(self.A_figures.keys())))
+    r_fig = copy_figure(self.A_figures[figure_id])
     return(r_fig)
       
   def get_B_figure(self, figure_id=""):
     """ generate the figure figure_id and return it at the B-format
         if figure_id is empty, the first figure of the figure dictionary is selected
     """
-    A_fig = self.get_A_figure(figure_id)
-    r_fig = design_output.cnc_cut_figure(A_fig, "get_B_figure_{:s}".format(figure_id))
+    self.update_2d_figures()
+    if(figure_id==''):
+      figure_id = self.A_figures.keys()[0]
+    fig_key = (self.constraint_hash, figure_id)
+    if(self.cache_2d_enable and (fig_key in self.B_figures)):
+      B_fig = self.B_figures[fig_key]
+    else:
+      B_fig = design_output.cnc_cut_figure(self.get_A_figure(figure_id), "get_B_figure_{:s}".format(figure_id))
+      if(self.cache_2d_enable):
+        self.B_figures[fig_key] = B_fig
+    r_fig = copy_figure(B_fig)
+    return(r_fig)
+
+  def get_ideal_figure(self, figure_id=""):
+    """ generate the figure figure_id without the cnc-cut (the outlines as designed, used by the display)
+        if figure_id is empty, the first figure of the figure dictionary is selected
+    """
+    self.update_2d_figures()
+    if(figure_id==''):
+      figure_id = self.A_figures.keys()[0]
+    fig_key = (self.constraint_hash, figure_id)
+    if(self.cache_2d_enable and (fig_key in self.ideal_figures)):
+      ideal_fig = self.ideal_figures[fig_key]
+    else:
+      ideal_fig = design_output.ideal_figure(self.get_A_figure(figure_id), "get_ideal_figure_{:s}".format(figure_id))
+      if(self.cache_2d_enable):
+        self.ideal_figures[fig_key] = ideal_fig
+    r_fig = copy_figure(ideal_fig)
     return(r_fig)
 
   def get_display_2d_figure_list(self):
@@ -326,15 +511,14 @@ class bare_design:
     figs = self.display_2d_figure_list
     r_list = []
     if(figs != None):
-      self.apply_2d_constructor() # create the A-figures
+      self.update_2d_figures() # create the A-figures
       if(len(figs)==0):
         r_list = self.A_figures.keys()
       else:
         r_list = figs
       for f in r_list:
         if(not f in self.A_figures.keys()):
-          print("ERR304: Error, f {:s} is not an existing 2d-figures {:s}".format(f, ' '.join(self.A_figures.keys())))
-          sys.exit(2)
+          raise cnc25d_error.Cnc25dDesignError("ERR304: Error, f {:s} is not an existing 2d-figures {:s}".format(f, ' '.join(self.A_figures.keys())))
     return(r_list)
 
   def outline_display(self):
@@ -343,19 +527,17 @@ class bare_design:
     print("{:s}".format(self.get_info()))
     fig_ids = self.get_display_2d_figure_list()
     for f in fig_ids:
-      fig = self.A_figures[f]
       d_info = "display_{:s}".format(f)
-      #print("dbg218: fig:", fig)
       print("{:s}".format(d_info))
-      outline_backends.figure_simple_display(design_output.cnc_cut_figure(fig, d_info), design_output.ideal_figure(fig, d_info), d_info)
+      outline_backends.figure_simple_display(self.get_B_figure(f), self.get_ideal_figure(f), d_info)
 
   def apply_3d_constructor(self):
     """ internal method that execute the f_3d_constructor function
     """
     if(self.f_3d_constructor==None):
-      print("ERR214: Error, the function f_3d_constructor has not been set!")
-      sys.exit(2)
-    (assembly_conf, slice3d_conf) = self.f_3d_constructor(self.constraint)
+      raise cnc25d_error.Cnc25dDesignError("ERR214: Error, the function f_3d_constructor has not been set!")
+    with design_profile.stage('f_3d_constructor'):
+      (assembly_conf, slice3d_conf) = self.f_3d_constructor(self.constraint)
     self.assembly_configurations = assembly_conf
     self.slice3d_configurations = slice3d_conf
     return((self.assembly_configurations, self.slice3d_configurations))
@@ -364,9 +546,9 @@ class bare_design:
     """ internal method that execute the f_3d_freecad_constructor function
     """
     if(self.f_3d_freecad_constructor==None):
-      print("ERR315: Error, the function f_3d_freecad_constructor has not been set!")
-      sys.exit(2)
-    (freecad_function_pts, fc_obj_slice3d_conf) = self.f_3d_freecad_constructor(self.constraint)
+      raise cnc25d_error.Cnc25dDesignError("ERR315: Error, the function f_3d_freecad_constructor has not been set!")
+    with design_profile.stage('f_3d_freecad_constructor'):
+      (freecad_function_pts, fc_obj_slice3d_conf) = self.f_3d_freecad_constructor(self.constraint)
     self.freecad_function_pts = freecad_function_pts
     self.fc_obj_slice3d_conf = fc_obj_slice3d_conf
     return((self.freecad_function_pts, self.fc_obj_slice3d_conf))
@@ -374,14 +556,14 @@ class bare_design:
   def complete_assembly_conf(self, partial_conf):
     """ prepare an assembly_conf and in particular generate the required outline-figures
     """
-    self.apply_2d_constructor()
+    self.update_2d_figures()
     #print("dbg243: partial_conf:", partial_conf)
     r_assembly_conf = []
     for i in range(len(partial_conf)):
       one_figure_conf = list(partial_conf[i])
       fig_name = one_figure_conf[0]
       #print("dbg352: fig_name:", fig_name)
-      fig_B = design_output.cnc_cut_figure(self.A_figures[fig_name], "complete_assembly_conf_{:s}".format(fig_name))
+      fig_B = self.get_B_figure(fig_name)
       one_figure_conf[0] = fig_B
       r_assembly_conf.append(one_figure_conf)
     return(r_assembly_conf)
@@ -395,11 +577,10 @@ class bare_design:
     if(assembly_name==""):
       assembly_name = self.assembly_configurations.keys()[0] # set the first 3d-assembly-configuration per default
     if(not assembly_name in self.assembly_configurations.keys()):
-      print("ERR187: Error, the assembly_name {:s} is not in the possible 3d-assembly-configuration".format(assembly_name))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dDesignError("ERR187: Error, the assembly_name {:s} is not in the possible 3d-assembly-configuration".format(assembly_name))
     #print("dbg245: self.assembly_configurations:", self.assembly_configurations)
     #print("dbg246: assembly_name:", assembly_name)
-    r_fc_obj = design_output.figures_to_freecad_assembly(self.complete_assembly_conf(self.assembly_configurations[assembly_name]))
+    r_fc_obj = design_output.figures_to_freecad_assembly(self.complete_assembly_conf(self.assembly_configurations[assembly_name]), self.fuse_mode, self.get_fuse_jobs())
     return(r_fc_obj)
 
   def get_fc_obj_function(self, function_id=""):
@@ -411,9 +592,9 @@ class bare_design:
     if(function_id==""):
       function_id = self.freecad_function_pts.keys()[0] # set the first 3d-freecad_function_pts per default
     if(not function_id in self.freecad_function_pts.keys()):
-      print("ERR370: Error, the function_id {:s} is not in the possible 3d-freecad_function_pts".format(function_id))
-      sys.exit(2)
-    r_fc_obj = self.freecad_function_pts[function_id](self.constraint) # execute the function that generate a freecad object
+      raise cnc25d_error.Cnc25dDesignError("ERR370: Error, the function_id {:s} is not in the possible 3d-freecad_function_pts".format(function_id))
+    with design_profile.stage('freecad_function'):
+      r_fc_obj = self.freecad_function_pts[function_id](self.constraint) # execute the function that generate a freecad object
     return(r_fc_obj)
 
   def write_info_txt(self, output_file_basename):
@@ -430,21 +611,75 @@ class bare_design:
     ofh.write(self.get_info())
     ofh.close()
 
+  def set_export_jobs(self, ai_jobs=1):
+    """ set the number of processes used to export the figures in files
+        1 exports the figures one after the other. 0 uses one process per CPU
+    """
+    if(ai_jobs<0):
+      raise cnc25d_error.Cnc25dDesignError("ERR909: Error, the number of export jobs {:d} is negative".format(ai_jobs))
+    self.export_jobs = ai_jobs
+
+  def set_fuse_mode(self, ai_fuse_mode='sequential'):
+    """ set the way the parts of the 3d-assembly-configurations are merged: sequential, tree, compound or parallel
+        see design_output.figures_to_freecad_assembly()
+    """
+    if(not ai_fuse_mode in design_output.fuse_modes):
+      raise cnc25d_error.Cnc25dDesignError("ERR912: Error, the fuse mode {:s} is unknown. Try: {:s}".format(ai_fuse_mode, ', '.join(design_output.fuse_modes)))
+    self.fuse_mode = ai_fuse_mode
+
+  def get_fuse_jobs(self):
+    """ return the number of processes given to design_output.figures_to_freecad_assembly()
+        the parallel fuse mode uses one process per CPU (0) when the export jobs are not set (1)
+    """
+    r_jobs = self.export_jobs
+    if((self.fuse_mode=='parallel')and(r_jobs==1)):
+      r_jobs = 0
+    return(r_jobs)
+
+  def export_figures(self, figure_files, txt_info, ai_jobs=None):
+    """ write the 2d-figures in files
+        figure_files is a list of (figure_id, [filenames]). Each figure is cnc-cut once for all its files
+        if ai_jobs (default: self.export_jobs) is not 1, the figures are exported in parallel by the workers of freecad_pool (without loading FreeCAD) and the logs are printed in the figure order
+    """
+    jobs = ai_jobs
+    if(jobs==None):
+      jobs = self.export_jobs
+    if((jobs==1)or(len(figure_files)<2)):
+      for (f, filenames) in figure_files:
+        fig_B = self.get_B_figure(f)
+        for filename in filenames:
+          design_output.generate_output_file(fig_B, filename, self.figure_heights[f], txt_info)
+      return(0)
+    job_list = []
+    for (f, filenames) in figure_files:
+      fig_key = (self.constraint_hash, f)
+      if(self.cache_2d_enable and (fig_key in self.B_figures)):
+        job_list.append((f, 'figure', (None, self.B_figures[fig_key], filenames, self.figure_heights[f], txt_info)))
+      else:
+        job_list.append((f, 'figure', (self.A_figures[f], None, filenames, self.figure_heights[f], txt_info)))
+    print("Export {:d} figures of {:s}".format(len(job_list), self.design_name))
+    reports = freecad_pool.run_jobs(job_list, jobs)
+    if(self.cache_2d_enable):
+      for (f, fig_B, log_txt, elapsed_time, error) in reports:
+        if(error==None):
+          self.B_figures[(self.constraint_hash, f)] = fig_B
+    freecad_pool.raise_job_errors(reports)
+    return(0)
+
   def get_write_2d_figure_list(self):
     """ generate the list of 2d_figures to be written according to self.write_2d_figure_list
     """
     figs = self.write_2d_figure_list
     r_list = []
     if(figs != None):
-      self.apply_2d_constructor() # create the A-figures
+      self.update_2d_figures() # create the A-figures
       if(len(figs)==0):
         r_list = self.A_figures.keys()
       else:
         r_list = figs
       for f in r_list:
         if(not f in self.A_figures.keys()):
-          print("ERR291: Error, f {:s} is not an existing 2d-figures {:s}".format(f, ' '.join(self.A_figures.keys())))
-          sys.exit(2)
+          raise cnc25d_error.Cnc25dDesignError("ERR291: Error, f {:s} is not an existing 2d-figures {:s}".format(f, ' '.join(self.A_figures.keys())))
     return(r_list)
 
   def write_figure_svg(self, output_file_basename):
@@ -453,8 +688,7 @@ class bare_design:
     """
     txt_info = self.get_info()
     figs = self.get_write_2d_figure_list()
-    for f in figs:
-      design_output.generate_output_file(design_output.cnc_cut_figure(self.A_figures[f], "generate_svg_{:s}".format(f)), "{:s}_{:s}.svg".format(output_file_basename, f), self.figure_heights[f], txt_info)
+    self.export_figures([ (f, ["{:s}_{:s}.svg".format(output_file_basename, f)]) for f in figs ], txt_info)
 
   def write_figure_dxf(self, output_file_basename):
     """ write all 2d-figures in dxf files
@@ -462,8 +696,7 @@ class bare_design:
     """
     txt_info = self.get_info()
     figs = self.get_write_2d_figure_list()
-    for f in figs:
-      design_output.generate_output_file(design_output.cnc_cut_figure(self.A_figures[f], "generate_dxf_{:s}".format(f)), "{:s}_{:s}.dxf".format(output_file_basename, f), self.figure_heights[f], txt_info)
+    self.export_figures([ (f, ["{:s}_{:s}.dxf".format(output_file_basename, f)]) for f in figs ], txt_info)
 
   def get_write_3d_figure_list(self):
     """ generate the list of 2d_figures to be written according to self.write_3d_figure_list
@@ -471,15 +704,14 @@ class bare_design:
     figs = self.write_3d_figure_list
     r_list = []
     if(figs != None):
-      self.apply_2d_constructor() # create the A-figures
+      self.update_2d_figures() # create the A-figures
       if(len(figs)==0):
         r_list = self.A_figures.keys()
       else:
         r_list = figs
       for f in r_list:
         if(not f in self.A_figures.keys()):
-          print("ERR380: Error, f {:s} is not an existing 2d-figures {:s}".format(f, ' '.join(self.A_figures.keys())))
-          sys.exit(2)
+          raise cnc25d_error.Cnc25dDesignError("ERR380: Error, f {:s} is not an existing 2d-figures {:s}".format(f, ' '.join(self.A_figures.keys())))
     return(r_list)
 
   def write_figure_brep(self, output_file_basename, suffix='brep'):
@@ -488,8 +720,7 @@ class bare_design:
     """
     txt_info = self.get_info()
     figs = self.get_write_3d_figure_list()
-    for f in figs:
-      design_output.generate_output_file(design_output.cnc_cut_figure(self.A_figures[f], "generate_brep_{:s}".format(f)), "{:s}_{:s}.{:s}".format(output_file_basename, f, suffix), self.figure_heights[f], txt_info)
+    self.export_figures([ (f, ["{:s}_{:s}.{:s}".format(output_file_basename, f, suffix)]) for f in figs ], txt_info)
 
   def get_write_3d_conf_list(self):
     """ generate the list of 3d-assembly-configurations to be written according to self.write_3d_conf_list
@@ -504,8 +735,7 @@ class bare_design:
         r_list = confs
       for f in r_list:
         if(not f in self.assembly_configurations.keys()):
-          print("ERR406: Error, f {:s} is not an existing 3d-assembly-configurations {:s}".format(f, ' '.join(self.assembly_configurations.keys())))
-          sys.exit(2)
+          raise cnc25d_error.Cnc25dDesignError("ERR406: Error, f {:s} is not an existing 3d-assembly-configurations {:s}".format(f, ' '.join(self.assembly_configurations.keys())))
     return(r_list)
 
   def write_assembly_brep(self, output_file_basename, ai_brep=True, ai_stl=False):
@@ -513,10 +743,16 @@ class bare_design:
         output_file_basename contains the directory path and the file-basename
     """
     confs = self.get_write_3d_conf_list()
+    if((self.export_jobs!=1)and(len(confs)>1)): # one assembly per FreeCAD worker
+      job_list = []
+      for a in confs:
+        job_list.append((a, 'assembly', (self.complete_assembly_conf(self.assembly_configurations[a]), "{:s}_{:s}".format(output_file_basename, a), ai_brep, ai_stl, self.slice3d_configurations[a], self.fuse_mode)))
+      freecad_pool.raise_job_errors(freecad_pool.run_jobs(job_list, self.export_jobs))
+      return(0)
     for a in confs:
       print("write_assembly_brep: {:s}".format(a))
       # (ai_3d_conf, ai_output_filename, ai_brep=True, ai_stl=False, ai_slice_xyz=[])
-      design_output.generate_3d_assembly_output_file(self.complete_assembly_conf(self.assembly_configurations[a]), "{:s}_{:s}".format(output_file_basename, a), ai_brep=ai_brep, ai_stl=ai_stl, ai_slice_xyz=self.slice3d_configurations[a]) 
+      design_output.generate_3d_assembly_output_file(self.complete_assembly_conf(self.assembly_configurations[a]), "{:s}_{:s}".format(output_file_basename, a), ai_brep=ai_brep, ai_stl=ai_stl, ai_slice_xyz=self.slice3d_configurations[a], ai_fuse_mode=self.fuse_mode, ai_jobs=self.get_fuse_jobs()) 
 
   def get_write_3d_freecad_list(self):
     """ generate the list of 3d-freecad_objects to be written according to self.write_3d_freecad_list
@@ -532,8 +768,7 @@ class bare_design:
         r_list = l
       for f in r_list:
         if(not f in self.freecad_function_pts.keys()):
-          print("ERR460: Error, f {:s} is not an existing 3d-freecad_function_pts {:s}".format(f, ' '.join(self.freecad_function_pts.keys())))
-          sys.exit(2)
+          raise cnc25d_error.Cnc25dDesignError("ERR460: Error, f {:s} is not an existing 3d-freecad_function_pts {:s}".format(f, ' '.join(self.freecad_function_pts.keys())))
     return(r_list)
 
   def write_freecad_brep(self, output_file_basename, ai_brep=True, ai_stl=False):
@@ -541,21 +776,49 @@ class bare_design:
         output_file_basename contains the directory path and the file-basename
     """
     l = self.get_write_3d_freecad_list()
+    if((self.export_jobs!=1)and(len(l)>1)and freecad_pool.is_picklable((self.freecad_function_pts, self.constraint))): # each FreeCAD worker constructs and exports one freecad-object
+      job_list = []
+      for a in l:
+        job_list.append((a, 'freecad_function', (self.freecad_function_pts[a], self.constraint, "{:s}_{:s}".format(output_file_basename, a), ai_brep, ai_stl, self.fc_obj_slice3d_conf[a])))
+      freecad_pool.raise_job_errors(freecad_pool.run_jobs(job_list, self.export_jobs))
+      return(0)
     for a in l:
       # (ai_3d_conf, ai_output_filename, ai_brep=True, ai_stl=False, ai_slice_xyz=[])
       design_output.freecad_object_output_file(self.get_fc_obj_function(a), "{:s}_{:s}".format(output_file_basename, a), ai_brep=ai_brep, ai_stl=ai_stl, ai_slice_xyz=self.fc_obj_slice3d_conf[a]) 
 
+  def write_output_formats(self, output_file_basename, formats):
+    """ write the design in several formats in one pass
+        formats is a list of file-suffixes among svg, svgz, dxf, brep and stl
+        each 2d-figure is cnc-cut once and the same B-figure feeds all the backends
+    """
+    for fmt in formats:
+      if(not fmt in (output_formats_2d + output_formats_3d)):
+        raise cnc25d_error.Cnc25dDesignError("ERR903: Error, the output format {:s} is unknown. Try: {:s}".format(fmt, ', '.join(output_formats_2d + output_formats_3d)))
+    self.write_info_txt(output_file_basename) # write info in test file
+    txt_info = self.get_info()
+    formats_2d = [ fmt for fmt in output_formats_2d if fmt in formats ]
+    formats_3d = [ fmt for fmt in output_formats_3d if fmt in formats ]
+    figure_files = collections.OrderedDict()
+    if(len(formats_2d)>0):
+      for f in self.get_write_2d_figure_list():
+        figure_files.setdefault(f, []).extend([ "{:s}_{:s}.{:s}".format(output_file_basename, f, fmt) for fmt in formats_2d ])
+    if(len(formats_3d)>0):
+      for f in self.get_write_3d_figure_list():
+        figure_files.setdefault(f, []).extend([ "{:s}_{:s}.{:s}".format(output_file_basename, f, fmt) for fmt in formats_3d ])
+    self.export_figures(figure_files.items(), txt_info)
+    if(len(formats_3d)>0):
+      self.write_assembly_brep(output_file_basename, ai_brep=('brep' in formats_3d), ai_stl=('stl' in formats_3d))
+      self.write_freecad_brep(output_file_basename, ai_brep=('brep' in formats_3d), ai_stl=('stl' in formats_3d))
+
   def run_simulation(self, sim_id=''):
     """ run the simulation sim_id
     """
     if(len(self.simulation_2d_pts)==0):
-      print("ERR268: Error, no simulation function is provided. Can't run 2d-simulate {:s}".format(sim_id))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dDesignError("ERR268: Error, no simulation function is provided. Can't run 2d-simulate {:s}".format(sim_id))
     if(sim_id==''):
       sim_id = self.simulation_2d_pts.keys()[0]
     if(not sim_id in self.simulation_2d_pts.keys()):
-      print("ERR382: Error, the simulation id {:s} does not exist in the list {:s}".format(sim_id, ' '.join(self.simulation_2d_pts.keys())))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dDesignError("ERR382: Error, the simulation id {:s} does not exist in the list {:s}".format(sim_id, ' '.join(self.simulation_2d_pts.keys())))
     print("SIMULATION: {:s} runs simulation: {:s}".format(self.design_name, sim_id))
     #self.simulation_2d_pts[sim_id](self.constraint) # writing correct but too compact for my eyes ;)
     f_simulation = self.simulation_2d_pts[sim_id]
@@ -658,6 +921,26 @@ class bare_design:
       help="Select the object to be returned by the method cli. Depreciated! Use rather the appropriate methods")
     cwoo_parser.add_argument('--view_design_configuration','--vdc', action='store_true', default=False, dest='sw_view_design_configuration',
       help="View the design configuration (2D-figures, 2D-simulations, assembly_3dconfs, displayed_figures ...)")
+    cwoo_parser.add_argument('--formats', action='store', default='', dest='sw_formats',
+      help="Comma separated list of output formats (svg,svgz,dxf,brep,stl) written in one pass with --output_file_basename. Each figure is cnc-cut only once")
+    cwoo_parser.add_argument('--jobs', action='store', type=int, default=None, dest='sw_jobs',
+      help="Number of FreeCAD worker processes used to export the figures, the 3D assemblies and the freecad-objects in files. 0 uses one process per CPU. Default: 1 (or the value set by set_export_jobs())")
+    cwoo_parser.add_argument('--fuse_mode', action='store', default=None, dest='sw_fuse_mode',
+      help="How the parts of the 3D assemblies are merged: sequential (default), tree, compound (no boolean, fast preview) or parallel (tree fuse in --jobs processes, one per CPU if --jobs is not set)")
+    cwoo_parser.add_argument('--cache_2d_dir','--c2d', action='store', default='', dest='sw_cache_2d_dir',
+      help="Directory where the 2D-figures are persisted and reused between runs with the same constraint")
+    cwoo_parser.add_argument('--profile', action='store', nargs='?', const='', default=None, dest='sw_profile',
+      help="Measure the wall time, the CPU time and the number of calls of each stage of the run and print them. If a filename is given, the measurements are also written in this JSON file")
+    cwoo_parser.add_argument('--profile_dir', action='store', default='', dest='sw_profile_dir',
+      help="Profile each stage with cProfile and dump the data in <profile_dir>/<stage>.prof (implies --profile)")
+    cwoo_parser.add_argument('--headless_simulation','--hs', action='store', nargs='?', const='', default=None, dest='sw_headless_simulation',
+      help="Run the 2D-simulations without Tk-window. The frames are written in <basename>_frame_NNNN.png and <basename>.svg and the curve tables in <basename>_curves.csv. Without basename, the frames are only computed (benchmark)")
+    cwoo_parser.add_argument('--headless_frames', action='store', type=int, default=None, dest='sw_headless_frames',
+      help="Number of frames of the headless simulation")
+    cwoo_parser.add_argument('--headless_angle_step', action='store', type=float, default=None, dest='sw_headless_angle_step',
+      help="Angle position increment between two frames of the headless simulation. Default: the fast speed of the Tk-window")
+    cwoo_parser.add_argument('--headless_formats', action='store', default=None, dest='sw_headless_formats',
+      help="Comma separated list of the headless simulation outputs (png,svg,csv). Default: all of them")
     #print("dbg363: effective_args:", effective_args)
     if(('-h' in effective_args)or('--help' in effective_args)):
       cwoo_parser.print_help()
@@ -666,10 +949,47 @@ class bare_design:
     else:
       (oo_args, remaining_args) = cwoo_parser.parse_known_args(effective_args)
     #print("dbg322: remaining_args:", remaining_args)
+    profile_run = ((oo_args.sw_profile!=None)or(oo_args.sw_profile_dir!=''))
+    if(profile_run):
+      design_profile.profile_setup(True, oo_args.sw_profile_dir)
+    headless_settings = headless_display.headless_save()
+    try:
+      r_cli = self.apply_output_options(oo_args, remaining_args, effective_args_in_txt)
+    finally: # the failing runs are also reported
+      headless_display.headless_restore(headless_settings) # the --headless_* options only apply to this call
+      if(profile_run):
+        try:
+          design_profile.write_profile_report(oo_args.sw_profile or '', self.design_name)
+        finally:
+          design_profile.profile_setup(False)
+    return(r_cli)
+
+  def apply_output_options(self, oo_args, remaining_args, effective_args_in_txt):
+    """ internal method of apply_cli_with_output_options() that applies the parsed argument-output-options oo_args
+        and the design constraint remaining_args. It returns the value of apply_cli_with_output_options()
+    """
+    if(oo_args.sw_headless_simulation!=None):
+      headless_formats = None
+      if(oo_args.sw_headless_formats!=None):
+        headless_formats = [ fmt.strip() for fmt in oo_args.sw_headless_formats.split(',') if fmt.strip()!='' ]
+      if(oo_args.sw_headless_simulation==''):
+        headless_formats = []
+      headless_display.headless_setup(True, oo_args.sw_headless_simulation, oo_args.sw_headless_frames, oo_args.sw_headless_angle_step, headless_formats)
+    if(oo_args.sw_jobs!=None):
+      self.set_export_jobs(oo_args.sw_jobs)
+    if(oo_args.sw_fuse_mode!=None):
+      self.set_fuse_mode(oo_args.sw_fuse_mode)
+    if(oo_args.sw_cache_2d_dir!=''):
+      self.set_2d_cache(True, oo_args.sw_cache_2d_dir)
     self.apply_cli(' '.join(remaining_args))
     self.cli_str = effective_args_in_txt # must be set after apply_constraint()
     # generate output files
-    if(oo_args.sw_output_file_basename!=''):
+    if(oo_args.sw_formats!=''):
+      if(oo_args.sw_output_file_basename==''):
+        raise cnc25d_error.Cnc25dDesignError("ERR904: Error, --formats {:s} requires --output_file_basename".format(oo_args.sw_formats))
+      output_file_basename = re.sub('\.(svg|svgz|dxf|brep|stl)$', '', oo_args.sw_output_file_basename)
+      self.write_output_formats(output_file_basename, [ fmt.strip() for fmt in oo_args.sw_formats.split(',') if fmt.strip()!='' ])
+    elif(oo_args.sw_output_file_basename!=''):
       if(re.search('\.svg$', oo_args.sw_output_file_basename)):
         output_file_basename = re.sub('\.svg$', '', oo_args.sw_output_file_basename)
         self.write_info_txt(output_file_basename) # write info in test file
@@ -691,12 +1011,10 @@ class bare_design:
         self.write_assembly_brep(output_file_basename, ai_brep=False, ai_stl=True)
         self.write_freecad_brep(output_file_basename, ai_brep=False, ai_stl=True)
       else:
-        print("ERR698: Error, no output format extension provided! Try suffix: .dxf, .svg, .brep or .stl")
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dDesignError("ERR698: Error, no output format extension provided! Try suffix: .dxf, .svg, .brep or .stl")
     # run simulation
     if(oo_args.sw_simulate_2d==None):
-      print("ERR510: no simualtion has been set")
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dDesignError("ERR510: no simualtion has been set")
     elif(oo_args.sw_simulate_2d!=''):
       #print("dbg482: oo_args.sw_simulate_2d:", oo_args.sw_simulate_2d)
       self.run_simulation(oo_args.sw_simulate_2d)
@@ -717,8 +1035,7 @@ class bare_design:
     r_cli = 1
     if(oo_args.sw_return_type!=''):
       if(self.f_return_type==None):
-        print("ERR277: Error, no return_type function is provided. Can't apply return_type {:s}".format(oo_args.sw_return_type))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dDesignError("ERR277: Error, no return_type function is provided. Can't apply return_type {:s}".format(oo_args.sw_return_type))
       r_cli = self.f_return_type(oo_args.sw_return_type, self.constraint)
     return(r_cli)
 
@@ -727,8 +1044,7 @@ class bare_design:
         If test_id=='', all design-self-test are executed
     """
     if(self.self_tests==[]):
-      print("ERR322: Error, the self_tests list has not been set!")
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dDesignError("ERR322: Error, the self_tests list has not been set!")
     test_ids = []
     for i in range(len(self.self_tests)):
       test_ids.append(self.self_tests[i][0])
@@ -737,8 +1053,7 @@ class bare_design:
       test_list.extend(test_ids)
     else:
       if(not test_id in test_ids):
-        print("ERR541: Error, test_id {:s} is not in the test-list {:s}".format(test_id, ', '.join(test_ids)))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dDesignError("ERR541: Error, test_id {:s} is not in the test-list {:s}".format(test_id, ', '.join(test_ids)))
       test_list.append(test_id)
     print("\nInfo: test_list: {:s}\n".format(', '.join(test_list)))
     for i in range(len(test_list)):
@@ -747,8 +1062,7 @@ class bare_design:
         if(test_ids[j]==test_list[i]):
           tn=j
       if(tn==-1):
-        print("ERR562: the test {:s} has not been found".format(test_list[i]))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dDesignError("ERR562: the test {:s} has not been found".format(test_list[i]))
       else:
         print("{:2d} test case: '{:s}'\nwith switch: {:s}".format(tn+1, self.self_tests[tn][0], self.self_tests[tn][1]))
         self.apply_constraint_default_value()
@@ -759,8 +1073,7 @@ class bare_design:
     """ write a file containing the complete list of parameters and their default values
     """
     if(self.parser==None):
-      print("ERR331: Error, parser has not been set!")
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dDesignError("ERR331: Error, parser has not been set!")
     constraint_dict = vars(self.parser.parse_args([]))
     py_txt = ""
     for (k,v) in constraint_dict.iteritems():
@@ -808,7 +1121,7 @@ class bare_design:
 # import for testing bare_design
 #import cnc25d_api # cannot import cnc25d_api because cnc25d_api import bare_design
 import importing_freecad
-importing_freecad.importing_freecad()
+#importing_freecad.importing_freecad() # FreeCAD is imported on first use by lazy_import
 import cnc_outline
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -816,8 +1129,8 @@ import cnc_outline
 import math
 import sys, argparse
 #
-import Part
-from FreeCAD import Base
+from lazy_import import Part
+from lazy_import import Base
 # end of import for testing bare_design
 
 def bare_design_test1():
@@ -847,20 +1160,15 @@ def bare_design_test1():
       c['height'] = c['length']
     # check the constraint
     if(c['width']<c['length']*0.1):
-      print("ERR129: Error, width {:0.3f} is too small compare to length {:0.3f}".format(c['width'], c['length']))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dDesignError("ERR129: Error, width {:0.3f} is too small compare to length {:0.3f}".format(c['width'], c['length']))
     if(c['width']>c['length']*10.0):
-      print("ERR132: Error, width {:0.3f} is too big compare to length {:0.3f}".format(c['width'], c['length']))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dDesignError("ERR132: Error, width {:0.3f} is too big compare to length {:0.3f}".format(c['width'], c['length']))
     if(c['height']<c['length']*0.1):
-      print("ERR135: Error, height {:0.3f} is too small compare to length {:0.3f}".format(c['height'], c['length']))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dDesignError("ERR135: Error, height {:0.3f} is too small compare to length {:0.3f}".format(c['height'], c['length']))
     if(c['height']>c['length']*10.0):
-      print("ERR138: Error, height {:0.3f} is too big compare to length {:0.3f}".format(c['height'], c['length']))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dDesignError("ERR138: Error, height {:0.3f} is too big compare to length {:0.3f}".format(c['height'], c['length']))
     if(c['smooth_radius']>0.4*min(c['length'], c['width'])):
-      print("ERR182: Error, smooth_radius {:0.3f} is too big compare to length {:0.3f} or width {:0.3f}".format(c['smooth_radius'], c['length'], c['width']))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dDesignError("ERR182: Error, smooth_radius {:0.3f} is too big compare to length {:0.3f} or width {:0.3f}".format(c['smooth_radius'], c['length'], c['width']))
     return(c)
 
   def cube_figures(c):
@@ -1039,7 +1347,7 @@ def bare_design_test_cli(ai_args=""):
 ################################################################
 
 if __name__ == "__main__":
-  FreeCAD.Console.PrintMessage("bare_design.py says hello!\n")
+  print("bare_design.py says hello!")
   # select your script behavior
   #bare_design_test_cli()
   bare_design_test_cli("--test1")
@@ -30,7 +30,7 @@ The main function displays in a Tk-interface the bell piece, or generates the de
 ################################################################
 
 import cnc25d_api
-cnc25d_api.importing_freecad()
+#cnc25d_api.importing_freecad() # FreeCAD is imported on first use by lazy_import
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -46,7 +46,7 @@ import sys, argparse
 #import re # to detect .dxf or .svg
 #import Tkinter # to display the outline in a small GUI
 #
-import Part
+from lazy_import import Part
 #from FreeCAD import Base
 # 3rd parties
 #import svgwrite
@@ -222,46 +222,37 @@ def bell_constraint_check(c):
   radian_epsilon = math.pi/1000
   # axle_internal_diameter
   if(c['axle_internal_diameter']<radian_epsilon):
-    print("ERR333: Error, axle_internal_diameter {:0.3f} is too small".format(c['axle_internal_diameter']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR333: Error, axle_internal_diameter {:0.3f} is too small".format(c['axle_internal_diameter']))
   c['axle_internal_radius'] = c['axle_internal_diameter']/2.0
   # axle_external_diameter
   c['axle_external_radius'] = c['axle_external_diameter']/2.0
   if(c['axle_external_radius']==0):
     c['axle_external_radius'] = 2*c['axle_internal_radius']
   if(c['axle_external_radius']<c['axle_internal_radius']+radian_epsilon):
-    print("ERR340: Error, axle_external_radius {:0.3f} must be bigger than axle_internal_radius {:0.3f}".format(c['axle_external_radius'], c['axle_internal_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR340: Error, axle_external_radius {:0.3f} must be bigger than axle_internal_radius {:0.3f}".format(c['axle_external_radius'], c['axle_internal_radius']))
   # leg_length
   if(c['leg_length']<c['axle_internal_radius']):
-    print("ERR346: Error, leg_length {:0.3f} must be bigger than axle_internal_radius {:0.3f}".format(c['leg_length'], c['axle_internal_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR346: Error, leg_length {:0.3f} must be bigger than axle_internal_radius {:0.3f}".format(c['leg_length'], c['axle_internal_radius']))
   # bell_face_height
   if(c['bell_face_height']<radian_epsilon):
-    print("ERR350: Error, bell_face_height {:0.3f} must be strictly positive".format(c['bell_face_height']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR350: Error, bell_face_height {:0.3f} must be strictly positive".format(c['bell_face_height']))
   # bell_face_width
   if(c['bell_face_width']<2*c['axle_external_radius']):
-    print("ERR354: Error, bell_face_width {:0.3f} is too small compare too axle_external_radius {:0.3f}".format(c['bell_face_width'], c['axle_external_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR354: Error, bell_face_width {:0.3f} is too small compare too axle_external_radius {:0.3f}".format(c['bell_face_width'], c['axle_external_radius']))
   # base_diameter
   c['base_radius'] = c['base_diameter']/2.0
   if(c['base_radius']<c['bell_face_width']/10.0*math.sqrt(5**2+1.5**2)):
-    print("ERR357: Error, base_radius {:0.3f} is too small compare to bell_face_width {:0.3f}".format(c['base_radius'], c['bell_face_width']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR357: Error, base_radius {:0.3f} is too small compare to bell_face_width {:0.3f}".format(c['base_radius'], c['bell_face_width']))
   # face_thickness
   if(c['face_thickness']<radian_epsilon):
-    print("ERR358: Error, face_thickness {:0.3f} must be strictly positive".format(c['face_thickness']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR358: Error, face_thickness {:0.3f} must be strictly positive".format(c['face_thickness']))
   if(c['face_thickness']>c['bell_face_width']/5.0):
-    print("ERR361: Error, face_thickness {:0.3f} is too big compare to bell_face_width {:0.3f}".format(c['face_thickness'], c['bell_face_width']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR361: Error, face_thickness {:0.3f} is too big compare to bell_face_width {:0.3f}".format(c['face_thickness'], c['bell_face_width']))
   # side_thickness
   if(c['side_thickness']==0.0):
     c['side_thickness'] = c['face_thickness']
   if(c['side_thickness']>c['bell_face_width']/5.0):
-    print("ERR367: Error, side_thickness {:0.3f} is too big compare to bell_face_width {:0.3f}".format(c['side_thickness'], c['bell_face_width']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR367: Error, side_thickness {:0.3f} is too big compare to bell_face_width {:0.3f}".format(c['side_thickness'], c['bell_face_width']))
   # base_thickness
   if(c['base_thickness']==0.0):
     c['base_thickness'] = c['face_thickness']
@@ -272,268 +263,204 @@ def bell_constraint_check(c):
     # axle_hole_diameter
     c['axle_hole_radius'] = c['axle_hole_diameter']/2.0
     if(c['axle_hole_radius']<radian_epsilon):
-      print("ERR370: Error, axle_hole_radius {:0.3f} must be strictly positive".format(c['axle_hole_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR370: Error, axle_hole_radius {:0.3f} must be strictly positive".format(c['axle_hole_radius']))
     # axle_hole_position_diameter
     c['axle_hole_position_radius'] = c['axle_hole_position_diameter']/2.0
     if(c['axle_hole_position_radius']==0.0):
       c['axle_hole_position_radius'] = (c['axle_internal_radius']+c['axle_external_radius'])/2.0
     if(c['axle_hole_position_radius'] < c['axle_internal_radius']+c['axle_hole_radius']+radian_epsilon):
-      print("ERR378: Error: axle_hole_position_radius {:0.3f} is too small compare to axle_internal_radius {:0.3f} and axle_hole_radius {:0.3f}".format(c['axle_hole_position_radius'], c['axle_internal_radius'], c['axle_hole_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR378: Error: axle_hole_position_radius {:0.3f} is too small compare to axle_internal_radius {:0.3f} and axle_hole_radius {:0.3f}".format(c['axle_hole_position_radius'], c['axle_internal_radius'], c['axle_hole_radius']))
     if(c['axle_hole_position_radius'] > c['axle_external_radius']-c['axle_hole_radius']-radian_epsilon):
-      print("ERR381: Error: axle_hole_position_radius {:0.3f} is too big compare to axle_external_radius {:0.3f} and axle_hole_radius {:0.3f}".format(c['axle_hole_position_radius'], c['axle_external_radius'], c['axle_hole_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR381: Error: axle_hole_position_radius {:0.3f} is too big compare to axle_external_radius {:0.3f} and axle_hole_radius {:0.3f}".format(c['axle_hole_position_radius'], c['axle_external_radius'], c['axle_hole_radius']))
     # axle_hole_angle
   # leg_spare_width
   if(c['leg_spare_width'] > (c['bell_face_width']-2*c['axle_external_radius'])/2.0+radian_epsilon):
-    print("ERR385: Error, leg_spare_width {:0.3f} is too big compare to bell_face_width {:0.3f} and axle_external_radius {:0.3f}".format(c['leg_spare_width'], c['bell_face_width'], c['axle_external_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR385: Error, leg_spare_width {:0.3f} is too big compare to bell_face_width {:0.3f} and axle_external_radius {:0.3f}".format(c['leg_spare_width'], c['bell_face_width'], c['axle_external_radius']))
   # leg_smoothing_radius
   if(c['leg_smoothing_radius']<c['bell_cnc_router_bit_radius']):
-    print("ERR389: Error, leg_smoothing_radius {:0.3f} must be bigger than bell_cnc_router_bit_radius {:0.3f}".format(c['leg_smoothing_radius'], c['bell_cnc_router_bit_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR389: Error, leg_smoothing_radius {:0.3f} must be bigger than bell_cnc_router_bit_radius {:0.3f}".format(c['leg_smoothing_radius'], c['bell_cnc_router_bit_radius']))
   if(c['leg_smoothing_radius']<c['leg_spare_width']):
-    print("ERR403: Error, leg_smoothing_radius {:0.3f} must be bigger than leg_spare_width {:0.3f}".format(c['leg_smoothing_radius'], c['leg_spare_width']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR403: Error, leg_smoothing_radius {:0.3f} must be bigger than leg_spare_width {:0.3f}".format(c['leg_smoothing_radius'], c['leg_spare_width']))
   if(c['leg_smoothing_radius']>c['leg_length']):
-    print("ERR392: Error, leg_smoothing_radius {:0.3f} must be bigger than leg_length {:0.3f}".format(c['leg_smoothing_radius'], c['leg_length']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR392: Error, leg_smoothing_radius {:0.3f} must be bigger than leg_length {:0.3f}".format(c['leg_smoothing_radius'], c['leg_length']))
   # motor_hole_diameter
   c['motor_hole_radius'] = c['motor_hole_diameter']/2.0
   if(c['motor_hole_radius']>0.0):
     # motor_hole_x_distance
     if(c['motor_hole_x_distance']<2*c['motor_hole_radius']+radian_epsilon):
-      print("ERR399: Error, motor_hole_x_distance {:0.3f} is too small compare to motor_hole_radius {:0.3f}".format(c['motor_hole_x_distance'], c['motor_hole_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR399: Error, motor_hole_x_distance {:0.3f} is too small compare to motor_hole_radius {:0.3f}".format(c['motor_hole_x_distance'], c['motor_hole_radius']))
     if(c['motor_hole_x_distance']>c['bell_face_width']-2*c['side_thickness']-2*c['motor_hole_radius']-radian_epsilon):
-      print("ERR402: Error, motor_hole_x_distance {:0.3f} is too big compare to bell_face_width {:0.3f}, side_thickness {:0.3f} and motor_hole_radius {:0.3f}".format(c['motor_hole_x_distance'], c['bell_face_width'], c['side_thickness'], c['motor_hole_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR402: Error, motor_hole_x_distance {:0.3f} is too big compare to bell_face_width {:0.3f}, side_thickness {:0.3f} and motor_hole_radius {:0.3f}".format(c['motor_hole_x_distance'], c['bell_face_width'], c['side_thickness'], c['motor_hole_radius']))
     # motor_hole_z_distance
     if(c['motor_hole_z_distance']<2*c['motor_hole_radius']+radian_epsilon):
-      print("ERR406: Error, motor_hole_z_distance {:0.3f} is too small compare to motor_hole_radius {:0.3f}".format(c['motor_hole_z_distance'], c['motor_hole_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR406: Error, motor_hole_z_distance {:0.3f} is too small compare to motor_hole_radius {:0.3f}".format(c['motor_hole_z_distance'], c['motor_hole_radius']))
     if(c['motor_hole_z_distance']>c['bell_face_height']+c['leg_length']-2*c['motor_hole_radius']-radian_epsilon):
-      print("ERR409: Error, motor_hole_z_distance {:0.3f} is too big compare to bell_face_height {:0.3f}, leg_length {:0.3f} and motor_hole_radius {:0.3f}".format(c['motor_hole_z_distance'], c['bell_face_height'], c['leg_length'], c['motor_hole_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR409: Error, motor_hole_z_distance {:0.3f} is too big compare to bell_face_height {:0.3f}, leg_length {:0.3f} and motor_hole_radius {:0.3f}".format(c['motor_hole_z_distance'], c['bell_face_height'], c['leg_length'], c['motor_hole_radius']))
     # motor_hole_z_position
     if(c['motor_hole_z_position']<c['motor_hole_radius']+radian_epsilon):
-      print("ERR413: Error, motor_hole_z_position {:0.3f} is too small compare to motor_hole_radius {:0.3f}".format(c['motor_hole_z_position'], c['motor_hole_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR413: Error, motor_hole_z_position {:0.3f} is too small compare to motor_hole_radius {:0.3f}".format(c['motor_hole_z_position'], c['motor_hole_radius']))
     if(c['motor_hole_z_position']>c['bell_face_height']+c['leg_length']-c['motor_hole_z_distance']-2*c['motor_hole_radius']-radian_epsilon):
-      print("ERR416: Error, motor_hole_z_distance {:0.3f} is too big compare to bell_face_height {:0.3f}, leg_length {:0.3f}, motor_hole_z_distance {:0.3f} and motor_hole_radius {:0.3f}".format(c['motor_hole_z_distance'], c['bell_face_height'], c['leg_length'], c['motor_hole_z_distance'], c['motor_hole_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR416: Error, motor_hole_z_distance {:0.3f} is too big compare to bell_face_height {:0.3f}, leg_length {:0.3f}, motor_hole_z_distance {:0.3f} and motor_hole_radius {:0.3f}".format(c['motor_hole_z_distance'], c['bell_face_height'], c['leg_length'], c['motor_hole_z_distance'], c['motor_hole_radius']))
   # int_buttress_x_length
   if(c['int_buttress_x_length']>(c['bell_face_width']-2*c['side_thickness'])/3.0):
-    print("ERR426: Error, int_buttress_x_length {:0.3f} is too big compare to bell_face_width {:0.3f} and side_thickness {:0.3f}".format(c['int_buttress_x_length'], c['bell_face_width'], c['side_thickness']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR426: Error, int_buttress_x_length {:0.3f} is too big compare to bell_face_width {:0.3f} and side_thickness {:0.3f}".format(c['int_buttress_x_length'], c['bell_face_width'], c['side_thickness']))
   if(c['int_buttress_x_length']>0):
     # int_buttress_z_width
     if(c['int_buttress_z_width']<3*c['bell_cnc_router_bit_radius']):
-      print("ERR431: Error, int_buttress_z_width {:0.3f} is too small compare to bell_cnc_router_bit_radius {:0.3f}".format(c['int_buttress_z_width'], c['bell_cnc_router_bit_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR431: Error, int_buttress_z_width {:0.3f} is too small compare to bell_cnc_router_bit_radius {:0.3f}".format(c['int_buttress_z_width'], c['bell_cnc_router_bit_radius']))
     if(c['int_buttress_z_width']>c['bell_face_height']/5.0):
-      print("ERR434: Error, int_buttress_z_width {:0.3f} is too big compare to bell_face_height {:0.3f}".format(c['int_buttress_z_width'], c['bell_face_height']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR434: Error, int_buttress_z_width {:0.3f} is too big compare to bell_face_height {:0.3f}".format(c['int_buttress_z_width'], c['bell_face_height']))
     # int_buttress_z_distance
     if(c['int_buttress_z_distance']<c['int_buttress_z_width']+radian_epsilon):
-      print("ERR438: Error, int_buttress_z_distance {:0.3f} must be bigger than int_buttress_z_width {:0.3f}".format(c['int_buttress_z_distance'], c['int_buttress_z_width']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR438: Error, int_buttress_z_distance {:0.3f} must be bigger than int_buttress_z_width {:0.3f}".format(c['int_buttress_z_distance'], c['int_buttress_z_width']))
     if(c['int_buttress_z_distance']>c['bell_face_height']-2*c['int_buttress_z_width']-radian_epsilon):
-      print("ERR441: Error, int_buttress_z_distance {:0.3f} is too big compare to bell_face_height {:0.3f} and int_buttress_z_width {:0.3f}".format(c['int_buttress_z_distance'], c['bell_face_height'], c['int_buttress_z_width']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR441: Error, int_buttress_z_distance {:0.3f} is too big compare to bell_face_height {:0.3f} and int_buttress_z_width {:0.3f}".format(c['int_buttress_z_distance'], c['bell_face_height'], c['int_buttress_z_width']))
     # int_buttress_x_position
     if(c['int_buttress_x_position']>c['bell_face_width']/2.0-c['face_thickness']-c['int_buttress_x_length']):
-      print("ERR445: Error, int_buttress_x_position {:0.3f} is too big compare to bell_face_width {:0.3f}, face_thickness {:0.3f} and int_buttress_x_length {:0.3f}".format(c['int_buttress_x_position'], c['bell_face_width'], c['face_thickness'], c['int_buttress_x_length']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR445: Error, int_buttress_x_position {:0.3f} is too big compare to bell_face_width {:0.3f}, face_thickness {:0.3f} and int_buttress_x_length {:0.3f}".format(c['int_buttress_x_position'], c['bell_face_width'], c['face_thickness'], c['int_buttress_x_length']))
     # int_buttress_z_position
     if(c['int_buttress_z_position']>c['bell_face_height']-c['int_buttress_z_distance']-c['int_buttress_z_width']-radian_epsilon):
-      print("ERR448: int_buttress_z_position {:0.3f} is too big compare to bell_face_height {:0.3f}, int_buttress_z_distance {:0.3f} and int_buttress_z_width {:0.3f}".format(c['int_buttress_z_position'], c['bell_face_height'], c['int_buttress_z_distance'], c['int_buttress_z_width']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR448: int_buttress_z_position {:0.3f} is too big compare to bell_face_height {:0.3f}, int_buttress_z_distance {:0.3f} and int_buttress_z_width {:0.3f}".format(c['int_buttress_z_position'], c['bell_face_height'], c['int_buttress_z_distance'], c['int_buttress_z_width']))
     # int_buttress_int_corner_length
     if(c['int_buttress_int_corner_length']>c['int_buttress_x_position']):
-      print("ERR453: Error, int_buttress_int_corner_length {:0.3f} must be smaller than int_buttress_x_position {:0.3f}".format(c['int_buttress_int_corner_length'], c['int_buttress_x_position']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR453: Error, int_buttress_int_corner_length {:0.3f} must be smaller than int_buttress_x_position {:0.3f}".format(c['int_buttress_int_corner_length'], c['int_buttress_x_position']))
     # int_buttress_ext_corner_length
     if(c['int_buttress_ext_corner_length']>c['bell_face_width']/2.0-c['face_thickness']-c['int_buttress_x_length']-c['int_buttress_x_position']):
-      print("ERR457: Error, int_buttress_ext_corner_length {:0.3f} is too big comapre to bell_face_width {:0.3f}, face_thickness {:0.3f}, int_buttress_x_length {:0.3f} and int_buttress_x_position {:0.3f}".format(c['int_buttress_ext_corner_length'], c['bell_face_width'], c['face_thickness'], c['int_buttress_x_length'], c['int_buttress_x_position']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR457: Error, int_buttress_ext_corner_length {:0.3f} is too big comapre to bell_face_width {:0.3f}, face_thickness {:0.3f}, int_buttress_x_length {:0.3f} and int_buttress_x_position {:0.3f}".format(c['int_buttress_ext_corner_length'], c['bell_face_width'], c['face_thickness'], c['int_buttress_x_length'], c['int_buttress_x_position']))
     # int_buttress_bump_length
     if(c['int_buttress_bump_length']>c['int_buttress_x_position']+c['int_buttress_x_length']):
-      print("ERR461: Error, int_buttress_bump_length {:0.3f} is too big compare to int_buttress_x_position {:0.3f} and int_buttress_x_length {:0.3f}".format(c['int_buttress_bump_length'], c['int_buttress_x_position'], c['int_buttress_x_length']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR461: Error, int_buttress_bump_length {:0.3f} is too big compare to int_buttress_x_position {:0.3f} and int_buttress_x_length {:0.3f}".format(c['int_buttress_bump_length'], c['int_buttress_x_position'], c['int_buttress_x_length']))
     # int_buttress_arc_height
     if(abs(c['int_buttress_arc_height'])>c['int_buttress_x_length']):
-      print("ERR465: Error, int_buttress_arc_height {:0.3f} absolute value must be smaller than int_buttress_x_length {:0.3f}".format(c['int_buttress_arc_height'], c['int_buttress_x_length']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR465: Error, int_buttress_arc_height {:0.3f} absolute value must be smaller than int_buttress_x_length {:0.3f}".format(c['int_buttress_arc_height'], c['int_buttress_x_length']))
     # int_buttress_smoothing_radius
     if(c['int_buttress_smoothing_radius']>c['int_buttress_bump_length']):
-      print("ERR469: Error, int_buttress_smoothing_radius {:0.3f} must be smaller than int_buttress_bump_length {:0.3f}".format(c['int_buttress_smoothing_radius'], c['int_buttress_bump_length']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR469: Error, int_buttress_smoothing_radius {:0.3f} must be smaller than int_buttress_bump_length {:0.3f}".format(c['int_buttress_smoothing_radius'], c['int_buttress_bump_length']))
   # ext_buttress_z_length
   if(c['ext_buttress_z_length']>c['bell_face_height']/3.0):
-    print("ERR473: Error, ext_buttress_z_length {:0.3f} is too big compare to bell_face_height {:0.3f}".format(c['ext_buttress_z_length'], c['bell_face_height']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR473: Error, ext_buttress_z_length {:0.3f} is too big compare to bell_face_height {:0.3f}".format(c['ext_buttress_z_length'], c['bell_face_height']))
   if(c['ext_buttress_z_length']>0):
     # ext_buttress_x_width
     if(c['ext_buttress_x_width']<3*c['bell_cnc_router_bit_radius']):
-      print("ERR478: Error, ext_buttress_x_width {:0.3f} is too small compare to bell_cnc_router_bit_radius {:0.3f}".format(c['ext_buttress_x_width'], c['bell_cnc_router_bit_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR478: Error, ext_buttress_x_width {:0.3f} is too small compare to bell_cnc_router_bit_radius {:0.3f}".format(c['ext_buttress_x_width'], c['bell_cnc_router_bit_radius']))
     if(c['ext_buttress_x_width']>c['bell_face_width']/5.0):
-      print("ERR481: Error, ext_buttress_x_width {:0.3f} is too big compare to bell_face_width {:0.3f}".format(c['ext_buttress_x_width'], c['bell_face_width']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR481: Error, ext_buttress_x_width {:0.3f} is too big compare to bell_face_width {:0.3f}".format(c['ext_buttress_x_width'], c['bell_face_width']))
     # ext_buttress_x_distance
     if(c['ext_buttress_x_distance']<radian_epsilon):
-      print("ERR485: Error, ext_buttress_x_distance {:0.3f} must be strictly positive".format(c['ext_buttress_x_distance']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR485: Error, ext_buttress_x_distance {:0.3f} must be strictly positive".format(c['ext_buttress_x_distance']))
     if(c['ext_buttress_x_distance']>c['bell_face_width']-2*c['ext_buttress_x_width']-2*c['face_thickness']):
-      print("ERR488: Error, ext_buttress_x_distance {:0.3f} is too big compare to bell_face_width {:0.3f} ext_buttress_x_width {:0.3f} and face_thickness {:0.3f}".format(c['ext_buttress_x_distance'], c['bell_face_width'], c['ext_buttress_x_width'], c['face_thickness']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR488: Error, ext_buttress_x_distance {:0.3f} is too big compare to bell_face_width {:0.3f} ext_buttress_x_width {:0.3f} and face_thickness {:0.3f}".format(c['ext_buttress_x_distance'], c['bell_face_width'], c['ext_buttress_x_width'], c['face_thickness']))
     # ext_buttress_z_position
     if(c['ext_buttress_z_position']>c['bell_face_height']+c['leg_length']-c['ext_buttress_z_length']):
-      print("ERR490: Error, ext_buttress_z_position {:0.3f} is too big compare to bell_face_height {:0.3f}, leg_length {:0.3f} and ext_buttress_z_length {:0.3f}".format(c['ext_buttress_z_position'], c['bell_face_height'], c['leg_length'], c['ext_buttress_z_length']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR490: Error, ext_buttress_z_position {:0.3f} is too big compare to bell_face_height {:0.3f}, leg_length {:0.3f} and ext_buttress_z_length {:0.3f}".format(c['ext_buttress_z_position'], c['bell_face_height'], c['leg_length'], c['ext_buttress_z_length']))
     # ext_buttress_y_length
     if(c['ext_buttress_y_length']>c['base_radius']-c['bell_face_width']/2.0):
-      print("ERR499: Error, ext_buttress_y_length {:0.3f} is too big compare to base_radius {:0.3f} and bell_face_width {:0.3f}".format(c['ext_buttress_y_length'], c['base_radius'], c['bell_face_width']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR499: Error, ext_buttress_y_length {:0.3f} is too big compare to base_radius {:0.3f} and bell_face_width {:0.3f}".format(c['ext_buttress_y_length'], c['base_radius'], c['bell_face_width']))
     # ext_buttress_y_position
     if(math.sqrt((c['ext_buttress_x_distance']/2.0+c['ext_buttress_x_width'])**2+(c['bell_face_width']/2.0+c['ext_buttress_y_position']+c['ext_buttress_y_length'])**2)>c['base_radius']):
-      print("ERR502: Error, ext_buttress_y_position {:0.3f} is too big compare to ext_buttress_x_distance {:0.3f}, ext_buttress_x_width {:0.3f}, bell_face_width {:0.3f}, ext_buttress_y_length {:0.3f} and base_radius {:0.3f}".format(c['ext_buttress_y_position'], c['ext_buttress_x_distance'], c['ext_buttress_x_width'], c['bell_face_width'], c['ext_buttress_y_length'], c['base_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR502: Error, ext_buttress_y_position {:0.3f} is too big compare to ext_buttress_x_distance {:0.3f}, ext_buttress_x_width {:0.3f}, bell_face_width {:0.3f}, ext_buttress_y_length {:0.3f} and base_radius {:0.3f}".format(c['ext_buttress_y_position'], c['ext_buttress_x_distance'], c['ext_buttress_x_width'], c['bell_face_width'], c['ext_buttress_y_length'], c['base_radius']))
     # ext_buttress_face_int_corner_length
     if(c['ext_buttress_face_int_corner_length']>c['ext_buttress_z_position']):
-      print("ERR507: Error, ext_buttress_face_int_corner_length {:0.3f} must be smaller than ext_buttress_z_position {:0.3f}".format(c['ext_buttress_face_int_corner_length'], c['ext_buttress_z_position']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR507: Error, ext_buttress_face_int_corner_length {:0.3f} must be smaller than ext_buttress_z_position {:0.3f}".format(c['ext_buttress_face_int_corner_length'], c['ext_buttress_z_position']))
     # ext_buttress_face_ext_corner_length
     if(c['ext_buttress_face_ext_corner_length']>c['bell_face_height']+c['leg_length']-c['ext_buttress_z_length']):
-      print("ext_buttress_face_ext_corner_length {:0.3f} is too big compare to bell_face_height {:0.3f}, leg_length {:0.3f} and ext_buttress_z_length {:0.3f}".format(c['ext_buttress_face_ext_corner_length'], c['bell_face_height'], c['leg_length'], c['ext_buttress_z_length']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ext_buttress_face_ext_corner_length {:0.3f} is too big compare to bell_face_height {:0.3f}, leg_length {:0.3f} and ext_buttress_z_length {:0.3f}".format(c['ext_buttress_face_ext_corner_length'], c['bell_face_height'], c['leg_length'], c['ext_buttress_z_length']))
     # ext_buttress_face_bump_length
     if(c['ext_buttress_face_bump_length']>c['ext_buttress_y_position']+c['ext_buttress_y_length']):
-      print("ERR515: Error, ext_buttress_face_bump_length {:0.3f} is too big compare to ext_buttress_y_position {:0.3f} and ext_buttress_y_length {:0.3f}".format(c['ext_buttress_face_bump_length'], c['ext_buttress_y_position'], c['ext_buttress_y_length']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR515: Error, ext_buttress_face_bump_length {:0.3f} is too big compare to ext_buttress_y_position {:0.3f} and ext_buttress_y_length {:0.3f}".format(c['ext_buttress_face_bump_length'], c['ext_buttress_y_position'], c['ext_buttress_y_length']))
     # ext_buttress_base_int_corner_length
     if(c['ext_buttress_base_int_corner_length']>c['ext_buttress_y_position']):
-      print("ERR519: Error, ext_buttress_base_int_corner_length {:0.3f} must be smaller than ext_buttress_y_position {:0.3f}".format(c['ext_buttress_base_int_corner_length'], c['ext_buttress_y_position']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR519: Error, ext_buttress_base_int_corner_length {:0.3f} must be smaller than ext_buttress_y_position {:0.3f}".format(c['ext_buttress_base_int_corner_length'], c['ext_buttress_y_position']))
     # ext_buttress_base_ext_corner_length
     if(c['ext_buttress_base_ext_corner_length']>c['base_radius']-(c['bell_face_width']/2.0+c['ext_buttress_y_position']+c['ext_buttress_y_length'])):
-      print("ERR523: Error, ext_buttress_base_ext_corner_length {:0.3f} is too big compare to base_radius {:0.3f}, bell_face_width {:0.3f}, ext_buttress_y_position {:0.3f} and ext_buttress_y_length {:0.3f}".format(c['ext_buttress_base_ext_corner_length'], c['base_radius'], c['bell_face_width'], c['ext_buttress_y_position'], c['ext_buttress_y_length']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR523: Error, ext_buttress_base_ext_corner_length {:0.3f} is too big compare to base_radius {:0.3f}, bell_face_width {:0.3f}, ext_buttress_y_position {:0.3f} and ext_buttress_y_length {:0.3f}".format(c['ext_buttress_base_ext_corner_length'], c['base_radius'], c['bell_face_width'], c['ext_buttress_y_position'], c['ext_buttress_y_length']))
     # ext_buttress_base_bump_length
     if(c['ext_buttress_base_bump_length']>c['ext_buttress_z_position']+c['ext_buttress_z_length']):
-      print("ERR527: Error, ext_buttress_base_bump_length {:0.3f} is too big compare to ext_buttress_z_position {:0.3f} and ext_buttress_z_length {:0.3f}".format(c['ext_buttress_base_bump_length'], c['ext_buttress_z_position'], c['ext_buttress_z_length']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR527: Error, ext_buttress_base_bump_length {:0.3f} is too big compare to ext_buttress_z_position {:0.3f} and ext_buttress_z_length {:0.3f}".format(c['ext_buttress_base_bump_length'], c['ext_buttress_z_position'], c['ext_buttress_z_length']))
     # ext_buttress_arc_height
     if(abs(c['ext_buttress_arc_height'])>max(c['ext_buttress_z_length'], c['ext_buttress_y_length'])):
-      print("ERR531: Error, ext_buttress_arc_height {:0.3f} absolute value is too big compare to ext_buttress_z_length {:0.3f} and ext_buttress_y_length {:0.3f}".format(c['ext_buttress_arc_height'], c['ext_buttress_z_length'], c['ext_buttress_y_length']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR531: Error, ext_buttress_arc_height {:0.3f} absolute value is too big compare to ext_buttress_z_length {:0.3f} and ext_buttress_y_length {:0.3f}".format(c['ext_buttress_arc_height'], c['ext_buttress_z_length'], c['ext_buttress_y_length']))
     # ext_buttress_smoothing_radius
     if(c['ext_buttress_smoothing_radius']>max(c['ext_buttress_face_bump_length'], c['ext_buttress_base_bump_length'])):
-      print("ERR535: Error, ext_buttress_smoothing_radius {:0.3f} is too big compare to ext_buttress_face_bump_length {:0.3f} and ext_buttress_base_bump_length {:0.3f}".format(c['ext_buttress_smoothing_radius'], c['ext_buttress_face_bump_length'], c['ext_buttress_base_bump_length']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR535: Error, ext_buttress_smoothing_radius {:0.3f} is too big compare to ext_buttress_face_bump_length {:0.3f} and ext_buttress_base_bump_length {:0.3f}".format(c['ext_buttress_smoothing_radius'], c['ext_buttress_face_bump_length'], c['ext_buttress_base_bump_length']))
   # hollow_z_height
   if(c['hollow_z_height']>c['bell_face_height']):
-    print("ERR539: Error, hollow_z_height {:0.3f} must be smaller than bell_face_height {:0.3f}".format(c['hollow_z_height'], c['bell_face_height']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR539: Error, hollow_z_height {:0.3f} must be smaller than bell_face_height {:0.3f}".format(c['hollow_z_height'], c['bell_face_height']))
   # hollow_y_width
   if(c['hollow_y_width']<2*c['bell_cnc_router_bit_radius']):
-    print("ERR543: Error, hollow_y_width {:0.3f} is too small compare to bell_cnc_router_bit_radius {:0.3f}".format(c['hollow_y_width'], c['bell_cnc_router_bit_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR543: Error, hollow_y_width {:0.3f} is too small compare to bell_cnc_router_bit_radius {:0.3f}".format(c['hollow_y_width'], c['bell_cnc_router_bit_radius']))
   if(c['hollow_y_width']>c['bell_face_width']-2*c['face_thickness']):
-    print("ERR546: Error, hollow_y_width {:0.3f} is too big compare to bell_face_width {:0.3f} and face_thickness {:0.3f}".format(c['hollow_y_width'], c['bell_face_width'], c['face_thickness']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR546: Error, hollow_y_width {:0.3f} is too big compare to bell_face_width {:0.3f} and face_thickness {:0.3f}".format(c['hollow_y_width'], c['bell_face_width'], c['face_thickness']))
   # hollow_spare_width
   if(c['hollow_spare_width']>c['bell_face_width']/2-c['face_thickness']-c['hollow_y_width']/2.0):
-    print("ERR550: Error, hollow_spare_width {:0.3f} is too big compare to bell_face_width {:0.3f}, face_thickness {:0.3f} and hollow_y_width {:0.3f}".format(c['hollow_spare_width'], c['bell_face_width'], c['face_thickness'], c['hollow_y_width']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR550: Error, hollow_spare_width {:0.3f} is too big compare to bell_face_width {:0.3f}, face_thickness {:0.3f} and hollow_y_width {:0.3f}".format(c['hollow_spare_width'], c['bell_face_width'], c['face_thickness'], c['hollow_y_width']))
   # base_hole_nb
   if(c['base_hole_nb']>0):
     # base_hole_diameter
     c['base_hole_radius'] = c['base_hole_diameter']/2.0
     if(c['base_hole_radius']<radian_epsilon):
-      print("ERR556: Error, base_hole_radius {:0.3f} must be strictly positive".format(c['base_hole_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR556: Error, base_hole_radius {:0.3f} must be strictly positive".format(c['base_hole_radius']))
     # base_hole_position_diameter
     c['base_hole_position_radius'] = c['base_hole_position_diameter']/2.0
     if(c['base_hole_position_radius']==0):
       c['base_hole_position_radius'] = c['base_radius'] - 2*c['base_hole_radius']
     if(c['base_hole_position_radius']<c['bell_face_width']/2.0):
-      print("ERR564: Error, base_hole_position_radius {:0.3f} is too small compare to bell_face_width {:0.3f}".format(c['base_hole_position_radius'], c['bell_face_width']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR564: Error, base_hole_position_radius {:0.3f} is too small compare to bell_face_width {:0.3f}".format(c['base_hole_position_radius'], c['bell_face_width']))
     if(c['base_hole_position_radius']>c['base_radius']-c['base_hole_radius']):
-      print("ERR567: Error, base_hole_position_radius {:0.3f} is too big compare to base_radius {:0.3f} and base_hole_radius {:0.3f}".format(c['base_hole_position_radius'], c['base_radius'], c['base_hole_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR567: Error, base_hole_position_radius {:0.3f} is too big compare to base_radius {:0.3f} and base_hole_radius {:0.3f}".format(c['base_hole_position_radius'], c['base_radius'], c['base_hole_radius']))
     # base_hole_angle
   # y_hole_diameter
   c['y_hole_radius'] = c['y_hole_diameter']/2.0
   if(c['y_hole_radius']>0):
     # y_hole_z_top_position
     if(abs(c['y_hole_z_top_position'])>c['bell_face_height']):
-      print("ERR575: Error, y_hole_z_top_position {:0.3f} absolute value is too big compare to bell_face_height {:0.3f}".format(c['y_hole_z_top_position'], c['bell_face_height']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR575: Error, y_hole_z_top_position {:0.3f} absolute value is too big compare to bell_face_height {:0.3f}".format(c['y_hole_z_top_position'], c['bell_face_height']))
     if(c['y_hole_z_top_position']>0):
       if(c['y_hole_z_top_position']<c['int_buttress_z_width']+c['y_hole_radius']):
-        print("ERR580: Error, positive y_hole_z_top_position {:0.3f} is too small compare to int_buttress_z_width {:0.3f} and y_hole_radius {:0.3f}".format(c['y_hole_z_top_position'], c['int_buttress_z_width'], c['y_hole_radius']))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR580: Error, positive y_hole_z_top_position {:0.3f} is too small compare to int_buttress_z_width {:0.3f} and y_hole_radius {:0.3f}".format(c['y_hole_z_top_position'], c['int_buttress_z_width'], c['y_hole_radius']))
     else:
       if(c['y_hole_z_top_position']>-1*c['y_hole_radius']):
-        print("ERR584: Error, negative y_hole_z_top_position {:0.3f} must be smaller than y_hole_radius {:0.3f}".format(c['y_hole_z_top_position'], -1*c['y_hole_radius']))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR584: Error, negative y_hole_z_top_position {:0.3f} must be smaller than y_hole_radius {:0.3f}".format(c['y_hole_z_top_position'], -1*c['y_hole_radius']))
     # y_hole_z_bottom_position
     if(abs(c['y_hole_z_bottom_position'])>c['bell_face_height']):
-      print("ERR575: Error, y_hole_z_bottom_position {:0.3f} absolute value is too big compare to bell_face_height {:0.3f}".format(c['y_hole_z_bottom_position'], c['bell_face_height']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR575: Error, y_hole_z_bottom_position {:0.3f} absolute value is too big compare to bell_face_height {:0.3f}".format(c['y_hole_z_bottom_position'], c['bell_face_height']))
     if(c['y_hole_z_bottom_position']>0):
       if(c['y_hole_z_bottom_position']<c['int_buttress_z_width']+c['y_hole_radius']):
-        print("ERR580: Error, positive y_hole_z_bottom_position {:0.3f} is too small compare to int_buttress_z_width {:0.3f} and y_hole_radius {:0.3f}".format(c['y_hole_z_bottom_position'], c['int_buttress_z_width'], c['y_hole_radius']))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR580: Error, positive y_hole_z_bottom_position {:0.3f} is too small compare to int_buttress_z_width {:0.3f} and y_hole_radius {:0.3f}".format(c['y_hole_z_bottom_position'], c['int_buttress_z_width'], c['y_hole_radius']))
     else:
       if(c['y_hole_z_bottom_position']>-1*c['y_hole_radius']):
-        print("ERR584: Error, negative y_hole_z_bottom_position {:0.3f} must be smaller than y_hole_radius {:0.3f}".format(c['y_hole_z_bottom_position'], -1*c['y_hole_radius']))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR584: Error, negative y_hole_z_bottom_position {:0.3f} must be smaller than y_hole_radius {:0.3f}".format(c['y_hole_z_bottom_position'], -1*c['y_hole_radius']))
     # y_hole_x_position
     if(c['y_hole_x_position']<c['y_hole_radius']):
-      print("ERR588: Error, y_hole_x_position {:0.3f} is too small compare to y_hole_radius {:0.3f}".format(c['y_hole_x_position'], c['y_hole_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR588: Error, y_hole_x_position {:0.3f} is too small compare to y_hole_radius {:0.3f}".format(c['y_hole_x_position'], c['y_hole_radius']))
     if(c['y_hole_x_position']>c['bell_face_width']/2.0-c['side_thickness']):
-      print("ERR591: Error, y_hole_x_position {:0.3f} is too big compare to bell_face_width {:0.3f} and side_thickness {:0.3f}".format(c['y_hole_x_position'], c['bell_face_width'], c['side_thickness']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR591: Error, y_hole_x_position {:0.3f} is too big compare to bell_face_width {:0.3f} and side_thickness {:0.3f}".format(c['y_hole_x_position'], c['bell_face_width'], c['side_thickness']))
   # x_hole_diameter
   c['x_hole_radius'] = c['x_hole_diameter']/2.0
   if(c['x_hole_radius']>0):
     # x_hole_z_top_position
     if(abs(c['x_hole_z_top_position'])>c['bell_face_height']):
-      print("ERR598: Error, x_hole_z_top_position {:0.3f} absolute value is too big compare to bell_face_height {:0.3f}".format(c['x_hole_z_top_position'], c['bell_face_height']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR598: Error, x_hole_z_top_position {:0.3f} absolute value is too big compare to bell_face_height {:0.3f}".format(c['x_hole_z_top_position'], c['bell_face_height']))
     if(c['x_hole_z_top_position']>0):
       if(c['x_hole_z_top_position']<c['int_buttress_z_width']+c['x_hole_radius']):
-        print("ERR580: Error, positive x_hole_z_top_position {:0.3f} is too small compare to int_buttress_z_width {:0.3f} and x_hole_radius {:0.3f}".format(c['x_hole_z_top_position'], c['int_buttress_z_width'], c['x_hole_radius']))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR580: Error, positive x_hole_z_top_position {:0.3f} is too small compare to int_buttress_z_width {:0.3f} and x_hole_radius {:0.3f}".format(c['x_hole_z_top_position'], c['int_buttress_z_width'], c['x_hole_radius']))
     else:
       if(c['x_hole_z_top_position']>-1*c['x_hole_radius']):
-        print("ERR584: Error, negative x_hole_z_top_position {:0.3f} must be smaller than x_hole_radius {:0.3f}".format(c['x_hole_z_top_position'], -1*c['x_hole_radius']))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR584: Error, negative x_hole_z_top_position {:0.3f} must be smaller than x_hole_radius {:0.3f}".format(c['x_hole_z_top_position'], -1*c['x_hole_radius']))
     # x_hole_z_bottom_position
     if(abs(c['x_hole_z_bottom_position'])>c['bell_face_height']):
-      print("ERR598: Error, x_hole_z_bottom_position {:0.3f} absolute value is too big compare to bell_face_height {:0.3f}".format(c['x_hole_z_bottom_position'], c['bell_face_height']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR598: Error, x_hole_z_bottom_position {:0.3f} absolute value is too big compare to bell_face_height {:0.3f}".format(c['x_hole_z_bottom_position'], c['bell_face_height']))
     if(c['x_hole_z_bottom_position']>0):
       if(c['x_hole_z_bottom_position']<c['int_buttress_z_width']+c['x_hole_radius']):
-        print("ERR580: Error, positive x_hole_z_bottom_position {:0.3f} is too small compare to int_buttress_z_width {:0.3f} and x_hole_radius {:0.3f}".format(c['x_hole_z_bottom_position'], c['int_buttress_z_width'], c['x_hole_radius']))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR580: Error, positive x_hole_z_bottom_position {:0.3f} is too small compare to int_buttress_z_width {:0.3f} and x_hole_radius {:0.3f}".format(c['x_hole_z_bottom_position'], c['int_buttress_z_width'], c['x_hole_radius']))
     else:
       if(c['x_hole_z_bottom_position']>-1*c['x_hole_radius']):
-        print("ERR584: Error, negative x_hole_z_bottom_position {:0.3f} must be smaller than x_hole_radius {:0.3f}".format(c['x_hole_z_bottom_position'], -1*c['x_hole_radius']))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR584: Error, negative x_hole_z_bottom_position {:0.3f} must be smaller than x_hole_radius {:0.3f}".format(c['x_hole_z_bottom_position'], -1*c['x_hole_radius']))
     # x_hole_y_position
     if(c['x_hole_y_position']<c['x_hole_radius']):
-      print("ERR588: Error, x_hole_y_position {:0.3f} is too small compare to x_hole_radius {:0.3f}".format(c['x_hole_y_position'], c['x_hole_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR588: Error, x_hole_y_position {:0.3f} is too small compare to x_hole_radius {:0.3f}".format(c['x_hole_y_position'], c['x_hole_radius']))
     if(c['x_hole_y_position']>c['bell_face_width']/2.0-c['side_thickness']):
-      print("ERR591: Error, x_hole_y_position {:0.3f} is too big compare to bell_face_width {:0.3f} and side_thickness {:0.3f}".format(c['x_hole_y_position'], c['bell_face_width'], c['side_thickness']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR591: Error, x_hole_y_position {:0.3f} is too big compare to bell_face_width {:0.3f} and side_thickness {:0.3f}".format(c['x_hole_y_position'], c['bell_face_width'], c['side_thickness']))
   # z_hole_diameter
   c['z_hole_radius'] = c['z_hole_diameter']/2.0
   # z_hole_external_diameter
@@ -542,19 +469,15 @@ def bell_constraint_check(c):
     c['z_hole_external_radius'] = 2*c['z_hole_radius']
   # z_hole_position_length
   if(c['z_hole_position_length']<math.sqrt(2)*c['z_hole_radius']):
-    print("ERR623: Error, z_hole_position_length {:0.3f} is too small compare to z_hole_radius {:0.3f}".format(c['z_hole_position_length'], c['z_hole_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR623: Error, z_hole_position_length {:0.3f} is too small compare to z_hole_radius {:0.3f}".format(c['z_hole_position_length'], c['z_hole_radius']))
   if(c['z_hole_position_length']>c['bell_face_width']/2.0):
-    print("ERR626: Error, z_hole_position_length {:0.3f} is too big compare to bell_face_width {:0.3f}".format(c['z_hole_position_length'], c['bell_face_width']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR626: Error, z_hole_position_length {:0.3f} is too big compare to bell_face_width {:0.3f}".format(c['z_hole_position_length'], c['bell_face_width']))
   # bell_cnc_router_bit_radius
   if(c['bell_cnc_router_bit_radius']>min(c['face_thickness'], c['side_thickness'], c['base_thickness'])/2.0):
-    print("ERR634: Error, bell_cnc_router_bit_radius {:0.3f} is too big compare to face_thickness {:0.3f}, side_thickness {:0.3f} or base_thickness {:0.3f}".format(c['bell_cnc_router_bit_radius'], c['face_thickness'], c['side_thickness'], c['base_thickness']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR634: Error, bell_cnc_router_bit_radius {:0.3f} is too big compare to face_thickness {:0.3f}, side_thickness {:0.3f} or base_thickness {:0.3f}".format(c['bell_cnc_router_bit_radius'], c['face_thickness'], c['side_thickness'], c['base_thickness']))
   # bell_extra_cut_thickness
   if(c['bell_extra_cut_thickness']>min(c['bell_face_width'], c['bell_face_height'])/10.0):
-    print("ERR630: Error, bell_extra_cut_thickness {:0.3f} is too big compare to bell_face_width {:0.3f} and bell_face_height {:0.3f}".format(c['bell_extra_cut_thickness'], c['bell_face_width'], c['bell_face_height']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR630: Error, bell_extra_cut_thickness {:0.3f} is too big compare to bell_face_width {:0.3f} and bell_face_height {:0.3f}".format(c['bell_extra_cut_thickness'], c['bell_face_width'], c['bell_face_height']))
   ## intermediate parameters
   c['f_w2'] = c['bell_face_width']/2.0
   c['ib_x_zero'] = c['int_buttress_ext_corner_length']
@@ -896,8 +819,7 @@ def bell_cli_return_type(return_type, c):
   elif(return_type=='figures_3dconf_info'):
     r_b = (figures['part_list'], assembly_conf['bell_assembly_conf1'], b_info)
   else:
-    print("ERR508: Error the return_type {:s} is unknown".format(return_type))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR508: Error the return_type {:s} is unknown".format(return_type))
   return(r_b)
 
 ################################################################
@@ -962,9 +884,9 @@ class bell(cnc25d_api.bare_design):
 
 # this works with python and freecad :)
 if __name__ == "__main__":
-  FreeCAD.Console.PrintMessage("bell.py says hello!\n")
+  print("bell.py says hello!")
   my_b = bell()
-  my_b.cli()
+  cnc25d_api.cli_shim(my_b.cli)
   if(cnc25d_api.interpretor_is_freecad()):
     #b_value = my_b.cli("--bell_extra_cut_thickness 1.0 --return_type freecad_object") # old fashion
     #Part.show(b_value)
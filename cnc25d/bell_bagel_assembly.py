@@ -30,7 +30,7 @@ The main function displays in a Tk-interface the bell_bagel parts, or generates
 ################################################################
 
 import cnc25d_api
-cnc25d_api.importing_freecad()
+#cnc25d_api.importing_freecad() # FreeCAD is imported on first use by lazy_import
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -46,7 +46,7 @@ import sys, argparse
 #import re # to detect .dxf or .svg
 #import Tkinter # to display the outline in a small GUI
 #
-import Part
+from lazy_import import Part
 #from FreeCAD import Base
 # 3rd parties
 #import svgwrite
@@ -117,40 +117,35 @@ def bba_constraint_check(c):
   # bagel_axle_diameter
   c['bagel_axle_radius'] = c['bagel_axle_diameter']/2.0
   if(c['bagel_axle_radius']<radian_epsilon):
-    print("ERR125: Error, bagel_axle_radius {:0.3f} is too small".format(c['bagel_axle_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR125: Error, bagel_axle_radius {:0.3f} is too small".format(c['bagel_axle_radius']))
   c['bagel_axle_diameter'] = 2*c['bagel_axle_radius']
   # bagel_axle_internal_diameter
   c['bagel_axle_internal_radius'] = c['bagel_axle_internal_diameter']/2.0
   if(c['bagel_axle_internal_radius']==0):
     c['bagel_axle_internal_radius'] = 2*c['bagel_axle_radius']
   if(c['bagel_axle_internal_radius']<c['bagel_axle_radius']):
-    print("ERR132: Error, bagel_axle_internal_radius {:0.3f} must be bigger than bagel_axle_radius {:0.3f}".format(c['bagel_axle_internal_radius'], c['bagel_axle_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR132: Error, bagel_axle_internal_radius {:0.3f} must be bigger than bagel_axle_radius {:0.3f}".format(c['bagel_axle_internal_radius'], c['bagel_axle_radius']))
   c['bagel_axle_internal_diameter'] = 2*c['bagel_axle_internal_radius']
   # bagel_axle_external_diameter
   c['bagel_axle_external_radius'] = c['bagel_axle_external_diameter']/2.0
   if(c['bagel_axle_external_radius']==0):
     c['bagel_axle_external_radius'] = 2*c['bagel_axle_internal_radius']
   if(c['bagel_axle_external_radius']<c['bagel_axle_internal_radius']+radian_epsilon):
-    print("ERR139: Error, bagel_axle_external_radius {:0.3f} must be bigger than bagel_axle_internal_radius {:0.3f}".format(c['bagel_axle_external_radius'], c['bagel_axle_internal_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR139: Error, bagel_axle_external_radius {:0.3f} must be bigger than bagel_axle_internal_radius {:0.3f}".format(c['bagel_axle_external_radius'], c['bagel_axle_internal_radius']))
   c['bagel_axle_external_diameter'] = 2*c['bagel_axle_external_radius']
   # axle_internal_diameter
   c['axle_internal_radius'] = c['axle_internal_diameter']/2.0
   if(c['axle_internal_radius']==0):
     c['axle_internal_radius'] = c['bagel_axle_internal_radius']
   if(c['axle_internal_radius']<c['bagel_axle_radius']):
-    print("ERR146: Error, axle_internal_radius {:0.3f} must be bigger than bagel_axle_radius {:0.3f}".format(c['axle_internal_radius'], c['bagel_axle_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR146: Error, axle_internal_radius {:0.3f} must be bigger than bagel_axle_radius {:0.3f}".format(c['axle_internal_radius'], c['bagel_axle_radius']))
   c['axle_internal_diameter'] = 2*c['axle_internal_radius']
   # axle_external_diameter
   c['axle_external_radius'] = c['axle_external_diameter']/2.0
   if(c['axle_external_radius']==0):
     c['axle_external_radius'] = 2*c['axle_internal_radius']
   if(c['axle_external_radius']<c['axle_internal_radius']+radian_epsilon):
-    print("ERR139: Error, axle_external_radius {:0.3f} must be bigger than axle_internal_radius {:0.3f}".format(c['axle_external_radius'], c['axle_internal_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR139: Error, axle_external_radius {:0.3f} must be bigger than axle_internal_radius {:0.3f}".format(c['axle_external_radius'], c['axle_internal_radius']))
   c['axle_external_diameter'] = 2*c['axle_external_radius']
   ### sub-design check
   #i_bell = inherit_bell(c)
@@ -333,10 +328,10 @@ class bba(cnc25d_api.bare_design):
 
 # this works with python and freecad :)
 if __name__ == "__main__":
-  FreeCAD.Console.PrintMessage("bell_bagel_assembly.py says hello!\n")
+  print("bell_bagel_assembly.py says hello!")
   my_bba = bba()
   #my_bba.cli()
-  my_bba.cli("--bell_extra_cut_thickness 1.0 --bagel_extra_cut_thickness 1.0")
+  cnc25d_api.cli_shim(my_bba.cli, "--bell_extra_cut_thickness 1.0 --bagel_extra_cut_thickness 1.0")
   if(cnc25d_api.interpretor_is_freecad()):
     #my_bba.apply_cli("--bell_extra_cut_thickness 1.0 --bagel_extra_cut_thickness 1.0")
     #my_bba.outline_display()
@@ -73,8 +73,7 @@ def bell_face_side_holes(ai_c, ai_type):
     axle_hole_y_bottom_position = ai_c['x_hole_z_bottom_position']
     axle_hole_x_position = ai_c['x_hole_y_position']
   else:
-    print("ERR065: Error, ")
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR065: Error, ")
   ### intermediate parameters
   int_buttress_x1 = -1*ai_c['bell_face_width']/2.0 + wall_thickness + ai_c['int_buttress_x_position']
   int_buttress_x2 = -1*int_buttress_x1 - ai_c['int_buttress_x_length']
@@ -134,9 +133,8 @@ def bell_face_outline(ai_c):
   lAC = math.sqrt(lAB**2+lBC**2)
   cos_aBAC = float(lAB)/lAC
   if(abs(cos_aBAC)>1):
-    print("ERR063: Error, cos_aBAC {:0.3f} is out of the range -1..1".format(cos_aBAC))
     print("dbg064: lAC {:0.3f}  lAB {:0.3f}".format(lAC, lAB))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR063: Error, cos_aBAC {:0.3f} is out of the range -1..1".format(cos_aBAC))
   aBAC = math.acos(cos_aBAC)
   #lAD = math.sqrt(lAC**2-lCD**2)
   aCAD = math.asin(float(lCD)/lAC)
@@ -166,8 +164,7 @@ def bell_face_outline(ai_c):
     # angle (Gx, GH)
     axGH = math.atan2(Hy-Gy, Hx-Gx)
     if(abs(axGH+leg_ext_axle_angle)>radian_epsilon): # check axGH
-      print("ERR097: Error, axGH {:0.3f} is not equal to -1*leg_ext_axle_angle {:0.3f}".format(axGH, leg_ext_axle_angle))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR097: Error, axGH {:0.3f} is not equal to -1*leg_ext_axle_angle {:0.3f}".format(axGH, leg_ext_axle_angle))
     # angle (Gx, GE)
     axGE = math.atan2(Ey-Gy, Ex-Gx)
     # angle (Gx, GI)
@@ -359,13 +356,11 @@ def bell_base_main_hole_outline(ai_c):
     lCB = math.sqrt(lAB**2+lAC**2-2*lAB*lAC*math.cos(aBAC)) # law of cosines in the triangle ABC
     cos_aACB = (lCB**2+lAC**2-lAB**2)/(2*lCB*lAC)
     if(abs(cos_aACB)>1):
-      print("ERR359: Error, cos_aACB {:0.3f} is out of the range -1..1".format(cos_aACB))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR359: Error, cos_aACB {:0.3f} is out of the range -1..1".format(cos_aACB))
     aACB = math.acos(cos_aACB)
     cos_aBCD = lCD/lCB
     if(abs(cos_aBCD)>1):
-      print("ERR364: Error, cos_aBCD {:0.3f} is out of the range -1..1".format(cos_aBCD))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR364: Error, cos_aBCD {:0.3f} is out of the range -1..1".format(cos_aBCD))
     aBCD = math.acos(cos_aBCD)
     aACD = aACB + aBCD
     #print("dbg370: aACB {:0.3f}  aBCD {:0.3f}  aACD {:0.3f}".format(aACB, aBCD, aACD))
@@ -581,8 +576,7 @@ def bell_external_buttress(ai_c, ai_type):
   elif(ai_type=='side'):
     wall_thickness = ai_c['side_thickness']
   else:
-    print("ERR527: Error, ai_type {:s} doesn't exist".format(ai_type))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR527: Error, ai_type {:s} doesn't exist".format(ai_type))
   ### outline construction
   b_p = {}
   b_p['vertical_crenel_length']       = ai_c['ext_buttress_z_length']
@@ -32,7 +32,7 @@ It's a rewrite of the script box_wood_frame_ng.py using bare_design.py
 #import importing_freecad
 #importing_freecad.importing_freecad()
 import cnc25d_api
-cnc25d_api.importing_freecad()
+#cnc25d_api.importing_freecad() # FreeCAD is imported on first use by lazy_import
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -49,7 +49,7 @@ import sys, argparse
 #
 from box_wood_frame_outline import *
 #
-import Part
+from lazy_import import Part
 #from FreeCAD import Base
 
 
@@ -137,8 +137,7 @@ def bwf_constraint_check(c):
   ## check parameter coherence
   minimal_thickness = 5.0 # only used to check the parameter coherence
   if( (c['plank_height'] + c['v_plank_width'] + c['wall_diagonal_size'] + c['d_plank_height']*math.sqrt(2) + minimal_thickness) > c['box_width']/2 ):
-    print("ERR601: Error of parameter coherence. Reduce wall_diagonal_size!\n")
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR601: Error of parameter coherence. Reduce wall_diagonal_size!\n")
   ## reassigned zero value minor parameters
   ai_tobo_diag_depth=0 # that was previously an argument
   if(ai_tobo_diag_depth==0):
@@ -580,11 +579,11 @@ class box_wood_frame(cnc25d_api.bare_design):
 
 # this works with python and freecad :)
 if __name__ == "__main__":
-  FreeCAD.Console.PrintMessage("box_wood_frame says hello!\n")
+  print("box_wood_frame says hello!")
   my_bwf = box_wood_frame()
   #my_bwf.cli()
   #my_bwf.cli("--box_height 600.0")
-  my_bwf.cli("--module_width 1")
+  cnc25d_api.cli_shim(my_bwf.cli, "--module_width 1")
   if(cnc25d_api.interpretor_is_freecad()):
     Part.show(my_bwf.get_fc_obj_3dconf('bwf_3dconf1'))
 
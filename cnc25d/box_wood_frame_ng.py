@@ -34,7 +34,7 @@ The function return a FreeCAD Part object of the assembled object.
 #import importing_freecad
 #importing_freecad.importing_freecad()
 import cnc25d_api
-cnc25d_api.importing_freecad()
+#cnc25d_api.importing_freecad() # FreeCAD is imported on first use by lazy_import
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -53,8 +53,8 @@ import os
 #import cnc_cut_outline
 #import export_2d
 #
-import Part
-from FreeCAD import Base
+from lazy_import import Part
+from lazy_import import Base
 
 ################################################################
 # box_wood_frame dictionary-constraint-arguments default values
@@ -171,8 +171,7 @@ def box_wood_frame(ai_constraints):
   bwf_c.update(ai_constraints)
   print("dbg155: bwf_c:", bwf_c)
   if(len(bwf_c.viewkeys() & bwfdi.viewkeys()) != len(bwf_c.viewkeys() | bwfdi.viewkeys())): # check if the dictionary bwf_c has exactly all the keys compare to box_wood_frame_dictionary_init()
-    print("ERR157: Error, bwf_c has too much entries as {:s} or missing entries as {:s}".format(bwf_c.viewkeys() - bwfdi.viewkeys(), bwfdi.viewkeys() - bwf_c.viewkeys()))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR157: Error, bwf_c has too much entries as {:s} or missing entries as {:s}".format(bwf_c.viewkeys() - bwfdi.viewkeys(), bwfdi.viewkeys() - bwf_c.viewkeys()))
   #print("dbg164: new box_wood_frame constraints:")
   #for k in bwf_c.viewkeys():
   #  if(bwf_c[k] != bwfdi[k]):
@@ -895,8 +894,7 @@ def box_wood_frame(ai_constraints):
     elif(nai_plank_name=="slab58_front"):
       r_plank = slab_front(nai_cutting_extra)
     else:
-      print("ERR115: Error, the plank_name {:s} doesn't exist".format(nai_plank_name))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR115: Error, the plank_name {:s} doesn't exist".format(nai_plank_name))
     return(r_plank)
   def place_plank_generic(nai_plank_name, nai_module_width, nai_cutting_extra, ai_flip, ai_orientation, ai_position_x, ai_position_y, ai_position_z):
     """ Wrapper function to place any planks in a cuboid construction
@@ -1163,8 +1161,7 @@ def box_wood_frame(ai_constraints):
       elif(l_orientation=='yx'):
         l_inc_x = 1
       else:
-        print("ERR564: the l_orientation {:s} doesn't exist!".format(l_orientation))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR564: the l_orientation {:s} doesn't exist!".format(l_orientation))
       for li in range(l_plank_desc[lp][3]):
         r_batch.append(place_plank_generic(lp, nai_module_width, nai_cutting_extra, 'i', l_orientation, l_pos_x, l_pos_y, ai_ini_z))
         l_pos_x = l_pos_x + l_inc_x*(l_plank_desc[lp][1]+ai_step_x)
@@ -1738,8 +1735,7 @@ for plank section : plank_type_nb plank_nb total_length  : Accumulation: plank_t
     #r_bwf = frame_assembly(ai_module_width,ai_cutting_extra,0)
     #Part.show(r_bwf)
   else:
-    print("ERR736: Error, return_type {:s} is unknown".format(bwf_c['return_type']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR736: Error, return_type {:s} is unknown".format(bwf_c['return_type']))
   #r_bwf.exportStl("bwf_assembly.stl")
   #r_bwf = plank_tobo_diagonal(0)
   #r_bwf.exportBrep("plank_tobo_diagonal.brep")
@@ -1856,7 +1852,7 @@ def box_wood_frame_cli(ai_args=""):
 
 # this works with python and freecad :)
 if __name__ == "__main__":
-  FreeCAD.Console.PrintMessage("box_wood_frame says hello!\n")
+  print("box_wood_frame says hello!")
   #my_bwf = box_wood_frame_cli()
   #my_bwf = box_wood_frame_cli("--box_height 600.0 --return_type freecad_object")
   my_bwf = box_wood_frame_cli("--box_height 600.0")
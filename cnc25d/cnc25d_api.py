@@ -29,12 +29,20 @@ to be used by the design examples or external scripts
 # import
 ################################################################
 
+import cnc25d_error
 import importing_freecad
+import lazy_import
 import cnc_outline
+import outline_array
 import outline_backends
 import positioning
+import positioning_matrix
+import mesh_extrusion
+import analytic_slicer
 import export_2d
 import design_output
+import design_profile
+import headless_display
 import design_help
 import bare_design
 import design_frontend
@@ -44,9 +52,22 @@ import draw_2d_frontend
 # api function alias
 ################################################################
 
+# from cnc25d_error
+Cnc25dError = cnc25d_error.Cnc25dError
+Cnc25dOutlineError = cnc25d_error.Cnc25dOutlineError
+Cnc25dBackendError = cnc25d_error.Cnc25dBackendError
+Cnc25dDesignError = cnc25d_error.Cnc25dDesignError
+Cnc25dConstraintError = cnc25d_error.Cnc25dConstraintError
+cli_shim = cnc25d_error.cli_shim
+
 # from importing_freecad
 importing_freecad = importing_freecad.importing_freecad
 
+# from lazy_import
+Lazy_Module = lazy_import.Lazy_Module
+import_time_report = lazy_import.import_time_report
+check_import_time_budget = lazy_import.check_import_time_budget
+
 # from cnc_cut_outline
 outline_shift_x = cnc_outline.outline_shift_x
 outline_shift_y = cnc_outline.outline_shift_y
@@ -55,21 +76,43 @@ outline_rotate = cnc_outline.outline_rotate
 outline_close = cnc_outline.outline_close
 outline_reverse = cnc_outline.outline_reverse
 cnc_cut_outline = cnc_outline.cnc_cut_outline
+cnc_cut_outline_batch = cnc_outline.cnc_cut_outline_batch
+corner_cache_setup = cnc_outline.corner_cache_setup
+corner_cache_clear = cnc_outline.corner_cache_clear
+corner_cache_info = cnc_outline.corner_cache_info
 smooth_outline_c_curve = cnc_outline.smooth_outline_c_curve
 smooth_outline_b_curve = cnc_outline.smooth_outline_b_curve
 ideal_outline = cnc_outline.ideal_outline
 
+# from outline_array
+Outline_Array = outline_array.Outline_Array
+outline_to_array = outline_array.outline_to_array
+array_to_outline = outline_array.array_to_outline
+
 # from outline_backends
 outline_arc_line = outline_backends.outline_arc_line
 #outline_circle = outline_backends.outline_circle # included now in outline_arc_line()
 Two_Canvas =  outline_backends.Two_Canvas
+tkinter_tessellation = outline_backends.tkinter_tessellation
 figure_simple_display = outline_backends.figure_simple_display
 write_figure_in_svg = outline_backends.write_figure_in_svg
+write_figure_in_svg_stream = outline_backends.write_figure_in_svg_stream
 write_figure_in_dxf = outline_backends.write_figure_in_dxf
+write_figure_in_dxf_stream = outline_backends.write_figure_in_dxf_stream
 figure_to_freecad_25d_part =  outline_backends.figure_to_freecad_25d_part
 
 # from positioning
 place_plank = positioning.place_plank
+place_plank_placement = positioning.place_plank_placement
+place_plank_matrix = positioning_matrix.place_plank_matrix
+
+# from mesh_extrusion
+figure_to_mesh = mesh_extrusion.figure_to_mesh
+figure_to_stl = mesh_extrusion.figure_to_stl
+figures_to_stl_assembly = mesh_extrusion.figures_to_stl_assembly
+
+# from analytic_slicer
+xyz_slices_to_dxf = analytic_slicer.xyz_slices_to_dxf
 
 # from export_2d
 export_to_dxf = export_2d.export_to_dxf
@@ -92,8 +135,23 @@ flip_rotate_and_translate_figure = design_output.flip_rotate_and_translate_figur
 cnc_cut_figure =  design_output.cnc_cut_figure
 ideal_figure = design_output.ideal_figure
 figures_to_freecad_assembly = design_output.figures_to_freecad_assembly
+fuse_tree = design_output.fuse_tree
+
+# from design_profile
+profile_setup = design_profile.profile_setup
+profile_stage = design_profile.stage
+profile_report = design_profile.profile_report
+write_profile_report = design_profile.write_profile_report
+
+# from headless_display
+Headless_Canvas = headless_display.Headless_Canvas
+headless_setup = headless_display.headless_setup
+headless_enabled = headless_display.headless_enabled
+headless_save = headless_display.headless_save
+headless_restore = headless_display.headless_restore
 
 # from bare_design
+constraint_hash = bare_design.constraint_hash
 bare_design = bare_design.bare_design
 
 # design_frontend
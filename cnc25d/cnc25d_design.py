@@ -29,54 +29,70 @@ to be used by the design examples or external scripts
 # import
 ################################################################
 
-import box_wood_frame
-import gear_profile
-import gearwheel
-import gearring
-import gearbar
-import split_gearwheel
-import epicyclic_gearing
-import axle_lid
-import motor_lid
-import bell
-import bagel
-import bell_bagel_assembly
-import crest
-import cross_cube
-import gimbal
-import low_torque_transmission
+import sys
+import types
+# the design modules are imported when a design is used for the first time
+from lazy_import import Lazy_Module
 
 ################################################################
 # Cnc25d Designs
 ################################################################
 
+# design name -> proxy of the design class
+design_classes = {}
+
 ## wood structure
-box_wood_frame = box_wood_frame.box_wood_frame
+design_classes['box_wood_frame'] = Lazy_Module('box_wood_frame', 'box_wood_frame')
 #hexa_bone = hexa_bone.hexa_bone
 
 ## gear
 # gear back-office
-gear_profile = gear_profile.gear_profile
+design_classes['gear_profile'] = Lazy_Module('gear_profile', 'gear_profile')
 # standard gear
-gearwheel = gearwheel.gearwheel
-gearring = gearring.gearring
-gearbar = gearbar.gearbar
+design_classes['gearwheel'] = Lazy_Module('gearwheel', 'gearwheel')
+design_classes['gearring'] = Lazy_Module('gearring', 'gearring')
+design_classes['gearbar'] = Lazy_Module('gearbar', 'gearbar')
 # advanced gear
-split_gearwheel = split_gearwheel.split_gearwheel
+design_classes['split_gearwheel'] = Lazy_Module('split_gearwheel', 'split_gearwheel')
 #gearlever = gearlever.gearlever
 # gear system
-epicyclic_gearing = epicyclic_gearing.epicyclic_gearing
-axle_lid = axle_lid.axle_lid
-motor_lid = motor_lid.motor_lid
+design_classes['epicyclic_gearing'] = Lazy_Module('epicyclic_gearing', 'epicyclic_gearing')
+design_classes['axle_lid'] = Lazy_Module('axle_lid', 'axle_lid')
+design_classes['motor_lid'] = Lazy_Module('motor_lid', 'motor_lid')
 #gear_train = gear_train.gear_train
-ltt = low_torque_transmission.ltt
+design_classes['ltt'] = Lazy_Module('low_torque_transmission', 'ltt')
 
 ## gimbal
-bell = bell.bell
-bagel = bagel.bagel
-bba = bell_bagel_assembly.bba
-crest = crest.crest
-cross_cube = cross_cube.cross_cube
-gimbal = gimbal.gimbal
+design_classes['bell'] = Lazy_Module('bell', 'bell')
+design_classes['bagel'] = Lazy_Module('bagel', 'bagel')
+design_classes['bba'] = Lazy_Module('bell_bagel_assembly', 'bba')
+design_classes['crest'] = Lazy_Module('crest', 'crest')
+design_classes['cross_cube'] = Lazy_Module('cross_cube', 'cross_cube')
+design_classes['gimbal'] = Lazy_Module('gimbal', 'gimbal')
+
+################################################################
+# lazy design module
+################################################################
+
+class Lazy_Design_Module(types.ModuleType):
+  """ replacement of this module in sys.modules: the attribute cnc25d_design.<design> imports the design module on first use and returns the real design class
+      so the design classes can be instantiated, subclassed and checked with isinstance()
+  """
+
+  def __init__(self, ai_module):
+    types.ModuleType.__init__(self, ai_module.__name__, ai_module.__doc__)
+    self.__dict__.update(ai_module.__dict__)
+    self.__dict__['lazy_original_module'] = ai_module # keep the original module alive, otherwise Python 2 clears its globals
+
+  def __getattr__(self, ai_name):
+    if(not ai_name in design_classes):
+      raise AttributeError("module {:s} has no attribute {:s}".format(self.__name__, ai_name))
+    r_class = design_classes[ai_name].load()
+    setattr(self, ai_name, r_class) # the next accesses don't go through __getattr__
+    return(r_class)
+
+  def __dir__(self):
+    return(sorted(set(self.__dict__.keys()) | set(design_classes.keys())))
 
+sys.modules[__name__] = Lazy_Design_Module(sys.modules[__name__])
 
@@ -0,0 +1,90 @@
+# cnc25d_error.py
+# the exceptions raised by the cnc25d function library and the designs
+# created by agent on 2026/10/16
+#
+# (C) Copyright 2026 agent
+#
+# This file is part of the Cnc25D Python package.
+#
+# Cnc25D is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Cnc25D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cnc25D.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+cnc25d_error.py defines the exception hierarchy of Cnc25D.
+The errors are raised instead of exiting the Python interpreter, so a script or a worker process can catch them and continue with the next job.
+The error message still starts with its ERRxxx code.
+cli_shim() restores the command-line behavior: print the error message and exit with the status 2.
+"""
+
+################################################################
+# import
+################################################################
+
+import sys
+import re
+
+################################################################
+# exception classes
+################################################################
+
+class Cnc25dError(Exception):
+  """ base class of all the errors raised by Cnc25D
+      message: the error message as it was printed before (starting with the ERRxxx code)
+      code: the ERRxxx code extracted from the message (empty string if the message has no code)
+      exit_status: the exit status used by cli_shim()
+  """
+  def __init__(self, ai_message, ai_exit_status=2):
+    Exception.__init__(self, ai_message)
+    self.message = ai_message
+    self.exit_status = ai_exit_status
+    self.code = ''
+    code_match = re.match(r"\s*(ERR\d+)", ai_message)
+    if(code_match):
+      self.code = code_match.group(1)
+
+class Cnc25dOutlineError(Cnc25dError):
+  """ error in the outline and geometry functions (cnc_outline, small_geometry, outline_array, draw_2d_frontend)
+  """
+  pass
+
+class Cnc25dBackendError(Cnc25dError):
+  """ error in the backends (outline_backends, display_backend, design_output, positioning, export_2d, FreeCAD importation)
+  """
+  pass
+
+class Cnc25dDesignError(Cnc25dError):
+  """ error in bare_design or in a design (gearwheel, bell, gimbal ...)
+  """
+  pass
+
+class Cnc25dConstraintError(Cnc25dDesignError):
+  """ a constraint of a design is not valid (design_frontend.check())
+  """
+  pass
+
+################################################################
+# command line shim
+################################################################
+
+def cli_shim(ai_function, *ai_args, **ai_kwargs):
+  """ call ai_function with the arguments ai_args and ai_kwargs
+      If a Cnc25dError is raised, print its message and exit with its exit_status (usually 2) like the command line interface always did
+  """
+  try:
+    r_ret = ai_function(*ai_args, **ai_kwargs)
+  except Cnc25dError as err:
+    print(err.message)
+    sys.exit(err.exit_status)
+  return(r_ret)
+
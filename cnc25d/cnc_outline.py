@@ -53,9 +53,25 @@ from __future__ import division # to get float division
 #
 import math
 import sys, argparse
+import numpy
+import collections
 #
 import design_help # just for get_effective_args()
+import cnc25d_error
 from small_geometry import *
+import outline_array
+
+################################################################
+# global variable
+################################################################
+
+# cache of the corners solved by cnc_cut_corner(). The corners are stored in a canonical frame (current point at the origin, previous point on the x-axis)
+corner_cache = collections.OrderedDict()
+corner_cache_enable = True
+corner_cache_max_size = 4096 # LRU bound
+corner_cache_precision = 1e-7 # quantization of the canonical coordinates
+corner_cache_hit = 0
+corner_cache_miss = 0
 
 ################################################################
 # ******** Sub-functions for the API ***********
@@ -68,20 +84,17 @@ def check_outline_format(ai_outline):
   r_outline_type = -1
   # check if it is a format-B circle
   if(not isinstance(ai_outline, (tuple, list))):
-    print("ERR937: Error, ai_outline must be a list or a tuple")
     print("dbg072: ai_outline:", ai_outline)
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR937: Error, ai_outline must be a list or a tuple")
   # check if the outline contains at least on element
   if(len(ai_outline)==0):
-    print("ERR075: Error, ai_outline should not be empty!")
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR075: Error, ai_outline should not be empty!")
   # check if the outline is a circle or a general outline
   if(isinstance(ai_outline[0], (tuple, list))): # general outline
     # checks on ai_outline for general outline
     if(len(ai_outline)<2):
-      print("ERR402: Error, the segment list must contain at least 2 elements. Currently, len(ai_outline) = {:d}".format(len(ai_outline)))
       print("dbg082: ai_outline:", ai_outline)
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR402: Error, the segment list must contain at least 2 elements. Currently, len(ai_outline) = {:d}".format(len(ai_outline)))
     # check the first point
     len_first_point = len(ai_outline[0])
     if(len_first_point==2):
@@ -89,13 +102,11 @@ def check_outline_format(ai_outline):
     elif(len_first_point==3):
       r_outline_type = 2
     else:
-      print("ERR457: Error, the first point has an unexpected number of items {:d}".format(len_first_point))
       #print("dbg093: ai_outline:", ai_outline)
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR457: Error, the first point has an unexpected number of items {:d}".format(len_first_point))
   else: # circle outline
     if(len(ai_outline)!=3):
-      print("ERR758: Error, circle outline must be a list of 3 floats (or int)! Current len: {:d}".format(len(ai_outline)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR758: Error, circle outline must be a list of 3 floats (or int)! Current len: {:d}".format(len(ai_outline)))
     r_outline_type = 0
   return(r_outline_type)
 
@@ -125,16 +136,14 @@ def reverse_outline(ai_outline):
       elif(len_p==4):
         is_arc = True
       else:
-        print("ERR257: Error, the segment has an unxepected number of items {:d}".format(len_p))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR257: Error, the segment has an unxepected number of items {:d}".format(len_p))
     elif(outline_type==2):
       if(len_p==3):
         is_arc = False
       elif(len_p==5):
         is_arc = True
       else:
-        print("ERR258: Error, the segment has an unxepected number of items {:d}".format(len_p))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR258: Error, the segment has an unxepected number of items {:d}".format(len_p))
     #else:
     #  print("ERR557: Error, the outline_type is unexpected {:d}".format(outline_type))
     #  sys.exit(2)
@@ -203,23 +212,19 @@ def smooth_corner_line_line(ai_pre_point, ai_current_point, ai_post_point, ai_ro
   # corner angle
   #if(AG==0):
   if(AG<radian_epsilon):
-    print("ERR406: the length AG is null at point {:s} ({:0.2f}, {:0.2f}, {:0.2f})".format(ai_error_msg_id, AX, AY, ai_router_bit_request))
-    sys.exit(1)
+    raise cnc25d_error.Cnc25dOutlineError("ERR406: the length AG is null at point {:s} ({:0.2f}, {:0.2f}, {:0.2f})".format(ai_error_msg_id, AX, AY, ai_router_bit_request), 1)
   #if(AH==0):
   if(AH<radian_epsilon):
-    print("ERR407: the length AH is null at point {:s} ({:0.2f}, {:0.2f}, {:0.2f})".format(ai_error_msg_id, AX, AY, ai_router_bit_request))
-    sys.exit(1)
+    raise cnc25d_error.Cnc25dOutlineError("ERR407: the length AH is null at point {:s} ({:0.2f}, {:0.2f}, {:0.2f})".format(ai_error_msg_id, AX, AY, ai_router_bit_request), 1)
   #if(GH==0):
   if(GH<radian_epsilon):
-    print("ERR408: the length GH is null at point {:s} ({:0.2f}, {:0.2f}, {:0.2f})".format(ai_error_msg_id, AX, AY, ai_router_bit_request))
-    sys.exit(1)
+    raise cnc25d_error.Cnc25dOutlineError("ERR408: the length GH is null at point {:s} ({:0.2f}, {:0.2f}, {:0.2f})".format(ai_error_msg_id, AX, AY, ai_router_bit_request), 1)
   # law of cosines
   #corner_angle = math.acos((AG**2+AH**2-GH**2)/(2*AH*AG))
   corner_cos = (AG**2+AH**2-GH**2)/(2*AH*AG)
   if(abs(corner_cos)>(1+radian_epsilon)):
-    print("ERR210: Error with math.acos {:0.5f}".format((AG**2+AH**2-GH**2)/(2*AH*AG)))
     print("dbg211: AG {:0.3f}  AH {:0.3f}  GH {:0.3f}".format(AG, AH, GH))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR210: Error with math.acos {:0.5f}".format((AG**2+AH**2-GH**2)/(2*AH*AG)))
   elif(corner_cos>=1):
     corner_angle = 0
   elif(corner_cos<=-1):
@@ -311,16 +316,13 @@ def enlarge_corner_line_line(ai_pre_point, ai_current_point, ai_post_point, ai_r
   # corner angle
   #if(AG==0):
   if(AG<radian_epsilon):
-    print("ERR506: the length AG is null at point {:s} ({:0.2f}, {:0.2f}, {:0.2f})".format(ai_error_msg_id, AX, AY, ai_router_bit_request))
-    sys.exit(1)
+    raise cnc25d_error.Cnc25dOutlineError("ERR506: the length AG is null at point {:s} ({:0.2f}, {:0.2f}, {:0.2f})".format(ai_error_msg_id, AX, AY, ai_router_bit_request), 1)
   #if(AH==0):
   if(AH<radian_epsilon):
-    print("ERR507: the length AH is null at point {:s} ({:0.2f}, {:0.2f}, {:0.2f})".format(ai_error_msg_id, AX, AY, ai_router_bit_request))
-    sys.exit(1)
+    raise cnc25d_error.Cnc25dOutlineError("ERR507: the length AH is null at point {:s} ({:0.2f}, {:0.2f}, {:0.2f})".format(ai_error_msg_id, AX, AY, ai_router_bit_request), 1)
   #if(GH==0):
   if(GH<radian_epsilon):
-    print("ERR508: the length GH is null at point {:s} ({:0.2f}, {:0.2f}, {:0.2f})".format(ai_error_msg_id, AX, AY, ai_router_bit_request))
-    sys.exit(1)
+    raise cnc25d_error.Cnc25dOutlineError("ERR508: the length GH is null at point {:s} ({:0.2f}, {:0.2f}, {:0.2f})".format(ai_error_msg_id, AX, AY, ai_router_bit_request), 1)
   corner_angle = math.acos((AG**2+AH**2-GH**2)/(2*AH*AG))
   #print("dbg296: corner_angle:", corner_angle)
   if(corner_angle>math.pi-radian_epsilon):
@@ -448,9 +450,11 @@ def enlarge_corner_arc_arc(ai_pre_point, ai_pre_middle, ai_current_point, ai_pos
   #print("dbg341: r_outline:", r_outline)
   return(r_outline)
 
-def cnc_cut_corner(ai_pre_point, ai_pre_middle, ai_current_point, ai_post_middle, ai_post_point, ai_router_bit_request, ai_error_msg_id, ai_error_msg_idx):
+def sub_cnc_cut_corner(ai_pre_point, ai_pre_middle, ai_current_point, ai_post_middle, ai_post_point, ai_router_bit_request, ai_error_msg_id, ai_error_msg_idx):
   """ Compute the open outline of a corner defined by two segemts (lines or arcs)
       The output outline has the same format as the input format of outline_backends.outline_arc_line()
+      This is the solver without cache. Use cnc_cut_corner()
+      It returns (outline, warning): warning is True if the corner requested to be smoothed or enlarged is left angular (the solver printed a WARNxxx)
   """
   #print("dbg107: ai_error_msg_id: {:s}  ai_error_msg_idx: {:d}".format(ai_error_msg_id, ai_error_msg_idx))
   #error_msg_id = "error_msg_id: {:s}.{:d}".format(ai_error_msg_id, ai_error_msg_idx)
@@ -488,8 +492,100 @@ def cnc_cut_corner(ai_pre_point, ai_pre_middle, ai_current_point, ai_post_middle
     elif((ai_pre_middle!=None)and(ai_post_middle!=None)):
       r_outline = enlarge_corner_arc_arc(ai_pre_point, ai_pre_middle, ai_current_point, ai_post_middle, ai_post_point, abs(ai_router_bit_request), error_msg_id)
   #print("dbg578: r_outline:", r_outline)
+  r_warning = ((ai_router_bit_request!=0)and(len(r_outline)==1)and(len(r_outline[0])==2))
+  return((r_outline, r_warning))
+
+def corner_cache_key(ai_pre_point, ai_pre_middle, ai_current_point, ai_post_middle, ai_post_point, ai_router_bit_request):
+  """ compute the key of a corner for the corner_cache and the rotation angle of its canonical frame
+      The canonical frame has its origin on ai_current_point and its x-axis toward ai_pre_point
+  """
+  (AX, AY) = (ai_current_point[0], ai_current_point[1])
+  frame_angle = math.atan2(ai_pre_point[1]-AY, ai_pre_point[0]-AX)
+  cos_a = math.cos(frame_angle)
+  sin_a = math.sin(frame_angle)
+  key = [ai_router_bit_request]
+  for pt in (ai_pre_point, ai_pre_middle, ai_post_middle, ai_post_point):
+    if(pt==None):
+      key.append(None)
+    else:
+      ix = pt[0]-AX
+      iy = pt[1]-AY
+      key.append(int(round((ix*cos_a+iy*sin_a)/corner_cache_precision)))
+      key.append(int(round((-1*ix*sin_a+iy*cos_a)/corner_cache_precision)))
+  r_key = (tuple(key), frame_angle)
+  return(r_key)
+
+def corner_outline_move(ai_outline, ai_ox, ai_oy, ai_rotation_angle, ai_x_offset, ai_y_offset):
+  """ rotate around (ai_ox, ai_oy) and then translate a corner outline (list of 2-tuples and 4-tuples)
+  """
+  cos_a = math.cos(ai_rotation_angle)
+  sin_a = math.sin(ai_rotation_angle)
+  r_outline = []
+  for seg in ai_outline:
+    new_seg = []
+    for i in range(0, len(seg), 2):
+      ix = seg[i]-ai_ox
+      iy = seg[i+1]-ai_oy
+      new_seg.append(ai_ox+ix*cos_a-iy*sin_a+ai_x_offset)
+      new_seg.append(ai_oy+ix*sin_a+iy*cos_a+ai_y_offset)
+    r_outline.append(tuple(new_seg))
+  return(r_outline)
+
+def cnc_cut_corner(ai_pre_point, ai_pre_middle, ai_current_point, ai_post_middle, ai_post_point, ai_router_bit_request, ai_error_msg_id, ai_error_msg_idx):
+  """ Compute the open outline of a corner defined by two segemts (lines or arcs)
+      The output outline has the same format as the input format of outline_backends.outline_arc_line()
+      The solved corners are memorized in a LRU cache. A corner equal (after quantization) to a cached corner up to a rotation and a translation is not solved again.
+      The corners left angular with a warning by sub_cnc_cut_corner() are not cached, so each occurrence prints its warning as without cache.
+  """
+  global corner_cache_hit, corner_cache_miss
+  if((not corner_cache_enable)or(ai_router_bit_request==0)):
+    (r_outline, corner_warning) = sub_cnc_cut_corner(ai_pre_point, ai_pre_middle, ai_current_point, ai_post_middle, ai_post_point, ai_router_bit_request, ai_error_msg_id, ai_error_msg_idx)
+  else:
+    (AX, AY) = (ai_current_point[0], ai_current_point[1])
+    (key, frame_angle) = corner_cache_key(ai_pre_point, ai_pre_middle, ai_current_point, ai_post_middle, ai_post_point, ai_router_bit_request)
+    if(key in corner_cache):
+      corner_cache_hit += 1
+      canonical_outline = corner_cache.pop(key)
+      corner_cache[key] = canonical_outline # most recently used
+      r_outline = corner_outline_move(canonical_outline, 0, 0, frame_angle, AX, AY)
+    else:
+      corner_cache_miss += 1
+      (r_outline, corner_warning) = sub_cnc_cut_corner(ai_pre_point, ai_pre_middle, ai_current_point, ai_post_middle, ai_post_point, ai_router_bit_request, ai_error_msg_id, ai_error_msg_idx)
+      if(not corner_warning):
+        corner_cache[key] = corner_outline_move(r_outline, AX, AY, -1*frame_angle, -1*AX, -1*AY)
+        if(len(corner_cache)>corner_cache_max_size):
+          corner_cache.popitem(last=False) # least recently used
   return(r_outline)
 
+def corner_cache_setup(ai_enable=True, ai_max_size=4096, ai_precision=1e-7):
+  """ enable or disable the cache of cnc_cut_corner() and set its size and precision
+      the cache and its counters are cleared
+  """
+  global corner_cache_enable, corner_cache_max_size, corner_cache_precision
+  corner_cache_enable = ai_enable
+  corner_cache_max_size = ai_max_size
+  corner_cache_precision = ai_precision
+  corner_cache_clear()
+
+def corner_cache_clear():
+  """ empty the cache of cnc_cut_corner() and reset its hit/miss counters
+  """
+  global corner_cache_hit, corner_cache_miss
+  corner_cache.clear()
+  corner_cache_hit = 0
+  corner_cache_miss = 0
+
+def corner_cache_info():
+  """ return the statistics of the cache of cnc_cut_corner()
+  """
+  r_info = {
+    'enable' : corner_cache_enable,
+    'hit' : corner_cache_hit,
+    'miss' : corner_cache_miss,
+    'size' : len(corner_cache),
+    'max_size' : corner_cache_max_size}
+  return(r_info)
+
 def arc_middle(ai_arc_pt1, ai_arc_pt2, ai_arc_pt3, ai_new_end1, ai_new_end2, ai_error_msg_id, ai_error_msg_idx):
   """ Compute the middle point of an arc with new end points
   """
@@ -517,17 +613,15 @@ def arc_middle(ai_arc_pt1, ai_arc_pt2, ai_arc_pt3, ai_new_end1, ai_new_end2, ai_
   ID = math.sqrt((DX-IX)**2+(DY-IY)**2)
   IE = math.sqrt((EX-IX)**2+(EY-IY)**2)
   if((abs(IA-arc_radius)>radian_epsilon)or(abs(IB-arc_radius)>radian_epsilon)or(abs(IC-arc_radius)>radian_epsilon)):
-    print("ERR831: Error, in {:s}, I is not equidistant from A,B,C,D,E. IA={:0.2f} IB={:0.2f} IC={:0.2f}".format(ai_error_msg_id, IA, IB, IC))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR831: Error, in {:s}, I is not equidistant from A,B,C,D,E. IA={:0.2f} IB={:0.2f} IC={:0.2f}".format(ai_error_msg_id, IA, IB, IC))
   if((abs(ID-IA)>radian_epsilon)or(abs(IE-IA)>radian_epsilon)):
-    print("ERR832: Error, in {:s}, I is not equidistant from A,B,C,D,E. IA={:0.2f} IB={:0.2f} IC={:0.2f} ID={:0.2f} IE={:0.2f}".format(error_msg_id, IA, IB, IC, ID, IE))
     print("dbg414: AX {:0.2f}  AY {:0.2f}".format(AX,AY))
     print("dbg424: BX {:0.2f}  BY {:0.2f}".format(BX,BY))
     print("dbg434: CX {:0.2f}  CY {:0.2f}".format(CX,CY))
     print("dbg444: DX {:0.2f}  DY {:0.2f}".format(DX,DY))
     print("dbg454: EX {:0.2f}  EY {:0.2f}".format(EX,EY))
     print("dbg464: IX {:0.2f}  IY {:0.2f}".format(IX,IY))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR832: Error, in {:s}, I is not equidistant from A,B,C,D,E. IA={:0.2f} IB={:0.2f} IC={:0.2f} ID={:0.2f} IE={:0.2f}".format(error_msg_id, IA, IB, IC, ID, IE))
   # calculation of the angles d=(Ix, ID) and e=(Ix, IE)
   d = math.atan2(DY-IY, DX-IX)
   e = math.atan2(EY-IY, EX-IX)
@@ -571,8 +665,7 @@ def arc_middle(ai_arc_pt1, ai_arc_pt2, ai_arc_pt3, ai_new_end1, ai_new_end2, ai_
   FY = IY+arc_radius*math.sin(f)
   # dummy F in case of error
   if(arc_middle_status==2):
-    print("ERR221: Error in {:s} during the recalculation of the arc middle point!".format(error_msg_id))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR221: Error in {:s} during the recalculation of the arc middle point!".format(error_msg_id))
     #print("WARN221: Warning in {:s}, creating a dummy arc because of internal error!".format(error_msg_id))
     #lDE = math.sqrt((EX-DX)**2+(EY-DY)**2)
     #xDE = math.atan2(EY-DY, EX-DX)
@@ -592,8 +685,7 @@ def general_outline_shift_xy(ai_outline, ai_x_offset, ai_x_coefficient, ai_y_off
   """
   # check the parameters
   if((ai_x_coefficient==0)or(ai_y_coefficient==0)):
-    print("ERR439: Error, a multiplication coefficient is set to zero: {:0.2f}  {:0.2f}".format(ai_x_coefficient, ai_y_coefficient))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR439: Error, a multiplication coefficient is set to zero: {:0.2f}  {:0.2f}".format(ai_x_coefficient, ai_y_coefficient))
   # check if the outline must be reversed
   if((ai_x_coefficient*ai_y_coefficient)<0):
     i_outline=reverse_outline(ai_outline)
@@ -615,19 +707,16 @@ def general_outline_shift_xy(ai_outline, ai_x_offset, ai_x_coefficient, ai_y_off
       elif(len_p==4):
         is_arc = True
       else:
-        print("ERR237: Error, the segment has an unxepected number of items {:d}".format(len_p))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR237: Error, the segment has an unxepected number of items {:d}".format(len_p))
     elif(outline_type==2):
       if(len_p==3):
         is_arc = False
       elif(len_p==5):
         is_arc = True
       else:
-        print("ERR247: Error, the segment has an unxepected number of items {:d}".format(len_p))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR247: Error, the segment has an unxepected number of items {:d}".format(len_p))
     else:
-      print("ERR257: Error, the outline_type is unexpected {:d}".format(outline_type))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR257: Error, the outline_type is unexpected {:d}".format(outline_type))
     # extract segments
     end_point = []
     end_point_router_bit = []
@@ -673,19 +762,16 @@ def general_outline_rotate(ai_outline, ai_ox, ai_oy, ai_rotation_angle):
       elif(len_p==4):
         is_arc = True
       else:
-        print("ERR237: Error, the segment has an unxepected number of items {:d}".format(len_p))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR237: Error, the segment has an unxepected number of items {:d}".format(len_p))
     elif(outline_type==2):
       if(len_p==3):
         is_arc = False
       elif(len_p==5):
         is_arc = True
       else:
-        print("ERR247: Error, the segment has an unxepected number of items {:d}".format(len_p))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR247: Error, the segment has an unxepected number of items {:d}".format(len_p))
     else:
-      print("ERR257: Error, the outline_type is unexpected {:d}".format(outline_type))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR257: Error, the outline_type is unexpected {:d}".format(outline_type))
     # extract segments
     end_point = []
     end_point_router_bit = []
@@ -718,7 +804,10 @@ def general_outline_rotate(ai_outline, ai_ox, ai_oy, ai_rotation_angle):
 def outline_shift_xy(ai_outline, ai_x_offset, ai_x_coefficient, ai_y_offset, ai_y_coefficient):
   """ For each point of the list, add the offset and multiply by coefficient the coordinates
       ai_outline can be list of segments with the format-A (input of cnc_cut_outline.cnc_cut_outline()) or format-B (input of outline_backends.outline_arc_line())
+      ai_outline can also be an Outline_Array. In this case, the returned outline is also an Outline_Array
   """
+  if(isinstance(ai_outline, outline_array.Outline_Array)):
+    return(ai_outline.shift_xy(ai_x_offset, ai_x_coefficient, ai_y_offset, ai_y_coefficient))
   outline_type = check_outline_format(ai_outline)
   if(outline_type==0): # it's a format-B circle
     if(abs(ai_x_coefficient)!=abs(ai_y_coefficient)):
@@ -749,7 +838,10 @@ def outline_shift_y(ai_outline, ai_y_offset, ai_y_coefficient):
 def outline_rotate(ai_outline, ai_ox, ai_oy, ai_rotation_angle):
   """ For each point of the list, apply a rotation of angle ai_rotation_angle and rotation center (ai_ox, ai_oy)
       ai_outline can be list of segments with the format-A or with the format-B
+      ai_outline can also be an Outline_Array. In this case, the returned outline is also an Outline_Array
   """
+  if(isinstance(ai_outline, outline_array.Outline_Array)):
+    return(ai_outline.rotate(ai_ox, ai_oy, ai_rotation_angle))
   outline_type = check_outline_format(ai_outline)
   if(outline_type==0): # it's a format-B circle
     circle_center_x = ai_outline[0]
@@ -791,7 +883,10 @@ def outline_reverse(ai_outline):
   """ reverse an outline to make the last point becomes the first point
       It handles correctly the middle point of arcs.
       it supports format-A and format-B including circle
+      it also supports Outline_Array
   """
+  if(isinstance(ai_outline, outline_array.Outline_Array)):
+    return(ai_outline.reverse())
   # check the ai_outline format
   outline_type = check_outline_format(ai_outline)
   r_outline = ai_outline
@@ -799,7 +894,105 @@ def outline_reverse(ai_outline):
     r_outline = reverse_outline(ai_outline)
   return(r_outline)
 
-def cnc_cut_outline(ai_segment_list, ai_error_msg_id):
+def batch_line_line_corners(ai_pt_end, ai_pt_mid, ai_pt_request, ai_outline_closed):
+  """ Solve in one numpy pass all the line-line corners of an outline (angular, smoothed, enlarged obtuse and enlarged acute)
+      The corner outline of a line-line corner only depends on the directions of the two lines, so it can be computed before the sequential construction of cnc_cut_outline()
+      It returns a list with one element per point: None if the corner must be solved by cnc_cut_corner() or the tuple (required_length, corner_outline)
+      required_length is the minimal length of the two adjacent segments. It must be checked with the actual previous and following points.
+  """
+  # use to check is angle is smaller than pi/2
+  radian_epsilon = math.pi/1000
+  point_nb = len(ai_pt_end)
+  r_corners = [None]*point_nb
+  # index of the corners: the start point of a closed outline and the middle points
+  if(ai_outline_closed):
+    corn_idx = numpy.arange(0, point_nb-1)
+  else:
+    corn_idx = numpy.arange(1, point_nb-1)
+  if(len(corn_idx)==0):
+    return(r_corners)
+  pre_idx = corn_idx-1
+  pre_seg_idx = corn_idx.copy()
+  post_idx = corn_idx+1
+  if(ai_outline_closed):
+    pre_idx[0] = point_nb-2
+    pre_seg_idx[0] = point_nb-1
+  end = numpy.array(ai_pt_end, dtype=numpy.float64)
+  request = numpy.array(ai_pt_request, dtype=numpy.float64)[corn_idx]
+  is_arc = numpy.array([(m!=None) for m in ai_pt_mid], dtype=numpy.bool_)
+  # the pre-segment ends on the corner and the post-segment ends on the post point
+  line_line = numpy.logical_not(numpy.logical_or(is_arc[pre_seg_idx], is_arc[post_idx]))
+  A = end[corn_idx]
+  AG = end[pre_idx]-A
+  AH = end[post_idx]-A
+  lAG = numpy.sqrt(numpy.sum(AG**2, axis=1))
+  lAH = numpy.sqrt(numpy.sum(AH**2, axis=1))
+  valid = line_line & (lAG>=radian_epsilon) & (lAH>=radian_epsilon)
+  lAG[~valid] = 1
+  lAH[~valid] = 1
+  uG = AG/lAG[:,numpy.newaxis]
+  uH = AH/lAH[:,numpy.newaxis]
+  corner_angle = numpy.arccos(numpy.clip(numpy.sum(uG*uH, axis=1), -1, 1))
+  # the flat and acute corners are left to cnc_cut_corner() that raises the warnings
+  angle_ok = (corner_angle<math.pi-radian_epsilon) & (corner_angle>radian_epsilon)
+  valid = valid & ((request==0) | angle_ok)
+  corner_angle[~valid] = math.pi/2
+  half_angle = corner_angle/2
+  radius = numpy.abs(request)
+  smooth = valid & (request>0)
+  obtuse = valid & (request<0) & (corner_angle>math.pi/2-radian_epsilon)
+  acute = valid & (request<0) & numpy.logical_not(obtuse)
+  # smoothed corner: AE ( = AF = r/(tan(a/2) ), AK ( = AL = r*(1-sin(a/2))*2/sin(a) )
+  need = numpy.zeros(len(corn_idx))
+  need[smooth] = radius[smooth]/numpy.tan(half_angle[smooth])
+  need[obtuse] = 2*radius[obtuse]*numpy.cos(half_angle[obtuse])
+  need[acute] = radius[acute]/numpy.sin(half_angle[acute])
+  AK = radius*(1-numpy.sin(half_angle))*2/numpy.sin(corner_angle)
+  E = A+uG*need[:,numpy.newaxis]
+  F = A+uH*need[:,numpy.newaxis]
+  I = A+(uG+uH)*(AK/2)[:,numpy.newaxis]
+  # enlarged acute corner: AR ( = AS = AM/2 ), AV ( = AW = r/cos(a/2) )
+  AR = (need/2)[:,numpy.newaxis]
+  AV = (radius/numpy.cos(half_angle))[:,numpy.newaxis]
+  K = A+uG*AR-uH*AR+(uG+uH)*AV/2
+  L = A-uG*AR+uH*AR+(uG+uH)*AV/2
+  # conversion to python lists for the outline construction
+  l_A = A.tolist()
+  l_E = E.tolist()
+  l_F = F.tolist()
+  l_I = I.tolist()
+  l_K = K.tolist()
+  l_L = L.tolist()
+  l_need = need.tolist()
+  for i in numpy.nonzero(valid)[0].tolist():
+    (AX, AY) = l_A[i]
+    if(smooth[i]):
+      corner_outline = [tuple(l_E[i]), (l_I[i][0], l_I[i][1], l_F[i][0], l_F[i][1])]
+    elif(obtuse[i]):
+      corner_outline = [tuple(l_E[i]), (AX, AY, l_F[i][0], l_F[i][1])]
+    elif(acute[i]):
+      corner_outline = [tuple(l_E[i]), tuple(l_K[i]), (AX, AY, l_L[i][0], l_L[i][1]), tuple(l_F[i])]
+    else: # angular corner
+      corner_outline = [(AX, AY)]
+    r_corners[corn_idx[i]] = (l_need[i], corner_outline)
+  return(r_corners)
+
+def batch_corner(ai_batch_corners, ai_pt_idx, ai_pre_point, ai_current_point, ai_post_point):
+  """ return the corner outline pre-computed by batch_line_line_corners() if it is still valid with the actual previous and following points
+      otherwise return None
+  """
+  # use to check is angle is smaller than pi/2
+  radian_epsilon = math.pi/1000
+  r_corner = None
+  if(ai_batch_corners[ai_pt_idx]!=None):
+    (required_length, corner_outline) = ai_batch_corners[ai_pt_idx]
+    AG = math.sqrt((ai_pre_point[0]-ai_current_point[0])**2+(ai_pre_point[1]-ai_current_point[1])**2)
+    AH = math.sqrt((ai_post_point[0]-ai_current_point[0])**2+(ai_post_point[1]-ai_current_point[1])**2)
+    if((AG>=radian_epsilon)and(AH>=radian_epsilon)and(AG>=required_length)and(AH>=required_length)):
+      r_corner = corner_outline[:]
+  return(r_corner)
+
+def cnc_cut_outline(ai_segment_list, ai_error_msg_id, ai_batch=False):
   """
   This function converts a list of segments (lines and arcs) into a list of segments (lines and arcs) compatible with a CNC cut.
   For each input segment, you must provide:
@@ -817,6 +1010,7 @@ def cnc_cut_outline(ai_segment_list, ai_error_msg_id):
   If the outline is closed, the router_bit request of the start point is used and the router_bit request of the end point of the last segment is ignore.
   From a programming point of view, ai_segment_list is a tuple of 3-tulpes and/or 5-tuples.
   The returned list of segments has the same format as the input list of segment of outline_backends.outline_arc_line()
+  If ai_batch is True, the line-line corners are solved in one numpy pass before the construction of the outline (see cnc_cut_outline_batch())
   """
   # is the outline closed or open?
   #precision_epsilon = 1/1000.0
@@ -834,15 +1028,12 @@ def cnc_cut_outline(ai_segment_list, ai_error_msg_id):
   segment_nb = point_nb-1
   # check of the outline size
   if(segment_nb<1):
-    print("ERR202: Error in {:s}, the number of segments must be bigger than 1. Currently: {:d}".format(ai_error_msg_id, segment_nb))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR202: Error in {:s}, the number of segments must be bigger than 1. Currently: {:d}".format(ai_error_msg_id, segment_nb))
   if((segment_nb<2)and(outline_closed)):
-    print("ERR203: Error in {:s}, the number of segments must be bigger than 2 with a closed outline. Currently: {:d}".format(ai_error_msg_id, point_nb))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR203: Error in {:s}, the number of segments must be bigger than 2 with a closed outline. Currently: {:d}".format(ai_error_msg_id, point_nb))
   # check the start point
   if(len(ai_segment_list[0])!=3):
-    print("ERR564: the start point is not defined with three floats. {:d}".format(len(ai_segment_list[0])))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR564: the start point is not defined with three floats. {:d}".format(len(ai_segment_list[0])))
   # extract segment data
   pt_end = []
   pt_mid = []
@@ -857,8 +1048,7 @@ def cnc_cut_outline(ai_segment_list, ai_error_msg_id):
       (mid_pt_x, mid_pt_y, end_pt_x, end_pt_y, end_pt_r) = ai_segment_list[pt_idx]
       mid_elem = (mid_pt_x, mid_pt_y)
     else:
-      print("ERR563: Error, the segment is defined with an unexpected number of float {:d}".format(len_segment))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR563: Error, the segment is defined with an unexpected number of float {:d}".format(len_segment))
     pt_end.append((end_pt_x,end_pt_y))
     pt_request.append(end_pt_r)
     pt_mid.append(mid_elem)
@@ -871,11 +1061,18 @@ def cnc_cut_outline(ai_segment_list, ai_error_msg_id):
   if(pt_request[-1]!=0):
     print("WARN947: Warning, in {:s}, the router_bit request of the last point of the outline is not zero: {:0.2f}".format(ai_error_msg_id, pt_request[-1]))
     pt_request[-1]=0
+  # solve the line-line corners in advance
+  batch_corners = [None]*point_nb
+  if(ai_batch):
+    batch_corners = batch_line_line_corners(pt_end, pt_mid, pt_request, outline_closed)
   # build outline
   r_outline = []
   # start point
   if(outline_closed):
-    r_outline.extend(cnc_cut_corner(pt_end[-2],pt_mid[-1], pt_end[0], pt_mid[1], pt_end[1], pt_request[0], ai_error_msg_id, 0))
+    new_corner = batch_corner(batch_corners, 0, pt_end[-2], pt_end[0], pt_end[1])
+    if(new_corner==None):
+      new_corner = cnc_cut_corner(pt_end[-2],pt_mid[-1], pt_end[0], pt_mid[1], pt_end[1], pt_request[0], ai_error_msg_id, 0)
+    r_outline.extend(new_corner)
   else:
     r_outline.append(pt_end[0])
   # middle of the outline
@@ -897,7 +1094,9 @@ def cnc_cut_outline(ai_segment_list, ai_error_msg_id):
       if(following_middle_point!=None):
         following_middle_point = arc_middle(pt_end[-2], pt_mid[-1], pt_end[-1], pt_end[-2], following_point, "{:s}.am2".format(ai_error_msg_id), -2)
     # compute the corner outline
-    new_corner = cnc_cut_corner(previous_point, tmp_middle_point, pt_end[corn_idx+1], following_middle_point, following_point, pt_request[corn_idx+1], ai_error_msg_id, corn_idx+1)
+    new_corner = batch_corner(batch_corners, corn_idx+1, previous_point, pt_end[corn_idx+1], following_point)
+    if(new_corner==None):
+      new_corner = cnc_cut_corner(previous_point, tmp_middle_point, pt_end[corn_idx+1], following_middle_point, following_point, pt_request[corn_idx+1], ai_error_msg_id, corn_idx+1)
     #print("dbg551: previous_point", previous_point)
     #print("dbg552: tmp_middle_point", tmp_middle_point)
     #print("dbg553: pt_end[corn_idx+1]", pt_end[corn_idx+1])
@@ -929,6 +1128,14 @@ def cnc_cut_outline(ai_segment_list, ai_error_msg_id):
   # function return
   return(r_outline)
 
+def cnc_cut_outline_batch(ai_segment_list, ai_error_msg_id):
+  """ Same as cnc_cut_outline() but the line-line corners are classified and solved in one numpy pass.
+      The arc corners and the corners that don't fit the constraints are still solved one by one with cnc_cut_corner().
+      The returned outline matches the one of cnc_cut_outline() within the numerical precision.
+  """
+  r_outline = cnc_cut_outline(ai_segment_list, ai_error_msg_id, True)
+  return(r_outline)
+
 def approximate_curve_tangent(ai_polyline, ai_error_msg_id):
   """
   This function gets a list of points (outline format b with only lines).
@@ -945,14 +1152,12 @@ def approximate_curve_tangent(ai_polyline, ai_error_msg_id):
   point_nb = len(ai_polyline)
   # check the outline point number
   if(point_nb<2):
-    print("ERR309: Error in {:s}, the number of points must be bigger than 2. Currently: {:d}".format(ai_error_msg_id, point_nb))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR309: Error in {:s}, the number of points must be bigger than 2. Currently: {:d}".format(ai_error_msg_id, point_nb))
   # check if ai_polyline is valid
   for i in range(len(ai_polyline)):
     point_len = len(ai_polyline[i])
     if(point_len!=2):
-      print("ERR319: Error in {:s}, the point {:d} of ai_polyline must have exactly 2 elements. Currently: {:d}".format(ai_error_msg_id, i, point_len))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR319: Error in {:s}, the point {:d} of ai_polyline must have exactly 2 elements. Currently: {:d}".format(ai_error_msg_id, i, point_len))
   # processing initialization
   r_outline = []
   pre_point = ai_polyline[0]
@@ -967,8 +1172,7 @@ def approximate_curve_tangent(ai_polyline, ai_error_msg_id):
     tangent_inclination2 = math.atan2((post2_point[1]-pre_point[1])/segment_length, (post2_point[0]-pre_point[0])/segment_length)
     tangent_inclination2_diff = math.fmod(tangent_inclination2-tangent_inclination+5*math.pi, 2*math.pi) - math.pi
     if(abs(tangent_inclination2_diff)>math.pi/3):
-      print("ERR315: Error in {:s}, the tangent_inclination is changing too fast for a curve approximation. tangent_inclination: {:0.2f}  tangent_inclination2: {:0.2f}".format(ai_error_msg_id, tangent_inclination, tangent_inclination2))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR315: Error in {:s}, the tangent_inclination is changing too fast for a curve approximation. tangent_inclination: {:0.2f}  tangent_inclination2: {:0.2f}".format(ai_error_msg_id, tangent_inclination, tangent_inclination2))
     tangent_inclination = math.fmod(tangent_inclination-1*tangent_inclination2_diff/2 + 5*math.pi, 2*math.pi) - math.pi
   r_outline.append((ai_polyline[0][0], ai_polyline[0][1], tangent_inclination)) # first-point
   # processing incrementation
@@ -993,8 +1197,7 @@ def approximate_curve_tangent(ai_polyline, ai_error_msg_id):
     tangent_inclination2 = math.atan2((post_point[1]-pre2_point[1])/segment_length, (post_point[0]-pre2_point[0])/segment_length)
     tangent_inclination2_diff = math.fmod(tangent_inclination2-tangent_inclination+5*math.pi, 2*math.pi) - math.pi
     if(abs(tangent_inclination2_diff)>math.pi/3):
-      print("ERR315: Error in {:s}, the tangent_inclination is changing too fast for a curve approximation. tangent_inclination: {:0.2f}  tangent_inclination2: {:0.2f}".format(ai_error_msg_id, tangent_inclination, tangent_inclination2))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR315: Error in {:s}, the tangent_inclination is changing too fast for a curve approximation. tangent_inclination: {:0.2f}  tangent_inclination2: {:0.2f}".format(ai_error_msg_id, tangent_inclination, tangent_inclination2))
     tangent_inclination = math.fmod(tangent_inclination-1*tangent_inclination2_diff/2 + 5*math.pi, 2*math.pi) - math.pi
   r_outline.append((ai_polyline[-1][0], ai_polyline[-1][1], tangent_inclination)) # end-point
   # return
@@ -1045,8 +1248,7 @@ def ideal_outline(ai_outline, ai_error_msg_id):
       # check the segment length
       segment_len = len(i_segment)
       if((segment_len!=3)and(segment_len!=5)):
-        print("ERR868: Error in {:s}.{:d}, len(segment_len) is not 3 or 5!".format(ai_error_msg_id, i))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR868: Error in {:s}.{:d}, len(segment_len) is not 3 or 5!".format(ai_error_msg_id, i))
       i += 1
       # construct the ideal outline
       r_outline.append(i_segment[:-1]) # remove the third or the fifth element
@@ -1065,12 +1267,12 @@ def ideal_outline(ai_outline, ai_error_msg_id):
 ################################################################
 
 import importing_freecad 
-importing_freecad.importing_freecad()
+#importing_freecad.importing_freecad() # FreeCAD is imported on first use by lazy_import
 #
-import Part
-from FreeCAD import Base 
+from lazy_import import Part
+from lazy_import import Base
 #
-import Tkinter
+from lazy_import import Tkinter
 import outline_backends
 #
 #import timeit
@@ -30,7 +30,7 @@ The main function displays in a Tk-interface the crest part, or generates the de
 ################################################################
 
 import cnc25d_api
-cnc25d_api.importing_freecad()
+#cnc25d_api.importing_freecad() # FreeCAD is imported on first use by lazy_import
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -46,7 +46,7 @@ import sys, argparse
 #import re # to detect .dxf or .svg
 #import Tkinter # to display the outline in a small GUI
 #
-import Part
+from lazy_import import Part
 #from FreeCAD import Base
 # 3rd parties
 #import svgwrite
@@ -150,111 +150,89 @@ def crest_constraint_check(c):
   ### outline
   #gear_module
   if(c['gear_module']<radian_epsilon):
-    print("ERR194: Error, gear_module {:0.3f} must be strictly positive".format(c['gear_module']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR194: Error, gear_module {:0.3f} must be strictly positive".format(c['gear_module']))
   #virtual_tooth_nb
   if((c['virtual_tooth_nb']-3)*c['gear_module']<0.9*c['cube_width']):
-    print("ERR198: Error, virtual_tooth_nb {:d} is too small compare to gear_module {:0.3f} and cube_width {:0.3f}".format(c['virtual_tooth_nb'], c['gear_module'], c['cube_width']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR198: Error, virtual_tooth_nb {:d} is too small compare to gear_module {:0.3f} and cube_width {:0.3f}".format(c['virtual_tooth_nb'], c['gear_module'], c['cube_width']))
   gear_hollow_radius = (c['virtual_tooth_nb']-2)*c['gear_module']/2.0
   minimal_gear_portion_angle = 2*math.asin(c['cube_width']/(2.0*gear_hollow_radius))
   maximal_gear_portion_angle = 2*(math.pi-math.asin((c['cube_width']/2.0+c['free_mounting_width'])/gear_hollow_radius))
   #portion_tooth_nb
   gear_portion_angle = 2*math.pi*(c['portion_tooth_nb']+1)/c['virtual_tooth_nb']
   if(gear_portion_angle<minimal_gear_portion_angle):
-    print("ERR205: Error, portion_tooth_nb {:d} is too small compare to gear_module {:0.3f}, virtual_tooth_nb {:d} and cube_width {:0.3f}".format(c['portion_tooth_nb'], c['gear_module'], c['virtual_tooth_nb'], c['cube_width']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR205: Error, portion_tooth_nb {:d} is too small compare to gear_module {:0.3f}, virtual_tooth_nb {:d} and cube_width {:0.3f}".format(c['portion_tooth_nb'], c['gear_module'], c['virtual_tooth_nb'], c['cube_width']))
   if(gear_portion_angle>maximal_gear_portion_angle):
-    print("ERR208: Error, portion_tooth_nb {:d} is too big compare to gear_module {:0.3f}, virtual_tooth_nb {:d}, free_mounting_width {:0.3f} and cube_width {:0.3f}".format(c['portion_tooth_nb'], c['gear_module'], c['virtual_tooth_nb'], c['free_mounting_width'], c['cube_width']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR208: Error, portion_tooth_nb {:d} is too big compare to gear_module {:0.3f}, virtual_tooth_nb {:d}, free_mounting_width {:0.3f} and cube_width {:0.3f}".format(c['portion_tooth_nb'], c['gear_module'], c['virtual_tooth_nb'], c['free_mounting_width'], c['cube_width']))
   #free_mounting_width
   if(c['free_mounting_width']<max(c['face_B1_thickness'], c['face_B2_thickness'])+c['crest_cnc_router_bit_radius']):
-    print("ERR212: Error, free_mounting_width {:0.3f} is too small compare to face_B1_thickness {:0.3f}, face_B2_thickness {:0.3f} and crest_cnc_router_bit_radius {:0.3f}".format(c['free_mounting_width'], c['face_B1_thickness'], c['face_B2_thickness'], c['crest_cnc_router_bit_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR212: Error, free_mounting_width {:0.3f} is too small compare to face_B1_thickness {:0.3f}, face_B2_thickness {:0.3f} and crest_cnc_router_bit_radius {:0.3f}".format(c['free_mounting_width'], c['face_B1_thickness'], c['face_B2_thickness'], c['crest_cnc_router_bit_radius']))
   if(c['free_mounting_width']+c['cube_width']/2.0>gear_hollow_radius):
-    print("ERR215: Error, free_mounting_width {:0.3f} is too big compare to cube_width {:0.3f} and gear_hollow_radius {:0.3f}".format(c['free_mounting_width'], c['cube_width'], gear_hollow_radius))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR215: Error, free_mounting_width {:0.3f} is too big compare to cube_width {:0.3f} and gear_hollow_radius {:0.3f}".format(c['free_mounting_width'], c['cube_width'], gear_hollow_radius))
   ### crest_hollow
   #crest_hollow_leg_nb # possible values: 1(filled), 2(end-legs only), 3, 4 ...
   if(c['crest_hollow_leg_nb']<1):
-    print("ERR220: Error, crest_hollow_leg_nb {:d} must be bigger or equal to 1".format(c['crest_hollow_leg_nb']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR220: Error, crest_hollow_leg_nb {:d} must be bigger or equal to 1".format(c['crest_hollow_leg_nb']))
   #end_leg_width
   if(c['end_leg_width']<radian_epsilon):
-    print("ERR224: Error, end_leg_width {:0.3f} must be strictly positive".format(c['end_leg_width']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR224: Error, end_leg_width {:0.3f} must be strictly positive".format(c['end_leg_width']))
   if(c['end_leg_width']>0.7*2*math.pi*gear_hollow_radius*gear_portion_angle/c['crest_hollow_leg_nb']):
-    print("ERR228: Error, end_leg_width {:0.3f} is too big compare to gear_hollow_radius {:0.3f}, gear_portion_angle {:0.3f} and crest_hollow_leg_nb {:d}".format(c['end_leg_width'], gear_hollow_radius, gear_portion_angle, c['crest_hollow_leg_nb']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR228: Error, end_leg_width {:0.3f} is too big compare to gear_hollow_radius {:0.3f}, gear_portion_angle {:0.3f} and crest_hollow_leg_nb {:d}".format(c['end_leg_width'], gear_hollow_radius, gear_portion_angle, c['crest_hollow_leg_nb']))
   #middle_leg_width
   if(c['middle_leg_width']==0):
     c['middle_leg_width'] = c['end_leg_width']
   if(c['middle_leg_width']<radian_epsilon):
-    print("ERR232: Error, middle_leg_width {:0.3f} must be strictly positive".format(c['middle_leg_width']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR232: Error, middle_leg_width {:0.3f} must be strictly positive".format(c['middle_leg_width']))
   if(c['middle_leg_width']>0.7*2*math.pi*gear_hollow_radius*gear_portion_angle/c['crest_hollow_leg_nb']):
-    print("ERR235: Error, middle_leg_width {:0.3f} is too big compare to gear_hollow_radius {:0.3f}, gear_portion_angle {:0.3f} and crest_hollow_leg_nb {:d}".format(c['middle_leg_width'], gear_hollow_radius, gear_portion_angle, c['crest_hollow_leg_nb']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR235: Error, middle_leg_width {:0.3f} is too big compare to gear_hollow_radius {:0.3f}, gear_portion_angle {:0.3f} and crest_hollow_leg_nb {:d}".format(c['middle_leg_width'], gear_hollow_radius, gear_portion_angle, c['crest_hollow_leg_nb']))
   #crest_hollow_external_diameter
   c['crest_hollow_external_radius'] = c['crest_hollow_external_diameter']/2.0
   if(c['crest_hollow_external_radius']==0):
     c['crest_hollow_external_radius'] = gear_hollow_radius - 1.5*c['gear_module']
   if(c['crest_hollow_external_radius']>gear_hollow_radius):
-    print("ERR244: Error, crest_hollow_external_radius {:0.3f} is too big compare to gear_hollow_radius {:0.3f}".format(c['crest_hollow_external_radius'], gear_hollow_radius))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR244: Error, crest_hollow_external_radius {:0.3f} is too big compare to gear_hollow_radius {:0.3f}".format(c['crest_hollow_external_radius'], gear_hollow_radius))
   #crest_hollow_internal_diameter
   c['crest_hollow_internal_radius'] = c['crest_hollow_internal_diameter']/2.0
   minimal_crest_hollow_internal_radius = math.sqrt((c['cube_width']/2.0)**2+(c['top_thickness']+c['height_margin']+c['axle_diameter']/2.0)**2)
   if(c['crest_hollow_internal_radius']==0):
     c['crest_hollow_internal_radius'] = minimal_crest_hollow_internal_radius
   if(c['crest_hollow_internal_radius']<minimal_crest_hollow_internal_radius):
-    print("ERR252: Error, crest_hollow_internal_radius {:0.3f} must be bigger than minimal_crest_hollow_internal_radius {:0.3f}".format(c['crest_hollow_internal_radius'], minimal_crest_hollow_internal_radius))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR252: Error, crest_hollow_internal_radius {:0.3f} must be bigger than minimal_crest_hollow_internal_radius {:0.3f}".format(c['crest_hollow_internal_radius'], minimal_crest_hollow_internal_radius))
   #floor_width
   if(c['floor_width']==0):
     c['floor_width'] = c['end_leg_width']
   if(c['floor_width']<radian_epsilon):
-    print("ERR257: Error, floor_width {:0.3f} must be strictly positive".format(c['floor_width']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR257: Error, floor_width {:0.3f} must be strictly positive".format(c['floor_width']))
   if(c['floor_width']+c['top_thickness']+c['height_margin']+c['axle_diameter']/2.0>gear_hollow_radius):
-    print("ERR260: Error, floor_width {:0.3f} is too big compare to top_thickness {:0.3f}, height_margin {:0.3f}, axle_diameter {:0.3f} and gear_hollow_radius {:0.3f}".format(c['floor_width'], c['top_thickness'], c['height_margin'], c['axle_diameter'], gear_hollow_radius))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR260: Error, floor_width {:0.3f} is too big compare to top_thickness {:0.3f}, height_margin {:0.3f}, axle_diameter {:0.3f} and gear_hollow_radius {:0.3f}".format(c['floor_width'], c['top_thickness'], c['height_margin'], c['axle_diameter'], gear_hollow_radius))
   #crest_hollow_smoothing_radius
   max_leg_width = max(c['end_leg_width'], c['middle_leg_width'])
   maximal_crest_hollow_smoothing_radius = (c['crest_hollow_external_radius']*float(gear_portion_angle)/c['crest_hollow_leg_nb'] - max_leg_width)/3.0
   if(c['crest_hollow_smoothing_radius']==0):
     c['crest_hollow_smoothing_radius'] = min(0.5*maximal_crest_hollow_smoothing_radius, 0.2*abs(c['crest_hollow_external_radius']-c['crest_hollow_internal_radius']))
   if(c['crest_hollow_smoothing_radius']<c['crest_cnc_router_bit_radius']):
-    print("ERR267: Error, crest_hollow_smoothing_radius {:0.3f} must be bigger than crest_cnc_router_bit_radius {:0.3f}".format(c['crest_hollow_smoothing_radius'], c['crest_cnc_router_bit_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR267: Error, crest_hollow_smoothing_radius {:0.3f} must be bigger than crest_cnc_router_bit_radius {:0.3f}".format(c['crest_hollow_smoothing_radius'], c['crest_cnc_router_bit_radius']))
   if(c['crest_hollow_smoothing_radius']>maximal_crest_hollow_smoothing_radius):
-    print("ERR270: Error, crest_hollow_smoothing_radius {:0.3f} must be smaller than maximal_crest_hollow_smoothing_radius {:0.3f}".format(c['crest_hollow_smoothing_radius'], maximal_crest_hollow_smoothing_radius))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR270: Error, crest_hollow_smoothing_radius {:0.3f} must be smaller than maximal_crest_hollow_smoothing_radius {:0.3f}".format(c['crest_hollow_smoothing_radius'], maximal_crest_hollow_smoothing_radius))
   if(c['crest_hollow_external_radius']<c['crest_hollow_internal_radius']+2.5*c['crest_hollow_smoothing_radius']):
-    print("ERR265: Error, crest_hollow_external_radius {:0.3f} is too small compare to crest_hollow_internal_radius {:0.3f} and crest_hollow_smoothing_radius {:0.3f}".format(c['crest_hollow_external_radius'], c['crest_hollow_internal_radius'], c['crest_hollow_smoothing_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR265: Error, crest_hollow_external_radius {:0.3f} is too small compare to crest_hollow_internal_radius {:0.3f} and crest_hollow_smoothing_radius {:0.3f}".format(c['crest_hollow_external_radius'], c['crest_hollow_internal_radius'], c['crest_hollow_smoothing_radius']))
   ### gear_holes
   #fastening_hole_diameter
   c['fastening_hole_radius'] = c['fastening_hole_diameter']/2.0
   #fastening_hole_position
   if(c['crest_hollow_external_radius'] + c['fastening_hole_position'] + c['fastening_hole_radius']>gear_hollow_radius):
-    print("ERR282: Error, fastening_hole_position {:0.3f} or fastening_hole_radius {:0.3f} are too big compare to crest_hollow_external_radius {:0.3f} and gear_hollow_radius {:0.3f}".format(c['fastening_hole_position'], c['fastening_hole_radius'], c['crest_hollow_external_radius'], gear_hollow_radius))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR282: Error, fastening_hole_position {:0.3f} or fastening_hole_radius {:0.3f} are too big compare to crest_hollow_external_radius {:0.3f} and gear_hollow_radius {:0.3f}".format(c['fastening_hole_position'], c['fastening_hole_radius'], c['crest_hollow_external_radius'], gear_hollow_radius))
   #centring_hole_diameter
   c['centring_hole_radius'] = c['centring_hole_diameter']/2.0
   #centring_hole_distance
   if(c['centring_hole_distance']<2.1*c['centring_hole_radius']):
-    print("ERR288: Error, centring_hole_distance {:0.3f} is too small compare to centring_hole_radius {:0.3f}".format(c['centring_hole_distance'], c['centring_hole_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR288: Error, centring_hole_distance {:0.3f} is too small compare to centring_hole_radius {:0.3f}".format(c['centring_hole_distance'], c['centring_hole_radius']))
   #centring_hole_position
   if(c['crest_hollow_external_radius'] + c['centring_hole_position'] + c['centring_hole_radius']>gear_hollow_radius):
-    print("ERR292: Error, centring_hole_position {:0.3f} or centring_hole_radius {:0.3f} are too big compare to crest_hollow_external_radius {:0.3f} and gear_hollow_radius {:0.3f}".format(c['centring_hole_position'], c['centring_hole_radius'], c['crest_hollow_external_radius'], gear_hollow_radius))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR292: Error, centring_hole_position {:0.3f} or centring_hole_radius {:0.3f} are too big compare to crest_hollow_external_radius {:0.3f} and gear_hollow_radius {:0.3f}".format(c['centring_hole_position'], c['centring_hole_radius'], c['crest_hollow_external_radius'], gear_hollow_radius))
   ## part thickness
   #crest_thickness
   if(c['crest_thickness']<radian_epsilon):
-    print("ERR297: Error, crest_thickness {:0.3f} must be strictly positive".format(c['crest_thickness']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR297: Error, crest_thickness {:0.3f} must be strictly positive".format(c['crest_thickness']))
   ### manufacturing
   #crest_cnc_router_bit_radius
   if(c['gear_router_bit_radius']<c['crest_cnc_router_bit_radius']):
@@ -290,8 +268,7 @@ def crest_2d_construction(c):
   gear_profile_B = i_gear_profile.get_A_figure('first_gear')[0]
   # gear_profile check
   if(abs(gear_profile_B[0][1]-gear_profile_B[-1][-1])>radian_epsilon):
-    print("ERR335: Error, extremities of the gear_profile_B have different y-coordiante {:0.3f} {:0.3f}".format(gear_profile_B[0][1], gear_profile_B[-1][-1]))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR335: Error, extremities of the gear_profile_B have different y-coordiante {:0.3f} {:0.3f}".format(gear_profile_B[0][1], gear_profile_B[-1][-1]))
   # gear_profile extremity angle
   crest_gear_angle = math.atan2(gear_profile_B[0][1]-cy, gear_profile_B[0][0]-cx)
  
@@ -370,8 +347,7 @@ def crest_2d_construction(c):
       ia1 = in1_angles[i]
       ia2 = in2_angles[i]
       if((ea2-ea1)<2.1*smoothing_ex_half_angle):
-        print("ERR419: Error, crest_hollow_smoothing_radius {:0.3f} or crest_hollow_leg_nb {:d} are too big".format(chsr, chln))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR419: Error, crest_hollow_smoothing_radius {:0.3f} or crest_hollow_leg_nb {:d} are too big".format(chsr, chln))
       hollow = []
       hollow.append((cx+cher*math.cos(ea1), cy+cher*math.sin(ea1), chsr))
       hollow.append((cx+cher*math.cos(ma), cy+cher*math.sin(ma), cx+cher*math.cos(ea2), cy+cher*math.sin(ea2), chsr))
@@ -555,9 +531,9 @@ class crest(cnc25d_api.bare_design):
 
 # this works with python and freecad :)
 if __name__ == "__main__":
-  FreeCAD.Console.PrintMessage("crest.py says hello!\n")
+  print("crest.py says hello!")
   my_c = crest()
-  my_c.cli()
+  cnc25d_api.cli_shim(my_c.cli)
   #my_c.cli("--cross_cube_extra_cut_thickness 1.0")
   if(cnc25d_api.interpretor_is_freecad()):
     Part.show(my_c.get_fc_obj_3dconf('crest_3dconf1'))
@@ -30,7 +30,7 @@ The main function displays in a Tk-interface the cross_cube piece, or generates
 ################################################################
 
 import cnc25d_api
-cnc25d_api.importing_freecad()
+#cnc25d_api.importing_freecad() # FreeCAD is imported on first use by lazy_import
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -46,7 +46,7 @@ import sys, argparse
 #import re # to detect .dxf or .svg
 #import Tkinter # to display the outline in a small GUI
 #
-import Part
+from lazy_import import Part
 #from FreeCAD import Base
 # 3rd parties
 #import svgwrite
@@ -434,11 +434,11 @@ class cross_cube(cnc25d_api.bare_design):
 
 # this works with python and freecad :)
 if __name__ == "__main__":
-  FreeCAD.Console.PrintMessage("cross_cube.py says hello!\n")
+  print("cross_cube.py says hello!")
   my_cc = cross_cube()
   #my_cc.cli()
   #my_cc.cli("--cross_cube_extra_cut_thickness 1.0")
-  my_cc.cli("--cross_cube_extra_cut_thickness 1.0 --face_A1_crest --face_B1_crest")
+  cnc25d_api.cli_shim(my_cc.cli, "--cross_cube_extra_cut_thickness 1.0 --face_A1_crest --face_B1_crest")
   if(cnc25d_api.interpretor_is_freecad()):
     Part.show(my_cc.get_fc_obj_3dconf('cross_cube_bare_assembly'))
 
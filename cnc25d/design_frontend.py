@@ -44,6 +44,8 @@ import math
 import sys
 import re
 #import argparse
+#
+import cnc25d_error
 #from datetime import datetime
 #import os, errno
 ## cnc25d
@@ -60,7 +62,7 @@ import re
 ################################################################
 
 def check(constraint_dict={}, error_id="ERR000", error_msg='', constraint_dict_name='c', condition=None, warning_nerror=False):
-  """ If the condition is False, print the error-message with the associated constraints and exit
+  """ If the condition is False, raise a Cnc25dConstraintError with the error-message and the associated constraints
       If the condition is set to None, the error_msg is evaluated
   """
   test_result = condition
@@ -75,7 +77,7 @@ def check(constraint_dict={}, error_id="ERR000", error_msg='', constraint_dict_n
       msg_introduction = "Warning on"
     #print("ERR073: Error on {:s} with:".format(error_msg))
     error_msg_without_dict = re.sub("'\]", " ", re.sub("{:s}\['".format(constraint_dict_name), " ", error_msg))
-    print("{:s}: {:s} {:s} with:".format(error_id, msg_introduction, error_msg_without_dict))
+    msg_lines = ["{:s}: {:s} {:s} with:".format(error_id, msg_introduction, error_msg_without_dict)]
     var_list = re.findall("{:s}\['\w+'\]".format(constraint_dict_name), error_msg)
     #print("dbg075: var_list:", var_list)
     for d_item in var_list:
@@ -83,12 +85,11 @@ def check(constraint_dict={}, error_id="ERR000", error_msg='', constraint_dict_n
       #d_key = re.sub("^.*\['(\w+)'\]$", "\1", d_item)
       #print("dbg078: d_key:", d_key)
       d_val = constraint_dict[d_key]
-      print("{:s}['{:s}'] = {:s}".format(constraint_dict_name, d_key, str(d_val)))
+      msg_lines.append("{:s}['{:s}'] = {:s}".format(constraint_dict_name, d_key, str(d_val)))
     if(not warning_nerror):
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dConstraintError("\n".join(msg_lines))
     else:
-      pass
-      #print("Should exit with error status 2")
+      print("\n".join(msg_lines))
   return(0)
 
 ################################################################
@@ -30,7 +30,7 @@ it provide macro that are commonly used to generate the output files of a design
 ################################################################
 
 import importing_freecad
-importing_freecad.importing_freecad()
+#importing_freecad.importing_freecad() # FreeCAD is imported on first use by lazy_import
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -46,10 +46,12 @@ from datetime import datetime
 #import os, errno
 import os
 import re
+import hashlib # for figure_hash()
+import multiprocessing # for the parallel fuse of the assemblies
 #import Tkinter # to display the outline in a small GUI
 # FreeCAD
-import Part
-from FreeCAD import Base
+from lazy_import import Part
+from lazy_import import Base
 # 3rd parties
 #import svgwrite
 #from dxfwrite import DXFEngine
@@ -58,9 +60,31 @@ import outline_backends
 import export_2d
 import design_help
 import cnc_outline
+import outline_array
 import positioning
+import mesh_extrusion
+import analytic_slicer
+import design_profile
+import cnc25d_error
 
 
+################################################################
+# global variable
+################################################################
+
+# outlines with at least this number of points are cnc-cut with the batch corner solver
+cnc_cut_batch_threshold = 64
+# SVG writer used by generate_output_file(): 'stream' (write_figure_in_svg_stream) or 'svgwrite' (write_figure_in_svg)
+svg_writer = 'stream'
+# DXF writer used by generate_output_file(): 'polyline' (write_figure_in_dxf_stream with one POLYLINE with bulges per outline, DXF R12), 'line_arc' (write_figure_in_dxf_stream with LINE and ARC, DXF R12) or 'dxfwrite' (write_figure_in_dxf)
+dxf_writer = 'polyline'
+# STL writer: 'mesh' (mesh_extrusion, without FreeCAD, with a FreeCAD fallback for the figures it can not extrude) or 'freecad' (extrusion and exportStl() of FreeCAD)
+stl_writer = 'mesh'
+# XYZ slicer of the 3D assemblies: 'analytic' (analytic_slicer, without FreeCAD booleans) or 'freecad' (export_2d.export_xyz_to_dxf() on the fused assembly)
+slice_writer = 'analytic'
+# the ways to merge the parts of a 3D assembly (see figures_to_freecad_assembly())
+fuse_modes = ('sequential', 'tree', 'compound', 'parallel')
+
 ################################################################
 # help functions
 ################################################################
@@ -104,32 +128,53 @@ def generate_output_file(ai_figure, ai_output_filename, ai_height, ai_info_txt='
     design_help.mkdir_p(l_output_dir)
     #l_output_basename = os.path.basename(ai_output_filename)
     #print("dbg449: l_output_basename:", l_output_basename)
-    # mozman dxfwrite
-    if(re.search('\.dxf$', ai_output_filename)):
-      #print("Generate {:s} with mozman dxfwrite".format(ai_output_filename))
-      outline_backends.write_figure_in_dxf(ai_figure, ai_output_filename)
-    # mozman svgwrite
-    elif(re.search('\.svg$', ai_output_filename)):
-      #print("Generate {:s} with mozman svgwrite".format(ai_output_filename))
-      outline_backends.write_figure_in_svg(ai_figure, ai_output_filename)
-    # FreeCAD
-    elif(re.search('\.brep$', ai_output_filename)):
-      print("Generate with FreeCAD the BRep file {:s}".format(ai_output_filename))
-      freecad_part = outline_backends.figure_to_freecad_25d_part(ai_figure, ai_height)
-      freecad_part.exportBrep("{:s}".format(ai_output_filename))
-      print("Generate with FreeCAD the DXF file {:s}.dxf".format(ai_output_filename))
-      # slice freecad_part  in the XY plan at a height of ai_height/2
-      export_2d.export_to_dxf(freecad_part, Base.Vector(0,0,1), ai_height/2, "{:s}.dxf".format(ai_output_filename))
-    elif(re.search('\.stl$', ai_output_filename)):
-      print("Generate with FreeCAD the STL file {:s}".format(ai_output_filename))
-      freecad_part = outline_backends.figure_to_freecad_25d_part(ai_figure, ai_height)
-      freecad_part.exportStl("{:s}".format(ai_output_filename))
-      print("Generate with FreeCAD the DXF file {:s}.dxf".format(ai_output_filename))
-      # slice freecad_part  in the XY plan at a height of ai_height/2
-      export_2d.export_to_dxf(freecad_part, Base.Vector(0,0,1), ai_height/2, "{:s}.dxf".format(ai_output_filename))
-    else:
-      print("ERR124: Error: the suffix of the filename {:s} is unknown. Try with suffix: .dxf, .svg, .brep or .stl".format(ai_output_filename))
-      sys.exit(2)
+    # one stage per backend: write_dxf, write_svg, write_svgz, write_brep, write_stl
+    with design_profile.stage("write_{:s}".format(os.path.splitext(ai_output_filename)[1][1:])):
+      # streaming DXF writer or mozman dxfwrite
+      if(re.search('\.dxf$', ai_output_filename)):
+        #print("Generate {:s} with mozman dxfwrite".format(ai_output_filename))
+        if(dxf_writer=='dxfwrite'):
+          outline_backends.write_figure_in_dxf(ai_figure, ai_output_filename)
+        else:
+          outline_backends.write_figure_in_dxf_stream(ai_figure, ai_output_filename, ai_polyline=(dxf_writer=='polyline'))
+      # mozman svgwrite or streaming SVG writer
+      elif(re.search('\.svg$', ai_output_filename)):
+        #print("Generate {:s} with mozman svgwrite".format(ai_output_filename))
+        if(svg_writer=='svgwrite'):
+          outline_backends.write_figure_in_svg(ai_figure, ai_output_filename)
+        else:
+          outline_backends.write_figure_in_svg_stream(ai_figure, ai_output_filename)
+      elif(re.search('\.svgz$', ai_output_filename)):
+        outline_backends.write_figure_in_svg_stream(ai_figure, ai_output_filename, ai_gzip=True)
+      # FreeCAD
+      elif(re.search('\.brep$', ai_output_filename)):
+        print("Generate with FreeCAD the BRep file {:s}".format(ai_output_filename))
+        freecad_part = outline_backends.figure_to_freecad_25d_part(ai_figure, ai_height)
+        freecad_part.exportBrep("{:s}".format(ai_output_filename))
+        print("Generate with FreeCAD the DXF file {:s}.dxf".format(ai_output_filename))
+        # slice freecad_part  in the XY plan at a height of ai_height/2
+        export_2d.export_to_dxf(freecad_part, Base.Vector(0,0,1), ai_height/2, "{:s}.dxf".format(ai_output_filename))
+      elif(re.search('\.stl$', ai_output_filename)):
+        mesh_done = False
+        if(stl_writer=='mesh'):
+          try:
+            mesh_extrusion.figure_to_stl(ai_figure, ai_height, ai_output_filename)
+            # the slice of the extruded figure at ai_height/2 is the figure itself
+            outline_backends.write_figure_in_dxf_stream(ai_figure, "{:s}.dxf".format(ai_output_filename), ai_polyline=(dxf_writer=='polyline'))
+            mesh_done = True
+          except cnc25d_error.Cnc25dBackendError as err:
+            if(not err.code in mesh_extrusion.freecad_fallback_codes):
+              raise
+            print("WARN920: Warning, the mesh extruder fails ({:s}). The figure is extruded with FreeCAD.".format(err.message))
+        if(not mesh_done):
+          print("Generate with FreeCAD the STL file {:s}".format(ai_output_filename))
+          freecad_part = outline_backends.figure_to_freecad_25d_part(ai_figure, ai_height)
+          freecad_part.exportStl("{:s}".format(ai_output_filename))
+          print("Generate with FreeCAD the DXF file {:s}.dxf".format(ai_output_filename))
+          # slice freecad_part  in the XY plan at a height of ai_height/2
+          export_2d.export_to_dxf(freecad_part, Base.Vector(0,0,1), ai_height/2, "{:s}.dxf".format(ai_output_filename))
+      else:
+        raise cnc25d_error.Cnc25dBackendError("ERR124: Error: the suffix of the filename {:s} is unknown. Try with suffix: .dxf, .svg, .svgz, .brep or .stl".format(ai_output_filename))
     # info_txt
     #if(ai_info_txt!=''):
     #  output_basename = re.sub('(\.dxf$)|(\.svg$)', '', ai_output_filename)
@@ -148,15 +193,16 @@ def freecad_object_output_file(ai_freecad_object, ai_output_filename, ai_brep=Tr
   if(ai_brep):
     brep_output_filename = "{:s}.brep".format(ai_output_filename)
     print("Generate with FreeCAD the BRep file {:s}".format(brep_output_filename))
-    ai_freecad_object.exportBrep(brep_output_filename)
+    with design_profile.stage('freecad_export_brep'):
+      ai_freecad_object.exportBrep(brep_output_filename)
   if(ai_stl):
     stl_output_filename = "{:s}.stl".format(ai_output_filename)
     print("Generate with FreeCAD the STL file {:s}".format(stl_output_filename))
-    ai_freecad_object.exportStl(stl_output_filename)
+    with design_profile.stage('freecad_export_stl'):
+      ai_freecad_object.exportStl(stl_output_filename)
   if(len(ai_slice_xyz)>0):
     if(len(ai_slice_xyz)!=9):
-      print("ERR150: Error, len(ai_slice_xyz) {:d} must be 9".format(len(ai_slice_xyz)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dBackendError("ERR150: Error, len(ai_slice_xyz) {:d} must be 9".format(len(ai_slice_xyz)))
     size_x = ai_slice_xyz[0]
     size_y = ai_slice_xyz[1]
     size_z = ai_slice_xyz[2]
@@ -169,16 +215,36 @@ def freecad_object_output_file(ai_freecad_object, ai_output_filename, ai_brep=Tr
     dxf_output_filename = "{:s}_xyz_slices.dxf".format(ai_output_filename)
     print("Slice with FreeCAD the 3D into the DXF file {:s}".format(dxf_output_filename))
     #print("dbg161: zero_x {:0.3f}  zero_y {:0.3f}  zero_z {:0.3f}".format(zero_x, zero_y, zero_z))
-    ai_freecad_object.translate(Base.Vector(-1*zero_x, -1*zero_y, -1*zero_z))
-    export_2d.export_xyz_to_dxf(ai_freecad_object, size_x, size_y, size_z, slice_x, slice_y, slice_z, dxf_output_filename)
+    with design_profile.stage('freecad_xyz_slices'):
+      ai_freecad_object.translate(Base.Vector(-1*zero_x, -1*zero_y, -1*zero_z))
+      export_2d.export_xyz_to_dxf(ai_freecad_object, size_x, size_y, size_z, slice_x, slice_y, slice_z, dxf_output_filename)
   return(0)
 
-def generate_3d_assembly_output_file(ai_3d_conf, ai_output_filename, ai_brep=True, ai_stl=False, ai_slice_xyz=[]):
+def generate_3d_assembly_output_file(ai_3d_conf, ai_output_filename, ai_brep=True, ai_stl=False, ai_slice_xyz=[], ai_fuse_mode='sequential', ai_jobs=0):
   """ implement the swith --output_file_basename for 3D assembly
+      with stl_writer='mesh', the STL file is written by mesh_extrusion, or by FreeCAD if one figure can not be extruded into a mesh
+      with slice_writer='analytic', the XYZ slices are computed by analytic_slicer with ai_jobs processes
+      FreeCAD computes the assembly only for the remaining outputs
   """
-  print("Compute with FreeCAD the 3D assembly {:s}".format(ai_output_filename))
-  fc_assembly = figures_to_freecad_assembly(ai_3d_conf)
-  freecad_object_output_file(fc_assembly, ai_output_filename, ai_brep, ai_stl, ai_slice_xyz)
+  fc_stl = ai_stl
+  if(ai_stl and (stl_writer=='mesh')):
+    try:
+      with design_profile.stage('mesh_stl_assembly'):
+        mesh_extrusion.figures_to_stl_assembly(ai_3d_conf, "{:s}.stl".format(ai_output_filename))
+      fc_stl = False
+    except cnc25d_error.Cnc25dBackendError as err:
+      if(not err.code in mesh_extrusion.freecad_fallback_codes):
+        raise
+      print("WARN920: Warning, the mesh extruder fails ({:s}). The assembly is extruded with FreeCAD.".format(err.message))
+  fc_slice_xyz = ai_slice_xyz
+  if((len(ai_slice_xyz)>0) and (slice_writer=='analytic')):
+    with design_profile.stage('analytic_xyz_slices'):
+      analytic_slicer.xyz_slices_to_dxf(ai_3d_conf, ai_slice_xyz, "{:s}_xyz_slices.dxf".format(ai_output_filename), ai_jobs)
+    fc_slice_xyz = []
+  if(ai_brep or fc_stl or (len(fc_slice_xyz)>0)):
+    print("Compute with FreeCAD the 3D assembly {:s} (fuse mode: {:s})".format(ai_output_filename, ai_fuse_mode))
+    fc_assembly = figures_to_freecad_assembly(ai_3d_conf, ai_fuse_mode, ai_jobs)
+    freecad_object_output_file(fc_assembly, ai_output_filename, ai_brep, fc_stl, fc_slice_xyz)
   return(0)
 
 def flip_rotate_and_translate_figure(ai_figure, ai_zero_x, ai_zero_y, ai_size_x, ai_size_y, ai_x_flip, ai_y_flip, ai_rotation_angle, ai_translate_x, ai_translate_y):
@@ -186,12 +252,19 @@ def flip_rotate_and_translate_figure(ai_figure, ai_zero_x, ai_zero_y, ai_size_x,
   """
   r_figure = []
   for i in range(len(ai_figure)):
-    centered_ol = cnc_outline.outline_shift_xy(ai_figure[i], -1*(ai_zero_x+ai_size_x/2.0), 1, -1*(ai_zero_y+ai_size_y/2.0), 1)
+    if(cnc_outline.check_outline_format(ai_figure[i])==0): # circle of format-B
+      i_ol = ai_figure[i]
+    else: # the four transformations are applied on the numpy arrays and the outline is converted back only once
+      i_ol = outline_array.outline_to_array(ai_figure[i])
+    centered_ol = cnc_outline.outline_shift_xy(i_ol, -1*(ai_zero_x+ai_size_x/2.0), 1, -1*(ai_zero_y+ai_size_y/2.0), 1)
     flipped_ol = cnc_outline.outline_shift_xy(centered_ol, 0.0, ai_x_flip, 0.0, ai_y_flip)
     #flipped_ol = cnc_outline.outline_shift_xy(centered_ol, 0, ai_x_flip, 0, ai_y_flip) # what makes the most sense? re-shift or not?
     rotated_ol = cnc_outline.outline_rotate(flipped_ol, 0.0, 0.0, ai_rotation_angle)
     translated_ol = cnc_outline.outline_shift_xy(rotated_ol, ai_size_x/2.0+ai_translate_x, 1, ai_size_y/2.0+ai_translate_y, 1)
-    r_figure.append(translated_ol[:])
+    if(isinstance(translated_ol, outline_array.Outline_Array)):
+      r_figure.append(translated_ol.to_outline())
+    else:
+      r_figure.append(translated_ol[:])
   return(r_figure)
 
 def rotate_and_translate_figure(ai_figure, ai_rotation_center_x, ai_rotation_center_y, ai_rotation_angle, ai_translate_x, ai_translate_y):
@@ -207,12 +280,16 @@ def cnc_cut_figure(ai_figure, ai_error_msg_id):
   """ apply the cnc_cut_outline function to all outlines of the input figure
   """
   r_figure = []
-  for i in range(len(ai_figure)):
-    #print("dbg133:", ai_figure[i])
-    if(cnc_outline.check_outline_format(ai_figure[i])==2):
-      r_figure.append(cnc_outline.cnc_cut_outline(ai_figure[i], "{:s}.ol{:d}".format(ai_error_msg_id, i)))
-    else: # circle of format-B
-      r_figure.append(ai_figure[i])
+  with design_profile.stage('cnc_cut_figure'):
+    for i in range(len(ai_figure)):
+      #print("dbg133:", ai_figure[i])
+      if(cnc_outline.check_outline_format(ai_figure[i])==2):
+        if(len(ai_figure[i])>=cnc_cut_batch_threshold):
+          r_figure.append(cnc_outline.cnc_cut_outline_batch(ai_figure[i], "{:s}.ol{:d}".format(ai_error_msg_id, i)))
+        else:
+          r_figure.append(cnc_outline.cnc_cut_outline(ai_figure[i], "{:s}.ol{:d}".format(ai_error_msg_id, i)))
+      else: # circle of format-B
+        r_figure.append(ai_figure[i])
   return(r_figure)
 
 def ideal_figure(ai_figure, ai_error_msg_id):
@@ -227,27 +304,111 @@ def ideal_figure(ai_figure, ai_error_msg_id):
       r_figure.append(ai_figure[i])
   return(r_figure)
 
-def figures_to_freecad_assembly(ai_figure_assembly):
+def figure_hash(ai_figure):
+  """ return a sha1 hex string that identifies the content of the figure ai_figure
+  """
+  r_hash = hashlib.sha1(repr(ai_figure)).hexdigest()
+  return(r_hash)
+
+def fuse_tree(ai_shapes):
+  """ fuse the list of FreeCAD shapes ai_shapes with a balanced pairwise reduction
+      the shapes fused together stay small, so the total cost of the boolean operations is lower than with a left-to-right fuse
+  """
+  shapes = list(ai_shapes)
+  while(len(shapes)>1):
+    fused = []
+    for i in range(0, len(shapes)-1, 2):
+      fused.append(shapes[i].fuse(shapes[i+1]))
+    if(len(shapes)%2==1):
+      fused.append(shapes[-1])
+    shapes = fused
+  r_shape = shapes[0]
+  return(r_shape)
+
+def sub_fuse_brep_strings(ai_brep_strings):
+  """ fuse with fuse_tree() the shapes serialized as BREP strings and return the result as a BREP string
+      This function is executed by the processes of the multiprocessing.Pool of figures_to_freecad_assembly()
+  """
+  shapes = []
+  for brep_string in ai_brep_strings:
+    shape = Part.Shape()
+    shape.importBrepFromString(brep_string)
+    shapes.append(shape)
+  r_brep_string = fuse_tree(shapes).exportBrepToString()
+  return(r_brep_string)
+
+def fuse_parallel(ai_shapes, ai_jobs=0):
+  """ fuse the list of FreeCAD shapes ai_shapes with ai_jobs processes (0: one per CPU)
+      each process fuses a contiguous sub-list (the shapes are transferred as BREP strings), then the partial results are fused with fuse_tree()
+  """
+  jobs = ai_jobs
+  if(jobs==0):
+    jobs = multiprocessing.cpu_count()
+  jobs = min(jobs, len(ai_shapes)//2)
+  if(jobs<2):
+    print("WARN936: Warning, the parallel fuse of {:d} shapes gets {:d} process(es) (requested jobs: {:d}). The shapes are fused with fuse_tree() in the current process".format(len(ai_shapes), max(jobs, 1), ai_jobs))
+    return(fuse_tree(ai_shapes))
+  brep_strings = [ shape.exportBrepToString() for shape in ai_shapes ]
+  chunk_size = (len(brep_strings)+jobs-1)//jobs
+  chunks = [ brep_strings[i:i+chunk_size] for i in range(0, len(brep_strings), chunk_size) ]
+  fuse_pool = multiprocessing.Pool(processes=len(chunks))
+  try:
+    fused_strings = fuse_pool.map(sub_fuse_brep_strings, chunks)
+  finally:
+    fuse_pool.close()
+    fuse_pool.join()
+  partial_shapes = []
+  for brep_string in fused_strings:
+    shape = Part.Shape()
+    shape.importBrepFromString(brep_string)
+    partial_shapes.append(shape)
+  r_shape = fuse_tree(partial_shapes)
+  return(r_shape)
+
+def figures_to_freecad_assembly(ai_figure_assembly, ai_fuse_mode='sequential', ai_jobs=0, ai_instance_cache=True):
   """ Extrude figures and place them from a list of figures and 3D positioning instructions
+      ai_fuse_mode selects how the parts are merged:
+        sequential: fuse from left to right (the historical behavior)
+        tree: balanced pairwise fuse (same result, fewer expensive booleans)
+        compound: no boolean operation, just a compound of the parts (fast preview, common faces are not fused)
+        parallel: like tree, but the sub-trees are fused by ai_jobs processes (0: one per CPU)
+      If ai_instance_cache is True, a figure placed several times with the same zero and size_z is extruded once and the other instances are copies
   """
+  if(not ai_fuse_mode in fuse_modes):
+    raise cnc25d_error.Cnc25dBackendError("ERR911: Error, the fuse mode {:s} is unknown. Try: {:s}".format(ai_fuse_mode, ', '.join(fuse_modes)))
   obj_nb = len(ai_figure_assembly)
   if(obj_nb<1):
-    print("ERR235: the freecad assembly must contain at least one figure")
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dBackendError("ERR235: the freecad assembly must contain at least one figure")
   fc_obj = []
+  extruded_parts = {} # instance cache: (figure_hash, zero_x, zero_y, size_z) -> extruded part
   for i in range(obj_nb):
     if(len(ai_figure_assembly[i])!=11):
-      print("ERR219: Error len of ai_figure_assembly {:d} must be 11".format(len(ai_figure_assembly[i])))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dBackendError("ERR219: Error len of ai_figure_assembly {:d} must be 11".format(len(ai_figure_assembly[i])))
     (part_figure, zero_x, zero_y, size_x, size_y, size_z, flip, orientation, translate_x, translate_y, translate_z) = ai_figure_assembly[i]
-    part_figure_zero = rotate_and_translate_figure(part_figure, 0, 0, 0, -1*zero_x, -1*zero_y)
-    part_extruded = outline_backends.figure_to_freecad_25d_part(part_figure_zero, size_z)
+    part_key = None
+    if(ai_instance_cache):
+      part_key = (figure_hash(part_figure), zero_x, zero_y, size_z)
+    if(part_key in extruded_parts):
+      part_extruded = extruded_parts[part_key].copy()
+    else:
+      part_figure_zero = rotate_and_translate_figure(part_figure, 0, 0, 0, -1*zero_x, -1*zero_y)
+      with design_profile.stage('freecad_extrusion'):
+        part_extruded = outline_backends.figure_to_freecad_25d_part(part_figure_zero, size_z)
+      if(ai_instance_cache):
+        extruded_parts[part_key] = part_extruded.copy() # the copy in the cache is never placed
     part_placed = positioning.place_plank(part_extruded, size_x, size_y, size_z, flip, orientation, translate_x, translate_y, translate_z)
-    fc_obj.append(part_placed.copy())
-  #r_assembly = Part.makeCompound(fc_obj) # common face are not fused with makeCompound
-  r_assembly = fc_obj[0]
-  for i in range(obj_nb-1):
-    r_assembly = r_assembly.fuse(fc_obj[i+1])
+    fc_obj.append(part_placed)
+  with design_profile.stage("freecad_fuse_{:s}".format(ai_fuse_mode)):
+    if(ai_fuse_mode=='compound'):
+      r_assembly = Part.makeCompound(fc_obj) # common face are not fused with makeCompound
+    elif(ai_fuse_mode=='tree'):
+      r_assembly = fuse_tree(fc_obj)
+    elif(ai_fuse_mode=='parallel'):
+      r_assembly = fuse_parallel(fc_obj, ai_jobs)
+    else:
+      r_assembly = fc_obj[0]
+      for i in range(obj_nb-1):
+        r_assembly = r_assembly.fuse(fc_obj[i+1])
   return(r_assembly)
 
 ################################################################
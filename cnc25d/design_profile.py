@@ -0,0 +1,274 @@
+# design_profile.py
+# measures the time spent in each stage of a design run
+# created by agent on 2026/10/16
+#
+# (C) Copyright 2026 agent
+#
+# This file is part of the Cnc25D Python package.
+#
+# Cnc25D is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Cnc25D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cnc25D.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+design_profile.py records the wall time, the CPU time and the number of calls of the stages of a design run (constraint construction, f_constraint_check, f_2d_constructor, cnc_cut_figure, the backend writes, the FreeCAD booleans and exports).
+A stage is measured with 'with design_profile.stage("stage_name"):'. When the profiling is disabled (the default), a stage only tests the flag profile_enable.
+The stages can be nested: the time of a stage includes the time of its sub-stages.
+With a profile directory, each stage is also profiled with cProfile and dumped in <profile_dir>/<stage_name>.prof at the end of the run. A stage nested in a profiled stage is included in the cProfile data of its parent.
+"""
+
+################################################################
+# import
+################################################################
+
+import os
+import time
+import json
+import cProfile
+import collections
+import shutil
+import tempfile
+import argparse
+#
+import cnc25d_error
+import design_help # just for get_effective_args()
+
+################################################################
+# global variable
+################################################################
+
+profile_enable = False
+# if not empty, the directory where the cProfile data of each stage is dumped
+profile_dir = ''
+# stage_name -> [call_nb, wall_time, cpu_time], in the order of the first call
+stage_stats = collections.OrderedDict()
+# stage_name -> cProfile.Profile, accumulated over the calls of the stage
+stage_profilers = collections.OrderedDict()
+# the stage currently profiled by cProfile (only one profiler can be active)
+active_profiler_stage = None
+
+################################################################
+# stage measurement
+################################################################
+
+def sub_cpu_time():
+  """ return the user+system CPU time of the process
+  """
+  t = os.times()
+  r_cpu = t[0]+t[1]
+  return(r_cpu)
+
+class stage(object):
+  """ context manager that measures the stage ai_stage_name when profile_enable is True
+  """
+  __slots__ = ('stage_name', 'start_wall', 'start_cpu', 'profiler')
+
+  def __init__(self, ai_stage_name):
+    self.stage_name = ai_stage_name
+    self.start_wall = None
+    self.profiler = None
+
+  def __enter__(self):
+    global active_profiler_stage
+    if(profile_enable):
+      stage_stats.setdefault(self.stage_name, [0, 0.0, 0.0]) # a stage is reported in the order of its first call, before its sub-stages
+      if((profile_dir!='')and(active_profiler_stage==None)):
+        self.profiler = stage_profilers.setdefault(self.stage_name, cProfile.Profile())
+        active_profiler_stage = self.stage_name
+        self.profiler.enable()
+      self.start_cpu = sub_cpu_time()
+      self.start_wall = time.time()
+    return(self)
+
+  def __exit__(self, ai_type, ai_value, ai_traceback):
+    global active_profiler_stage
+    if(self.start_wall!=None): # the stage has been entered with profile_enable
+      wall = time.time()-self.start_wall
+      cpu = sub_cpu_time()-self.start_cpu
+      if(self.profiler!=None):
+        self.profiler.disable()
+        active_profiler_stage = None
+      add_stage_time(self.stage_name, wall, cpu)
+    return(False) # the exceptions are not caught
+
+def add_stage_time(ai_stage_name, ai_wall_time, ai_cpu_time, ai_call_nb=1):
+  """ add a measurement to the stage ai_stage_name (used for the times measured by other processes)
+  """
+  if(profile_enable):
+    stats = stage_stats.setdefault(ai_stage_name, [0, 0.0, 0.0])
+    stats[0] += ai_call_nb
+    stats[1] += ai_wall_time
+    stats[2] += ai_cpu_time
+  return(0)
+
+################################################################
+# profile setup and report
+################################################################
+
+def profile_reset():
+  """ forget the measurements done so far
+  """
+  global active_profiler_stage
+  stage_stats.clear()
+  stage_profilers.clear()
+  active_profiler_stage = None
+  return(0)
+
+def profile_setup(ai_enable=True, ai_profile_dir=''):
+  """ enable or disable the stage measurements and reset them
+      ai_profile_dir: if not empty, each stage is also profiled with cProfile and dumped in this directory by write_profile_report()
+  """
+  global profile_enable
+  global profile_dir
+  profile_enable = ai_enable
+  profile_dir = ai_profile_dir
+  profile_reset()
+  return(0)
+
+def profile_report(ai_title=''):
+  """ return the measurements as a dictionary that can be serialized in JSON
+  """
+  r_report = {'title': ai_title, 'stages': []}
+  for (name, (call_nb, wall, cpu)) in stage_stats.items():
+    r_report['stages'].append({'stage': name, 'calls': call_nb, 'wall_time': wall, 'cpu_time': cpu})
+  return(r_report)
+
+def profile_report_txt(ai_title=''):
+  """ return the measurements as a text table
+  """
+  r_txt = "profile of {:s}:\n".format(ai_title)
+  r_txt += "{:<36s} {:>7s} {:>10s} {:>10s}\n".format('stage', 'calls', 'wall (s)', 'cpu (s)')
+  for (name, (call_nb, wall, cpu)) in stage_stats.items():
+    r_txt += "{:<36s} {:>7d} {:>10.3f} {:>10.3f}\n".format(name, call_nb, wall, cpu)
+  return(r_txt)
+
+def write_profile_report(ai_filename='', ai_title=''):
+  """ print the measurements, write them in the JSON file ai_filename (if not empty) and dump the cProfile data of each stage in profile_dir
+  """
+  print(profile_report_txt(ai_title))
+  if(ai_filename!=''):
+    print("Generate the profile report {:s}".format(ai_filename))
+    try:
+      ofh = open(ai_filename, 'w')
+      json.dump(profile_report(ai_title), ofh, indent=2)
+      ofh.close()
+    except IOError as err:
+      raise cnc25d_error.Cnc25dBackendError("ERR933: Error, the profile report {:s} can not be written: {:s}".format(ai_filename, str(err)))
+  if(profile_dir!=''):
+    if(not os.path.isdir(profile_dir)):
+      os.makedirs(profile_dir)
+    for (name, profiler) in stage_profilers.items():
+      prof_filename = os.path.join(profile_dir, "{:s}.prof".format(name))
+      print("Generate the cProfile file {:s}".format(prof_filename))
+      profiler.dump_stats(prof_filename)
+  return(0)
+
+################################################################
+# ******** test API ***********
+################################################################
+
+def design_profile_test1():
+  """ measure nested stages, a failing stage and an external measurement, then check the report, the JSON file and the cProfile files
+      and check that nothing is measured when the profiling is disabled
+  """
+  r_test = 1
+  dpt_dir = tempfile.mkdtemp()
+  profile_setup(False)
+  with stage('disabled_stage'):
+    time.sleep(0.01)
+  if(len(stage_stats)>0):
+    print("ERR: design_profile a stage is measured while the profiling is disabled")
+    r_test = 0
+  profile_setup(True, os.path.join(dpt_dir, 'prof'))
+  for i in range(2):
+    with stage('outer_stage'):
+      time.sleep(0.02)
+      with stage('inner_stage'):
+        time.sleep(0.03)
+  try:
+    with stage('failing_stage'):
+      raise cnc25d_error.Cnc25dDesignError("ERR000: Error, design_profile_test1 failing stage")
+  except cnc25d_error.Cnc25dDesignError:
+    pass
+  add_stage_time('worker_stage', 1.5, 1.25, 3)
+  report = profile_report('design_profile_test1')
+  stages = dict([ (s['stage'], s) for s in report['stages'] ])
+  if([ s['stage'] for s in report['stages'] ]!=['outer_stage', 'inner_stage', 'failing_stage', 'worker_stage']):
+    print("ERR: design_profile the stages are not reported in the order of their first call")
+    r_test = 0
+  elif([ stages[name]['calls'] for name in ('outer_stage', 'inner_stage', 'failing_stage', 'worker_stage') ]!=[2, 2, 1, 3]):
+    print("ERR: design_profile wrong numbers of calls")
+    r_test = 0
+  elif(not ((stages['inner_stage']['wall_time']>=0.06)and(stages['outer_stage']['wall_time']>=stages['inner_stage']['wall_time']+0.04))):
+    print("ERR: design_profile the wall time of a stage does not include its sub-stages")
+    r_test = 0
+  elif((stages['worker_stage']['wall_time']!=1.5)or(stages['worker_stage']['cpu_time']!=1.25)):
+    print("ERR: design_profile the external measurement is not added")
+    r_test = 0
+  json_filename = os.path.join(dpt_dir, 'report.json')
+  write_profile_report(json_filename, 'design_profile_test1')
+  ifh = open(json_filename, 'r')
+  json_report = json.load(ifh)
+  ifh.close()
+  if(json_report!=report):
+    print("ERR: design_profile the JSON report differs from profile_report()")
+    r_test = 0
+  prof_files = sorted(os.listdir(os.path.join(dpt_dir, 'prof')))
+  if(prof_files!=['failing_stage.prof', 'outer_stage.prof']): # inner_stage is included in the cProfile data of outer_stage
+    print("ERR: design_profile wrong cProfile files: {:s}".format(', '.join(prof_files)))
+    r_test = 0
+  raised_code = ''
+  try:
+    write_profile_report(os.path.join(dpt_dir, 'missing_dir', 'report.json'))
+  except cnc25d_error.Cnc25dBackendError as err:
+    raised_code = err.code
+  if(raised_code!='ERR933'):
+    print("ERR: design_profile the unwritable report raises '{:s}' instead of ERR933".format(raised_code))
+    r_test = 0
+  profile_setup(False)
+  with stage('outer_stage'):
+    pass
+  if((len(stage_stats)>0)or(active_profiler_stage!=None)):
+    print("ERR: design_profile the measurements are not reset by profile_setup(False)")
+    r_test = 0
+  shutil.rmtree(dpt_dir)
+  print("design_profile_test1: {:s}".format("OK" if r_test else "FAILED"))
+  return(r_test)
+
+################################################################
+# ******** command line interface ***********
+################################################################
+
+def design_profile_cli(ai_args=""):
+  """ command line interface to run this script in standalone
+  """
+  dp_parser = argparse.ArgumentParser(description='Test the design_profile API.')
+  dp_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
+    help='Run design_profile_test1()')
+  effective_args = design_help.get_effective_args(ai_args)
+  dp_args = dp_parser.parse_args(effective_args)
+  r_dpc = 0
+  print("dbg111: start testing design_profile.py")
+  if(dp_args.sw_test1):
+    r_dpc = design_profile_test1()
+  print("dbg999: end of script")
+  return(r_dpc)
+
+################################################################
+# main
+################################################################
+
+if __name__ == "__main__":
+  #design_profile_cli()
+  design_profile_cli("--test1")
+
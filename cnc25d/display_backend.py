@@ -33,10 +33,12 @@ display_backend.py creates and displays the two Tkinter Canvas windows used by o
 
 import math
 import sys, argparse
-import Tkinter
+import numpy
+from lazy_import import Tkinter
 #import tkMessageBox
-import matplotlib.pyplot
+from lazy_import import matplotlib # matplotlib.pyplot is imported on first use
 import design_help # just for get_effective_args()
+import cnc25d_error
 
 ################################################################
 # global variable
@@ -49,50 +51,44 @@ g_fast_angle_speed = 1.0
 g_step_angle_speed = float(g_fast_angle_speed)/8
 g_slow_angle_speed = float(g_fast_angle_speed)/16
 g_step_period = 100 # ms
+# screen-space tessellation of the tkinter outlines (see outline_backends.outline_arc_line_with_tkinter())
+tkinter_pixel_scale = 0 # pixels per model unit, set by Two_Canvas while the canvas graphics are computed. 0: model-space tessellation
+tkinter_chord_tolerance = 0.5 # maximal distance in pixel between an arc and its tkinter polyline
 
 ################################################################
 # ******** sub-functions for Two_Canvas ***********
 ################################################################
 
-def find_outline_extremum(ai_outline_list):
-  """ find the four extremum (min_x, min_y, max_x, max_y) of a list of outlines
+def sub_outline_points(ai_outline):
+  """ return the points of an outline of the canvas graphics as a numpy array (n,2)
   """
-  # first point
-  first_point_x = 0
-  first_point_y = 0
-  first_outline_type = ai_outline_list[0][0]
-  first_outline = ai_outline_list[0][1]
-  if((first_outline_type=='graphic_lines')or(first_outline_type=='overlay_lines')):
-    first_point_x=first_outline[0][0]
-    first_point_y=first_outline[0][1]
-  elif((first_outline_type=='graphic_polygon')or(first_outline_type=='overlay_polygon')):
-    first_point_x=first_outline[0]
-    first_point_y=first_outline[1]
-  else:
-    print("ERR305: Error, the outline type is unknow: {:s}".format(first_outline_type))
-    sys.exit(2)
-  min_x=first_point_x
-  max_x=first_point_x
-  min_y=first_point_y
-  max_y=first_point_y
+  r_points = numpy.asarray(ai_outline[1], dtype=numpy.float64).reshape(-1, 2)
+  return(r_points)
+
+def graphics_to_arrays(ai_outline_list):
+  """ convert the coordinates of a list of outlines (tuples of lines or polygon points) into numpy arrays
+      the lines become an array (n,4) and the polygon points an array (n,2). The other fields are unchanged
+  """
+  r_outline_list = []
   for outline in ai_outline_list:
     outline_type = outline[0]
     if((outline_type=='graphic_lines')or(outline_type=='overlay_lines')):
-      lines = outline[1]
-      for line in lines:
-        #print("dbg772: line:", line)
-        min_x = min(min_x, line[0], line[2])
-        max_x = max(max_x, line[0], line[2])
-        min_y = min(min_y, line[1], line[3])
-        max_y = max(max_y, line[1], line[3])
+      r_outline_list.append((outline_type, numpy.asarray(outline[1], dtype=numpy.float64).reshape(-1, 4)) + tuple(outline[2:]))
     elif((outline_type=='graphic_polygon')or(outline_type=='overlay_polygon')):
-      points = outline[1]
-      for i in range(len(points)/2):
-        #print("dbg773: i:", i)
-        min_x = min(min_x, points[2*i])
-        max_x = max(max_x, points[2*i])
-        min_y = min(min_y, points[2*i+1])
-        max_y = max(max_y, points[2*i+1])
+      r_outline_list.append((outline_type, numpy.asarray(outline[1], dtype=numpy.float64).reshape(-1, 2)) + tuple(outline[2:]))
+    else:
+      raise cnc25d_error.Cnc25dBackendError("ERR305: Error, the outline type is unknow: {:s}".format(outline_type))
+  return(r_outline_list)
+
+def find_outline_extremum(ai_outline_list):
+  """ find the four extremum (min_x, min_y, max_x, max_y) of a list of outlines
+  """
+  first_outline_type = ai_outline_list[0][0]
+  if(not first_outline_type in ('graphic_lines', 'overlay_lines', 'graphic_polygon', 'overlay_polygon')):
+    raise cnc25d_error.Cnc25dBackendError("ERR305: Error, the outline type is unknow: {:s}".format(first_outline_type))
+  points = numpy.vstack([ sub_outline_points(outline) for outline in ai_outline_list ])
+  (min_x, min_y) = points.min(axis=0).tolist()
+  (max_x, max_y) = points.max(axis=0).tolist()
   r_extremum = (min_x, min_y, max_x, max_y)
   #print("dbg653: r_extremum:", r_extremum)
   return(r_extremum)
@@ -121,28 +117,19 @@ def compute_scale_coef(ai_extremum, ai_canvas_size):
 
 def scale_outline(ai_outline_list, ai_coef):
   """ apply the scale coefficient to a list of outlines
+      the coordinates of the returned outlines are numpy arrays (see graphics_to_arrays())
   """
   (lx, kx, ly, ky) = ai_coef
+  scale_2 = numpy.array([lx, ly])
+  shift_2 = numpy.array([kx, ky])
   r_outline_list = []
   for outline in ai_outline_list:
     outline_type = outline[0]
     if((outline_type=='graphic_lines')or(outline_type=='overlay_lines')):
-      lines = outline[1]
-      new_lines = []
-      for line in lines:
-        new_line = []
-        for i in range(len(line)/2):
-          new_line.append(line[2*i]*lx+kx)
-          new_line.append(line[2*i+1]*ly+ky)
-        new_lines.append(tuple(new_line))
-      r_outline_list.append((outline_type, tuple(new_lines),  outline[2],  outline[3]))
+      lines = numpy.asarray(outline[1], dtype=numpy.float64).reshape(-1, 4)
+      r_outline_list.append((outline_type, lines*numpy.tile(scale_2, 2)+numpy.tile(shift_2, 2),  outline[2],  outline[3]))
     elif((outline_type=='graphic_polygon')or(outline_type=='overlay_polygon')):
-      points = outline[1]
-      new_points = []
-      for i in range(len(points)/2):
-        new_points.append(points[2*i]*lx+kx)
-        new_points.append(points[2*i+1]*ly+ky)
-      r_outline_list.append((outline_type, tuple(new_points),  outline[2],  outline[3], outline[4]))
+      r_outline_list.append((outline_type, sub_outline_points(outline)*scale_2+shift_2,  outline[2],  outline[3], outline[4]))
   return(r_outline_list)
 
 def compute_crop_limit(ai_selected_area, ai_canvas_size, ai_scale_coef):
@@ -164,46 +151,195 @@ def compute_crop_limit(ai_selected_area, ai_canvas_size, ai_scale_coef):
   r_crop_limit = (limit_x1, limit_y1, limit_x2, limit_y2)
   return(r_crop_limit)
 
+def clip_lines(ai_lines, ai_limit):
+  """ clip the lines ai_lines (numpy array (n,4)) by the rectangle ai_limit = (x1, y1, x2, y2) with the Liang-Barsky algorithm
+      the lines partially inside the rectangle are shortened, the lines outside are removed
+  """
+  (limit_x1, limit_y1, limit_x2, limit_y2) = ai_limit
+  (x0, y0) = (ai_lines[:,0], ai_lines[:,1])
+  dx = ai_lines[:,2]-x0
+  dy = ai_lines[:,3]-y0
+  t_in = numpy.zeros(len(ai_lines))
+  t_out = numpy.ones(len(ai_lines))
+  keep = numpy.ones(len(ai_lines), dtype=numpy.bool_)
+  for (p, q) in ((-1*dx, x0-limit_x1), (dx, limit_x2-x0), (-1*dy, y0-limit_y1), (dy, limit_y2-y0)):
+    parallel = (p==0)
+    keep &= ~(parallel&(q<0))
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+      t = q/p
+    t_in = numpy.where((p<0)&~parallel, numpy.maximum(t_in, t), t_in)
+    t_out = numpy.where((p>0)&~parallel, numpy.minimum(t_out, t), t_out)
+  keep &= (t_in<=t_out)
+  (x0, y0, dx, dy, t_in, t_out) = (x0[keep], y0[keep], dx[keep], dy[keep], t_in[keep], t_out[keep])
+  r_lines = numpy.column_stack((x0+t_in*dx, y0+t_in*dy, x0+t_out*dx, y0+t_out*dy))
+  return(r_lines)
+
+def clip_polygon(ai_points, ai_limit):
+  """ clip the polygon ai_points (numpy array (n,2)) by the rectangle ai_limit = (x1, y1, x2, y2) with the Sutherland-Hodgman algorithm
+      each side of the rectangle is one vectorized pass over the edges of the polygon
+  """
+  (limit_x1, limit_y1, limit_x2, limit_y2) = ai_limit
+  r_points = ai_points
+  for (axis, limit, sign) in ((0, limit_x1, 1), (0, limit_x2, -1), (1, limit_y1, 1), (1, limit_y2, -1)):
+    if(len(r_points)==0):
+      break
+    nxt = numpy.roll(r_points, -1, axis=0)
+    inside = (sign*(r_points[:,axis]-limit)>=0)
+    nxt_inside = numpy.roll(inside, -1)
+    crossing = (inside!=nxt_inside)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+      t = (limit-r_points[:,axis])/(nxt[:,axis]-r_points[:,axis])
+      intersections = r_points+t[:,numpy.newaxis]*(nxt-r_points)
+    # each edge (point, next) outputs its intersection (if crossing) then the next point (if inside)
+    candidates = numpy.stack((intersections, nxt), axis=1).reshape(-1, 2)
+    selected = numpy.column_stack((crossing, nxt_inside)).ravel()
+    r_points = candidates[selected]
+  return(r_points)
+
 def crop_outline(ai_outline_list, ai_limit):
   """ crop a list of outlines to get a new list of outlines
+      the lines and polygons are clipped by the rectangle ai_limit
   """
-  (limit_x1, limit_y1, limit_x2, limit_y2) = ai_limit
   r_outline_list = []
   for outline in ai_outline_list:
     outline_type = outline[0]
     if((outline_type=='graphic_lines')or(outline_type=='overlay_lines')):
-      lines = outline[1]
-      new_lines = []
-      for line in lines:
-        include_new_line = 1
-        for i in range(len(line)/2):
-          if((line[2*i]<limit_x1)
-              or (line[2*i]>limit_x2)
-              or (line[2*i+1]<limit_y1)
-              or (line[2*i+1]>limit_y2)):
-            include_new_line = 0
-        if(include_new_line==1):
-          new_lines.append(line)
+      new_lines = clip_lines(numpy.asarray(outline[1], dtype=numpy.float64).reshape(-1, 4), ai_limit)
       if(len(new_lines)>0):
-        r_outline_list.append((outline_type, tuple(new_lines),  outline[2],  outline[3]))
+        r_outline_list.append((outline_type, new_lines,  outline[2],  outline[3]))
     elif((outline_type=='graphic_polygon')or(outline_type=='overlay_polygon')):
-      points = outline[1]
-      new_points = []
-      for i in range(len(points)/2):
-        if((points[2*i]>limit_x1)
-            and (points[2*i]<limit_x2)
-            and (points[2*i+1]>limit_y1)
-            and (points[2*i+1]<limit_y2)):
-          new_points.append(points[2*i])
-          new_points.append(points[2*i+1])
-        else:
-          if(len(new_points)>1):
-            r_outline_list.append((outline_type, tuple(new_points),  outline[2],  outline[3], outline[4]))
-            new_points = []
+      new_points = clip_polygon(sub_outline_points(outline), ai_limit)
       if(len(new_points)>1):
-        r_outline_list.append((outline_type, tuple(new_points),  outline[2],  outline[3], outline[4]))
+        r_outline_list.append((outline_type, new_points,  outline[2],  outline[3], outline[4]))
   return(r_outline_list)
 
+def lines_to_polylines(ai_lines):
+  """ join the consecutive lines (x1, y1, x2, y2) of a tkinter outline into polylines (x1, y1, x2, y2, x3, y3 ...)
+      a new polyline starts when a line doesn't start at the end of the previous line
+  """
+  lines = numpy.asarray(ai_lines, dtype=numpy.float64).reshape(-1, 4)
+  if(len(lines)==0):
+    return([])
+  breaks = numpy.flatnonzero((lines[1:,0]!=lines[:-1,2])|(lines[1:,1]!=lines[:-1,3]))+1
+  r_polylines = []
+  for run in numpy.split(lines, breaks):
+    r_polylines.append(tuple(run[0,0:2].tolist()+run[:,2:4].ravel().tolist()))
+  return(r_polylines)
+
+################################################################
+# ******** Retained_Canvas class ***********
+################################################################
+
+class Retained_Canvas():
+  """ draw the outline lists of the successive frames in a Tkinter Canvas, keeping the canvas items between the frames
+      each polyline of an outline is one line item. An item is moved with canvas.coords() only when its coordinates change
+      and the items that are not used by a frame are hidden, so the items are created only once
+      the items are kept in the drawing order, so the lines and the polygons are stacked as if the frame was drawn from scratch
+  """
+
+  def __init__(self, ai_canvas):
+    """ bind the canvas ai_canvas
+    """
+    self.canvas = ai_canvas
+    # [item_id, item_type, coordinates, options, visible] of the line and polygon items in the drawing order
+    self.items = []
+    # marker_name -> [item_id, coordinates, visible] of the mouse selection rectangle and measurement line
+    self.marker_items = {}
+
+  def sub_create_item(self, ai_item_type, ai_coordinates, ai_options):
+    """ create a line or polygon item and return its id
+    """
+    if(ai_item_type=='line'):
+      r_id = self.canvas.create_line(ai_coordinates, **ai_options)
+    else:
+      r_id = self.canvas.create_polygon(ai_coordinates, **ai_options)
+    return(r_id)
+
+  def sub_update_item(self, ai_index, ai_item_type, ai_coordinates, ai_options):
+    """ move, configure or create the item ai_index of the drawing order
+        return True if the item has been created above the next items (its stacking must be restored)
+    """
+    if(ai_index==len(self.items)): # a new item is created above all the others
+      item_id = self.sub_create_item(ai_item_type, ai_coordinates, ai_options)
+      self.items.append([item_id, ai_item_type, ai_coordinates, ai_options, True])
+      return(False)
+    item = self.items[ai_index]
+    if(item[1]!=ai_item_type): # a line can not become a polygon: the item is replaced
+      self.canvas.delete(item[0])
+      self.items[ai_index] = [self.sub_create_item(ai_item_type, ai_coordinates, ai_options), ai_item_type, ai_coordinates, ai_options, True]
+      return(True)
+    if(item[2]!=ai_coordinates):
+      self.canvas.coords(item[0], ai_coordinates)
+      item[2] = ai_coordinates
+    if(item[3]!=ai_options):
+      self.canvas.itemconfigure(item[0], **ai_options)
+      item[3] = ai_options
+    if(not item[4]):
+      self.canvas.itemconfigure(item[0], state=Tkinter.NORMAL)
+      item[4] = True
+    return(False)
+
+  def sub_hide_items(self, ai_first_index):
+    """ hide the items from ai_first_index
+    """
+    for item in self.items[ai_first_index:]:
+      if(item[4]):
+        self.canvas.itemconfigure(item[0], state=Tkinter.HIDDEN)
+        item[4] = False
+    return(0)
+
+  def draw(self, ai_canvas_graphics, ai_overlay):
+    """ draw the scaled outline list ai_canvas_graphics. The overlay outlines are drawn only if ai_overlay==1
+    """
+    item_nb = 0
+    restack = False
+    for outline in ai_canvas_graphics:
+      outline_type = outline[0]
+      if((outline_type=='graphic_lines')or((outline_type=='overlay_lines')and(ai_overlay==1))):
+        options = {'fill': outline[2], 'width': outline[3]}
+        for polyline in lines_to_polylines(outline[1]):
+          restack |= self.sub_update_item(item_nb, 'line', polyline, options)
+          item_nb += 1
+      elif((outline_type=='graphic_polygon')or((outline_type=='overlay_polygon')and(ai_overlay==1))):
+        options = {'fill': outline[2], 'outline': outline[3], 'width': outline[4]}
+        restack |= self.sub_update_item(item_nb, 'polygon', tuple(numpy.ravel(outline[1]).tolist()), options)
+        item_nb += 1
+    self.sub_hide_items(item_nb)
+    if(restack): # raise the items in the drawing order, then the markers
+      for item in self.items:
+        self.canvas.tag_raise(item[0])
+      for item in self.marker_items.values():
+        self.canvas.tag_raise(item[0])
+    return(0)
+
+  def draw_marker(self, ai_marker_name, ai_coordinates):
+    """ draw the red rectangle or line ai_marker_name ('rectangle' or 'line') at ai_coordinates, or hide it if ai_coordinates is None
+        the marker is kept above the outlines
+    """
+    if(not ai_marker_name in self.marker_items):
+      if(ai_coordinates==None):
+        return(0)
+      if(ai_marker_name=='rectangle'):
+        item_id = self.canvas.create_rectangle(ai_coordinates, fill='', outline='red', width=2)
+      else:
+        item_id = self.canvas.create_line(ai_coordinates, fill='red', width=2)
+      self.marker_items[ai_marker_name] = [item_id, ai_coordinates, True]
+      return(0)
+    item = self.marker_items[ai_marker_name]
+    if(ai_coordinates==None):
+      if(item[2]):
+        self.canvas.itemconfigure(item[0], state=Tkinter.HIDDEN)
+        item[2] = False
+      return(0)
+    if(item[1]!=ai_coordinates):
+      self.canvas.coords(item[0], ai_coordinates)
+      item[1] = ai_coordinates
+    if(not item[2]):
+      self.canvas.itemconfigure(item[0], state=Tkinter.NORMAL)
+      item[2] = True
+    self.canvas.tag_raise(item[0])
+    return(0)
+
 ################################################################
 # ******** Two_Canvas class ***********
 ################################################################
@@ -378,25 +514,21 @@ class Two_Canvas():
     #self.apply_curve_graphic_table(self.angle_position, self.angle_speed)
     self.frame_a.after(g_step_period, self.simulation_step)
   
-  def draw_canvas(self, ai_canvas, ai_canvas_graphics, ai_overlay):
-    """ Draw the computed outline list into a canvas
+  def compute_canvas_graphics(self):
+    """ call the canvas_graphic_function with tkinter_pixel_scale set to the finest displayed scale
+        the main window scale, or the zoom window scale when the zoom window is visible
     """
-    for outline in ai_canvas_graphics:
-      outline_type = outline[0]
-      if(outline_type=='graphic_lines'):
-        lines = outline[1]
-        for line in lines:
-          ai_canvas.create_line(line, fill=outline[2], width=outline[3])
-      elif(outline_type=='overlay_lines'):
-        if(ai_overlay==1):
-          lines = outline[1]
-          for line in lines:
-            ai_canvas.create_line(line, fill=outline[2], width=outline[3])
-      elif(outline_type=='graphic_polygon'):
-        ai_canvas.create_polygon(outline[1], fill=outline[2], outline=outline[3], width=outline[4])
-      elif(outline_type=='overlay_polygon'):
-        if(ai_overlay==1):
-          ai_canvas.create_polygon(outline[1], fill=outline[2], outline=outline[3], width=outline[4])
+    global tkinter_pixel_scale
+    pixel_scale = abs(self.scale_coef_a[0])
+    if(self.frame_b.state()!='withdrawn'):
+      pixel_scale = max(pixel_scale, abs(self.scale_coef_b[0]))
+    previous_pixel_scale = tkinter_pixel_scale
+    tkinter_pixel_scale = pixel_scale
+    try:
+      r_graphics = self.canvas_graphic_function(self.rotation_direction, self.angle_position)
+    finally:
+      tkinter_pixel_scale = previous_pixel_scale
+    return(r_graphics)
 
   def apply_canvas_graphic_function(self):
     """ compute and draw the outline list for the main and the zoom window
@@ -412,35 +544,39 @@ class Two_Canvas():
     #  #sys.exit(2)
     #  print("WARN446: Warning, the canvas_graphic_function has not been set!")
     if(self.canvas_graphic_function!=None):
-      all_graphics = self.canvas_graphic_function(self.rotation_direction, self.angle_position)
-      #
-      self.canvas_a.delete(Tkinter.ALL)
-      # uncomment if you want to scale outline depending on the angle_position
-      #self.outline_extremum = find_outline_extremum(all_graphics)
+      # the scale coefficients are computed first, so the arcs are tessellated for the displayed scale
       canvas_a_size = (canvas_a_width, canvas_a_height, tkinter_canvas_margin_x, tkinter_canvas_margin_y)
       self.scale_coef_a = compute_scale_coef(self.outline_extremum, canvas_a_size)
-      canvas_a_graphics = scale_outline(all_graphics, self.scale_coef_a)
-      self.draw_canvas(self.canvas_a, canvas_a_graphics, self.overlay)
-      if(self.canvas_a_mouse_press==1):
-        self.canvas_a.create_rectangle(self.mouse_x1, self.mouse_y1, self.mouse_x2, self.mouse_y2, fill='', outline='red', width=2)
-      #
       if(self.crop_limit==(0,0,0,0)):
         self.crop_limit=(self.outline_extremum[0], self.outline_extremum[1], (self.outline_extremum[0]+self.outline_extremum[2])/2, (self.outline_extremum[1]+self.outline_extremum[3])/2)
+      canvas_b_size = (canvas_b_width, canvas_b_height, 2, 2)
+      self.scale_coef_b = compute_scale_coef(self.crop_limit, canvas_b_size)
+      all_graphics = graphics_to_arrays(self.compute_canvas_graphics())
+      # the canvas items are kept between the frames (see Retained_Canvas)
+      #self.canvas_a.delete(Tkinter.ALL)
+      # uncomment if you want to scale outline depending on the angle_position
+      #self.outline_extremum = find_outline_extremum(all_graphics)
+      canvas_a_graphics = scale_outline(all_graphics, self.scale_coef_a)
+      self.retained_canvas_a.draw(canvas_a_graphics, self.overlay)
+      if(self.canvas_a_mouse_press==1):
+        self.retained_canvas_a.draw_marker('rectangle', (self.mouse_x1, self.mouse_y1, self.mouse_x2, self.mouse_y2))
+      else:
+        self.retained_canvas_a.draw_marker('rectangle', None)
       #
-      self.canvas_b.delete(Tkinter.ALL)
+      #self.canvas_b.delete(Tkinter.ALL)
       crop_graphics = crop_outline(all_graphics, self.crop_limit)
       #print("dbg857: len(crop_graphics):", len(crop_graphics))
-      canvas_b_size = (canvas_b_width, canvas_b_height, 2, 2)
       #print("dbg768: self.crop_limit:", self.crop_limit)
       #print("dbg763: canvas_b_size:", canvas_b_size)
-      self.scale_coef_b = compute_scale_coef(self.crop_limit, canvas_b_size)
       #print("dbg854: scale_coef_b:", scale_coef_b)
       canvas_b_graphics = scale_outline(crop_graphics, self.scale_coef_b)
       #print("dbg986: canvas_b_graphics:", canvas_b_graphics)
-      self.draw_canvas(self.canvas_b, canvas_b_graphics, self.overlay)
+      self.retained_canvas_b.draw(canvas_b_graphics, self.overlay)
       #self.canvas_b.create_line((5,5,canvas_b_width-5,canvas_b_height-5), fill='yellow', width=3)
       if(self.canvas_b_mouse_press==1):
-        self.canvas_b.create_line(self.mouse_bx1, self.mouse_by1, self.mouse_bx2, self.mouse_by2, fill='red', width=2)
+        self.retained_canvas_b.draw_marker('line', (self.mouse_bx1, self.mouse_by1, self.mouse_bx2, self.mouse_by2))
+      else:
+        self.retained_canvas_b.draw_marker('line', None)
 
   def action_button_overlay(self):
     """ Toggle the overlay visibility
@@ -474,6 +610,7 @@ class Two_Canvas():
     #self.canvas_b.columnconfigure(0, weight=1)
     #self.canvas_b.rowconfigure(0, weight=1)
     self.canvas_b.pack(fill=Tkinter.BOTH, expand=1) # with Toplevel parent, it seems you need to use pack to resisze the canvas !
+    self.retained_canvas_b = Retained_Canvas(self.canvas_b)
     self.canvas_b.bind("<ButtonPress-1>", self.action_canvas_b_mouse_button_press)
     self.canvas_b.bind("<B1-Motion>", self.action_canvas_b_mouse_button_motion)
     self.canvas_b.bind("<ButtonRelease-1>", self.action_canvas_b_mouse_button_release)
@@ -607,6 +744,7 @@ class Two_Canvas():
     self.canvas_a =  Tkinter.Canvas(self.frame_a, width=initial_tkinter_canvas_width, height=initial_tkinter_canvas_height)
     #self.canvas_a.pack(fill=Tkinter.BOTH, expand=1)
     self.canvas_a.grid(column=0, row=0, sticky=Tkinter.N+Tkinter.E+Tkinter.S+Tkinter.W)
+    self.retained_canvas_a = Retained_Canvas(self.canvas_a)
     self.canvas_a.columnconfigure(0, weight=1)
     self.canvas_a.rowconfigure(0, weight=1)
     self.canvas_a.bind("<ButtonPress-1>", self.action_canvas_a_mouse_button_press)
@@ -919,6 +1057,65 @@ Tenait en son bec un fromage.
   r_test = 1
   return(r_test)
 
+def sub_polygon_area(ai_points):
+  """ signed area of the polygon ai_points (numpy array (n,2)) with the shoelace formula
+  """
+  nxt = numpy.roll(ai_points, -1, axis=0)
+  r_area = 0.5*numpy.sum(ai_points[:,0]*nxt[:,1]-nxt[:,0]*ai_points[:,1])
+  return(r_area)
+
+def crop_outline_test3():
+  """ check clip_lines(), clip_polygon() and crop_outline() against known clippings by the rectangle (0, 0, 10, 10)
+      this test doesn't open any window
+  """
+  r_test = 1
+  limit = (0.0, 0.0, 10.0, 10.0)
+  # (line, expected clipped line or None if removed)
+  line_checks = (
+    ((1, 1, 5, 5), (1, 1, 5, 5)),       # inside
+    ((-5, 5, 15, 5), (0, 5, 10, 5)),    # crossing two sides
+    ((-5, -5, 15, 15), (0, 0, 10, 10)), # crossing two corners
+    ((15, 2, 5, 2), (10, 2, 5, 2)),     # the direction is kept
+    ((5, 12, 5, -3), (5, 10, 5, 0)),    # vertical
+    ((-1, 0, -1, 10), None),            # parallel to a side and outside
+    ((20, 20, 30, 30), None),           # outside
+    ((-5, 8, 8, 20), None))             # outside, across the corner region
+  lines = numpy.array([ lc[0] for lc in line_checks ], dtype=numpy.float64)
+  expected_lines = numpy.array([ lc[1] for lc in line_checks if(lc[1]!=None) ], dtype=numpy.float64)
+  clipped_lines = clip_lines(lines, limit)
+  if((clipped_lines.shape!=expected_lines.shape)or(not numpy.allclose(clipped_lines, expected_lines))):
+    print("ERR: crop_outline_test3 clip_lines() returns {:s}".format(str(clipped_lines.tolist())))
+    r_test = 0
+  # (polygon, expected area after clipping)
+  polygon_checks = (
+    (((2, 2), (8, 2), (8, 8), (2, 8)), 36.0),                     # inside
+    (((-5, -5), (15, -5), (15, 15), (-5, 15)), 100.0),            # around the rectangle
+    (((5, 5), (15, 5), (5, 15)), 25.0),                           # one corner inside
+    (((5, -2), (12, 5), (5, 12), (-2, 5)), 82.0),                 # diamond cutting the four corners
+    (((-2, 2), (12, 2), (12, 4), (2, 4), (2, 6), (12, 6), (12, 8), (-2, 8)), 44.0), # concave
+    (((20, 20), (30, 20), (30, 30)), 0.0))                        # outside
+  for (polygon, expected_area) in polygon_checks:
+    clipped_points = clip_polygon(numpy.array(polygon, dtype=numpy.float64), limit)
+    area = abs(sub_polygon_area(clipped_points)) if(len(clipped_points)>0) else 0.0
+    inside = numpy.all((clipped_points>=-1e-9)&(clipped_points<=10+1e-9))
+    if((abs(area-expected_area)>1e-9)or(not inside)):
+      print("ERR: crop_outline_test3 clip_polygon() of {:s} returns {:s}".format(str(polygon), str(clipped_points.tolist())))
+      r_test = 0
+  outline_list = [
+    ('graphic_lines', (-5, 5, 15, 5, 20, 20, 30, 30), 'red', 1),
+    ('overlay_lines', (20, 20, 30, 30), 'blue', 1),
+    ('graphic_polygon', (5, 5, 15, 5, 5, 15), 'green', 'black', 1),
+    ('overlay_polygon', (20, 20, 30, 20, 30, 30), 'green', 'black', 1)]
+  cropped_list = crop_outline(outline_list, limit)
+  if([ outline[0] for outline in cropped_list ]!=['graphic_lines', 'graphic_polygon']):
+    print("ERR: crop_outline_test3 crop_outline() keeps the outlines {:s}".format(', '.join([ outline[0] for outline in cropped_list ])))
+    r_test = 0
+  elif((cropped_list[0][1].tolist()!=[[0, 5, 10, 5]])or(cropped_list[0][2:]!=('red', 1))or(cropped_list[1][2:]!=('green', 'black', 1))):
+    print("ERR: crop_outline_test3 crop_outline() returns wrong outlines")
+    r_test = 0
+  print("crop_outline_test3: {:s}".format("OK" if r_test else "FAILED"))
+  return(r_test)
+
 ################################################################
 # ******** command line interface ***********
 ################################################################
@@ -931,6 +1128,8 @@ def display_backends_cli(ai_args=""):
     help='Run two_canvas_class_test1() with a static graphic')
   db_parser.add_argument('--test2','--t2', action='store_true', default=False, dest='sw_test2',
     help='Run two_canvas_class_test2() with a dynamic graphic')
+  db_parser.add_argument('--test3','--t3', action='store_true', default=False, dest='sw_test3',
+    help='Run crop_outline_test3() that checks the clipping of the lines and polygons')
   effective_args = design_help.get_effective_args(ai_args)
   db_args = db_parser.parse_args(effective_args)
   r_dbc = 0
@@ -939,6 +1138,8 @@ def display_backends_cli(ai_args=""):
     r_dbc = two_canvas_class_test1()
   elif(db_args.sw_test2):
     r_dbc = two_canvas_class_test2()
+  elif(db_args.sw_test3):
+    r_dbc = crop_outline_test3()
   print("dbg999: end of script")
   return(r_dbc)
 
@@ -952,4 +1153,5 @@ if __name__ == "__main__":
   #display_backends_cli()                   # get arguments from the command line
   display_backends_cli("--test1")   # run the test1
   #display_backends_cli("--test2")
+  #display_backends_cli("--test3")
 
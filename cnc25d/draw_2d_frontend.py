@@ -51,6 +51,7 @@ import copy
 ## cnc25d
 import small_geometry
 import cnc_outline
+import cnc25d_error
 #import outline_backends
 #import export_2d
 
@@ -65,11 +66,9 @@ def get_center(CX=0.0, CY=0.0, C=()):
   OCY = CY
   if(len(C)>0):
     if((CX!=0)or(CY!=0)):
-      print("ERR112: Error, CX {:0.3f} or CY {:0.3d} have been set simultaneously with C".format(CX, CY))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR112: Error, CX {:0.3f} or CY {:0.3d} have been set simultaneously with C".format(CX, CY))
     if(len(C)!=2):
-      print("ERR115: len(C) {:d} is not 2".format(len(C)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR115: len(C) {:d} is not 2".format(len(C)))
     OCX = C[0]
     OCY = C[1]
   r = (OCX, OCY)
@@ -82,8 +81,7 @@ def c_xy(d, a, CX=0.0, CY=0.0, C=()):
   """
   # check distance
   if(d<0):
-    print("ERR104: Error, the polar coordinate distance d {:0.3f} is negative".format(d))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR104: Error, the polar coordinate distance d {:0.3f} is negative".format(d))
   # origin-center
   (OCX, OCY) = get_center(CX, CY, C)
   # conversion polar to Cartesian coordinates
@@ -133,8 +131,7 @@ class Arc_Line_Outline:
     rbr is the router_bit_radius to be applied on the StartPoint corner.
     """
     if(self.ol!=[]):
-      print("ERR152: Error, StartPoint can not be added to the outline {:s} with {:d} segments".format(self.outline_id, len(self.ol)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR152: Error, StartPoint can not be added to the outline {:s} with {:d} segments".format(self.outline_id, len(self.ol)))
     (X, Y) = get_center(CX, CY, C)
     self.ol.append((X, Y, rbr))
 
@@ -144,8 +141,7 @@ class Arc_Line_Outline:
     rbr is the router_bit_radius to be applied on the new point corner.
     """
     if(len(self.ol)<1):
-      print("ERR163: Error, line-segment can not be added to the outline {:s} with {:d} segments. Add StartPoint first.".format(self.outline_id, len(self.ol)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR163: Error, line-segment can not be added to the outline {:s} with {:d} segments. Add StartPoint first.".format(self.outline_id, len(self.ol)))
     (X, Y) = get_center(CX, CY, C)
     self.ol.append((X, Y, rbr))
     
@@ -155,8 +151,7 @@ class Arc_Line_Outline:
     rbr is the router_bit_radius to be applied on the CX2,CY2 corner.
     """
     if(len(self.ol)<1):
-      print("ERR174: Error, arc-segment can not be added to the outline {:s} with {:d} segments. Add StartPoint first.".format(self.outline_id, len(self.ol)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR174: Error, arc-segment can not be added to the outline {:s} with {:d} segments. Add StartPoint first.".format(self.outline_id, len(self.ol)))
     (X1, Y1) = get_center(CX1, CY1, C1)
     (X2, Y2) = get_center(CX2, CY2, C2)
     self.ol.append((X1, Y1, X2, Y2, rbr))
@@ -167,8 +162,7 @@ class Arc_Line_Outline:
     rbr is the router_bit_radius to be applied on the CX2,CY2 corner.
     """
     if(len(self.ol)<1):
-      print("ERR174: Error, arc-segment can not be added to the outline {:s} with {:d} segments. Add StartPoint first.".format(self.outline_id, len(self.ol)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR174: Error, arc-segment can not be added to the outline {:s} with {:d} segments. Add StartPoint first.".format(self.outline_id, len(self.ol)))
     (X1, Y1) = c_xy(R, a1, CX, CY, C)
     (X2, Y2) = c_xy(R, a2, CX, CY, C)
     self.ol.append((X1, Y1, X2, Y2, rbr))
@@ -184,8 +178,7 @@ class Arc_Line_Outline:
     Close the outline with a line-segment
     """
     if(len(self.ol)<2):
-      print("ERR157: Error, line-segment can not be added to close the outline {:s} with {:d} segments. Add at least one segment first.".format(self.outline_id, len(self.ol)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR157: Error, line-segment can not be added to close the outline {:s} with {:d} segments. Add at least one segment first.".format(self.outline_id, len(self.ol)))
     X = self.ol[0][0]
     Y = self.ol[0][1]
     self.ol.append((X, Y, 0)) # last point rbr must be 0
@@ -195,8 +188,7 @@ class Arc_Line_Outline:
     Close the outline with an arc-segment
     """
     if(len(self.ol)<2):
-      print("ERR168: Error, arc-segment can not be added to close the outline {:s} with {:d} segments. Add at least one segment first.".format(self.outline_id, len(self.ol)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR168: Error, arc-segment can not be added to close the outline {:s} with {:d} segments. Add at least one segment first.".format(self.outline_id, len(self.ol)))
     (X1, Y1) = get_center(CX1, CY1, C1)
     X2 = self.ol[0][0]
     Y2 = self.ol[0][1]
@@ -210,8 +202,7 @@ class Arc_Line_Outline:
     radian_epsilon = math.pi/1000
     #
     if((abs(self.ol[0][0]-self.ol[-1][-3])>radian_epsilon)or(abs(self.ol[0][1]-self.ol[-1][-2])>radian_epsilon)):
-      print("ERR206: Error, outline {:s} should be closed but is not closed: first point ({:0.3f}, {:0.3f}), last point ({:0.3f}, {:0.3f})".format(self.outline_id, self.ol[0][0], self.ol[0][1], self.ol[-1][-3], self.ol[-1][-2]))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR206: Error, outline {:s} should be closed but is not closed: first point ({:0.3f}, {:0.3f}), last point ({:0.3f}, {:0.3f})".format(self.outline_id, self.ol[0][0], self.ol[0][1], self.ol[-1][-3], self.ol[-1][-2]))
     last_segment = list(self.ol[-1])
     last_segment[-3] = self.ol[0][0]
     last_segment[-2] = self.ol[0][1]
@@ -250,21 +241,16 @@ class Arc_Line_Outline:
     radian_epsilon = math.pi/1000
     #
     if(len(self.ol)<2):
-      print("ERR179: Error, figure {:s}, outline {:s} with {:d} segments is too short. Add at leat two segment first.".format(figure_id, self.outline_id, len(self.ol)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR179: Error, figure {:s}, outline {:s} with {:d} segments is too short. Add at leat two segment first.".format(figure_id, self.outline_id, len(self.ol)))
     if(len(self.ol[0])!=3):
-      print("ERR222: Error, figure {:s}, outline {:s}, the StartPoint_length {:d} is not 3".format(figure_id, self.outline_id, len(self.ol[0])))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR222: Error, figure {:s}, outline {:s}, the StartPoint_length {:d} is not 3".format(figure_id, self.outline_id, len(self.ol[0])))
     for i in range(len(self.ol)):
       if((len(self.ol[i])!=3)and(len(self.ol[i])!=5)):
-        print("ERR226: Error, figure {:s}, outline {:s}, segment {:d}, length {:d} is not 3 or 5".format(figure_id, self.outline_id, i, len(self.ol[i])))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR226: Error, figure {:s}, outline {:s}, segment {:d}, length {:d} is not 3 or 5".format(figure_id, self.outline_id, i, len(self.ol[i])))
     if((self.ol[0][0]!=self.ol[-1][-3])or(self.ol[0][1]!=self.ol[-1][-2])):
-      print("ERR182: Error, figure {:s}, outline {:s} is not closed: first point ({:0.3f}, {:0.3f}), last point ({:0.3f}, {:0.3f})".format(figure_id, self.outline_id, self.ol[0][0], self.ol[0][1], self.ol[-1][-3], self.ol[-1][-2]))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR182: Error, figure {:s}, outline {:s} is not closed: first point ({:0.3f}, {:0.3f}), last point ({:0.3f}, {:0.3f})".format(figure_id, self.outline_id, self.ol[0][0], self.ol[0][1], self.ol[-1][-3], self.ol[-1][-2]))
     if(self.ol[-1][-1]!=0):
-      print("ERR185: Error, figure {:s}, outline {:s}, last point router_bit_radius {:0.3f} is not 0.0".format(figure_id, self.outline_id, self.ol[-1][-1]))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR185: Error, figure {:s}, outline {:s}, last point router_bit_radius {:0.3f} is not 0.0".format(figure_id, self.outline_id, self.ol[-1][-1]))
     # compute statistics on the outline
     stat = {}
     stat['pt_nb'] = 0
@@ -340,14 +326,11 @@ class Arc_Line_Outline:
         stat['y_min'] = min(stat['y_min'], self.ol[i+1][1], self.ol[i+1][3])
         stat['y_max'] = max(stat['y_max'], self.ol[i+1][1], self.ol[i+1][3])
       else:
-        print("ERR244: Error, figure_id {:s}, outline {:s}, segment {:d} unexpected length {:d}".format(figure_id, self.outline_id, i+1, len(self.ol[i+1])))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR244: Error, figure_id {:s}, outline {:s}, segment {:d} unexpected length {:d}".format(figure_id, self.outline_id, i+1, len(self.ol[i+1])))
       if(pt1_distance<radian_epsilon):
-        print("ERR258: Error, figure_id {:s}, outline {:s}, segment {:d} pt1_distance {:0.3f} too small".format(figure_id, self.outline_id, i+1, pt1_distance))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR258: Error, figure_id {:s}, outline {:s}, segment {:d} pt1_distance {:0.3f} too small".format(figure_id, self.outline_id, i+1, pt1_distance))
       if((pt2_distance<radian_epsilon) and not(segment_line_narc)):
-        print("ERR261: Error, figure_id {:s}, outline {:s}, segment {:d} pt2_distance {:0.3f} too small".format(figure_id, self.outline_id, i+1, pt2_distance))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR261: Error, figure_id {:s}, outline {:s}, segment {:d} pt2_distance {:0.3f} too small".format(figure_id, self.outline_id, i+1, pt2_distance))
       # string_length
       stat['string_length_min'] = min_w_init(stat['string_length_min'], string_length)
       stat['string_length_max'] = max_w_init(stat['string_length_max'], string_length)
@@ -431,12 +414,10 @@ y_length: {:0.3f}
         this function should be only used during the transistion to the new format (Arc_Line_Outline object)
     """
     if(len(ai_outline)<3):
-      print("ERR378: Error, outline {:s}, convert_from_old_format failed because import list {:d} is too short".format(self.outline_id, len(ai_outline)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR378: Error, outline {:s}, convert_from_old_format failed because import list {:d} is too short".format(self.outline_id, len(ai_outline)))
     first_segment = ai_outline[0]
     if(len(first_segment)!=3):
-      print("ERR381: Error, outline {:s}, convert_from_old_format failed because import first point length {:d} is not 3".format(self.outline_id, len(first_segment)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR381: Error, outline {:s}, convert_from_old_format failed because import first point length {:d} is not 3".format(self.outline_id, len(first_segment)))
     self.add_StartPoint(first_segment[0], first_segment[1], rbr=first_segment[2])
     for i in range(len(ai_outline)-2):
       segment = ai_outline[i+1]
@@ -445,22 +426,18 @@ y_length: {:0.3f}
       elif(len(segment)==5):
         self.add_ArcThrTo(segment[0], segment[1], segment[2], segment[3], rbr=segment[4])
       else:
-        print("ERR390: Error, outline {:s}, convert_from_old_format failed because segment length {:d} is not 3 or 5".format(self.outline_id, len(segment)))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR390: Error, outline {:s}, convert_from_old_format failed because segment length {:d} is not 3 or 5".format(self.outline_id, len(segment)))
     last_segment = ai_outline[-1]
     if(last_segment[-1]!=0):
-      print("ERR395: Error, outline {:s}, convert_from_old_format failed because import last_point rbr {:0.3f} is not 0.0".format(self.outline_id, last_segment[-1]))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR395: Error, outline {:s}, convert_from_old_format failed because import last_point rbr {:0.3f} is not 0.0".format(self.outline_id, last_segment[-1]))
     if((last_segment[-3]!=first_segment[0])or(last_segment[-2]!=first_segment[1])):
-      print("ERR399: Error, outline {:s}, convert_from_old_format failed because import is not closed x {:0.3f} {:0.3f} y {:0.3f} {:0.3f}".format(self.outline_id, first_segment[0], last_segment[-3], first_segment[1], last_segment[-2]))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR399: Error, outline {:s}, convert_from_old_format failed because import is not closed x {:0.3f} {:0.3f} y {:0.3f} {:0.3f}".format(self.outline_id, first_segment[0], last_segment[-3], first_segment[1], last_segment[-2]))
     if(len(last_segment)==3):
       self.close_with_Line()
     elif(len(last_segment)==5):
       self.close_with_ArcThr(last_segment[0], last_segment[1])
     else:
-      print("ERR406: Error, outline {:s}, convert_from_old_format failed because last_segment length {:d} is not 3 or 5".format(self.outline_id, len(last_segment)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR406: Error, outline {:s}, convert_from_old_format failed because last_segment length {:d} is not 3 or 5".format(self.outline_id, len(last_segment)))
 
   def cnc_cut(self):
     """ smooth and enlarged corner according to the router_bit_radius and return a B-format outline list
@@ -488,8 +465,7 @@ class Circle_Outline:
     """
     # check arguments
     if(R<0):
-      print("ERR151: Error, the radius R {:0.3f} is negative".format(R))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR151: Error, the radius R {:0.3f} is negative".format(R))
     (X, Y) = get_center(CX, CY, C)
     # save values
     self.outline_id = outline_id
@@ -504,8 +480,7 @@ class Circle_Outline:
     radian_epsilon = math.pi/1000
     #
     if(self.radius<radian_epsilon):
-      print("ERR361: Error, figure {:s}, circle {:s} with radius {:.3f} too small".format(figure_id, self.outline_id, self.radius))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR361: Error, figure {:s}, circle {:s} with radius {:.3f} too small".format(figure_id, self.outline_id, self.radius))
     circumference = self.radius*2*math.pi
     #
     stat = {}
@@ -546,8 +521,7 @@ y_max:  {:0.3f}
         this function should be only used during the transistion to the new format (Circle_Outline object)
     """
     if(len(ai_outline)!=3):
-      print("ERR483: Error, outline {:s}, convert_from_old_format failed because import list {:d} is not 3".format(self.outline_id, len(ai_outline)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR483: Error, outline {:s}, convert_from_old_format failed because import list {:d} is not 3".format(self.outline_id, len(ai_outline)))
     self.x = ai_outline[0]
     self.y = ai_outline[1]
     self.radius = ai_outline[2]
@@ -606,8 +580,7 @@ class Figure:
     ol_stat = outline.check(self.figure_id)
     if(hole_check):
       if((self.stat['x_min']>ol_stat['x_min'])or(self.stat['x_max']<ol_stat['x_max'])or(self.stat['y_min']>ol_stat['y_min'])or(self.stat['y_max']<ol_stat['y_max'])):
-        print("ERR417: Error, figure {:s}, hole-ouline {:s} outside the boundary: x_min {:0.3f} {:0.3f}, x_max {:0.3f} {:0.3f}, y_min {:0.3f} {:0.3f}, y_max {:0.3f} {:0.3f}".format(self.figure_id, outline.outline_id, self.stat['x_min'], ol_stat['x_min'], self.stat['x_max'], ol_stat['x_max'], self.stat['y_min'], ol_stat['y_min'], self.stat['y_max'], ol_stat['y_max']))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR417: Error, figure {:s}, hole-ouline {:s} outside the boundary: x_min {:0.3f} {:0.3f}, x_max {:0.3f} {:0.3f}, y_min {:0.3f} {:0.3f}, y_max {:0.3f} {:0.3f}".format(self.figure_id, outline.outline_id, self.stat['x_min'], ol_stat['x_min'], self.stat['x_max'], ol_stat['x_max'], self.stat['y_min'], ol_stat['y_min'], self.stat['y_max'], ol_stat['y_max']))
     self.stat['x_min'] = min_w_init(self.stat['x_min'], ol_stat['x_min'])
     self.stat['x_max'] = max_w_init(self.stat['x_max'], ol_stat['x_max'])
     self.stat['y_min'] = min_w_init(self.stat['y_min'], ol_stat['y_min'])
@@ -638,27 +611,23 @@ class Figure:
       self.stat['negative_rbr_max'] = max_w_init(self.stat['negative_rbr_max'], ol_stat['negative_rbr_max'])
       self.stat['negative_rbr_min'] = min_w_init(self.stat['negative_rbr_min'], ol_stat['negative_rbr_min'])
     else:
-      print("ERR429: Error, figure {:d}, outline {:s} is an invalid object".format(self.figure_id, outline.outline_id))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR429: Error, figure {:d}, outline {:s} is an invalid object".format(self.figure_id, outline.outline_id))
 
   def add_external_outline(self, outline):
     """ add the first outline a.k.a. the external outline
     """
     self.extrudable = True
     if(len(self.outlines)!=0):
-      print("ERR457: Error, figure {:s}, external_outline {:s} not added at the first position {:d}".format(self.figure_id, outline.outline_id, len(self.outlines)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR457: Error, figure {:s}, external_outline {:s} not added at the first position {:d}".format(self.figure_id, outline.outline_id, len(self.outlines)))
     self._add_outline(outline, False)
  
   def add_hole_outline(self, outline):
     """ add a hole-outline
     """
     if(len(self.outlines)==0): # check if there is already an external_outline
-      print("ERR465: Error, figure {:s}, hole_outline {:s} added before external_outline".format(self.figure_id, outline.outline_id))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR465: Error, figure {:s}, hole_outline {:s} added before external_outline".format(self.figure_id, outline.outline_id))
     if(not self.extrudable): # check no undefine_outline have been added
-      print("ERR468: Error, figure {:s}, hole_outline {:s} added to a not extrudable figure {:d}".format(self.figure_id, outline.outline_id, len(self.outlines)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR468: Error, figure {:s}, hole_outline {:s} added to a not extrudable figure {:d}".format(self.figure_id, outline.outline_id, len(self.outlines)))
     self._add_outline(outline, True)
 
   def add_undefine_outline(self, outline, extrudable=False):
@@ -759,8 +728,7 @@ y_length: {:0.3f}
     """ return the Outline object (Arc_Line or Circle) with the corresponding index in the outline list
     """
     if(abs(ai_index)>=len(self.outlines)):
-      print("ERR544: Error, figure {:s}, outline index {:d} is out of the range {:s}".format(self.figure_id, ai_index, len(self.outlines)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR544: Error, figure {:s}, outline index {:d} is out of the range {:s}".format(self.figure_id, ai_index, len(self.outlines)))
     r_outline = self.outlines[ai_index]
     return(r_outline)
 
@@ -773,8 +741,7 @@ y_length: {:0.3f}
       if(self.outlines[i].outline_id==ai_outline_id):
         idx = i
     if(idx==-1):
-      print("ERR558: Error, figure {:s}, outline_id {:s} does not exist".format(self.figure_id, ai_outline_id))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR558: Error, figure {:s}, outline_id {:s} does not exist".format(self.figure_id, ai_outline_id))
     r_outline = self.get_outline_index(idx)
     return(r_outline)
 
@@ -792,8 +759,7 @@ y_length: {:0.3f}
         this function should be only used during the transistion to the new format (Figure object)
     """
     if(len(ai_figure)<1):
-      print("ERR701: Error, figure {:s}, convert_from_old_format failed because import list {:d} is 0".format(self.figure_id, len(ai_figure)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR701: Error, figure {:s}, convert_from_old_format failed because import list {:d} is 0".format(self.figure_id, len(ai_figure)))
     for i in range(len(ai_figure)):
       old_ol = ai_figure[i]
       if(isinstance(old_ol[0], (tuple, list))): # outline is arc-line
@@ -863,8 +829,7 @@ class Figure_Collection:
     """ add a figure to the collection and update the statistics
     """
     if(not isinstance(ai_figure, Figure)):
-      print("ERR525: Error, figure_collection {:s}, add unexpected object {:s}".format(self.collection_id, ai_figure.figure_id))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR525: Error, figure_collection {:s}, add unexpected object {:s}".format(self.collection_id, ai_figure.figure_id))
     self.figures.append(copy.deepcopy(ai_figure)) # if the reference change, the stored object doesn't change
     #self.figures.append(copy.copy(ai_figure)) # todo: check the difference between copy() and deepcopy()
     # update statistics
@@ -922,8 +887,7 @@ dy_max:   {:0.3f}
     """ return the Figure object with the corresponding index in the figure list
     """
     if(abs(ai_index)>=len(self.figures)):
-      print("ERR583: Error, figure_collection {:s}, figure index {:d} is out of the range {:s}".format(self.collection_id, ai_index, len(self.figures)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR583: Error, figure_collection {:s}, figure index {:d} is out of the range {:s}".format(self.collection_id, ai_index, len(self.figures)))
     r_figure = self.figures[ai_index]
     return(r_figure)
 
@@ -936,8 +900,7 @@ dy_max:   {:0.3f}
       if(self.figures[i].figure_id==ai_figure_id):
         idx = i
     if(idx==-1):
-      print("ERR597: Error, figure_collection {:s}, figure_id {:s} does not exist".format(self.collection_id, ai_figure_id))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR597: Error, figure_collection {:s}, figure_id {:s} does not exist".format(self.collection_id, ai_figure_id))
     r_figure = self.get_figure_index(idx)
     return(r_figure)
 
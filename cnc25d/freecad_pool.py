@@ -0,0 +1,315 @@
+# freecad_pool.py
+# a pool of FreeCAD worker processes for the BRep and STL generation
+# created by agent on 2026/10/16
+#
+# (C) Copyright 2026 agent
+#
+# This file is part of the Cnc25D Python package.
+#
+# Cnc25D is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Cnc25D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cnc25D.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+freecad_pool.py runs the FreeCAD extrusions, booleans and exports of a design in a pool of worker processes.
+Each worker imports FreeCAD once, before its first job that needs it (BRep, FreeCAD STL, assembly or freecad_function), so the SVG and DXF jobs also run where FreeCAD is not installed.
+The pool is kept alive between the calls, so the export_figures(), write_figure_brep(), write_assembly_brep() and write_freecad_brep() of a design share the same workers.
+A job is a tuple (job_id, job_kind, job_args). The log of each job is captured and returned with its elapsed time and its error, so a failing job doesn't stop the other ones.
+"""
+
+################################################################
+# header for Python / FreeCAD compatibility
+################################################################
+
+import importing_freecad
+#importing_freecad.importing_freecad() # FreeCAD is imported by the workers with lazy_import
+
+################################################################
+# import
+################################################################
+
+import sys
+import os
+import time
+import shutil
+import tempfile
+import argparse
+import traceback
+import atexit
+import multiprocessing
+import StringIO # to capture the log of the jobs
+import cPickle as pickle # to check that a job can be sent to the workers
+#
+import design_output
+import design_help # just for get_effective_args()
+import lazy_import
+import design_profile
+import cnc25d_error
+
+################################################################
+# global variable
+################################################################
+
+# the job kinds and the design_output settings forwarded to the workers with each job
+job_kinds = ('figure', 'assembly', 'freecad_function')
+forwarded_settings = ('svg_writer', 'dxf_writer', 'stl_writer', 'slice_writer', 'cnc_cut_batch_threshold')
+# the pool of FreeCAD workers, created by get_worker_pool()
+worker_pool = None
+worker_pool_size = 0
+# the error of the FreeCAD importation in the worker process, reported by each job of this worker that needs FreeCAD
+worker_freecad_error = None
+worker_freecad_loaded = False
+
+################################################################
+# job functions
+################################################################
+
+def sub_load_freecad():
+  """ import FreeCAD in the worker process if not done yet
+      the importation is tried once per process and its error is raised by each job that needs FreeCAD
+  """
+  global worker_freecad_error
+  global worker_freecad_loaded
+  if(not worker_freecad_loaded):
+    worker_freecad_loaded = True
+    try:
+      lazy_import.Part.load()
+    except Exception as err:
+      worker_freecad_error = cnc25d_error.Cnc25dBackendError("ERR929: Error, the FreeCAD importation failed in the worker process: {:s}".format(str(err)))
+  if(worker_freecad_error!=None):
+    raise worker_freecad_error
+  return(0)
+
+def sub_job_needs_freecad(ai_job_kind, ai_job_args):
+  """ check if the job requires FreeCAD: the assembly and freecad_function jobs, and the figure jobs writing BRep or FreeCAD STL files
+  """
+  r_needs = True
+  if(ai_job_kind=='figure'):
+    r_needs = False
+    for filename in ai_job_args[2]:
+      extension = os.path.splitext(filename)[1].lower()
+      if((extension=='.brep')or((extension=='.stl')and(design_output.stl_writer=='freecad'))):
+        r_needs = True
+  elif(not ai_job_kind in job_kinds):
+    r_needs = False # reported as ERR926
+  return(r_needs)
+
+def sub_run_job(ai_job, ai_settings=None):
+  """ execute the job ai_job = (job_id, job_kind, job_args) and capture its log
+      return (job_id, result, log_txt, elapsed_time, error)
+        figure: job_args = (A_figure, B_figure, filename_list, height, info_txt). If B_figure is None, A_figure is cnc-cut first. The result is the B_figure
+        assembly: job_args = (3d_conf, output_basename, brep, stl, slice_xyz, fuse_mode). The result is None
+        freecad_function: job_args = (function, constraint, output_basename, brep, stl, slice_xyz). The result is None
+  """
+  (job_id, job_kind, job_args) = ai_job
+  start_time = time.time()
+  r_result = None
+  r_error = None
+  log_fh = StringIO.StringIO()
+  stdout_save = sys.stdout
+  sys.stdout = log_fh
+  try:
+    if(ai_settings!=None):
+      for (k, v) in ai_settings.items():
+        setattr(design_output, k, v)
+    if(sub_job_needs_freecad(job_kind, job_args)):
+      sub_load_freecad()
+    if(job_kind=='figure'):
+      (A_fig, B_fig, filenames, height, txt_info) = job_args
+      if(B_fig==None):
+        B_fig = design_output.cnc_cut_figure(A_fig, "get_B_figure_{:s}".format(job_id))
+      for filename in filenames:
+        design_output.generate_output_file(B_fig, filename, height, txt_info)
+      r_result = B_fig
+    elif(job_kind=='assembly'):
+      (conf, basename, brep, stl, slice_xyz, fuse_mode) = job_args
+      design_output.generate_3d_assembly_output_file(conf, basename, ai_brep=brep, ai_stl=stl, ai_slice_xyz=slice_xyz, ai_fuse_mode=fuse_mode, ai_jobs=1) # a worker can not start a pool
+    elif(job_kind=='freecad_function'):
+      (fc_function, constraint, basename, brep, stl, slice_xyz) = job_args
+      design_output.freecad_object_output_file(fc_function(constraint), basename, ai_brep=brep, ai_stl=stl, ai_slice_xyz=slice_xyz)
+    else:
+      raise cnc25d_error.Cnc25dBackendError("ERR926: Error, the job kind {:s} is unknown. Try: {:s}".format(job_kind, ', '.join(job_kinds)))
+  except cnc25d_error.Cnc25dError as err:
+    r_error = err
+  except Exception as err: # the FreeCAD exceptions can not always be sent back to the parent process
+    r_error = cnc25d_error.Cnc25dBackendError("ERR928: Error, the job {:s} failed with {:s}: {:s}\n{:s}".format(job_id, err.__class__.__name__, str(err), traceback.format_exc()))
+  finally:
+    sys.stdout = stdout_save
+  r_report = (job_id, r_result, log_fh.getvalue(), time.time()-start_time, r_error)
+  log_fh.close()
+  return(r_report)
+
+def sub_run_job_with_settings(ai_job_and_settings):
+  """ unpack the (job, settings) sent to the pool
+  """
+  (job, settings) = ai_job_and_settings
+  r_report = sub_run_job(job, settings)
+  return(r_report)
+
+################################################################
+# worker pool
+################################################################
+
+def get_worker_pool(ai_process_nb=0):
+  """ return the pool of ai_process_nb FreeCAD workers (0: one per CPU)
+      the pool is created at the first call and reused by the next calls with the same number of processes
+  """
+  global worker_pool
+  global worker_pool_size
+  process_nb = ai_process_nb
+  if(process_nb==0):
+    process_nb = multiprocessing.cpu_count()
+  if((worker_pool!=None)and(worker_pool_size!=process_nb)):
+    close_worker_pool()
+  if(worker_pool==None):
+    print("Start {:d} FreeCAD worker processes".format(process_nb))
+    worker_pool = multiprocessing.Pool(processes=process_nb)
+    worker_pool_size = process_nb
+  return(worker_pool)
+
+def close_worker_pool():
+  """ stop the FreeCAD workers
+  """
+  global worker_pool
+  global worker_pool_size
+  if(worker_pool!=None):
+    worker_pool.close()
+    worker_pool.join()
+    worker_pool = None
+    worker_pool_size = 0
+  return(0)
+
+atexit.register(close_worker_pool)
+
+def is_picklable(ai_object):
+  """ check if ai_object can be sent to a worker process
+  """
+  r_picklable = True
+  try:
+    pickle.dumps(ai_object, pickle.HIGHEST_PROTOCOL)
+  except Exception:
+    r_picklable = False
+  return(r_picklable)
+
+def run_jobs(ai_job_list, ai_process_nb=0):
+  """ execute the jobs of ai_job_list with a pool of ai_process_nb FreeCAD workers (0: one per CPU, 1: no pool, in the current process)
+      the logs are printed in the job order with the elapsed time of each job
+      return the list of (job_id, result, log_txt, elapsed_time, error). The errors are not raised, use raise_job_errors()
+  """
+  process_nb = ai_process_nb
+  if(process_nb==0):
+    process_nb = multiprocessing.cpu_count()
+  start_time = time.time()
+  if((process_nb==1)or(len(ai_job_list)<2)):
+    r_reports = map(sub_run_job, ai_job_list)
+  else:
+    settings = dict([ (k, getattr(design_output, k)) for k in forwarded_settings ])
+    print("Run {:d} FreeCAD jobs with {:d} processes".format(len(ai_job_list), process_nb))
+    r_reports = get_worker_pool(process_nb).map(sub_run_job_with_settings, [ (job, settings) for job in ai_job_list ], chunksize=1)
+  for ((job_id, result, log_txt, elapsed_time, error), job) in zip(r_reports, ai_job_list):
+    sys.stdout.write(log_txt)
+    design_profile.add_stage_time("freecad_pool_{:s}".format(job[1]), elapsed_time, 0.0) # the CPU time of a worker is not measured
+    if(error!=None):
+      print("job {:s} failed after {:0.3f} s: {:s}".format(job_id, elapsed_time, error.message.split('\n')[0]))
+    else:
+      print("job {:s}: {:0.3f} s".format(job_id, elapsed_time))
+  print("{:d} FreeCAD jobs done in {:0.3f} s".format(len(ai_job_list), time.time()-start_time))
+  return(r_reports)
+
+def raise_job_errors(ai_reports):
+  """ raise the error of the first failed job of ai_reports after reporting the number of failed jobs
+  """
+  failed = [ report for report in ai_reports if(report[4]!=None) ]
+  if(len(failed)>0):
+    print("{:d} of {:d} FreeCAD jobs failed: {:s}".format(len(failed), len(ai_reports), ', '.join([ report[0] for report in failed ])))
+    raise failed[0][4]
+  return(0)
+
+################################################################
+# ******** test API ***********
+################################################################
+
+def freecad_pool_test1():
+  """ run figure jobs (SVG and DXF, without FreeCAD) in the current process and with two workers
+      check the order of the reports, the returned B-figures, the written files and the job errors
+      these jobs must succeed even if FreeCAD is not installed
+  """
+  r_test = 1
+  fpt_square = [(0,0,5), (40,0,5), (40,30,5), (0,30,5), (0,0,0)]
+  fpt_figure = [fpt_square, (20,15,6)]
+  fpt_dir = tempfile.mkdtemp()
+  job_list = []
+  for i in range(4):
+    job_list.append(("fig{:d}".format(i), 'figure', (fpt_figure, None, [os.path.join(fpt_dir, "fig{:d}.svg".format(i)), os.path.join(fpt_dir, "fig{:d}.dxf".format(i))], 10.0, '')))
+  job_list.append(('bad_kind', 'unknown_kind', ()))
+  expected_B = design_output.cnc_cut_figure(fpt_figure, "freecad_pool_test1")
+  for process_nb in (1, 2):
+    reports = run_jobs(job_list, process_nb)
+    report_ids = [ report[0] for report in reports ]
+    if(report_ids!=[ job[0] for job in job_list ]):
+      print("ERR: freecad_pool the reports {:s} are not in the job order".format(', '.join(report_ids)))
+      r_test = 0
+    for (job_id, result, log_txt, elapsed_time, error) in reports:
+      if(job_id=='bad_kind'):
+        if((error==None)or(error.code!='ERR926')):
+          print("ERR: freecad_pool the unknown job kind is not reported with ERR926")
+          r_test = 0
+      elif(error!=None):
+        print("ERR: freecad_pool the job {:s} failed: {:s}".format(job_id, error.message))
+        r_test = 0
+      elif((result!=expected_B)or(not 'svg' in log_txt)):
+        print("ERR: freecad_pool the job {:s} returns a wrong B-figure or log".format(job_id))
+        r_test = 0
+      elif(not (os.path.isfile(os.path.join(fpt_dir, "{:s}.svg".format(job_id))) and os.path.isfile(os.path.join(fpt_dir, "{:s}.dxf".format(job_id))))):
+        print("ERR: freecad_pool the files of the job {:s} are missing".format(job_id))
+        r_test = 0
+    raised_code = ''
+    try:
+      raise_job_errors(reports)
+    except cnc25d_error.Cnc25dError as err:
+      raised_code = err.code
+    if(raised_code!='ERR926'):
+      print("ERR: freecad_pool raise_job_errors() raises '{:s}' instead of the first job error".format(raised_code))
+      r_test = 0
+  close_worker_pool()
+  shutil.rmtree(fpt_dir)
+  print("freecad_pool_test1: {:s}".format("OK" if r_test else "FAILED"))
+  return(r_test)
+
+################################################################
+# ******** command line interface ***********
+################################################################
+
+def freecad_pool_cli(ai_args=""):
+  """ command line interface to run this script in standalone
+  """
+  fp_parser = argparse.ArgumentParser(description='Test the freecad_pool API.')
+  fp_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
+    help='Run freecad_pool_test1()')
+  effective_args = design_help.get_effective_args(ai_args)
+  fp_args = fp_parser.parse_args(effective_args)
+  r_fpc = 0
+  print("dbg111: start testing freecad_pool.py")
+  if(fp_args.sw_test1):
+    r_fpc = freecad_pool_test1()
+  print("dbg999: end of script")
+  return(r_fpc)
+
+################################################################
+# main
+################################################################
+
+if __name__ == "__main__":
+  #freecad_pool_cli()
+  freecad_pool_cli("--test1")
+
@@ -31,7 +31,7 @@ The function gear_profile() returns an format B outline that can be easily inclu
 ################################################################
 
 import cnc25d_api
-cnc25d_api.importing_freecad()
+#cnc25d_api.importing_freecad() # FreeCAD is imported on first use by lazy_import
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -46,10 +46,11 @@ import sys, argparse
 #from datetime import datetime
 #import os, errno
 #import re
-import Tkinter # to display the outline in a small GUI
+from lazy_import import Tkinter # to display the outline in a small GUI
 import time # for time.sleep to help Tkinter to finish properly
+import numpy # to move the tkinter lines of the simulation
 # FreeCAD
-import Part
+from lazy_import import Part
 #from FreeCAD import Base
 # 3rd parties
 #import svgwrite
@@ -269,38 +270,31 @@ def gear_profile_constraint_check(c):
   if((c['gear_type']=='e')or(c['gear_type']=='i')or(c['gear_type']=='l')):
     g1_type = c['gear_type']
   else:
-    print("ERR111: Error, the gear_type {:s} is not valid!".format(c['gear_type']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR111: Error, the gear_type {:s} is not valid!".format(c['gear_type']))
   # g2_type
   if((c['second_gear_type']=='e')or(c['second_gear_type']=='i')or(c['second_gear_type']=='l')):
     g2_type = c['second_gear_type']
   else:
-    print("ERR511: Error, the gear_type {:s} is not valid!".format(c['second_gear_type']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR511: Error, the gear_type {:s} is not valid!".format(c['second_gear_type']))
   # check of the type cross compatibility
   if((g1_type=='i')and(g2_type!='e')):
-    print("ERR512: Error, internal gear is only compatible with external gear. g1_type: {:s}  g2_type: {:s}".format(g1_type, g2_type))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR512: Error, internal gear is only compatible with external gear. g1_type: {:s}  g2_type: {:s}".format(g1_type, g2_type))
   if((g1_type=='l')and(g2_type!='e')):
-    print("ERR512: Error, linear gear is only compatible with external gear. g1_type: {:s}  g2_type: {:s}".format(g1_type, g2_type))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR512: Error, linear gear is only compatible with external gear. g1_type: {:s}  g2_type: {:s}".format(g1_type, g2_type))
   g1_param['gear_type'] = g1_type
   g2_param['gear_type'] = g2_type
   # tooth_nb
   g1_n = c['gear_tooth_nb']
   if(g1_n==0):
-    print("ERR112: Error, the gear_tooth_nb must be set!")
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR112: Error, the gear_tooth_nb must be set!")
   if(g1_n<3):
-    print("ERR113: Error, the gear_tooth_nb {:d} must be equal or bigger than 3!".format(g1_n))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR113: Error, the gear_tooth_nb {:d} must be equal or bigger than 3!".format(g1_n))
   g2_n = c['second_gear_tooth_nb']
   g2_exist = False
   if(g2_n!=0):
     g2_exist = True
   if(g2_exist and (g1_n<3)):
-    print("ERR114: Error, the second_gear_tooth_nb {:d} must be equal or bigger than 3!".format(g2_n))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR114: Error, the second_gear_tooth_nb {:d} must be equal or bigger than 3!".format(g2_n))
   #g1_param['gear_exist'] = True
   #g2_param['gear_exist'] = g2_exist
   sys_param['second_gear_exist'] = g2_exist
@@ -314,8 +308,7 @@ def gear_profile_constraint_check(c):
     g1_m_set = True
   if(c['gear_primitive_diameter']>0):
     if(g1_m_set):
-      print("ERR115: Error, too much constraints! the gear_module is already set to {:0.2f}!".format(g1_m))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR115: Error, too much constraints! the gear_module is already set to {:0.2f}!".format(g1_m))
     else:
       if((g1_type=='i')or(g1_type=='e')):
         g1_m = float(c['gear_primitive_diameter'])/g1_n
@@ -324,11 +317,9 @@ def gear_profile_constraint_check(c):
       g1_m_set = True
   if(c['second_gear_primitive_diameter']>0):
     if(not g2_exist):
-      print("ERR116: Error, set second_gear_tooth_nb to use second_gear_primitive_diameter")
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR116: Error, set second_gear_tooth_nb to use second_gear_primitive_diameter")
     elif(g1_m_set):
-      print("ERR117: Error, too much constraints! the gear_module is already set to {:0.2f}!".format(g1_m))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR117: Error, too much constraints! the gear_module is already set to {:0.2f}!".format(g1_m))
     else:
       if((g2_type=='i')or(g2_type=='e')):
         g1_m = float(c['second_gear_primitive_diameter'])/g2_n
@@ -360,27 +351,23 @@ def gear_profile_constraint_check(c):
   # addendum_dedendum_parity
   g1_adp = float(c['gear_addendum_dedendum_parity'])/100
   if((g1_adp<=0)or(g1_adp>=1)):
-    print("ERR118: Error, the gear_addendum_dedendum_parity {:0.2f} must be set strictly between 0% and 100%!".format(c['gear_addendum_dedendum_parity']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR118: Error, the gear_addendum_dedendum_parity {:0.2f} must be set strictly between 0% and 100%!".format(c['gear_addendum_dedendum_parity']))
   g2_adp = 1-g1_adp
   if(c['second_gear_addendum_dedendum_parity']>0):
     if(not g2_exist):
-      print("ERR119: Error, set second_gear_tooth_nb to use second_gear_addendum_dedendum_parity")
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR119: Error, set second_gear_tooth_nb to use second_gear_addendum_dedendum_parity")
     else:
       #print("WARN211: Warning, second_gear_addendum_dedendum_parity is used for irregular cases.")
       g2_adp = float(c['second_gear_addendum_dedendum_parity'])/100
   if((g2_adp<=0)or(g2_adp>=1)):
-    print("ERR119: Error, the second_gear_addendum_dedendum_parity {:0.2f} must be set strictly between 0% and 100%!".format(c['second_gear_addendum_dedendum_parity']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR119: Error, the second_gear_addendum_dedendum_parity {:0.2f} must be set strictly between 0% and 100%!".format(c['second_gear_addendum_dedendum_parity']))
   g1_param['addendum_dedendum_parity'] = g1_adp
   g2_param['addendum_dedendum_parity'] = g2_adp
   # inter-axis additional length
   aal = c['second_gear_additional_axis_length']
   if(aal!=0):
     if(not g2_exist):
-      print("ERR120: Error, set second_gear_tooth_nb to use second_gear_additional_axis_length")
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR120: Error, set second_gear_tooth_nb to use second_gear_additional_axis_length")
     else:
       print("WARN212: Warning, second_gear_additional_axis_length is used for irregular cases.")
   sys_param['additional_inter_axis_length'] = aal
@@ -457,34 +444,27 @@ def gear_profile_constraint_check(c):
       g1_brp_set = True
     if(c['second_gear_base_diameter']>0):
       if(not g2_exist):
-        print("ERR121: Error, set second_gear_tooth_nb to use second_gear_base_diameter")
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR121: Error, set second_gear_tooth_nb to use second_gear_base_diameter")
       elif(g2_type=='l'):
-        print("ERR921: Error, the second gear type {:s} is a gearbar".format(g2_type))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR921: Error, the second gear type {:s} is a gearbar".format(g2_type))
       elif(g1_brp_set):
-        print("ERR122: Error, too much constraints! gear_base_diameter is already set to {:0.2f}".format(g1_brp*2))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR122: Error, too much constraints! gear_base_diameter is already set to {:0.2f}".format(g1_brp*2))
       else:
         g1_brp = float(c['second_gear_base_diameter']*g1_n)/(2*g2_n)
         g1_brp_set = True
     if(c['gearbar_slope']>0):
       if(not g2_exist):
-        print("ERR811: Error, set second_gear_tooth_nb to use gearbar_slope")
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR811: Error, set second_gear_tooth_nb to use gearbar_slope")
       elif((g2_type=='e')or(g2_type=='i')):
-        print("ERR812: Error, the second gear type {:s} is not a gearbar".format(g2_type))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR812: Error, the second gear type {:s} is not a gearbar".format(g2_type))
       elif(g1_brp_set):
-        print("ERR813: Error, too much constraints! gear_base_diameter is already set to {:0.2f}".format(g1_brp*2))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR813: Error, too much constraints! gear_base_diameter is already set to {:0.2f}".format(g1_brp*2))
       else:
         g1_brp = g1_pr*math.cos(c['gearbar_slope'])
         g1_brp_set = True
     if(c['gear_force_angle']>0):
       if(g1_brp_set):
-        print("ERR123: Error, too much constraints! gear_base_diameter is already set to {:0.2f}".format(g1_brp*2))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR123: Error, too much constraints! gear_base_diameter is already set to {:0.2f}".format(g1_brp*2))
       else:
         g1_brp = g1_pr*math.cos(c['gear_force_angle'])
         g1_brp_set = True
@@ -496,42 +476,34 @@ def gear_profile_constraint_check(c):
       g1_brn_set = True
     if(c['second_gear_base_diameter_n']>0):
       if(not g2_exist):
-        print("ERR121: Error, set second_gear_tooth_nb to use second_gear_base_diameter_n")
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR121: Error, set second_gear_tooth_nb to use second_gear_base_diameter_n")
       elif(g2_type=='l'):
-        print("ERR922: Error, the second gear type {:s} is a gearbar".format(g2_type))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR922: Error, the second gear type {:s} is a gearbar".format(g2_type))
       elif(g1_brn_set):
-        print("ERR122: Error, too much constraints! gear_base_diameter_n is already set to {:0.2f}".format(g1_brn*2))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR122: Error, too much constraints! gear_base_diameter_n is already set to {:0.2f}".format(g1_brn*2))
       else:
         g1_brn = float(c['second_gear_base_diameter_n']*g1_n)/(2*g2_n)
         g1_brn_set = True
     if(c['gearbar_slope_n']>0):
       if(not g2_exist):
-        print("ERR821: Error, set second_gear_tooth_nb to use gearbar_slope_n")
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR821: Error, set second_gear_tooth_nb to use gearbar_slope_n")
       elif((g2_type=='e')or(g2_type=='i')):
-        print("ERR822: Error, the second gear type {:s} is not a gearbar".format(g2_type))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR822: Error, the second gear type {:s} is not a gearbar".format(g2_type))
       elif(g1_brn_set):
-        print("ERR823: Error, too much constraints! gear_base_diameter is already set to {:0.2f}".format(g1_brn*2))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR823: Error, too much constraints! gear_base_diameter is already set to {:0.2f}".format(g1_brn*2))
       else:
         g1_brn = g1_pr*math.cos(c['gearbar_slope_n'])
         g1_brn_set = True
     if(c['gear_force_angle_n']>0):
       if(g1_brn_set):
-        print("ERR123: Error, too much constraints! gear_base_diameter is already set to {:0.2f}".format(g1_brn*2))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR123: Error, too much constraints! gear_base_diameter is already set to {:0.2f}".format(g1_brn*2))
       else:
         g1_brn = g1_pr*math.cos(c['gear_force_angle_n'])
         g1_brn_set = True
   elif(g1_type=='l'):
     g1_sp_set = False
     if((c['gear_base_diameter']>0)or(c['gear_base_diameter_n']>0)):
-      print("ERR331: Error, for gearbar use gearbar_slope and gearbar_slope_n instead of gear_base_diameter {:0.3f}  and gear_base_diameter_n {:0.3f}".format(c['gear_base_diameter'], c['gear_base_diameter_n']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR331: Error, for gearbar use gearbar_slope and gearbar_slope_n instead of gear_base_diameter {:0.3f}  and gear_base_diameter_n {:0.3f}".format(c['gear_base_diameter'], c['gear_base_diameter_n']))
     if(c['gearbar_slope']>0):
       g1_sp = c['gearbar_slope']
       g1_sp_set = True
@@ -541,17 +513,14 @@ def gear_profile_constraint_check(c):
         g1_sp_set = True
     if(c['second_gear_base_diameter']>0):
       if(not g2_exist):
-        print("ERR521: Error, set second_gear_tooth_nb to use second_gear_base_diameter")
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR521: Error, set second_gear_tooth_nb to use second_gear_base_diameter")
       elif(g1_sp_set):
-        print("ERR523: Error, too much constraints! gearbar_slope_angle is already set to {:0.2f}".format(g1_sp))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR523: Error, too much constraints! gearbar_slope_angle is already set to {:0.2f}".format(g1_sp))
       else:
         g1_sp = math.acos(float(c['second_gear_base_diameter'])/(2*g2_pr))
         g1_sp_set = True
     if(not g1_sp_set):
-      print("ERR541: Error, the slope angle of the linear gear 1 is not set!")
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR541: Error, the slope angle of the linear gear 1 is not set!")
     g1_sn = g1_sp
     g1_sn_set = False
     if(c['gearbar_slope_n']>0):
@@ -563,11 +532,9 @@ def gear_profile_constraint_check(c):
         g1_sn_set = True
     if(c['second_gear_base_diameter_n']>0):
       if(not g2_exist):
-        print("ERR531: Error, set second_gear_tooth_nb to use second_gear_base_diameter_n")
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR531: Error, set second_gear_tooth_nb to use second_gear_base_diameter_n")
       elif(g1_sn_set):
-        print("ERR532: Error, too much constraints! gearbar_slope_angle_n is already set to {:0.2f}".format(g1_sp))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR532: Error, too much constraints! gearbar_slope_angle_n is already set to {:0.2f}".format(g1_sp))
       else:
         g1_sn = math.acos(float(c['second_gear_base_diameter_n'])/(2*g2_pr))
         g1_sn_set = True
@@ -595,22 +562,18 @@ def gear_profile_constraint_check(c):
     if(g1_brp!=g1_brn):
       print("WARN218: Warning, g1_brp {:0.2f} and g1_brn {:0.2f} are different. The gear_tooth are asymmetrical!".format(g1_brp, g1_brn))
     if(g1_brp>g1_big_r):
-      print("ERR616: Error, g1_brp {:0.2f} is bigger than g1_big_r {:0.2f}".format(g1_brp, g1_big_r))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR616: Error, g1_brp {:0.2f} is bigger than g1_big_r {:0.2f}".format(g1_brp, g1_big_r))
     if(g1_brn>g1_big_r):
-      print("ERR646: Error, g1_brn {:0.2f} is bigger than g1_big_r {:0.2f}".format(g1_brn, g1_big_r))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR646: Error, g1_brn {:0.2f} is bigger than g1_big_r {:0.2f}".format(g1_brn, g1_big_r))
   if((g2_type=='e')or(g2_type=='i')):
     if(g2_exist and (g2_brp>g2_small_r)):
       print("WARN217: Warning, g2_brp {:0.2f} is bigger than g2_small_r {:0.2f}".format(g2_brp, g2_small_r))
     if(g2_exist and (g2_brn>g2_small_r)):
       print("WARN247: Warning, g2_brn {:0.2f} is bigger than g2_small_r {:0.2f}".format(g2_brn, g2_small_r))
     if(g2_exist and (g2_brp>g2_big_r)):
-      print("ERR617: Error, g2_brp {:0.2f} is bigger than g2_big_r {:0.2f}".format(g2_brp, g2_big_r))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR617: Error, g2_brp {:0.2f} is bigger than g2_big_r {:0.2f}".format(g2_brp, g2_big_r))
     if(g2_exist and (g2_brn>g2_big_r)):
-      print("ERR647: Error, g2_brn {:0.2f} is bigger than g2_big_r {:0.2f}".format(g2_brn, g2_big_r))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR647: Error, g2_brn {:0.2f} is bigger than g2_big_r {:0.2f}".format(g2_brn, g2_big_r))
   g1_param['positive_base_radius'] = g1_brp
   g1_param['negative_base_radius'] = g1_brn
   g1_param['positive_slope_angle'] = g1_sp
@@ -641,8 +604,7 @@ def gear_profile_constraint_check(c):
   g2_rbr = g1_rbr
   if(c['second_gear_router_bit_radius']>0):
     if(not g2_exist):
-      print("ERR124: Error, set second_gear_tooth_nb to use second_gear_router_bit_radius")
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR124: Error, set second_gear_tooth_nb to use second_gear_router_bit_radius")
     else:
       g2_rbr = c['second_gear_router_bit_radius']
   g1_param['gear_router_bit_radius'] = g1_rbr
@@ -703,8 +665,7 @@ def gear_profile_constraint_check(c):
   g1_ple = 0
   if(c['portion_tooth_nb']>0): # cut a portion of the first gear
     if(((g1_type=='e')or(g1_type=='i'))and(c['portion_tooth_nb']>=g1_n)):
-      print("ERR553: Error, the portion {:d} of gearwheel is bigger than the maximal number of teeth {:d}!".format(c['portion_tooth_nb'], g1_n))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR553: Error, the portion {:d} of gearwheel is bigger than the maximal number of teeth {:d}!".format(c['portion_tooth_nb'], g1_n))
     g1_ptn = c['portion_tooth_nb']
     g1_pfe = c['portion_first_end']
     g1_ple = c['portion_last_end']
@@ -924,7 +885,10 @@ def gear_profile_simulation_A(c):
     (g2_make_low_param, g2_info_low) = calc_low_level_gear_parameters(c['g2_param'])
     (place_low_parameters, place_info) = pre_g2_position_calculation(c['g1_param'], c['g2_param'], c['second_gear_additional_axis_length'], c['second_gear_position_angle'], g1_rotation_speed, speed_scale)
   ### simulation
-  print("Launch the simulation with Tkinter ..")
+  if(cnc25d_api.headless_enabled()):
+    print("Launch the simulation with the headless renderer ..")
+  else:
+    print("Launch the simulation with Tkinter ..")
   # initialization
   #g1_ideal_involute = ideal_tooth_outline(g1_make_low_param, 0, 0)
   #g1_ideal_tooth = ideal_tooth_outline(g1_make_low_param, 0, 1)
@@ -941,9 +905,32 @@ def gear_profile_simulation_A(c):
   g2_position_curve_table = []
   g2_rotation_speed_curve_table = []
   tangential_friction_curve_table = []
-  ### start Tkinter
-  tk_root = Tkinter.Tk()
-  my_canvas = cnc25d_api.Two_Canvas(tk_root)
+  ### gear outlines at the position 0, tessellated once per zoom level and moved to the position of each frame
+  gear_outline_functions = {}
+  gear_outline_functions['g1_outline_B'] = lambda: gear_profile_outline(g1_make_low_param, 0)
+  gear_outline_functions['g1_ideal_involute'] = lambda: ideal_tooth_outline(g1_make_low_param, 0, 0)
+  gear_outline_functions['g1_ideal_tooth'] = lambda: ideal_tooth_outline(g1_make_low_param, 0, 1)
+  if(c['g2_exist']):
+    gear_outline_functions['g2_outline_B'] = lambda: gear_profile_outline(g2_make_low_param, 0)
+    gear_outline_functions['g2_ideal_involute'] = lambda: ideal_tooth_outline(g2_make_low_param, 0, 0)
+    gear_outline_functions['g2_ideal_tooth'] = lambda: ideal_tooth_outline(g2_make_low_param, 0, 1)
+  gear_line_cache = {}
+  def sub_gear_lines(ai_outline_name, ai_low_parameters, ai_position):
+    """ return the tkinter lines (numpy array (n,4)) of the gear outline ai_outline_name moved to ai_position
+    """
+    cache_key = (ai_outline_name, cnc25d_api.tkinter_tessellation()[0])
+    if(not cache_key in gear_line_cache):
+      gear_line_cache[cache_key] = numpy.array(cnc25d_api.outline_arc_line(gear_outline_functions[ai_outline_name](), 'tkinter'), dtype=numpy.float64).reshape(-1, 2)
+    points = gear_line_cache[cache_key]
+    (cos_a, sin_a, tx, ty) = gear_outline_motion(ai_low_parameters, ai_position)
+    r_lines = numpy.column_stack((cos_a*points[:,0]-sin_a*points[:,1]+tx, sin_a*points[:,0]+cos_a*points[:,1]+ty)).reshape(-1, 4)
+    return(r_lines)
+  ### start Tkinter (or the off-screen renderer)
+  if(cnc25d_api.headless_enabled()):
+    my_canvas = cnc25d_api.Headless_Canvas()
+  else:
+    tk_root = Tkinter.Tk()
+    my_canvas = cnc25d_api.Two_Canvas(tk_root)
   # callback functions for display_backend
   def sub_canvas_graphics(ai_rotation_direction, ai_angle_position):
     """ create the graphics and fill-up the matplotlib curve tables
@@ -959,22 +946,18 @@ def gear_profile_simulation_A(c):
     if(c['g2_exist']):
       #g2_position = g2_ia-ai_angle_position # completely wrong, just waiting for the good formula
       (g2_position, g2_rotation_speed, tangential_friction, c1_speed_outline, c2_speed_outline) = g2_position_calculation(place_low_parameters, ai_rotation_direction, g1_position)
-    ## get outline_B
-    lg1_outline_B = gear_profile_outline(g1_make_low_param, g1_position)
-    lg1_ideal_involute = ideal_tooth_outline(g1_make_low_param, g1_position, 0)
-    lg1_ideal_tooth = ideal_tooth_outline(g1_make_low_param, g1_position, 1)
+    ## get the tkinter lines of the gears by moving the lines of the position 0
+    lg1_outline_lines = sub_gear_lines('g1_outline_B', g1_make_low_param, g1_position)
+    lg1_ideal_involute_lines = sub_gear_lines('g1_ideal_involute', g1_make_low_param, g1_position)
+    lg1_ideal_tooth_lines = sub_gear_lines('g1_ideal_tooth', g1_make_low_param, g1_position)
     if(c['g2_exist']):
-      lg2_outline_B = gear_profile_outline(g2_make_low_param, g2_position)
-      lg2_ideal_involute = ideal_tooth_outline(g2_make_low_param, g2_position, 0)
-      lg2_ideal_tooth = ideal_tooth_outline(g2_make_low_param, g2_position, 1)
-    ## alternative to get outline_B
-    #lg1_outline_B = cnc25d_api.outline_rotate(g1_outline_B, g1_ix, g1_iy, g1_position-c['gear_initial_angle'])
-    #lg1_ideal_involute = cnc25d_api.outline_rotate(g1_ideal_involute, g1_ix, g1_iy, g1_position)
-    #lg1_ideal_tooth = cnc25d_api.outline_rotate(g1_ideal_tooth, g1_ix, g1_iy, g1_position)
-    #if(c['g2_exist']):
-    #  lg2_outline_B = cnc25d_api.outline_rotate(g2_outline_B, g2_ix, g2_iy, g2_position)
-    #  lg2_ideal_involute = cnc25d_api.outline_rotate(g2_ideal_involute, g2_ix, g2_iy, g2_position)
-    #  lg2_ideal_tooth = cnc25d_api.outline_rotate(g2_ideal_tooth, g2_ix, g2_iy, g2_position)
+      lg2_outline_lines = sub_gear_lines('g2_outline_B', g2_make_low_param, g2_position)
+      lg2_ideal_involute_lines = sub_gear_lines('g2_ideal_involute', g2_make_low_param, g2_position)
+      lg2_ideal_tooth_lines = sub_gear_lines('g2_ideal_tooth', g2_make_low_param, g2_position)
+    ## alternative to get the lines: regenerate the outlines at each frame (slower)
+    #lg1_outline_lines = cnc25d_api.outline_arc_line(gear_profile_outline(g1_make_low_param, g1_position), 'tkinter')
+    #lg1_ideal_involute_lines = cnc25d_api.outline_arc_line(ideal_tooth_outline(g1_make_low_param, g1_position, 0), 'tkinter')
+    #lg1_ideal_tooth_lines = cnc25d_api.outline_arc_line(ideal_tooth_outline(g1_make_low_param, g1_position, 1), 'tkinter')
     # action_line
     if(c['g2_exist']):
       if(ai_rotation_direction==1):
@@ -983,13 +966,13 @@ def gear_profile_simulation_A(c):
         action_line_outline = c['negative_rotation_action_line_outline']
     ## make graphic
     r_canvas_graphics = []
-    r_canvas_graphics.append(('graphic_lines', cnc25d_api.outline_arc_line(lg1_outline_B, 'tkinter'), 'red', 1))
-    r_canvas_graphics.append(('overlay_lines', cnc25d_api.outline_arc_line(lg1_ideal_involute, 'tkinter'), 'green', 1))
-    r_canvas_graphics.append(('overlay_lines', cnc25d_api.outline_arc_line(lg1_ideal_tooth, 'tkinter'), 'blue', 1))
+    r_canvas_graphics.append(('graphic_lines', lg1_outline_lines, 'red', 1))
+    r_canvas_graphics.append(('overlay_lines', lg1_ideal_involute_lines, 'green', 1))
+    r_canvas_graphics.append(('overlay_lines', lg1_ideal_tooth_lines, 'blue', 1))
     if(c['g2_exist']):
-      r_canvas_graphics.append(('graphic_lines', cnc25d_api.outline_arc_line(lg2_outline_B, 'tkinter'), 'grey', 1))
-      r_canvas_graphics.append(('overlay_lines', cnc25d_api.outline_arc_line(lg2_ideal_involute, 'tkinter'), 'green', 1))
-      r_canvas_graphics.append(('overlay_lines', cnc25d_api.outline_arc_line(lg2_ideal_tooth, 'tkinter'), 'blue', 1))
+      r_canvas_graphics.append(('graphic_lines', lg2_outline_lines, 'grey', 1))
+      r_canvas_graphics.append(('overlay_lines', lg2_ideal_involute_lines, 'green', 1))
+      r_canvas_graphics.append(('overlay_lines', lg2_ideal_tooth_lines, 'blue', 1))
       # speed overlay
       r_canvas_graphics.append(('overlay_lines', cnc25d_api.outline_arc_line(c1_speed_outline, 'tkinter'), 'yellow', 1))
       r_canvas_graphics.append(('overlay_lines', cnc25d_api.outline_arc_line(c2_speed_outline, 'tkinter'), 'orange', 1))
@@ -1028,9 +1011,12 @@ def gear_profile_simulation_A(c):
   my_canvas.add_canvas_graphic_function(sub_canvas_graphics)
   my_canvas.add_parameter_info(g1g2_info_txt)
   my_canvas.add_curve_graphic_table(gear_profile_mpl_curves)
-  tk_root.mainloop()
-  del (my_canvas, tk_root) # because Tkinter could be used again later in this script
-  time.sleep(1) # delay to help Tkinter to close properly
+  if(cnc25d_api.headless_enabled()):
+    my_canvas.run()
+  else:
+    tk_root.mainloop()
+    del (my_canvas, tk_root) # because Tkinter could be used again later in this script
+    time.sleep(1) # delay to help Tkinter to close properly
   return(1)
 
 def gear_profile_2d_simulations():
@@ -1142,12 +1128,12 @@ class gear_profile(cnc25d_api.bare_design):
 
 # this works with python and freecad :)
 if __name__ == "__main__":
-  FreeCAD.Console.PrintMessage("gear_profile.py says hello!\n")
+  print("gear_profile.py says hello!")
   my_gp = gear_profile()
   #my_gp.cli("")
   #my_gp.cli("--gear_tooth_nb 17")
   #my_gp.cli("--gear_tooth_nb 17 --gear_module 10 --gear_router_bit_radius 3.0")
-  my_gp.cli("--gear_tooth_nb 17 --gear_module 10 --gear_router_bit_radius 3.0 --second_gear_tooth_nb 20")
+  cnc25d_api.cli_shim(my_gp.cli, "--gear_tooth_nb 17 --gear_module 10 --gear_router_bit_radius 3.0 --second_gear_tooth_nb 20")
   #my_gp.cli("--gear_tooth_nb 17 --output_file_basename test_output/toto1")
   #my_gp.cli("--gear_tooth_nb 17 --output_file_basename gear_profile_example_1.svg")
   #my_gp.cli("--gear_tooth_nb 17 --cut_portion 7 3 3 --output_file_basename gear_profile_example_2.svg")
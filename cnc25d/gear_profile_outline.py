@@ -43,6 +43,7 @@ import cnc25d_api
 import math
 #import sys, argparse
 import sys
+import argparse
 #from datetime import datetime
 #import os, errno
 #import re
@@ -53,6 +54,7 @@ import sys
 # 3rd parties
 #import svgwrite
 #from dxfwrite import DXFEngine
+import numpy # for the test of gear_outline_motion()
 # cnc25d
 import small_geometry # use some well-tested functions from the internal of the cnc25d_api
 
@@ -91,9 +93,8 @@ def involute_to_circle(ai_center, ai_base_radius, ai_initial_angle, ai_orientati
   u = ai_parameter
   # check the parameter
   if(u<0):
-    print("ERR099: Error, the parameter of the involute_to_circle must be positive {:0.8f}".format(u))
     print("dbg887: ai_center {:0.2f} {:0.2f}  ai_base_radius {:0.2f}  ai_initial_angle {:0.2f}  ai_orientation {:d}  ai_parameter {:0.2f}".format(ai_center[0], ai_center[1], ai_base_radius, ai_initial_angle, ai_orientation, ai_parameter))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR099: Error, the parameter of the involute_to_circle must be positive {:0.8f}".format(u))
   # involute_to_circle of center (0,0), radius 1 and initial_angle = 0 with the parameter u
   px0 = math.cos(u)+u*math.sin(u)
   py0 = rd*(math.sin(u)-u*math.cos(u))
@@ -133,8 +134,7 @@ def search_point_of_involute_to_circle(ai_center, ai_base_radius, ai_initial_ang
   R = ai_altitude
   # check the paramter
   if(R<B):
-    print("ERR098: Error, the altitude {:0.2f} is smaller than the base_diameter {:0.2f}".format(R, B))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR098: Error, the altitude {:0.2f} is smaller than the base_diameter {:0.2f}".format(R, B))
   ### method 1
   ## converge to P
   #u = 0
@@ -234,18 +234,14 @@ def calc_low_level_gear_parameters(ai_param):
   # tooth height check
   #
   if(g_ks*(g_pr-g_dr)<0):
-    print("ERR985: Error, g_pr {:0.2f} and g_dr {:0.2f} are not in the correct order!".format(g_pr, g_dr))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR985: Error, g_pr {:0.2f} and g_dr {:0.2f} are not in the correct order!".format(g_pr, g_dr))
   if(g_ks*(g_ar-g_pr)<0):
-    print("ERR986: Error, g_pr {:0.2f} and g_ar {:0.2f} are not in the correct order!".format(g_pr, g_ar))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR986: Error, g_pr {:0.2f} and g_ar {:0.2f} are not in the correct order!".format(g_pr, g_ar))
   # involute resolution check
   if(g_irp<1):
-    print("ERR786: Error, g_irp {:d} must be equal or bigger than 1!".format(g_irp))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR786: Error, g_irp {:d} must be equal or bigger than 1!".format(g_irp))
   if(g_irn<1):
-    print("ERR787: Error, g_irn {:d} must be equal or bigger than 1!".format(g_irn))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR787: Error, g_irn {:d} must be equal or bigger than 1!".format(g_irn))
   ### calculation of the low level parameters
   r_low_parameters = ()
   if((g_type=='e')or(g_type=='i')):
@@ -255,14 +251,12 @@ def calc_low_level_gear_parameters(ai_param):
     pi_module_angle = ai_param['pi_module_angle']
     # intersection of positive involute and the primitive circle
     if(g_brp>g_pr-radian_epsilon):
-      print("ERR987: Error, g_brp {:0.2f} is bigger than g_pr {:0.2f}!".format(g_brp, g_pr))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR987: Error, g_brp {:0.2f} is bigger than g_pr {:0.2f}!".format(g_brp, g_pr))
     (ippu, ippa, ippx, ippy, ippti) = search_point_of_involute_to_circle((g_ox, g_oy), g_brp, 0, 1, g_pr, initial_step, radian_epsilon_2)
     #ai_param['low_positive_primitive_angle'] = ippa
     # intersection of negative involute and the primitive circle
     if(g_brn>g_pr-radian_epsilon):
-      print("ERR988: Error, g_brn {:0.2f} is bigger than g_pr {:0.2f}!".format(g_brp, g_pr))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR988: Error, g_brn {:0.2f} is bigger than g_pr {:0.2f}!".format(g_brp, g_pr))
     (inpu, inpa, inpx, inpy, inpti) = search_point_of_involute_to_circle((g_ox, g_oy), g_brn, 0, -1, g_pr, initial_step, radian_epsilon_2)
     #ai_param['low_negative_primitive_angle'] = inpa
     # intersection of positive involute and the addendum circle
@@ -297,13 +291,11 @@ def calc_low_level_gear_parameters(ai_param):
     top_land = pi_module_angle*g_adp-(addendum_positive_involute+addendum_negative_involute)
     #print("dbg298: top_land", top_land) [bug] dxf-top_land is negative whereas this top_land is still positive [todo] fix it
     if(top_land*g_ar<radian_epsilon): # a bit stricter than 0
-      print("ERR989: Error, the top_land {:0.2f} is negative or too small!".format(top_land))
       print("dbg553: g_pr {:0.3f}  g_brp {:0.3f}  g_brn {:0.3f}".format(g_pr, g_brp, g_brn))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR989: Error, the top_land {:0.2f} is negative or too small!".format(top_land))
     bottom_land = pi_module_angle*(1-g_adp)-(dedendum_positive_involute+dedendum_negative_involute)
     if(bottom_land*g_dr<2.1*g_rbr): # a bit stricter than router_bit_radius
-      print("ERR990: Error, the bottom_land {:0.2f} is negative or too small compare to the router_bit_radius {:0.2f} ({:0.2f} < {:0.2f})!".format(bottom_land, g_rbr, bottom_land*g_dr, 2*g_rbr))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR990: Error, the bottom_land {:0.2f} is negative or too small compare to the router_bit_radius {:0.2f} ({:0.2f} < {:0.2f})!".format(bottom_land, g_rbr, bottom_land*g_dr, 2*g_rbr))
     ai_param['top_land'] = top_land
     ai_param['bottom_land'] = bottom_land
     ai_param['addendum_positive_involute'] = addendum_positive_involute
@@ -370,18 +362,15 @@ def calc_low_level_gear_parameters(ai_param):
     #bottom_land_length = bottom_land * g_dr
     bottom_land_length = 2 * g_dr * math.sin(bottom_land/2)
     if((g_ks*i1_dtri>0)or(g_ks*i2_dtri<0)):
-      print("ERR234: Error, i1_dtri {:0.3f} >0 or i2_dtri {:0.3f} < 0".format(g_ks*i1_dtri, g_ks*i2_dtri))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR234: Error, i1_dtri {:0.3f} >0 or i2_dtri {:0.3f} < 0".format(g_ks*i1_dtri, g_ks*i2_dtri))
     cos_i1_dtri = math.cos(i1_dtri)
     cos_i2_dtri = math.cos(i2_dtri)
     if((cos_i1_dtri<radian_epsilon)or(cos_i1_dtri<radian_epsilon)):
-      print("ERR632: Error, i1_dtri {:0.3f} or i2_dtri {:0.3f} are too closed to pi/2 or even bigger!".format(i1_dtri, i2_dtri))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR632: Error, i1_dtri {:0.3f} or i2_dtri {:0.3f} are too closed to pi/2 or even bigger!".format(i1_dtri, i2_dtri))
     ABh = bottom_land_length-i1_thickness/cos_i1_dtri-i2_thickness/cos_i2_dtri # see documentation graphic of hollow optimization
     ## check bottom_land with g_stp and g_stn
     if(ABh<radian_epsilon):
-      print("ERR381: Error, the bottom {:0.3f} is too small because of g_stp {:0.3f} and g_stn {:0.3f}".format(ABh, g_stp, g_stn))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR381: Error, the bottom {:0.3f} is too small because of g_stp {:0.3f} and g_stn {:0.3f}".format(ABh, g_stp, g_stn))
     a = math.pi/2-abs(i1_dtri) - g_ks * bottom_land/2
     b = math.pi/2-abs(i2_dtri) - g_ks * bottom_land/2
     AIB = math.pi - (a + b)
@@ -402,12 +391,10 @@ def calc_low_level_gear_parameters(ai_param):
       AI2 = ABh*math.sin(b)/math.sin(AIB)
       BI2 = ABh*math.sin(a)/math.sin(AIB)
       if(abs(AI2-AI)>radian_epsilon):
-        print("ERR972: Error, AI {:0.3f} and AI2 {:0.3f} are not equal".format(AI, AI2))
         print("dbg647: a {:0.3f}  b {:0.3f}  AIB {:0.3f}  ABh {:0.3f}".format(a, b, AIB, ABh))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR972: Error, AI {:0.3f} and AI2 {:0.3f} are not equal".format(AI, AI2))
       if(abs(BI2-BI)>radian_epsilon):
-        print("ERR973: Error, BI {:0.3f} and BI2 {:0.3f} are not equal".format(BI, BI2))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR973: Error, BI {:0.3f} and BI2 {:0.3f} are not equal".format(BI, BI2))
       # select the method for AI and BI
       AI = AI2
       BI = BI2
@@ -459,12 +446,10 @@ def calc_low_level_gear_parameters(ai_param):
     top_land = pi_module*g_adp-(positive_addendum+negative_addendum)
     bottom_land = pi_module*(1-g_adp)-(positive_dedendum+negative_dedendum)
     if(top_land<radian_epsilon):
-      print("ERR858: Error, the linear gear top-land {:0.3f} is negative or too small!".format(top_land))
       print("dbg455: g_sp {:0.3f}  g_sn {:0.3f}".format(g_sp, g_sn))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR858: Error, the linear gear top-land {:0.3f} is negative or too small!".format(top_land))
     if(bottom_land<2*g_rbr+radian_epsilon):
-      print("ERR859: Error, the linear gear bottom-land {:0.3f} is too small compare to the gear_router_bit_radius {:0.3f}".format(bottom_land, g_rbr))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR859: Error, the linear gear bottom-land {:0.3f} is too small compare to the gear_router_bit_radius {:0.3f}".format(bottom_land, g_rbr))
     ai_param['top_land'] = top_land
     ai_param['bottom_land'] = bottom_land
     ai_param['addendum_positive_slope'] = positive_addendum
@@ -497,8 +482,7 @@ def calc_low_level_gear_parameters(ai_param):
     cos_p = math.cos(g_sp)
     cos_n = math.cos(g_sn)
     if((cos_p<radian_epsilon)or(cos_n<radian_epsilon)):
-      print("ERR334: Error, g_sp {:0.3f}  or g_sn {:0.3f} are too closed to pi/2 or even bigger!".format(cos_p, cos_n))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR334: Error, g_sp {:0.3f}  or g_sn {:0.3f} are too closed to pi/2 or even bigger!".format(cos_p, cos_n))
     ABh = bottom_land - g_stp/cos_p - g_stn/cos_n
     a = math.pi/2-abs(g_sp)
     b = math.pi/2-abs(g_sn)
@@ -527,8 +511,7 @@ def calc_low_level_gear_parameters(ai_param):
     info_txt += "top land:          \t{:0.3f} (mm)  \t{:0.2f} %\n".format(top_land, 100*top_land/pi_module)
     info_txt += "bottom land:       \t{:0.3f} (mm)  \t{:0.2f} %\n".format(bottom_land, 100*bottom_land/pi_module)
   else:
-    print("ERR740: Error, the gear_type {:s} doesn't exist!".format(g_type))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR740: Error, the gear_type {:s} doesn't exist!".format(g_type))
   #return
   r_cllgp = (make_low_parameters, info_txt)
   return(r_cllgp)
@@ -571,8 +554,7 @@ def involute_outline(ai_ox, ai_oy, ai_base_radius, ai_offset, ai_sign, ai_u_nb,
     r_hollow_slope_A = ((p1x, p1y, 0), (p2x, p2y, ai_rbr))
     r_ti = p1t
   else:
-    print("ERR563: Error, the hollow end {:d} can only be 1 or -1".format(ai_he))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR563: Error, the hollow end {:d} can only be 1 or -1".format(ai_he))
   #if(ai_dbg==0):
   #  print("dbg569: ai_dsl {:0.3f}  ai_hsl {:0.3f}  + {:0.3f}".format(ai_dsl, ai_hsl, ai_dsl + ai_hsl))
   return(r_involute_B, r_hollow_slope_A, r_ti)
@@ -636,10 +618,11 @@ def half_hollow_outline(ai_tooth_angle, ai_sx, ai_sy, ai_si, ai_hrbr, ai_ham, ai
     r_hho = cnc25d_api.outline_reverse(r_hho)
   return(r_hho)
 
-def gearwheel_profile_outline(ai_low_parameters, ai_angle_position):
+def gearwheel_profile_outline(ai_low_parameters, ai_angle_position, ai_tooth_template=True):
   """ create the outline of a gear definied by ai_low_parameters
       The reference of a gearwheel is the middle of its first tooth.
       ai_angle_position sets the reference of the gearwheel.
+      If ai_tooth_template is True, the first tooth is computed and the other teeth are obtained by rotation of the first one.
   """
   # get ai_low_parameters
   (gear_type, pi_module_angle,
@@ -657,8 +640,7 @@ def gearwheel_profile_outline(ai_low_parameters, ai_angle_position):
   elif(gear_type=='i'):
     hgt = -1
   else:
-    print("ERR556: gear_type {:s} must be 'e' or 'i'".format(gear_type))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR556: gear_type {:s} must be 'e' or 'i'".format(gear_type))
   # construct the final_outline
   r_final_outline = []
   tooth_angle = ai_angle_position
@@ -679,7 +661,12 @@ def gearwheel_profile_outline(ai_low_parameters, ai_angle_position):
     r_final_outline.extend(half_hollow)
     r_final_outline.extend(start_of_profile_B)
   ### bulk of the gearwheel_portion
-  for tooth in range(portion_tooth_nb):
+  if(ai_tooth_template and (portion_tooth_nb>1)):
+    bulk_tooth_nb = 1 # the other teeth are copies of the first tooth
+  else:
+    bulk_tooth_nb = portion_tooth_nb
+  first_tooth_idx = len(r_final_outline)
+  for tooth in range(bulk_tooth_nb):
     # first involute
     (first_involute_B, first_hollow_slope_A, s_ti) = involute_outline(ox, oy, i1_base, i1_offset, i1_sign, i1u_nb, i1u_ini, i1u_inc, i1_thickness, hgt, -1, i1_dsl, i1_hsl, hrbr, tooth_angle)
     # second involute
@@ -699,11 +686,10 @@ def gearwheel_profile_outline(ai_low_parameters, ai_angle_position):
     # check the optimization
     if(ho):
       if((abs(first_hollow_slope_A[1][0]-second_hollow_slope_A[0][0])>radian_epsilon)or(abs(first_hollow_slope_A[1][1]-second_hollow_slope_A[0][1])>radian_epsilon)):
-        print("ERR582: the hollow optimization intersection is wrong: x1 {:0.3f}   x2 {:0.3f}  y1 {:0.3f}   y2 {:0.3f}".format(first_hollow_slope_A[1][0], second_hollow_slope_A[0][0], first_hollow_slope_A[1][1], second_hollow_slope_A[0][1]))
         #hollow_A = []
         #hollow_A.extend(first_hollow_slope_A)
         #hollow_A.extend(second_hollow_slope_A)
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR582: the hollow optimization intersection is wrong: x1 {:0.3f}   x2 {:0.3f}  y1 {:0.3f}   y2 {:0.3f}".format(first_hollow_slope_A[1][0], second_hollow_slope_A[0][0], first_hollow_slope_A[1][1], second_hollow_slope_A[0][1]))
     hollow_B = cnc25d_api.cnc_cut_outline(hollow_A, "hollow")
     # assembly
     r_final_outline.extend(first_involute_B)
@@ -711,6 +697,12 @@ def gearwheel_profile_outline(ai_low_parameters, ai_angle_position):
     r_final_outline.extend(second_involute_B)
     # prepare the next tooth
     tooth_angle += pi_module_angle
+  if(bulk_tooth_nb<portion_tooth_nb):
+    tooth_template = cnc25d_api.outline_to_array(r_final_outline[first_tooth_idx:])
+    teeth = tooth_template.pattern_rotate(ox, oy, pi_module_angle, portion_tooth_nb)
+    r_final_outline.extend(teeth.to_outline()[len(tooth_template):])
+    for tooth in range(bulk_tooth_nb, portion_tooth_nb):
+      tooth_angle += pi_module_angle
   ### end of bulk
   if(last_end>0):
     half_hollow = []
@@ -807,10 +799,11 @@ def slope_outline(ai_ox, ai_oy, ai_bi, ai_offset, ai_slope_angle, ai_sign, ai_to
   # return
   return(r_slope_B)
 
-def gearbar_profile_outline(ai_low_parameters, ai_tangential_position):
+def gearbar_profile_outline(ai_low_parameters, ai_tangential_position, ai_tooth_template=True):
   """ create the outline of a gearbar definied by ai_low_parameters
       The reference of a gearbar is the middle of the middle tooth.
       ai_tangential_position sets the reference of the gearbar.
+      If ai_tooth_template is True, the first tooth is computed and the other teeth are obtained by translation of the first one.
   """
   # precision
   #radian_epsilon = math.pi/1000
@@ -843,14 +836,18 @@ def gearbar_profile_outline(ai_low_parameters, ai_tangential_position):
   elif(len(gearbar_A)==1):
     r_final_outline.append((gearbar_A[0][0], gearbar_A[0][1]))
   # bulk of the gearbar
-  for tooth in range(bar_tooth_nb):
+  if(ai_tooth_template and (bar_tooth_nb>1)):
+    bulk_tooth_nb = 1 # the other teeth are copies of the first tooth
+  else:
+    bulk_tooth_nb = bar_tooth_nb
+  first_tooth_idx = len(r_final_outline)
+  for tooth in range(bulk_tooth_nb):
     gearbar_A = []
     l_positive_slope = slope_outline(g_ox, g_oy, g_bi, gb_p_offset, g_sp,  1, g_alp, g_dlp, g_hlp, g_stp, g_rbr, tangential_position) # positive slope
     l_negative_slope = slope_outline(g_ox, g_oy, g_bi, gb_n_offset, g_sn, -1, g_aln, g_dln, g_hln, g_stn, g_rbr, tangential_position+pi_module) # negative slope
     if(ho):
       if((abs(l_negative_slope[0][0]-l_positive_slope[1][0])>radian_epsilon)or(abs(l_negative_slope[0][1]-l_positive_slope[1][1])>radian_epsilon)):
-        print("ERR583: the gearbar hollow optimization intersection is wrong: x1 {:0.3f}   x2 {:0.3f}  y1 {:0.3f}   y2 {:0.3f}".format(l_positive_slope[1][0], l_negative_slope[0][0], l_positive_slope[1][1], l_negative_slope[0][1]))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR583: the gearbar hollow optimization intersection is wrong: x1 {:0.3f}   x2 {:0.3f}  y1 {:0.3f}   y2 {:0.3f}".format(l_positive_slope[1][0], l_negative_slope[0][0], l_positive_slope[1][1], l_negative_slope[0][1]))
     gearbar_A.extend(l_positive_slope)
     if(ho):
       gearbar_A.append(l_negative_slope[1])
@@ -861,6 +858,12 @@ def gearbar_profile_outline(ai_low_parameters, ai_tangential_position):
     r_final_outline.extend(gearbar_B)
     # prepare the next tooth
     tangential_position += pi_module
+  if(bulk_tooth_nb<bar_tooth_nb):
+    tooth_template = cnc25d_api.outline_to_array(r_final_outline[first_tooth_idx:])
+    teeth = tooth_template.pattern_shift(pi_module*math.cos(g_bi-math.pi/2), pi_module*math.sin(g_bi-math.pi/2), bar_tooth_nb)
+    r_final_outline.extend(teeth.to_outline()[len(tooth_template):])
+    for tooth in range(bulk_tooth_nb, bar_tooth_nb):
+      tangential_position += pi_module
   # end of the gearbar
   gearbar_A = []
   if(g_ple==3): # stop on hollow_middle
@@ -899,16 +902,17 @@ def ideal_linear_tooth_outline(ai_low_parameters, ai_tangential_position, ai_thi
   #return
   return(r_ideal_tooth_outline_B)
 
-def gear_profile_outline(ai_low_parameters, ai_angle_position):
+def gear_profile_outline(ai_low_parameters, ai_angle_position, ai_tooth_template=True):
   """ create the format B outline of a gear definied by ai_low_parameters
       ai_angle_position sets the gear position.
+      ai_tooth_template selects the tooth replication mode (see gearwheel_profile_outline())
   """
   r_gear_profile_outline_B = []
   g_type = ai_low_parameters[0]
   if((g_type=='e')or(g_type=='i')):
-    r_gear_profile_outline_B = gearwheel_profile_outline(ai_low_parameters, ai_angle_position)
+    r_gear_profile_outline_B = gearwheel_profile_outline(ai_low_parameters, ai_angle_position, ai_tooth_template)
   elif(g_type=='l'):
-    r_gear_profile_outline_B = gearbar_profile_outline(ai_low_parameters, ai_angle_position)
+    r_gear_profile_outline_B = gearbar_profile_outline(ai_low_parameters, ai_angle_position, ai_tooth_template)
   #return
   return(r_gear_profile_outline_B)
 
@@ -924,6 +928,24 @@ def ideal_tooth_outline(ai_low_parameters, ai_angle_position, ai_thickness_coeff
   #return
   return(r_ideal_tooth_outline)
 
+def gear_outline_motion(ai_low_parameters, ai_position):
+  """ return the motion (cos_a, sin_a, tx, ty) that moves the outlines of a gear (i, e or l) from the position 0 to ai_position
+      a point (x, y) moves to (cos_a*x-sin_a*y+tx, sin_a*x+cos_a*y+ty)
+      a gearwheel rotates around its center, a gearbar translates along its teeth (with the same cycle as gearbar_profile_outline())
+  """
+  g_type = ai_low_parameters[0]
+  if((g_type=='e')or(g_type=='i')):
+    (ox, oy) = ai_low_parameters[24:26]
+    (cos_a, sin_a) = (math.cos(ai_position), math.sin(ai_position))
+    r_motion = (cos_a, sin_a, ox-cos_a*ox+sin_a*oy, oy-sin_a*ox-cos_a*oy)
+  elif(g_type=='l'):
+    (pi_module, g_bi, middle_tooth) = (ai_low_parameters[1], ai_low_parameters[4], ai_low_parameters[6])
+    cyclic_tangential_position = math.fmod(ai_position, (middle_tooth-1)*pi_module)
+    r_motion = (1.0, 0.0, cyclic_tangential_position*math.cos(g_bi-math.pi/2), cyclic_tangential_position*math.sin(g_bi-math.pi/2))
+  else:
+    raise cnc25d_api.Cnc25dDesignError("ERR944: Error, the gear_type {:s} doesn't exist!".format(g_type))
+  return(r_motion)
+
 #############################################################################
 # positioning help-function
 #############################################################################
@@ -935,21 +957,18 @@ def calc_real_force_angle(ai_g1_type, ai_g1_pr, ai_g1_br, ai_g2_type, ai_g2_pr,
     r_real_force_angle = math.acos(float(ai_g1_br+ai_g2_br)/(ai_g1_pr+ai_g2_pr+ai_aal))
   elif((ai_g1_type=='i')and(ai_g2_type=='e')): # i-e
     if(ai_g2_pr>ai_g1_pr):
-      print("ERR546: Error, the gearring radius {:0.3f} must be bigger gearwheel radius {:0.3f}".format(ai_g1_pr, ai_g2_pr))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR546: Error, the gearring radius {:0.3f} must be bigger gearwheel radius {:0.3f}".format(ai_g1_pr, ai_g2_pr))
     r_real_force_angle = math.acos(float(ai_g1_br-ai_g2_br)/(ai_g1_pr-(ai_g2_pr+ai_aal)))
   elif((ai_g1_type=='e')and(ai_g2_type=='i')): # e-i
     if(ai_g1_pr>ai_g2_pr):
-      print("ERR547: Error, the gearring radius {:0.3f} must be bigger gearwheel radius {:0.3f}".format(ai_g2_pr, ai_g1_pr))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR547: Error, the gearring radius {:0.3f} must be bigger gearwheel radius {:0.3f}".format(ai_g2_pr, ai_g1_pr))
     r_real_force_angle = math.acos(float(ai_g2_br-ai_g1_br)/(ai_g2_pr-(ai_g1_pr+ai_aal)))
   elif((ai_g1_type=='l')and(ai_g2_type=='e')): # l-e
     r_real_force_angle = ai_g1_sa
   elif((ai_g1_type=='e')and(ai_g2_type=='l')): # e-l
     r_real_force_angle = ai_g2_sa
   else:
-    print("ERR221: Error, the gear type combination {:s}-{:s} does not exist!".format(ai_g1_type, ai_g2_type))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR221: Error, the gear type combination {:s}-{:s} does not exist!".format(ai_g1_type, ai_g2_type))
   return(r_real_force_angle)
 
 #############################################################################
@@ -1047,8 +1066,7 @@ def pre_g2_position_calculation(ai_g1_param, ai_g2_param, ai_aal, ai_g1g2_a, ai_
   # alternative for AB
   AB2 = math.sqrt((g2_ox-g1_ox)**2+(g2_oy-g1_oy)**2)
   if(abs(AB2-AB)>radian_epsilon):
-    print("ERR414: Error with the calculation of AB {:0.3f} or {:0.3f}".format(AB, AB2))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR414: Error with the calculation of AB {:0.3f} or {:0.3f}".format(AB, AB2))
   # KL (see documentation  graphic gear_position.svg), used only with e-e, e-i and i-e
   KL_rp = math.sin(rfa_rp)*AB
   KL_rn = math.sin(rfa_rn)*AB
@@ -1056,11 +1074,9 @@ def pre_g2_position_calculation(ai_g1_param, ai_g2_param, ai_aal, ai_g1g2_a, ai_
     KL_rp2 = math.sqrt(AB**2 - (g1_ks*g1_br_rp+g2_ks*g2_br_rp)**2) # kind of pythagor
     KL_rn2 = math.sqrt(AB**2 - (g1_ks*g1_br_rn+g2_ks*g2_br_rn)**2) # kind of pythagor
     if(abs(KL_rp2-KL_rp)>radian_epsilon):
-      print("ERR815: Error, KL_rp {:0.3f} and KL_rp2 {:0.3f} are too different!".format(KL_rp, KL_rp2))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR815: Error, KL_rp {:0.3f} and KL_rp2 {:0.3f} are too different!".format(KL_rp, KL_rp2))
     if(abs(KL_rn2-KL_rn)>radian_epsilon):
-      print("ERR876: Error, KL_rn {:0.3f} and KL_rn2 {:0.3f} are too different!".format(KL_rn, KL_rn2))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR876: Error, KL_rn {:0.3f} and KL_rn2 {:0.3f} are too different!".format(KL_rn, KL_rn2))
   # KE, BE, BD
   KE1_rp = 0 # default value for g_type = 'e' or 'i'
   BE1_rp = 0
@@ -1218,9 +1234,8 @@ def g2_position_calculation(ai_place_low_param, ai_rotation_direction, ai_g1_pos
     BAC = 0
     ABC = 0
   elif(min_ABC+med_ABC<max_ABC):
-    print("ERR478: Error of length in the triangle ABC")
     print("dbg637: AB {:0.3f}  AC {:0.3f}  BC {:0.3f}".format(AB, AC, BC))
-    sys.exit(20)
+    raise cnc25d_api.Cnc25dDesignError("ERR478: Error of length in the triangle ABC", 20)
   else:
     # law of cosine (Al-Kashi) in ABC
     BAC = math.acos(float(AB**2+AC**2-BC**2)/(2*AB*AC))
@@ -1241,12 +1256,10 @@ def g2_position_calculation(ai_place_low_param, ai_rotation_direction, ai_g1_pos
     ABC = math.copysign(ABC, ABC2)
     # check BAC and BAC2
     if(abs(BAC2-BAC)>radian_epsilon_1000):
-      print("ERR689: Error in the calculation of BAC {:0.3f} or BAC2 {:0.3f} !".format(BAC, BAC2))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR689: Error in the calculation of BAC {:0.3f} or BAC2 {:0.3f} !".format(BAC, BAC2))
     # check ABC and ABC2
     if(abs(ABC2-ABC)>radian_epsilon_1000):
-      print("ERR688: Error in the calculation of ABC {:0.3f} or ABC2 {:0.3f} !".format(ABC, ABC2))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR688: Error in the calculation of ABC {:0.3f} or ABC2 {:0.3f} !".format(ABC, ABC2))
   #print("dbg334: BAC: {:0.3f}".format(BAC))
   #print("dbg335: ABC: {:0.3f}".format(ABC))
   ## speed / radial angle
@@ -1255,8 +1268,7 @@ def g2_position_calculation(ai_place_low_param, ai_rotation_direction, ai_g1_pos
   if((g1_type=='e')or(g1_type=='i')):
     g1_sra2 = rd*g1_ks*math.atan(g1_contact_u)
     if(abs(g1_sra2-g1_sra)>radian_epsilon_100):
-      print("ERR417: Error in calculation of g1_sra {:0.3f} or g1_sra2 {:0.3f}".format(g1_sra, g1_sra2))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR417: Error in calculation of g1_sra {:0.3f} or g1_sra2 {:0.3f}".format(g1_sra, g1_sra2))
   ## speed of c1 (contact point of g1)
   # c1 speed
   if((g1_type=='e')or(g1_type=='i')):
@@ -1279,11 +1291,9 @@ def g2_position_calculation(ai_place_low_param, ai_rotation_direction, ai_g1_pos
     if((g1_type=='e')or(g1_type=='i')):
       g2_contact_u1 = g1_ks*float(KL - g2_ks*g1_contact_u*g1_br)/g2_br
       if(abs(g2_contact_u2-g2_contact_u1)>radian_epsilon_10):
-        print("ERR331: Error in the calculation of g2_contact_u1 {:0.3f} or g2_contact_u2 {:0.3f}".format(g2_contact_u1, g2_contact_u2))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR331: Error in the calculation of g2_contact_u1 {:0.3f} or g2_contact_u2 {:0.3f}".format(g2_contact_u1, g2_contact_u2))
       if(abs(g2_contact_u3-g2_contact_u1)>radian_epsilon_10):
-        print("ERR332: Error in the calculation of g2_contact_u1 {:0.3f} or g2_contact_u3 {:0.3f}".format(g2_contact_u1, g2_contact_u3))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR332: Error in the calculation of g2_contact_u1 {:0.3f} or g2_contact_u3 {:0.3f}".format(g2_contact_u1, g2_contact_u3))
     g2_contact_u = g2_contact_u3 # select the method for g2_contact_u
     ## c2_position
     g2_position = g1g2_a + (1+g1_ks*g2_ks)/2*math.pi - rd*g1_ks*(rfa - g2_contact_u) - g2_lo
@@ -1291,8 +1301,7 @@ def g2_position_calculation(ai_place_low_param, ai_rotation_direction, ai_g1_pos
     (c2x, c2y, t2i) = sample_of_gear_tooth_profile((g2_ox, g2_oy), g2_br, g2_position+g2_lo, -1*rd*g1_ks, 0, g2_contact_u)
     #print("dbg326: g2_position {:0.3f}  g2_lo {:0.3f}  g2_contact_u {:0.3f}  t2i {:0.3f}".format(g2_position, g2_lo, g2_contact_u, t2i))
     if(abs(math.fmod(ti-t2i+4.5*math.pi, math.pi) - 0.5*math.pi)>radian_epsilon_1000):
-      print("ERR874: Error, the tangents ti {:0.3f} and t2i {:0.3f} are not equal (modulo pi)".format(ti, t2i))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR874: Error, the tangents ti {:0.3f} and t2i {:0.3f} are not equal (modulo pi)".format(ti, t2i))
     #print("dbg632: g2_ox {:0.3f}  g2_oy {:0.3f}  g2_br {:0.3f}".format(g2_ox, g2_oy, g2_br))
     ## speed of c2 (contact point of g2)
     c2_speed_radial = c1_speed_radial
@@ -1301,9 +1310,8 @@ def g2_position_calculation(ai_place_low_param, ai_rotation_direction, ai_g1_pos
     # alternative
     c2_speed_tangential2 = rd*g1_ks*c2_speed_radial*g2_contact_u
     if(abs(c2_speed_tangential2-c2_speed_tangential)>radian_epsilon_10):
-      print("ERR336: Error in the calculation of c2_speed_tangential {:0.3f} or c2_speed_tangential2 {:0.3f}".format(c2_speed_tangential, c2_speed_tangential2))
       print("dbg967: radian_epsilon_1000 {:0.6f}  radian_epsilon_100000 {:0.6f}".format(radian_epsilon_1000, radian_epsilon_100000))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR336: Error in the calculation of c2_speed_tangential {:0.3f} or c2_speed_tangential2 {:0.3f}".format(c2_speed_tangential, c2_speed_tangential2))
     g2_rotation_speed = float(c2_speed)/BC
   elif(g2_type=='l'): # linear-gear (aka gearbar)
     #(KE2, BE2, BD2) = linear_gear_geometry(g2_sa, g1_br, AB)
@@ -1314,8 +1322,7 @@ def g2_position_calculation(ai_place_low_param, ai_rotation_direction, ai_g1_pos
     c2y = g2_oy + rd*BE2*math.sin(g2_bi-math.pi/2) + dc*math.sin(g2_bi-math.pi/2-rd*g2_sa)
     #print("dbg989: g2_position {:0.3f}   dc {:0.3f}".format(g2_position, dc))
     if(abs(math.fmod(ti - (g2_bi-1*rd*g2_sa)+4.5*math.pi, math.pi)-0.5*math.pi)>radian_epsilon_1000):
-      print("ERR875: Error, the tangents ti {:0.3f} and slope g2_sa {:0.3f} are not equal (modulo pi)".format(ti, g2_sa))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR875: Error, the tangents ti {:0.3f} and slope g2_sa {:0.3f} are not equal (modulo pi)".format(ti, g2_sa))
     c2_speed_radial = c1_speed_radial
     c2_speed = float(c2_speed_radial)/math.cos(g2_sa)
     c2_speed_tangential = rd*c2_speed*math.sin(g2_sa)
@@ -1366,8 +1373,7 @@ def info_on_real_force_angle(ai_g1_param, ai_g2_param, ai_sys_param, ai_rotation
   elif(ai_rotation_direction==-1):
     rotation_name = 'Negative'
   else:
-    print("ERR663: Error, ai_rotation_direction {:d} can only be 1 or -1!".format(ai_rotation_direction))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR663: Error, ai_rotation_direction {:d} can only be 1 or -1!".format(ai_rotation_direction))
   # get the interesting high-level parameters
   rd = ai_rotation_direction
   g1_type = ai_g1_param['gear_type']
@@ -1429,8 +1435,7 @@ def info_on_real_force_angle(ai_g1_param, ai_g2_param, ai_sys_param, ai_rotation
     S2Y = CY + g1_pr/g1_n*math.sin(g1g2_a+rd*math.pi/2)
     (F2X,F2Y, line_circle_intersection_status) = small_geometry.line_circle_intersection((Flx, Fly, Fk), (g1_ox, g1_oy), g1_ar, (S2X,S2Y), real_force_inclination, "F2 calcultation")
     if(line_circle_intersection_status==2):
-      print("ERR125: Error with the intersection of the force line and the addendum_circle_1")
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR125: Error with the intersection of the force line and the addendum_circle_1")
   elif(g1_type=='l'):
     LX = g1_ox+g1_ah*math.cos(g1g2_a)
     LY = g1_oy+g1_ah*math.sin(g1g2_a)
@@ -1439,16 +1444,14 @@ def info_on_real_force_angle(ai_g1_param, ai_g2_param, ai_sys_param, ai_rotation
     Bk = -1*(Blx*LX+Bly*LY)
     (F2X, F2Y, line_line_intersection_status) = small_geometry.line_line_intersection((Flx, Fly, Fk), (Blx, Bly, Bk), "F2 calcultation with gearbar")
     if(line_line_intersection_status==2):
-      print("ERR127: Error with the intersection of the force line and the gearbar addendum line")
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR127: Error with the intersection of the force line and the gearbar addendum line")
   # F1: intersection of the force line and the addendum_circle_2
   if((g2_type=='e')or(g2_type=='i')):
     S1X = CX + g2_pr/g2_n*math.cos(g1g2_a-rd*math.pi/2) # S1: define the side of the intersection line-circle
     S1Y = CY + g2_pr/g2_n*math.sin(g1g2_a-rd*math.pi/2)
     (F1X,F1Y, line_circle_intersection_status) = small_geometry.line_circle_intersection((Flx, Fly, Fk), (g2_ox, g2_oy), g2_ar, (S1X,S1Y), real_force_inclination+math.pi, "F1 calcultation")
     if(line_circle_intersection_status==2):
-      print("ERR126: Error with the intersection of the force line and the addendum_circle_2")
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR126: Error with the intersection of the force line and the addendum_circle_2")
   elif(g2_type=='l'):
     LX = g2_ox+g1_ah*math.cos(g1g2_a+math.pi)
     LY = g2_oy+g1_ah*math.sin(g1g2_a+math.pi)
@@ -1457,8 +1460,7 @@ def info_on_real_force_angle(ai_g1_param, ai_g2_param, ai_sys_param, ai_rotation
     Bk = -1*(Blx*LX+Bly*LY)
     (F1X, F1Y, line_line_intersection_status) = small_geometry.line_line_intersection((Flx, Fly, Fk), (Blx, Bly, Bk), "F1 calcultation with gearbar")
     if(line_line_intersection_status==2):
-      print("ERR129: Error with the intersection of the force line and the gearbar addendum line")
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR129: Error with the intersection of the force line and the gearbar addendum line")
   ### action_line_outline
   r_action_line_outline = ((F1X, F1Y), (F2X, F2Y))
   # length of F1F2
@@ -1495,3 +1497,102 @@ def info_on_real_force_angle(ai_g1_param, ai_g2_param, ai_sys_param, ai_rotation
   r_iorfa = (r_info, r_action_line_outline)
   return(r_iorfa)
 
+################################################################
+# ******** test API ***********
+################################################################
+
+def sub_polyline_distance(ai_points, ai_lines):
+  """ return the maximal distance between the points ai_points (numpy array (n,2)) and the lines ai_lines (numpy array (m,4))
+  """
+  line_start = ai_lines[:,0:2]
+  line_dir = ai_lines[:,2:4]-line_start
+  line_len2 = numpy.maximum(numpy.sum(line_dir**2, axis=1), 1e-30)
+  r_distance = 0.0
+  for k in range(0, len(ai_points), 256): # by chunk to limit the memory
+    pts = ai_points[k:k+256,numpy.newaxis,:]
+    t = numpy.clip(numpy.sum((pts-line_start)*line_dir, axis=2)/line_len2, 0, 1)
+    proj = line_start+t[:,:,numpy.newaxis]*line_dir
+    r_distance = max(r_distance, numpy.sqrt(numpy.sum((pts-proj)**2, axis=2)).min(axis=1).max())
+  return(r_distance)
+
+def gear_outline_motion_test1():
+  """ for the gears of the gear_profile self-tests, move the outlines created at the position 0 with gear_outline_motion() and compare them with the outlines created at the new position
+      the format-B outlines must match within 1e-6.
+      The tkinter lines match too, except for a few fine-resolution gears: arc_of_circle() rounds the number of points of an arc with int(),
+      and the rounding of an arc angle can flip this number. Then the two tessellations of the same arcs are compared with a distance of 0.01 mm
+  """
+  import gear_profile # the gear parameters come from the constraint check of gear_profile
+  r_test = 1
+  positions = (0.3, -1.7, 4.0, 25.0)
+  gp_design = gear_profile.gear_profile()
+  (comparison_nb, retessellated_nb) = (0, 0)
+  for (test_name, test_args) in gear_profile.gear_profile_self_test():
+    c = gp_design.apply_external_constraint(vars(gp_design.parser.parse_known_args(test_args.split())[0])) # the output options are ignored
+    gear_params = [c['g1_param']]
+    if(c['g2_exist']):
+      gear_params.append(c['g2_param'])
+    for g_param in gear_params:
+      (low_parameters, info_low) = calc_low_level_gear_parameters(g_param)
+      outline_functions = (
+        ('outline_B', lambda ai_position: gear_profile_outline(low_parameters, ai_position)),
+        ('ideal_involute', lambda ai_position: ideal_tooth_outline(low_parameters, ai_position, 0)),
+        ('ideal_tooth', lambda ai_position: ideal_tooth_outline(low_parameters, ai_position, 1)))
+      for (outline_name, outline_function) in outline_functions:
+        outline_0 = outline_function(0)
+        lines_0 = numpy.array(cnc25d_api.outline_arc_line(outline_0, 'tkinter'), dtype=numpy.float64).reshape(-1, 2)
+        for position in positions:
+          comparison_nb += 1
+          check_name = "{:s} {:s} gear {:s} at {:0.2f}".format(test_name, low_parameters[0], outline_name, position)
+          (cos_a, sin_a, tx, ty) = gear_outline_motion(low_parameters, position)
+          outline_p = outline_function(position)
+          if([ len(segment) for segment in outline_0 ]!=[ len(segment) for segment in outline_p ]):
+            print("ERR: gear_outline_motion_test1 the format-B outlines of {:s} have different segments".format(check_name))
+            r_test = 0
+            continue
+          points_0 = numpy.array([ x for segment in outline_0 for x in segment ], dtype=numpy.float64).reshape(-1, 2)
+          points_p = numpy.array([ x for segment in outline_p for x in segment ], dtype=numpy.float64).reshape(-1, 2)
+          moved_points = numpy.column_stack((cos_a*points_0[:,0]-sin_a*points_0[:,1]+tx, sin_a*points_0[:,0]+cos_a*points_0[:,1]+ty))
+          if(abs(moved_points-points_p).max()>1e-6):
+            print("ERR: gear_outline_motion_test1 the moved format-B outline of {:s} differs by {:0.3e}".format(check_name, abs(moved_points-points_p).max()))
+            r_test = 0
+            continue
+          moved_lines = numpy.column_stack((cos_a*lines_0[:,0]-sin_a*lines_0[:,1]+tx, sin_a*lines_0[:,0]+cos_a*lines_0[:,1]+ty)).reshape(-1, 4)
+          lines_p = numpy.array(cnc25d_api.outline_arc_line(outline_p, 'tkinter'), dtype=numpy.float64).reshape(-1, 4)
+          if((moved_lines.shape==lines_p.shape)and(abs(moved_lines-lines_p).max()<=1e-6)):
+            continue
+          retessellated_nb += 1
+          distance = max(sub_polyline_distance(moved_lines.reshape(-1, 2), lines_p), sub_polyline_distance(lines_p.reshape(-1, 2), moved_lines))
+          if(distance>0.01):
+            print("ERR: gear_outline_motion_test1 the moved tkinter lines of {:s} are {:0.3e} away from the regenerated lines".format(check_name, distance))
+            r_test = 0
+  print("gear_outline_motion_test1: {:d} comparisons, {:d} with another tessellation of the arcs".format(comparison_nb, retessellated_nb))
+  print("gear_outline_motion_test1: {:s}".format("OK" if r_test else "FAILED"))
+  return(r_test)
+
+################################################################
+# ******** command line interface ***********
+################################################################
+
+def gear_profile_outline_cli(ai_args=""):
+  """ command line interface to run this script in standalone
+  """
+  gpo_parser = argparse.ArgumentParser(description='Test the gear_profile_outline API.')
+  gpo_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
+    help='Run gear_outline_motion_test1()')
+  effective_args = cnc25d_api.get_effective_args(ai_args)
+  gpo_args = gpo_parser.parse_args(effective_args)
+  r_gpoc = 0
+  print("dbg111: start testing gear_profile_outline.py")
+  if(gpo_args.sw_test1):
+    r_gpoc = gear_outline_motion_test1()
+  print("dbg999: end of script")
+  return(r_gpoc)
+
+################################################################
+# main
+################################################################
+
+if __name__ == "__main__":
+  #gear_profile_outline_cli()
+  gear_profile_outline_cli("--test1")
+
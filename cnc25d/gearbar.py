@@ -31,7 +31,7 @@ You can also simulate or view of the gearbar and get a DXF, SVG or BRep file.
 ################################################################
 
 import cnc25d_api
-cnc25d_api.importing_freecad()
+#cnc25d_api.importing_freecad() # FreeCAD is imported on first use by lazy_import
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -47,7 +47,7 @@ import sys, argparse
 #import re
 #import Tkinter # to display the outline in a small GUI
 #
-import Part
+from lazy_import import Part
 #from FreeCAD import Base
 # 3rd parties
 #import svgwrite
@@ -126,12 +126,10 @@ def gearbar_constraint_check(c):
   c['gearbar_hole_radius'] = float(c['gearbar_hole_diameter'])/2
   # c['gearbar_hole_height_position']
   if((c['gearbar_hole_height_position']+c['gearbar_hole_radius'])>c['gearbar_height']):
-    print("ERR215: Error, gearbar_hole_height_position {:0.3} and gearbar_hole_radius {:0.3f} are too big compare to gearbar_height {:0.3f} !".format(c['gearbar_hole_height_position'], c['gearbar_hole_radius'], c['gearbar_height']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR215: Error, gearbar_hole_height_position {:0.3} and gearbar_hole_radius {:0.3f} are too big compare to gearbar_height {:0.3f} !".format(c['gearbar_hole_height_position'], c['gearbar_hole_radius'], c['gearbar_height']))
   # c['gearbar_hole_increment']
   if(c['gearbar_hole_increment']==0):
-    print("ERR183: Error gearbar_hole_increment must be bigger than zero!")
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR183: Error gearbar_hole_increment must be bigger than zero!")
   # c['gear_tooth_nb']
   if(c['gear_tooth_nb']>0): # create a gear_profile
     i_gear_profile = inherit_gear_profile() # inherit from gear_profile
@@ -156,8 +154,7 @@ def gearbar_constraint_check(c):
     bottom_land = gear_profile_parameters['g1_param']['bottom_land']
     top_land = gear_profile_parameters['g1_param']['top_land']
     if((top_land + full_positive_slope + bottom_land + full_negative_slope)!=c['pi_module']):
-      print("ERR269: Error with top_land {:0.3f}  full_positive_slope {:0.3f}  bottom_land {:0.3f}  full_negative_slope {:0.3f} and pi_module  {:0.3f}".format(top_land, full_positive_slope, bottom_land, full_negative_slope, c['pi_module']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR269: Error with top_land {:0.3f}  full_positive_slope {:0.3f}  bottom_land {:0.3f}  full_negative_slope {:0.3f} and pi_module  {:0.3f}".format(top_land, full_positive_slope, bottom_land, full_negative_slope, c['pi_module']))
     if(pfe==0):
       c['first_tooth_position'] = full_positive_slope + bottom_land + full_negative_slope + float(top_land)/2
     elif(pfe==1):
@@ -168,8 +165,7 @@ def gearbar_constraint_check(c):
       c['first_tooth_position'] = float(bottom_land)/2 + full_negative_slope + float(top_land)/2
   else: # no gear_profile, just a circle
     if(c['gear_primitive_diameter']<radian_epsilon):
-      print("ERR885: Error, the no-gear-profile line outline length gear_primitive_diameter {:0.2f} is too small!".format(c['gear_primitive_diameter']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR885: Error, the no-gear-profile line outline length gear_primitive_diameter {:0.2f} is too small!".format(c['gear_primitive_diameter']))
     #c['g1_ix'] = c['center_position_x
     #c['g1_iy'] = c['center_position_y
     c['gearbar_length'] = c['gear_primitive_diameter']
@@ -180,17 +176,14 @@ def gearbar_constraint_check(c):
   ### check parameter coherence (part 2)
   # minimal_gear_profile_height
   if(c['minimal_gear_profile_height']<radian_epsilon):
-    print("ERR265: Error, minimal_gear_profile_height {:0.3f} is too small".format(c['minimal_gear_profile_height']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR265: Error, minimal_gear_profile_height {:0.3f} is too small".format(c['minimal_gear_profile_height']))
   # gearbar_hole_diameter
   if((c['gearbar_hole_height_position']+c['gearbar_hole_radius'])>c['minimal_gear_profile_height']):
-    print("ERR269: Error, gearbar_hole_height_position {:0.3f} and gearbar_hole_radius {:0.3f} are too big compare to minimal_gear_profile_height {:0.3f}".format(c['gearbar_hole_height_position'], c['gearbar_hole_radius'], c['minimal_gear_profile_height']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR269: Error, gearbar_hole_height_position {:0.3f} and gearbar_hole_radius {:0.3f} are too big compare to minimal_gear_profile_height {:0.3f}".format(c['gearbar_hole_height_position'], c['gearbar_hole_radius'], c['minimal_gear_profile_height']))
   # pi_module
   if(c['gearbar_hole_radius']>0):
     if(c['pi_module']==0):
-      print("ERR277: Error, pi_module is null. You might need to use --gear_module")
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR277: Error, pi_module is null. You might need to use --gear_module")
   ###
   return(c)
 
@@ -364,11 +357,11 @@ class gearbar(cnc25d_api.bare_design):
 
 # this works with python and freecad :)
 if __name__ == "__main__":
-  FreeCAD.Console.PrintMessage("gearbar.py says hello!\n")
+  print("gearbar.py says hello!")
   my_gb = gearbar()
   #my_gb.cli()
   #my_gb.cli("--gear_tooth_nb 12 --gear_module 10 --gearbar_slope 0.3 --gear_router_bit_radius 3.0 --gearbar_height 40.0 --gearbar_hole_height_position 20.0 --return_type freecad_object")
-  my_gb.cli("--gear_tooth_nb 12 --gear_module 10 --gearbar_slope 0.3 --gear_router_bit_radius 3.0 --gearbar_height 40.0 --gearbar_hole_height_position 20.0")
+  cnc25d_api.cli_shim(my_gb.cli, "--gear_tooth_nb 12 --gear_module 10 --gearbar_slope 0.3 --gear_router_bit_radius 3.0 --gearbar_height 40.0 --gearbar_hole_height_position 20.0")
   if(cnc25d_api.interpretor_is_freecad()):
     Part.show(my_gb.get_fc_obj_3dconf('gearbar_3dconf1'))
   
@@ -47,8 +47,8 @@ import sys, argparse
 #import re
 #import Tkinter # to display the outline in a small GUI
 #
-import Part
-from FreeCAD import Base
+from lazy_import import Part
+from lazy_import import Base
 # 3rd parties
 #import svgwrite
 #from dxfwrite import DXFEngine
@@ -176,8 +176,7 @@ def gearring_constraint_check(c):
     gear_module = gear_profile_parameters['g1_param']['module']
   else: # no gear_profile, just a circle
     if(c['gear_primitive_diameter']<radian_epsilon):
-      print("ERR176: Error, the no-gear-profile circle outline diameter gear_primitive_diameter {:0.2f} is too small!".format(c['gear_primitive_diameter']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR176: Error, the no-gear-profile circle outline diameter gear_primitive_diameter {:0.2f} is too small!".format(c['gear_primitive_diameter']))
     c['g1_ix'] = c['center_position_x']
     c['g1_iy'] = c['center_position_y']
     c['maximal_gear_profile_radius'] = float(c['gear_primitive_diameter'])/2
@@ -195,8 +194,7 @@ def gearring_constraint_check(c):
   c['holder_crenel_half_width'] = float(c['holder_crenel_width'])/2
   holder_crenel_with_wall_half_width = c['holder_crenel_half_width'] + c['holder_crenel_skin_width']
   if(c['holder_radius']<holder_crenel_with_wall_half_width):
-    print("ERR213: Error, holder_radius {:0.3f} must be bigger than holder_crenel_with_wall_half_width {:0.3f}".format(c['holder_radius'], holder_crenel_with_wall_half_width))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR213: Error, holder_radius {:0.3f} must be bigger than holder_crenel_with_wall_half_width {:0.3f}".format(c['holder_radius'], holder_crenel_with_wall_half_width))
   c['holder_crenel_half_angle'] = math.asin(float(holder_crenel_with_wall_half_width)/c['holder_radius'])
   c['holder_crenel_x_position'] = math.sqrt((c['holder_radius'])**2 - (holder_crenel_with_wall_half_width)**2)
   additional_holder_maximal_height = c['holder_radius'] - c['holder_crenel_x_position']
@@ -211,63 +209,51 @@ def gearring_constraint_check(c):
   # c['holder_crenel_height
   if(c['holder_crenel_number']>0):
     if((0.9*holder_side_straigth_length)<c['holder_sr']):
-      print("ERR218: Error, the holder-crenel-wall-side height is too small: holder_side_straigth_length {:0.3f}  holder_smoothing_radius {:0.3f}".format(holder_side_straigth_length, c['holder_sr']))
       #print("dbg214: holder_radius, holder_crenel_x_position:", c['holder_radius'], c['holder_crenel_x_position'])
       #print("dbg215: holder_maximal_height, additional_holder_maximal_height:", holder_maximal_height, additional_holder_maximal_height)
       #print("dbg216: holder_crenel_skin_width, holder_maximal_height_plus:", c['holder_crenel_skin_width'], c['holder_maximal_height_plus'])
       #print("dbg217: holder_maximal_height_plus, holder_side_outer_smoothing_radius:", c['holder_maximal_height_plus'], c['holder_side_outer_smoothing_radius'])
       #print("dbg218: holder_hole_position_radius, holder_crenel_position, holder_crenel_height:", c['holder_hole_position_radius'], c['holder_crenel_position'], c['holder_crenel_height'])
       #print("dbg219: holder_maximal_radius, holder_radius:", c['holder_maximal_radius'], c['holder_radius'])
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR218: Error, the holder-crenel-wall-side height is too small: holder_side_straigth_length {:0.3f}  holder_smoothing_radius {:0.3f}".format(holder_side_straigth_length, c['holder_sr']))
   # c['holder_crenel_position']
   if(c['holder_crenel_position']<c['holder_hole_radius']):
-    print("ERR211: Error, holder_crenel_position {:0.3f} is too small compare to holder_hole_radius {:0.3f}".format(c['holder_crenel_position'], c['holder_hole_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR211: Error, holder_crenel_position {:0.3f} is too small compare to holder_hole_radius {:0.3f}".format(c['holder_crenel_position'], c['holder_hole_radius']))
   # c['holder_crenel_width']
   if(c['holder_crenel_width']<2.1*c['holder_crenel_rbr']):
-    print("ERR215: Error, holder_crenel_width {:0.3} is too small compare to holder_crenel_router_bit_radius {:0.3f}".format(c['holder_crenel_width'], c['holder_crenel_rbr']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR215: Error, holder_crenel_width {:0.3} is too small compare to holder_crenel_router_bit_radius {:0.3f}".format(c['holder_crenel_width'], c['holder_crenel_rbr']))
   # hollow_circle and holder-hole
   if(c['maximal_gear_profile_radius']>(c['holder_hole_position_radius']-c['holder_hole_radius'])):
-    print("ERR303: Error, holder-hole are too closed from the gear_hollow_circle: maximal_gear_profile_radius {:0.3f}  holder_hole_position_radius {:0.3f}  holder_hole_radius {:0.3f}".format(c['maximal_gear_profile_radius'], c['holder_hole_position_radius'], c['holder_hole_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR303: Error, holder-hole are too closed from the gear_hollow_circle: maximal_gear_profile_radius {:0.3f}  holder_hole_position_radius {:0.3f}  holder_hole_radius {:0.3f}".format(c['maximal_gear_profile_radius'], c['holder_hole_position_radius'], c['holder_hole_radius']))
   # holder_hole_mark_nb
   if((c['holder_hole_mark_nb']<0)or(c['holder_hole_mark_nb']>c['holder_crenel_number'])):
-    print("ERR294: Error, holder_hole_mark_nb {:d} is out of its range 0..{:d}".format(c['holder_hole_mark_nb'], c['holder_crenel_number']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR294: Error, holder_hole_mark_nb {:d} is out of its range 0..{:d}".format(c['holder_hole_mark_nb'], c['holder_crenel_number']))
   # holder_double_hole
   c['holder_double_hole_radius'] = c['holder_double_hole_diameter']/2.0
   c['holder_double_hole_position_radius'] = c['holder_hole_position_radius'] + c['holder_double_hole_position']
   if(c['holder_double_hole_length']<0):
-    print("ERR304: Error, holder_double_hole_length {:0.3f} should be positive".format(c['holder_double_hole_length']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR304: Error, holder_double_hole_length {:0.3f} should be positive".format(c['holder_double_hole_length']))
   elif(c['holder_double_hole_length']>0):
     if(c['holder_double_hole_radius']==0):
-      print("ERR308: Error, holder_double_hole_length {:0.3f} is positive whereas holder_double_hole_radius is set to zero".format(c['holder_double_hole_length']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR308: Error, holder_double_hole_length {:0.3f} is positive whereas holder_double_hole_radius is set to zero".format(c['holder_double_hole_length']))
   if(c['holder_double_hole_position']!=0):
     if(c['holder_double_hole_radius']==0):
-      print("ERR319: Error, holder_double_hole_position {:0.3f} is set whereas holder_double_hole_radius is still set to zero".format(c['holder_double_hole_position']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR319: Error, holder_double_hole_position {:0.3f} is set whereas holder_double_hole_radius is still set to zero".format(c['holder_double_hole_position']))
   if(c['holder_double_hole_radius']<0):
-    print("ERR322: Error, holder_double_hole_radius {:0.3f} must be positive or null".format(c['holder_double_hole_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR322: Error, holder_double_hole_radius {:0.3f} must be positive or null".format(c['holder_double_hole_radius']))
   elif(c['holder_double_hole_radius']>0):
     if(c['holder_double_hole_length']==0):
-      print("ERR326: Error, holder_double_hole_length must be positive when holder_double_hole_radius {:0.3f} is positive".format(c['holder_double_hole_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR326: Error, holder_double_hole_length must be positive when holder_double_hole_radius {:0.3f} is positive".format(c['holder_double_hole_radius']))
   # holder_double_hole_mark_nb
   if((c['holder_double_hole_mark_nb']<0)or(c['holder_double_hole_mark_nb']>c['holder_crenel_number'])):
-    print("ERR333: Error, holder_double_hole_mark_nb {:d} is out of its range 0..{:d}".format(c['holder_double_hole_mark_nb'], c['holder_crenel_number']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR333: Error, holder_double_hole_mark_nb {:d} is out of its range 0..{:d}".format(c['holder_double_hole_mark_nb'], c['holder_crenel_number']))
   ## holder_hole_B
   holder_hole_B_radius = float(c['holder_hole_B_diameter'])/2
   # holder_hole_B_crenel_list_bis
   c['holder_hole_B_crenel_list_bis'] = [ 0 for i in range(c['holder_crenel_number']) ]
   for i in range(len(c['holder_hole_B_crenel_list'])):
     if((int(c['holder_hole_B_crenel_list'][i])<0)or(int(c['holder_hole_B_crenel_list'][i])>=c['holder_crenel_number'])):
-      print("ERR286: Error, the holder_hole_B_crenel_list index {:s} is out of the range 0..{:d}".format(c['holder_hole_B_crenel_list'][i], c['holder_crenel_number']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR286: Error, the holder_hole_B_crenel_list index {:s} is out of the range 0..{:d}".format(c['holder_hole_B_crenel_list'][i], c['holder_crenel_number']))
     c['holder_hole_B_crenel_list_bis'][int(c['holder_hole_B_crenel_list'][i])] = 1
   #print("dbg358: holder_hole_B_crenel_list_bis:", c['holder_hole_B_crenel_list_bis'])
   c['holder_maximal_height_plus_B'] = c['holder_hole_position_radius'] + c['holder_crenel_B_position'] + c['holder_crenel_height'] - c['holder_radius'] + additional_holder_maximal_height
@@ -293,8 +279,7 @@ def gearring_constraint_check(c):
   #print("dbg378: holder_smoothing_radius_list:", c['holder_smoothing_radius_list'])
   #
   if(c['holder_crenel_number_cut']>c['holder_crenel_number']):
-    print("ERR288: Error, holder_crenel_number_cut {:d} must be smaller than holder_crenel_number {:d}".format(c['holder_crenel_number_cut'], c['holder_crenel_number']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR288: Error, holder_crenel_number_cut {:d} must be smaller than holder_crenel_number {:d}".format(c['holder_crenel_number_cut'], c['holder_crenel_number']))
   ###
   return(c)
 
@@ -351,8 +336,7 @@ def gearring_2d_construction(c):
   elif(c['holder_crenel_number']>0):
     angle_incr = 2*math.pi/c['holder_crenel_number']
     if((angle_incr-2*c['holder_crenel_half_angle'])<math.pi/10):
-      print("ERR369: Error, no enough space between the crenel: angle_incr {:0.3f}  holder_crenel_half_angle {:0.3f}".format(angle_incr, c['holder_crenel_half_angle']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR369: Error, no enough space between the crenel: angle_incr {:0.3f}  holder_crenel_half_angle {:0.3f}".format(angle_incr, c['holder_crenel_half_angle']))
     holder_A = []
     first_angle = c['holder_position_angle'] - c['holder_crenel_half_angle']
     holder_A.append([c['g1_ix']+c['holder_radius']*math.cos(first_angle), c['g1_iy']+c['holder_radius']*math.sin(first_angle), c['holder_smoothing_radius_list'][-1]])
@@ -614,11 +598,11 @@ class gearring(cnc25d_api.bare_design):
 
 # this works with python and freecad :)
 if __name__ == "__main__":
-  FreeCAD.Console.PrintMessage("gearring.py says hello!\n")
+  print("gearring.py says hello!")
   my_gr = gearring()
   #my_gr.cli()
   #my_gr.cli("--gear_tooth_nb 25 --gear_module 10 --holder_diameter 300.0 --holder_crenel_width 20.0 --holder_crenel_skin_width 10.0 --cnc_router_bit_radius 2.0")
-  my_gr.cli("--gear_tooth_nb 25 --gear_module 10 --holder_crenel_width 20.0 --holder_crenel_skin_width 10.0 --cnc_router_bit_radius 2.0")
+  cnc25d_api.cli_shim(my_gr.cli, "--gear_tooth_nb 25 --gear_module 10 --holder_crenel_width 20.0 --holder_crenel_skin_width 10.0 --cnc_router_bit_radius 2.0")
   if(cnc25d_api.interpretor_is_freecad()):
     Part.show(my_gr.get_fc_obj_3dconf('gearring_3dconf1'))
 
@@ -47,8 +47,8 @@ import sys, argparse
 #import re
 #import Tkinter # to display the outline in a small GUI
 #
-import Part
-from FreeCAD import Base
+from lazy_import import Part
+from lazy_import import Base
 # 3rd parties
 #import svgwrite
 #from dxfwrite import DXFEngine
@@ -157,54 +157,45 @@ def gearwheel_constraint_check(c):
     c['axle_rbr'] = c['cnc_router_bit_radius']
   # c['axle_type']
   if(not c['axle_type'] in ('none', 'circle', 'rectangle')):
-    print("ERR932: Error, axle_type {:s} is not valid!".format(c['axle_type']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR932: Error, axle_type {:s} is not valid!".format(c['axle_type']))
   # c['axle_x_width']
   axle_diameter = 0
   if(c['axle_type'] in('circle','rectangle')):
     if(c['axle_x_width']<2*c['axle_rbr']+radian_epsilon):
-      print("ERR663: Error, axle_x_width {:0.2f} is too small compare to axle_router_bit_radius {:0.2f}!".format(c['axle_x_width'], c['axle_rbr']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR663: Error, axle_x_width {:0.2f} is too small compare to axle_router_bit_radius {:0.2f}!".format(c['axle_x_width'], c['axle_rbr']))
     axle_diameter = c['axle_x_width']
     # c['axle_y_width']
     if(c['axle_type']=='rectangle'):
       if(c['axle_y_width']<2*c['axle_rbr']+radian_epsilon):
-        print("ERR664: Error, axle_y_width {:0.2f} is too small compare to axle_router_bit_radius {:0.2f}!".format(c['axle_y_width'], c['axle_rbr']))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR664: Error, axle_y_width {:0.2f} is too small compare to axle_router_bit_radius {:0.2f}!".format(c['axle_y_width'], c['axle_rbr']))
       axle_diameter = math.sqrt(c['axle_x_width']**2+c['axle_y_width']**2)
   # crenel_type
   if((c['crenel_type']!='rectangle')and(c['crenel_type']!='circle')):
-    print("ERR213: Error, crenel_type {:s} is unknown".format(c['crenel_type']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR213: Error, crenel_type {:s} is unknown".format(c['crenel_type']))
   # crenel_number
   crenel_increment_angle = 0.0
   if(c['crenel_number']>0):
     crenel_increment_angle = 2*math.pi/c['crenel_number']
   if(c['crenel_tooth_align']>0):
     if(c['crenel_number']>0):
-      print("ERR255: Error, crenel_tooth_align {:d} and crenel_number {:d} are set together".format(c['crenel_tooth_align'], c['crenel_number']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR255: Error, crenel_tooth_align {:d} and crenel_number {:d} are set together".format(c['crenel_tooth_align'], c['crenel_number']))
     if(c['crenel_angle']!=0):
-      print("ERR258: Error, crenel_tooth_align {:d} and crenel_angle {:0.3f} are set together".format(c['crenel_tooth_align'], c['crenel_angle']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR258: Error, crenel_tooth_align {:d} and crenel_angle {:0.3f} are set together".format(c['crenel_tooth_align'], c['crenel_angle']))
     if(c['gear_tooth_nb']==0):
-      print("ERR261: Error, crenel_tooth_align {:d} set and gear_tooth_nb {:d} is set to zero".format(c['crenel_tooth_align'], c['gear_tooth_nb']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR261: Error, crenel_tooth_align {:d} set and gear_tooth_nb {:d} is set to zero".format(c['crenel_tooth_align'], c['gear_tooth_nb']))
     c['crenel_number'] = int(c['gear_tooth_nb']/c['crenel_tooth_align'])
     c['crenel_angle'] = c['gear_initial_angle']
     crenel_increment_angle = c['crenel_tooth_align']*2*math.pi/c['gear_tooth_nb']
   #print("dbg266: crenel_number {:d}  crenel_angle {:0.3f}  crenel_increment_angle {:0.3f}".format(c['crenel_number'], c['crenel_angle'], crenel_increment_angle))
   # crenel_mark_nb
   if((c['crenel_mark_nb']<0)or(c['crenel_mark_nb']>c['crenel_number'])):
-    print("ERR233: Error, crenel_mark_nb {:d} is out of the range 0..{:d}".format(c['crenel_mark_nb'], c['crenel_number']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR233: Error, crenel_mark_nb {:d} is out of the range 0..{:d}".format(c['crenel_mark_nb'], c['crenel_number']))
   # crenel_diameter
   crenel_diameter = c['crenel_diameter']
   if(crenel_diameter==0):
     crenel_diameter = axle_diameter
   if(crenel_diameter<axle_diameter):
-    print("ERR212: Error, crenel_diameter {:0.3f} is smaller than the axle_diameter {:0.3f}".format(crenel_diameter, axle_diameter))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR212: Error, crenel_diameter {:0.3f} is smaller than the axle_diameter {:0.3f}".format(crenel_diameter, axle_diameter))
   c['crenel_radius'] = crenel_diameter/2.0
   # c['gear_tooth_nb']
   if(c['gear_tooth_nb']>0): # create a gear_profile
@@ -220,8 +211,7 @@ def gearwheel_constraint_check(c):
     c['addendum_radius'] = gear_profile_parameters['g1_param']['addendum_radius'] # for slice_xyz
   else: # no gear_profile, just a circle
     if(c['gear_primitive_diameter']<radian_epsilon):
-      print("ERR885: Error, the no-gear-profile circle outline diameter gear_primitive_diameter {:0.2f} is too small!".format(c['gear_primitive_diameter']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR885: Error, the no-gear-profile circle outline diameter gear_primitive_diameter {:0.2f} is too small!".format(c['gear_primitive_diameter']))
     c['g1_ix'] = c['center_position_x']
     c['g1_iy'] = c['center_position_y']
     minimal_gear_profile_radius = float(c['gear_primitive_diameter'])/2
@@ -232,8 +222,7 @@ def gearwheel_constraint_check(c):
   if(c['axle_radius'] == 0): # if axle = none
     c['axle_radius'] = 1.0
   if(c['axle_radius']>minimal_gear_profile_radius-radian_epsilon): # non sense case
-    print("ERR218: Error, axle_radius {:0.3f} is bigger than minimal_gear_profile_radius {:0.3f}".format(c['axle_radius'], minimal_gear_profile_radius))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR218: Error, axle_radius {:0.3f} is bigger than minimal_gear_profile_radius {:0.3f}".format(c['axle_radius'], minimal_gear_profile_radius))
   c['wheel_hollow_external_radius'] = c['wheel_hollow_external_diameter']/2.0
   c['wheel_hollow_internal_radius'] = c['wheel_hollow_internal_diameter']/2.0
   if(c['wheel_hollow_leg_number']>0):
@@ -259,45 +248,34 @@ def gearwheel_constraint_check(c):
   if(c['wheel_hollow_leg_number']>0):
     # wheel_hollow_external_diameter
     if(c['wheel_hollow_external_radius'] > minimal_gear_profile_radius-radian_epsilon):
-      print("ERR733: Error, wheel_hollow_external_radius {:0.2f} is bigger than the gear_hollow_radius {:0.2f}!".format(c['wheel_hollow_external_radius'], minimal_gear_profile_radius))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR733: Error, wheel_hollow_external_radius {:0.2f} is bigger than the gear_hollow_radius {:0.2f}!".format(c['wheel_hollow_external_radius'], minimal_gear_profile_radius))
     if(c['wheel_hollow_external_radius'] < c['wheel_hollow_internal_radius']+2*c['wheel_hollow_rbr']+radian_epsilon):
-      print("ERR734: Error, wheel_hollow_external_radius {:0.2f} is too small compare to wheel_hollow_internal_radius {:0.2f} and wheel_hollow_router_bit_radius {:0.2f}!".format(c['wheel_hollow_external_radius'], c['wheel_hollow_internal_radius'], c['wheel_hollow_rbr']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR734: Error, wheel_hollow_external_radius {:0.2f} is too small compare to wheel_hollow_internal_radius {:0.2f} and wheel_hollow_router_bit_radius {:0.2f}!".format(c['wheel_hollow_external_radius'], c['wheel_hollow_internal_radius'], c['wheel_hollow_rbr']))
     # wheel_hollow_leg_width
     if(c['wheel_hollow_leg_width']<radian_epsilon):
-      print("ERR735: Error, wheel_hollow_leg_width {:0.2f} is too small!".format(c['wheel_hollow_leg_width']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR735: Error, wheel_hollow_leg_width {:0.2f} is too small!".format(c['wheel_hollow_leg_width']))
     # wheel_hollow_internal_diameter
     if(c['wheel_hollow_internal_radius']<c['axle_radius']+radian_epsilon):
-      print("ERR736: Error, wheel_hollow_internal_radius {:0.2f} is too small compare to axle_radius {:0.2f}!".format(c['wheel_hollow_internal_radius'], c['axle_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR736: Error, wheel_hollow_internal_radius {:0.2f} is too small compare to axle_radius {:0.2f}!".format(c['wheel_hollow_internal_radius'], c['axle_radius']))
     if(2*c['wheel_hollow_internal_radius']<c['wheel_hollow_leg_width']+2*radian_epsilon):
-      print("ERR736: Error, wheel_hollow_internal_radius {:0.2f} is too small compare to wheel_hollow_leg_width {:0.2f}!".format(c['wheel_hollow_internal_radius'], c['wheel_hollow_leg_width']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR736: Error, wheel_hollow_internal_radius {:0.2f} is too small compare to wheel_hollow_leg_width {:0.2f}!".format(c['wheel_hollow_internal_radius'], c['wheel_hollow_leg_width']))
   if(c['crenel_number']>0):
     #print("dbg305: crenel_type {:s}".format(c['crenel_type']))
     if(c['crenel_type']=='rectangle'):
       if(math.sqrt((c['crenel_radius']+c['crenel_height'])**2+(c['crenel_width']/2)**2)> minimal_gear_profile_radius-radian_epsilon):
-        print("ERR298: Error, crenel_radius {:0.3f}, crenel_height {:0.3f} or crenel_width {:0.3f} are too big compare to minimal_gear_profile_radius {:0.3f}".format(c['crenel_radius'], c['crenel_height'], c['crenel_width'], minimal_gear_profile_radius))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR298: Error, crenel_radius {:0.3f}, crenel_height {:0.3f} or crenel_width {:0.3f} are too big compare to minimal_gear_profile_radius {:0.3f}".format(c['crenel_radius'], c['crenel_height'], c['crenel_width'], minimal_gear_profile_radius))
     elif(c['crenel_type']=='circle'):
       if((c['crenel_radius']+c['crenel_width']/2)>minimal_gear_profile_radius-radian_epsilon):
-        print("ERR311: Error, crenel_radius {:0.3f} or crenel_width {:0.3f} are too big compare to minimal_gear_profile_radius {:0.3f}".format(c['crenel_radius'], c['crenel_width'], minimal_gear_profile_radius))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR311: Error, crenel_radius {:0.3f} or crenel_width {:0.3f} are too big compare to minimal_gear_profile_radius {:0.3f}".format(c['crenel_radius'], c['crenel_width'], minimal_gear_profile_radius))
     if(c['crenel_radius']<radian_epsilon):
-      print("ERR301: Error, the crenel_radius {:0.3f} is too small".format(c['crenel_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR301: Error, the crenel_radius {:0.3f} is too small".format(c['crenel_radius']))
     if(abs(c['crenel_width'])>2*c['crenel_radius']-radian_epsilon):
-      print("ERR304: Error, crenel_width {:0.3f} is too big compare to crenel_radius {:0.3f}".format(c['crenel_width'], c['crenel_radius']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR304: Error, crenel_width {:0.3f} is too big compare to crenel_radius {:0.3f}".format(c['crenel_width'], c['crenel_radius']))
     c['crenel_half_width_angle'] = math.asin(c['crenel_width']/(2*c['crenel_radius']))
     if(c['crenel_half_width_angle']*2.2>crenel_increment_angle):
-      print("ERR305: Error, the crenel_increment_angle {:0.3f} or crenel_width {:0.3f} are too big!".format(crenel_increment_angle, c['crenel_width']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR305: Error, the crenel_increment_angle {:0.3f} or crenel_width {:0.3f} are too big!".format(crenel_increment_angle, c['crenel_width']))
     if(c['crenel_width']<3.2*c['crenel_rbr']):
-      print("ERR308: Error, crenel_width {:0.3f} is too small compare to crenel_router_bit_radius {:0.3f}".format(c['crenel_width'], c['crenel_rbr']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR308: Error, crenel_width {:0.3f} is too small compare to crenel_router_bit_radius {:0.3f}".format(c['crenel_width'], c['crenel_rbr']))
 
   ### crenel preparation
   c['crenel_axle_merge'] = False
@@ -341,8 +319,7 @@ def marked_circle_crenel(ai_x, ai_y, ai_radius, ai_orientation, ai_router_bit_ra
     #r_mcc = cnc25d_api.cnc_cut_outline(cnc25d_api.outline_rotate(A_mcc, ai_x, ai_y, ai_orientation), "marked_circle_crenel")
     r_mcc = cnc25d_api.outline_rotate(A_mcc, ai_x, ai_y, ai_orientation)
   else:
-    print("ERR182: Error, ai_mark_type {:d} doesn't exist".format(ai_mark_type))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR182: Error, ai_mark_type {:d} doesn't exist".format(ai_mark_type))
   return(r_mcc)
     
 ################################################################
@@ -442,8 +419,7 @@ def gearwheel_2d_construction(c):
     wh_angle = 2*math.pi/c['wheel_hollow_leg_number']
     wh_leg_top_angle1 = math.asin(float(c['wheel_hollow_leg_width']/2.0+c['wheel_hollow_rbr'])/(c['wheel_hollow_external_radius']-c['wheel_hollow_rbr']))
     if(wh_angle<2*wh_leg_top_angle1+radian_epsilon):
-      print("ERR664: Error, wh_angle {:0.2f} too small compare to wh_leg_top_angle1 {:0.2f}!".format(wh_angle, wh_leg_top_angle1))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR664: Error, wh_angle {:0.2f} too small compare to wh_leg_top_angle1 {:0.2f}!".format(wh_angle, wh_leg_top_angle1))
     wh_leg_bottom_angle1 = math.asin(float(c['wheel_hollow_leg_width']/2.0+c['wheel_hollow_rbr'])/(c['wheel_hollow_internal_radius']+c['wheel_hollow_rbr']))
     #wh_leg_top_angle2 = math.asin((c['wheel_hollow_leg_width']/2)/c['wheel_hollow_external_radius'])
     wh_leg_top_angle2 = math.asin(float(c['wheel_hollow_leg_width'])/(2*c['wheel_hollow_external_radius']))
@@ -655,14 +631,14 @@ class gearwheel(cnc25d_api.bare_design):
 
 # this works with python and freecad :)
 if __name__ == "__main__":
-  FreeCAD.Console.PrintMessage("gearwheel.py says hello!\n")
+  print("gearwheel.py says hello!")
   my_gw = gearwheel()
   #my_gw.cli()
   #my_gw.cli("--gear_tooth_nb 17 --output_file_basename test_output/toto2")
   #my_gw.cli("--gear_tooth_nb 17 --gear_module 10 --axle_type rectangle --axle_x_width 20 --axle_y_width 30 --axle_router_bit_radius 5")
   #my_gw.cli("--gear_tooth_nb 25 --gear_module 10 --gear_router_bit_radius 3.0 --axle_type rectangle --axle_x_width 20 --axle_y_width 15 --axle_router_bit_radius 2.0 --wheel_hollow_leg_number 5 --wheel_hollow_leg_width 10.0 --return_type freecad_object")
   #my_gw.cli("--gear_tooth_nb 25 --gear_module 10 --gear_router_bit_radius 3.0 --axle_type rectangle --axle_x_width 20 --axle_y_width 15 --axle_router_bit_radius 2.0 --wheel_hollow_leg_number 5 --wheel_hollow_leg_width 10.0")
-  my_gw.cli("--gear_tooth_nb 25 --gear_module 10 --axle_type circle --wheel_hollow_leg_number 5 --wheel_hollow_leg_width 10.0 --axle_x_width 50")
+  cnc25d_api.cli_shim(my_gw.cli, "--gear_tooth_nb 25 --gear_module 10 --axle_type circle --wheel_hollow_leg_number 5 --wheel_hollow_leg_width 10.0 --axle_x_width 50")
   #my_gw.cli("--gear_tooth_nb 17 --gear_module 10 --gear_router_bit_radius 3.0 --axle_type rectangle --axle_x_width 20 --axle_y_width 25 --axle_router_bit_radius 5.0 --wheel_hollow_leg_number 5 --wheel_hollow_leg_width 8.0 --wheel_hollow_leg_angle 0.0 --wheel_hollow_internal_diameter 50.0 --wheel_hollow_external_diameter 120.0 --wheel_hollow_router_bit_radius 10.0 --gear_profile_height 15.0")
   #my_gw.cli("--gear_tooth_nb 17 --gear_module 10 --gear_router_bit_radius 3.0 --axle_type rectangle --axle_x_width 20 --axle_y_width 25 --axle_router_bit_radius 5.0 --wheel_hollow_leg_number 5 --wheel_hollow_leg_width 8.0 --wheel_hollow_leg_angle 0.0 --wheel_hollow_internal_diameter 50.0 --wheel_hollow_external_diameter 120.0 --wheel_hollow_router_bit_radius 10.0 --gear_profile_height 15.0 --output_file_basename test_output/gearwheel_hat")
   #my_gw.cli("--gear_tooth_nb 17 --gear_module 10 --gear_router_bit_radius 3.0 --axle_type rectangle --axle_x_width 20 --axle_y_width 25 --axle_router_bit_radius 5.0 --wheel_hollow_leg_number 1 --wheel_hollow_leg_width 8.0 --wheel_hollow_leg_angle 0.0 --wheel_hollow_internal_diameter 50.0 --wheel_hollow_external_diameter 120.0 --wheel_hollow_router_bit_radius 10.0")
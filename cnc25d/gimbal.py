@@ -30,7 +30,7 @@ The main function displays in a Tk-interface the gimbal parts, or generates the
 ################################################################
 
 import cnc25d_api
-cnc25d_api.importing_freecad()
+#cnc25d_api.importing_freecad() # FreeCAD is imported on first use by lazy_import
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -41,13 +41,14 @@ cnc25d_api.importing_freecad()
 
 import math
 import sys, argparse
+import collections # OrderedDict for the base-assembly cache
 #from datetime import datetime
 #import os, errno
 #import re # to detect .dxf or .svg
 #import Tkinter # to display the outline in a small GUI
 #
-import Part
-from FreeCAD import Base
+from lazy_import import Part
+from lazy_import import Base
 # 3rd parties
 #import svgwrite
 #from dxfwrite import DXFEngine
@@ -56,6 +57,15 @@ import bell_bagel_assembly
 import cross_cube
 import angles
 
+################################################################
+# global variable
+################################################################
+
+# the constraints that only move the gimbal: they don't change the base-assembly
+gimbal_pose_keys = ('bottom_angle', 'top_angle', 'pan_angle', 'tilt_angle', 'b3')
+# base-assemblies (the non-moving placed sub-assemblies) kept in memory, indexed by the hash of the constraint without the pose keys
+gimbal_base_cache = collections.OrderedDict()
+gimbal_base_cache_max_size = 4
 
 ################################################################
 # gimbal constraint_constructor
@@ -110,8 +120,7 @@ def gimbal_constraint_check(c):
   ###
   if((c['bottom_angle']!=0)or(c['top_angle']!=0)):
     if((c['pan_angle']!=0)or(c['tilt_angle']!=0)):
-      print("ERR145: Error, roll-pitch angles {:0.3f} {:0.3f} and pan-tilt angles {:0.3f} {:0.3f} are set together".format(c['bottom_angle'], c['top_angle'], c['pan_angle'], c['tilt_angle']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR145: Error, roll-pitch angles {:0.3f} {:0.3f} and pan-tilt angles {:0.3f} {:0.3f} are set together".format(c['bottom_angle'], c['top_angle'], c['pan_angle'], c['tilt_angle']))
   if((c['pan_angle']!=0)or(c['tilt_angle']!=0)):
     (a1, a2) = angles.pan_tilt_to_roll_pitch(c['pan_angle'], c['tilt_angle'])
     c['bottom_angle'] = a1
@@ -119,25 +128,20 @@ def gimbal_constraint_check(c):
   (b1, b2) = angles.roll_pitch_to_pan_tilt(c['bottom_angle'], c['top_angle'])
   (a1, a2) = angles.pan_tilt_to_roll_pitch(b1, b2)
   if((abs(c['bottom_angle']-a1)>radian_epsilon)or(abs(c['top_angle']-a2)>radian_epsilon)):
-    print("ERR154: Internal error in angle conversion: a1 {:0.3f} {:0.3f}  a2 {:0.3f} {:0.3f}".format(c['bottom_angle'], a1, c['top_angle'], a2))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR154: Internal error in angle conversion: a1 {:0.3f} {:0.3f}  a2 {:0.3f} {:0.3f}".format(c['bottom_angle'], a1, c['top_angle'], a2))
   c['b3'] = angles.roll_pitch_pan_tilt_drift_angle(c['bottom_angle'], c['top_angle'])
   #
   if(abs(c['bottom_angle'])>0.7*math.pi):
-    print("ERR133: Error, bottom_angle {:0.3f} absolute value is too big".format(c['bottom_angle']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR133: Error, bottom_angle {:0.3f} absolute value is too big".format(c['bottom_angle']))
   if(abs(c['top_angle'])>0.7*math.pi):
-    print("ERR136: Error, top_angle {:0.3f} absolute value is too big".format(c['top_angle']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR136: Error, top_angle {:0.3f} absolute value is too big".format(c['top_angle']))
   if(abs(c['bottom_angle'])+abs(c['top_angle'])>1.1*math.pi):
-    print("ERR139: Error, bottom_angle {:0.3f} and top_angle {:0.3f} absolute values can not be so large at the same time".format(c['bottom_angle'], c['top_angle']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR139: Error, bottom_angle {:0.3f} and top_angle {:0.3f} absolute values can not be so large at the same time".format(c['bottom_angle'], c['top_angle']))
   # pan-tilt
   c['pan_angle'] = b1
   c['tilt_angle'] = b2
   if(c['tilt_angle']>0.6*math.pi):
-    print("ERR147: Error, tilt_angle {:0.3f} is to big".format(c['tilt_angle']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR147: Error, tilt_angle {:0.3f} is to big".format(c['tilt_angle']))
   return(c)
 
 ################################################################
@@ -219,9 +223,14 @@ def gimbal_2d_simulations():
 ################################################################
 
 ### gimbal freecad construction
-def sub_gimbal_freecad_construction(c, ai_bottom_angle, ai_top_angle):
-  """ generate the the freecad-object gimbal
+def sub_gimbal_base_assembly(c):
+  """ generate the freecad-objects of the gimbal that don't depend on the pose: the bottom bell_bagel, the top bell_bagel and the cross_cube placed at the angles (0, 0)
+      the base-assembly is computed once per constraint set (without the pose keys) and cached
   """
+  base_key = cnc25d_api.constraint_hash(dict([ (k, c[k]) for k in c.keys() if not k in gimbal_pose_keys ]))
+  if(base_key in gimbal_base_cache):
+    gimbal_base_cache[base_key] = gimbal_base_cache.pop(base_key) # most recently used
+    return(gimbal_base_cache[base_key])
   # intermediate parameters
   z1 = c['base_thickness'] + c['bell_face_height'] + c['leg_length']
   z2 = c['inter_axle_length']
@@ -239,13 +248,39 @@ def sub_gimbal_freecad_construction(c, ai_bottom_angle, ai_top_angle):
   fc_bb_top.translate(Base.Vector(0,0,z2))
   fc_cc.translate(Base.Vector(-1*c['cube_width']/2.0, -1*c['cube_width']/2.0, z1-(c['top_thickness'] + c['height_margin'] + c['axle_diameter']/2.0)))
   fc_cc.rotate(Base.Vector(0,0,0),Base.Vector(0,0,1),90)
+  r_base = (fc_bb_bottom, fc_bb_top, fc_cc, z1, z2)
+  gimbal_base_cache[base_key] = r_base
+  if(len(gimbal_base_cache)>gimbal_base_cache_max_size):
+    gimbal_base_cache.popitem(last=False) # least recently used
+  return(r_base)
+
+def sub_gimbal_pose(ai_base, ai_bottom_angle, ai_top_angle):
+  """ place the base-assembly ai_base at the pose (ai_bottom_angle, ai_top_angle)
+      the moving parts are wrapped in compounds that get the rotations, so the geometry of the cached base-assembly is shared and never modified
+  """
+  (fc_bb_bottom, fc_bb_top, fc_cc, z1, z2) = ai_base
   # apply the rotation
-  fc_bb_top.rotate(Base.Vector(0,0,z1+z2),Base.Vector(0,1,0),ai_top_angle*180/math.pi)
-  fc_top = Part.makeCompound([fc_bb_top, fc_cc])
+  fc_bb_top_posed = Part.makeCompound([fc_bb_top])
+  fc_bb_top_posed.rotate(Base.Vector(0,0,z1+z2),Base.Vector(0,1,0),ai_top_angle*180/math.pi)
+  fc_top = Part.makeCompound([fc_bb_top_posed, fc_cc])
   fc_top.rotate(Base.Vector(0,0,z1),Base.Vector(1,0,0),ai_bottom_angle*180/math.pi)
   r_fc_gimbal = Part.makeCompound([fc_bb_bottom, fc_top])
   return(r_fc_gimbal)
 
+def sub_gimbal_freecad_construction(c, ai_bottom_angle, ai_top_angle):
+  """ generate the the freecad-object gimbal
+  """
+  r_fc_gimbal = sub_gimbal_pose(sub_gimbal_base_assembly(c), ai_bottom_angle, ai_top_angle)
+  return(r_fc_gimbal)
+
+def gimbal_pose_sweep(c, ai_angle_pairs):
+  """ generator of the freecad-objects gimbal at the poses ai_angle_pairs (list of (bottom_angle, top_angle) in radians)
+      the base-assembly is constructed once, each pose costs only two rotations
+  """
+  base = sub_gimbal_base_assembly(c)
+  for (bottom_angle, top_angle) in ai_angle_pairs:
+    yield(sub_gimbal_pose(base, bottom_angle, top_angle))
+
 def sub_gfc_gimbal(c):
   return(sub_gimbal_freecad_construction(c, c['bottom_angle'], c['top_angle']))
 
@@ -373,6 +408,18 @@ class gimbal(cnc25d_api.bare_design):
       l_self_test_list          = gimbal_self_test())
     self.apply_constraint(constraint)
 
+  def pose_sweep(self, ai_angle_pairs):
+    """ generator of the freecad-objects gimbal at the poses ai_angle_pairs (list of (bottom_angle, top_angle) in radians)
+    """
+    return(gimbal_pose_sweep(self.constraint, ai_angle_pairs))
+
+  def write_pose_sweep(self, output_file_basename, ai_angle_pairs, ai_brep=True, ai_stl=False):
+    """ write the freecad-objects gimbal at the poses ai_angle_pairs in the files output_file_basename_<bottom>_<top> (angles in degree)
+    """
+    for ((bottom_angle, top_angle), fc_gimbal) in zip(ai_angle_pairs, self.pose_sweep(ai_angle_pairs)):
+      cnc25d_api.freecad_object_output_file(fc_gimbal, "{:s}_{:03d}_{:03d}".format(output_file_basename, int(round(bottom_angle*180/math.pi)), int(round(top_angle*180/math.pi))), ai_brep=ai_brep, ai_stl=ai_stl)
+    return(0)
+
 
 ################################################################
 # main
@@ -380,12 +427,12 @@ class gimbal(cnc25d_api.bare_design):
 
 # this works with python and freecad :)
 if __name__ == "__main__":
-  FreeCAD.Console.PrintMessage("gimbal.py says hello!\n")
+  print("gimbal.py says hello!")
   my_g = gimbal()
   #my_g.cli()
   #my_g.cli("--bagel_extra_cut_thickness 1.0")
   #my_g.cli("--bottom_angle 0.1 --top_angle 0.2")
-  my_g.cli("--face_A1_crest --face_B1_crest --bottom_angle 0.1 --top_angle 0.2")
+  cnc25d_api.cli_shim(my_g.cli, "--face_A1_crest --face_B1_crest --bottom_angle 0.1 --top_angle 0.2")
   if(cnc25d_api.interpretor_is_freecad()):
     Part.show(my_g.get_fc_obj_function('gimbal'))
 
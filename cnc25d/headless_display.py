@@ -0,0 +1,553 @@
+# headless_display.py
+# renders the 2D-simulations off-screen, without Tkinter and without display server
+# created by agent on 2026/10/16
+#
+# (C) Copyright 2026 agent
+#
+# This file is part of the Cnc25D Python package.
+#
+# Cnc25D is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Cnc25D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cnc25D.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+headless_display.py provides the class Headless_Canvas, an off-screen replacement of the Tkinter Two_Canvas of display_backend.py.
+It has the same api (add_canvas_graphic_function, add_parameter_info, add_curve_graphic_table) and drives the canvas_graphic_function over a fixed list of angle positions.
+Each frame can be rasterized in a PNG file, all the frames can be gathered in an animated SVG file and the matplotlib curve tables can be written in a CSV file.
+The rasterization only uses numpy and zlib, so the simulations can run and be benchmarked on a server without display.
+A simulation uses the headless rendering when headless_setup() has been called (for example with the option --headless_simulation).
+"""
+
+################################################################
+# import
+################################################################
+
+import os
+import time
+import csv
+import zlib
+import struct
+import shutil
+import tempfile
+import argparse
+import numpy
+#
+import display_backend
+import design_profile
+import design_help # just for get_effective_args()
+import cnc25d_error
+
+################################################################
+# global variable
+################################################################
+
+headless_enable = False
+# the output files are <output_basename>_frame_0000.png, <output_basename>.svg and <output_basename>_curves.csv
+headless_output_basename = ''
+headless_formats = ('png', 'svg', 'csv')
+headless_format_list = ('png', 'svg', 'csv')
+# the angle positions of the frames: 0, angle_step, 2*angle_step ...
+headless_frame_nb = 64
+headless_angle_step = display_backend.g_fast_angle_speed
+headless_frame_width = display_backend.initial_tkinter_canvas_width
+headless_frame_height = display_backend.initial_tkinter_canvas_height
+headless_overlay = 0
+headless_frame_duration = display_backend.g_step_period # ms, frame duration in the animated SVG
+headless_background = 'white'
+# the Tk color names used by the canvas graphics
+headless_colors = {
+  'black': (0, 0, 0),
+  'white': (255, 255, 255),
+  'red': (255, 0, 0),
+  'green': (0, 255, 0),
+  'blue': (0, 0, 255),
+  'yellow': (255, 255, 0),
+  'orange': (255, 165, 0),
+  'brown': (165, 42, 42),
+  'grey': (190, 190, 190),
+  'gray': (190, 190, 190),
+  'cyan': (0, 255, 255),
+  'magenta': (255, 0, 255),
+  'purple': (160, 32, 240),
+  'pink': (255, 192, 203)}
+
+################################################################
+# setup
+################################################################
+
+def headless_setup(ai_enable=True, ai_output_basename='', ai_frame_nb=None, ai_angle_step=None, ai_formats=None, ai_frame_size=None, ai_overlay=None):
+  """ enable or disable the headless rendering of the 2D-simulations and set its parameters
+      ai_formats: list of output formats among png, svg and csv. With an empty list, the frames are only computed (benchmark)
+      ai_frame_size: (width, height) of the frames in pixel
+  """
+  global headless_enable, headless_output_basename, headless_frame_nb, headless_angle_step, headless_formats, headless_frame_width, headless_frame_height, headless_overlay
+  if(ai_formats!=None):
+    for fmt in ai_formats:
+      if(not fmt in headless_format_list):
+        raise cnc25d_error.Cnc25dBackendError("ERR938: Error, the headless format {:s} is unknown. Try: {:s}".format(fmt, ', '.join(headless_format_list)))
+    headless_formats = tuple(ai_formats)
+  headless_enable = ai_enable
+  headless_output_basename = ai_output_basename
+  if(ai_frame_nb!=None):
+    headless_frame_nb = ai_frame_nb
+  if(ai_angle_step!=None):
+    headless_angle_step = ai_angle_step
+  if(ai_frame_size!=None):
+    (headless_frame_width, headless_frame_height) = ai_frame_size
+  if(ai_overlay!=None):
+    headless_overlay = ai_overlay
+  return(0)
+
+def headless_save():
+  """ return the current settings of the headless rendering, to be given back to headless_restore()
+  """
+  r_settings = (headless_enable, headless_output_basename, headless_frame_nb, headless_angle_step, headless_formats, headless_frame_width, headless_frame_height, headless_overlay)
+  return(r_settings)
+
+def headless_restore(ai_settings):
+  """ restore the settings of the headless rendering returned by headless_save()
+  """
+  global headless_enable, headless_output_basename, headless_frame_nb, headless_angle_step, headless_formats, headless_frame_width, headless_frame_height, headless_overlay
+  (headless_enable, headless_output_basename, headless_frame_nb, headless_angle_step, headless_formats, headless_frame_width, headless_frame_height, headless_overlay) = ai_settings
+  return(0)
+
+def headless_enabled():
+  """ check if the 2D-simulations must use the headless rendering
+  """
+  return(headless_enable)
+
+def headless_angle_positions(ai_frame_nb=None, ai_angle_step=None):
+  """ return the list of the angle positions of the frames
+  """
+  frame_nb = ai_frame_nb if(ai_frame_nb!=None) else headless_frame_nb
+  angle_step = ai_angle_step if(ai_angle_step!=None) else headless_angle_step
+  r_positions = [ i*angle_step for i in range(frame_nb) ]
+  return(r_positions)
+
+################################################################
+# rasterization
+################################################################
+
+def color_to_rgb(ai_color):
+  """ convert a Tk color (name or #rrggbb) into a (r, g, b) tuple
+  """
+  r_rgb = (0, 0, 0)
+  if(ai_color in headless_colors):
+    r_rgb = headless_colors[ai_color]
+  elif((len(ai_color)==7)and(ai_color[0]=='#')):
+    r_rgb = (int(ai_color[1:3], 16), int(ai_color[3:5], 16), int(ai_color[5:7], 16))
+  else:
+    print("WARN939: Warning, the color {:s} is unknown and replaced by black".format(ai_color))
+  return(r_rgb)
+
+def sub_spread(ai_counts):
+  """ for a list of counts (n0, n1 ...), return the index of the owner and the rank in the owner of the sum(counts) elements
+      it vectorizes the loops 'for i in owners: for k in range(counts[i])'
+  """
+  owner = numpy.repeat(numpy.arange(len(ai_counts)), ai_counts)
+  starts = numpy.cumsum(ai_counts)-ai_counts
+  rank = numpy.arange(len(owner))-starts[owner]
+  return(owner, rank)
+
+def raster_lines(ai_image, ai_lines, ai_rgb, ai_width=1):
+  """ draw the lines ai_lines (numpy array (n,4) in pixel) in the image ai_image (numpy array (height, width, 3))
+      each line is sampled with one point per pixel along its main direction
+  """
+  if(len(ai_lines)==0):
+    return(0)
+  (height, width) = ai_image.shape[0:2]
+  dx = ai_lines[:,2]-ai_lines[:,0]
+  dy = ai_lines[:,3]-ai_lines[:,1]
+  counts = numpy.ceil(numpy.maximum(abs(dx), abs(dy))).astype(numpy.int64)+1
+  (owner, rank) = sub_spread(counts)
+  step_nb = numpy.maximum(counts-1, 1).astype(numpy.float64)[owner]
+  # rank*dx/step_nb (and not rank/step_nb*dx) is exact for the integer coordinates, so no pixel is skipped by a rounding below an integer
+  px = numpy.floor(ai_lines[owner,0]+rank*dx[owner]/step_nb).astype(numpy.int64)
+  py = numpy.floor(ai_lines[owner,1]+rank*dy[owner]/step_nb).astype(numpy.int64)
+  half_width = int(ai_width)//2
+  for ox in range(-1*half_width, int(ai_width)-half_width):
+    for oy in range(-1*half_width, int(ai_width)-half_width):
+      (qx, qy) = (px+ox, py+oy)
+      inside = (qx>=0)&(qx<width)&(qy>=0)&(qy<height)
+      ai_image[qy[inside], qx[inside]] = ai_rgb
+  return(0)
+
+def raster_polygon(ai_image, ai_points, ai_rgb):
+  """ fill the polygon ai_points (numpy array (n,2) in pixel) in the image ai_image with the even-odd rule
+      the crossings of the edges with the pixel row centers are sorted by row, and each pair of crossings is a span to fill
+  """
+  if(len(ai_points)<3):
+    return(0)
+  (height, width) = ai_image.shape[0:2]
+  nxt = numpy.roll(ai_points, -1, axis=0)
+  (x0, y0, x1, y1) = (ai_points[:,0], ai_points[:,1], nxt[:,0], nxt[:,1])
+  # rows whose center y+0.5 is in [min(y0,y1), max(y0,y1))
+  row_min = numpy.clip(numpy.ceil(numpy.minimum(y0, y1)-0.5), 0, height).astype(numpy.int64)
+  row_max = numpy.clip(numpy.ceil(numpy.maximum(y0, y1)-0.5), 0, height).astype(numpy.int64)
+  (owner, rank) = sub_spread(row_max-row_min)
+  if(len(owner)==0):
+    return(0)
+  rows = row_min[owner]+rank
+  t = (rows+0.5-y0[owner])/(y1[owner]-y0[owner])
+  xs = x0[owner]+t*(x1[owner]-x0[owner])
+  order = numpy.lexsort((xs, rows))
+  (rows, xs) = (rows[order].reshape(-1, 2), xs[order].reshape(-1, 2))
+  # columns whose center x+0.5 is in [x_start, x_stop)
+  col_min = numpy.clip(numpy.ceil(xs[:,0]-0.5), 0, width).astype(numpy.int64)
+  col_max = numpy.clip(numpy.ceil(xs[:,1]-0.5), 0, width).astype(numpy.int64)
+  (span, rank) = sub_spread(numpy.maximum(col_max-col_min, 0))
+  ai_image[rows[span,0], col_min[span]+rank] = ai_rgb
+  return(0)
+
+def render_frame(ai_canvas_graphics, ai_width, ai_height, ai_overlay):
+  """ rasterize the scaled canvas graphics (see display_backend.graphics_to_arrays()) and return the image as a numpy array (height, width, 3)
+  """
+  r_image = numpy.empty((ai_height, ai_width, 3), dtype=numpy.uint8)
+  r_image[:,:] = color_to_rgb(headless_background)
+  for outline in ai_canvas_graphics:
+    outline_type = outline[0]
+    if((outline_type=='graphic_lines')or((outline_type=='overlay_lines')and(ai_overlay==1))):
+      raster_lines(r_image, outline[1], color_to_rgb(outline[2]), outline[3])
+    elif((outline_type=='graphic_polygon')or((outline_type=='overlay_polygon')and(ai_overlay==1))):
+      if(outline[2]!=''):
+        raster_polygon(r_image, outline[1], color_to_rgb(outline[2]))
+      if(outline[3]!=''):
+        raster_lines(r_image, numpy.hstack((outline[1], numpy.roll(outline[1], -1, axis=0))), color_to_rgb(outline[3]), outline[4])
+  return(r_image)
+
+def write_png(ai_image, ai_filename):
+  """ write the image ai_image (numpy array (height, width, 3) of uint8) in the PNG file ai_filename
+  """
+  def sub_chunk(ai_tag, ai_data):
+    """ return a PNG chunk with its length and CRC
+    """
+    r_chunk = struct.pack('>I', len(ai_data)) + ai_tag + ai_data + struct.pack('>I', zlib.crc32(ai_tag + ai_data) & 0xffffffff)
+    return(r_chunk)
+  (height, width) = ai_image.shape[0:2]
+  # each row starts with the filter type 0 (no filter)
+  raw = numpy.hstack((numpy.zeros((height, 1), dtype=numpy.uint8), ai_image.reshape(height, width*3)))
+  try:
+    ofh = open(ai_filename, 'wb')
+    ofh.write('\x89PNG\r\n\x1a\n')
+    ofh.write(sub_chunk('IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)))
+    ofh.write(sub_chunk('IDAT', zlib.compress(raw.tostring(), 6)))
+    ofh.write(sub_chunk('IEND', ''))
+    ofh.close()
+  except IOError as err:
+    raise cnc25d_error.Cnc25dBackendError("ERR940: Error, the file {:s} can not be written: {:s}".format(ai_filename, str(err)))
+  return(0)
+
+################################################################
+# animated SVG and CSV
+################################################################
+
+def svg_frame(ai_canvas_graphics, ai_overlay):
+  """ return the SVG elements (polylines and polygons) of the scaled canvas graphics of one frame
+  """
+  r_elements = []
+  for outline in ai_canvas_graphics:
+    outline_type = outline[0]
+    if((outline_type=='graphic_lines')or((outline_type=='overlay_lines')and(ai_overlay==1))):
+      for polyline in display_backend.lines_to_polylines(outline[1]):
+        points = ' '.join([ "{:0.1f},{:0.1f}".format(polyline[2*i], polyline[2*i+1]) for i in range(len(polyline)//2) ])
+        r_elements.append('<polyline points="{:s}" fill="none" stroke="{:s}" stroke-width="{:d}" />'.format(points, outline[2], int(outline[3])))
+    elif((outline_type=='graphic_polygon')or((outline_type=='overlay_polygon')and(ai_overlay==1))):
+      points = ' '.join([ "{:0.1f},{:0.1f}".format(x, y) for (x, y) in outline[1].tolist() ])
+      r_elements.append('<polygon points="{:s}" fill="{:s}" stroke="{:s}" stroke-width="{:d}" />'.format(points, (outline[2] if(outline[2]!='') else 'none'), (outline[3] if(outline[3]!='') else 'none'), int(outline[4])))
+  return(r_elements)
+
+def write_animated_svg(ai_frames, ai_width, ai_height, ai_frame_duration, ai_filename):
+  """ write the frames ai_frames (list of SVG element lists) in the SVG file ai_filename
+      each frame is a group only visible during its time slot (SMIL animation), and the animation loops forever
+  """
+  print("Generate the animated SVG file {:s}".format(ai_filename))
+  frame_nb = len(ai_frames)
+  total_duration = "{:0.3f}s".format(frame_nb*ai_frame_duration/1000.0)
+  try:
+    ofh = open(ai_filename, 'w')
+    ofh.write('<?xml version="1.0" encoding="utf-8" ?>\n')
+    ofh.write('<svg baseProfile="full" height="{:d}" version="1.1" width="{:d}" xmlns="http://www.w3.org/2000/svg" xmlns:ev="http://www.w3.org/2001/xml-events" xmlns:xlink="http://www.w3.org/1999/xlink">\n'.format(ai_height, ai_width))
+    ofh.write('<rect x="0" y="0" width="{:d}" height="{:d}" fill="{:s}" />\n'.format(ai_width, ai_height, headless_background))
+    for i in range(frame_nb):
+      if(i==0):
+        (values, key_times) = ('visible;hidden', "0;{:0.6f}".format(1.0/frame_nb))
+      else:
+        (values, key_times) = ('hidden;visible;hidden', "0;{:0.6f};{:0.6f}".format(float(i)/frame_nb, float(i+1)/frame_nb))
+      ofh.write('<g visibility="hidden">\n')
+      ofh.write('<animate attributeName="visibility" values="{:s}" keyTimes="{:s}" calcMode="discrete" dur="{:s}" repeatCount="indefinite" />\n'.format(values, key_times, total_duration))
+      ofh.write('\n'.join(ai_frames[i]) + '\n')
+      ofh.write('</g>\n')
+    ofh.write('</svg>\n')
+    ofh.close()
+  except IOError as err:
+    raise cnc25d_error.Cnc25dBackendError("ERR940: Error, the file {:s} can not be written: {:s}".format(ai_filename, str(err)))
+  return(0)
+
+def write_curve_csv(ai_curve_graphic_table, ai_filename):
+  """ write the curve tables of the matplotlib curve graphic table in the CSV file ai_filename
+      the first column is the abscissa computed like Two_Canvas.action_button_curve_graph()
+  """
+  curve_nb = len(ai_curve_graphic_table)-1
+  if(curve_nb<=0):
+    print("WARN451: Warning, the curve_graphic_table is not set! No CSV file")
+    return(1)
+  curve_table_len = min([ len(ai_curve_graphic_table[j+1][1]) for j in range(curve_nb) ])
+  if(curve_table_len==0):
+    print("WARN941: Warning, the curve tables are empty! No CSV file")
+    return(1)
+  print("Generate the CSV file {:s}".format(ai_filename))
+  x_increment = ai_curve_graphic_table[0][2]
+  try:
+    ofh = open(ai_filename, 'wb')
+    csv_writer = csv.writer(ofh)
+    csv_writer.writerow([ ' '.join(label.split()) for label in [ai_curve_graphic_table[0][1]] + [ ai_curve_graphic_table[j+1][0] for j in range(curve_nb) ] ])
+    for i in range(curve_table_len):
+      csv_writer.writerow([ i*x_increment ] + [ ai_curve_graphic_table[j+1][1][i] for j in range(curve_nb) ])
+    ofh.close()
+  except IOError as err:
+    raise cnc25d_error.Cnc25dBackendError("ERR940: Error, the file {:s} can not be written: {:s}".format(ai_filename, str(err)))
+  return(0)
+
+################################################################
+# Headless_Canvas class
+################################################################
+
+class Headless_Canvas():
+  """ off-screen replacement of display_backend.Two_Canvas
+      the outline extremum and the scale are computed with the first frame, like Two_Canvas does at add_canvas_graphic_function()
+  """
+
+  def __init__(self, ai_angle_positions=None, ai_output_basename=None, ai_formats=None):
+    """ the default arguments come from the global variables set by headless_setup()
+    """
+    self.angle_positions = ai_angle_positions if(ai_angle_positions!=None) else headless_angle_positions()
+    self.output_basename = ai_output_basename if(ai_output_basename!=None) else headless_output_basename
+    self.formats = ai_formats if(ai_formats!=None) else headless_formats
+    self.canvas_graphic_function = None
+    self.parameter_info = ''
+    self.curve_graphic_table = []
+    self.rotation_direction = 1
+
+  def add_canvas_graphic_function(self, ai_canvas_graphic_function):
+    """ api method to add the function that computes the canvas graphics of an angle position
+    """
+    self.canvas_graphic_function = ai_canvas_graphic_function
+
+  def add_parameter_info(self, ai_parameter_info):
+    """ api method to add the parameter info text. It is written in <output_basename>_info.txt
+    """
+    self.parameter_info = ai_parameter_info
+
+  def add_curve_graphic_table(self, ai_curve_graphic_table):
+    """ api method to add the curve tables. They are written in <output_basename>_curves.csv
+    """
+    self.curve_graphic_table = ai_curve_graphic_table
+
+  def compute_frame(self, ai_angle_position, ai_pixel_scale):
+    """ call the canvas_graphic_function with display_backend.tkinter_pixel_scale set to ai_pixel_scale
+    """
+    previous_pixel_scale = display_backend.tkinter_pixel_scale
+    display_backend.tkinter_pixel_scale = ai_pixel_scale
+    try:
+      r_graphics = display_backend.graphics_to_arrays(self.canvas_graphic_function(self.rotation_direction, ai_angle_position))
+    finally:
+      display_backend.tkinter_pixel_scale = previous_pixel_scale
+    return(r_graphics)
+
+  def run(self):
+    """ compute, render and write all the frames, then write the curve tables
+        return a dictionary with the frame number and the time spent to compute and to render the frames
+    """
+    if(self.canvas_graphic_function==None):
+      raise cnc25d_error.Cnc25dBackendError("ERR942: Error, no canvas_graphic_function is set in the Headless_Canvas")
+    if((len(self.formats)>0)and(self.output_basename=='')):
+      raise cnc25d_error.Cnc25dBackendError("ERR943: Error, the headless formats {:s} require an output_basename".format(', '.join(self.formats)))
+    output_dir = os.path.dirname(self.output_basename)
+    if((output_dir!='')and(not os.path.isdir(output_dir))):
+      os.makedirs(output_dir)
+    print("Run the headless simulation over {:d} frames of {:d}x{:d} pixels".format(len(self.angle_positions), headless_frame_width, headless_frame_height))
+    canvas_size = (headless_frame_width, headless_frame_height, display_backend.tkinter_canvas_margin_x, display_backend.tkinter_canvas_margin_y)
+    scale_coef = None
+    svg_frames = []
+    (graphics_time, render_time) = (0.0, 0.0)
+    for i in range(len(self.angle_positions)):
+      start_time = time.time()
+      with design_profile.stage('simulation_graphics'):
+        pixel_scale = abs(scale_coef[0]) if(scale_coef!=None) else 0
+        canvas_graphics = self.compute_frame(self.angle_positions[i], pixel_scale)
+        if(scale_coef==None):
+          scale_coef = display_backend.compute_scale_coef(display_backend.find_outline_extremum(canvas_graphics), canvas_size)
+      graphics_time += time.time()-start_time
+      start_time = time.time()
+      with design_profile.stage('simulation_render'):
+        scaled_graphics = display_backend.scale_outline(canvas_graphics, scale_coef)
+        if('png' in self.formats):
+          write_png(render_frame(scaled_graphics, headless_frame_width, headless_frame_height, headless_overlay), "{:s}_frame_{:04d}.png".format(self.output_basename, i))
+        if('svg' in self.formats):
+          svg_frames.append(svg_frame(scaled_graphics, headless_overlay))
+      render_time += time.time()-start_time
+    if('svg' in self.formats):
+      write_animated_svg(svg_frames, headless_frame_width, headless_frame_height, headless_frame_duration, "{:s}.svg".format(self.output_basename))
+    if('csv' in self.formats):
+      write_curve_csv(self.curve_graphic_table, "{:s}_curves.csv".format(self.output_basename))
+    if((self.output_basename!='')and(self.parameter_info!='')):
+      info_filename = "{:s}_info.txt".format(self.output_basename)
+      try:
+        ofh = open(info_filename, 'w')
+        ofh.write(self.parameter_info)
+        ofh.close()
+      except IOError as err:
+        raise cnc25d_error.Cnc25dBackendError("ERR940: Error, the file {:s} can not be written: {:s}".format(info_filename, str(err)))
+    frame_nb = len(self.angle_positions)
+    r_stats = {'frame_nb': frame_nb, 'graphics_time': graphics_time, 'render_time': render_time}
+    print("headless simulation: {:d} frames, graphics {:0.3f} s, rendering {:0.3f} s, {:0.1f} frames/s".format(frame_nb, graphics_time, render_time, frame_nb/max(graphics_time+render_time, 1e-9)))
+    return(r_stats)
+
+################################################################
+# ******** test API ***********
+################################################################
+
+def sub_read_png(ai_filename):
+  """ read back a PNG file written by write_png() and return the image as a numpy array (height, width, 3)
+      return None if a chunk CRC or the header is wrong
+  """
+  ifh = open(ai_filename, 'rb')
+  data = ifh.read()
+  ifh.close()
+  if(data[0:8]!='\x89PNG\r\n\x1a\n'):
+    return(None)
+  (pos, chunks) = (8, {})
+  while(pos<len(data)):
+    (length,) = struct.unpack('>I', data[pos:pos+4])
+    (tag, chunk_data) = (data[pos+4:pos+8], data[pos+8:pos+8+length])
+    (crc,) = struct.unpack('>I', data[pos+8+length:pos+12+length])
+    if(crc!=(zlib.crc32(tag + chunk_data) & 0xffffffff)):
+      return(None)
+    chunks[tag] = chunk_data
+    pos += 12+length
+  (width, height) = struct.unpack('>II', chunks['IHDR'][0:8])
+  raw = numpy.frombuffer(zlib.decompress(chunks['IDAT']), dtype=numpy.uint8).reshape(height, 1+3*width)
+  r_image = raw[:,1:].reshape(height, width, 3)
+  return(r_image)
+
+def headless_display_test1():
+  """ check the pixel counts of raster_lines(), raster_polygon() and render_frame(), read back the PNG file
+      and run a Headless_Canvas over three frames with the png, svg and csv outputs
+  """
+  r_test = 1
+  red = numpy.array((255, 0, 0), dtype=numpy.uint8)
+  def sub_count(ai_image, ai_rgb=red):
+    """ number of pixels of the color ai_rgb
+    """
+    return(int(numpy.sum(numpy.all(ai_image==ai_rgb, axis=2))))
+  # (lines, width, expected pixel number)
+  line_checks = (
+    (((5, 5, 25, 5),), 1, 21),                 # horizontal
+    (((5, 5, 25, 5),), 3, 69),                 # horizontal with a square brush of 3x3 pixels
+    (((0, 0, 10, 10),), 1, 11),                # diagonal
+    (((-10, 2, 10, 2),), 1, 11),               # partially outside the image
+    (((5, 5, 25, 5), (25, 5, 25, 15)), 1, 31), # two lines sharing a pixel
+    (((60, 5, 80, 5),), 1, 0))                 # outside the image
+  for (lines, width, expected_nb) in line_checks:
+    image = numpy.zeros((40, 50, 3), dtype=numpy.uint8)
+    raster_lines(image, numpy.array(lines, dtype=numpy.float64), red, width)
+    if(sub_count(image)!=expected_nb):
+      print("ERR: headless_display raster_lines() of {:s} draws {:d} pixels instead of {:d}".format(str(lines), sub_count(image), expected_nb))
+      r_test = 0
+  # (polygon, expected pixel number)
+  polygon_checks = (
+    (((10, 10), (30, 10), (30, 20), (10, 20)), 200),                             # rectangle on the pixel borders
+    (((10, 10), (30, 10), (30, 20), (20, 20), (20, 15), (15, 15), (15, 20), (10, 20)), 175), # concave
+    (((-10, -10), (60, -10), (60, 50), (-10, 50)), 2000),                        # around the image
+    (((0, 0), (40, 0), (0, 40)), 780))                                           # triangle of area 800
+  for (polygon, expected_nb) in polygon_checks:
+    image = numpy.zeros((40, 50, 3), dtype=numpy.uint8)
+    raster_polygon(image, numpy.array(polygon, dtype=numpy.float64), red)
+    if(sub_count(image)!=expected_nb):
+      print("ERR: headless_display raster_polygon() of {:s} fills {:d} pixels instead of {:d}".format(str(polygon), sub_count(image), expected_nb))
+      r_test = 0
+  frame_graphics = display_backend.graphics_to_arrays((
+    ('graphic_polygon', (10, 10, 30, 10, 30, 20, 10, 20), 'red', 'blue', 1),
+    ('overlay_lines', (0, 30, 49, 30), 'green', 1)))
+  for overlay in (0, 1):
+    image = render_frame(frame_graphics, 50, 40, overlay)
+    pixel_nbs = (sub_count(image), sub_count(image, (0, 0, 255)), sub_count(image, (0, 255, 0)), sub_count(image, (255, 255, 255)))
+    expected_nbs = (171, 60, 50*overlay, 2000-231-50*overlay) # the border of the polygon is drawn over its filling
+    if(pixel_nbs!=expected_nbs):
+      print("ERR: headless_display render_frame() with overlay {:d} draws the pixels {:s} instead of {:s}".format(overlay, str(pixel_nbs), str(expected_nbs)))
+      r_test = 0
+  hdt_dir = tempfile.mkdtemp()
+  png_filename = os.path.join(hdt_dir, 'frame.png')
+  write_png(image, png_filename)
+  png_image = sub_read_png(png_filename)
+  if((png_image is None)or(png_image.shape!=image.shape)or(not numpy.array_equal(png_image, image))):
+    print("ERR: headless_display the PNG file does not contain the rendered frame")
+    r_test = 0
+  output_basename = os.path.join(hdt_dir, 'sim', 'test2')
+  hdc = Headless_Canvas(headless_angle_positions(3, 10), output_basename, ('png', 'svg', 'csv'))
+  hdc.add_canvas_graphic_function(display_backend.test_canvas_graphic_2)
+  hdc.add_parameter_info("headless_display_test1")
+  hdc.add_curve_graphic_table((('global_title', 'x_axis_name', 0.5), ('plot1_title', (1, 2, 3), 'bo'), ('plot2_title', (8, 7, 3, 4), 'r')))
+  stats = hdc.run()
+  output_files = sorted(os.listdir(os.path.dirname(output_basename)))
+  expected_files = ['test2.svg', 'test2_curves.csv', 'test2_frame_0000.png', 'test2_frame_0001.png', 'test2_frame_0002.png', 'test2_info.txt']
+  if((stats['frame_nb']!=3)or(output_files!=expected_files)):
+    print("ERR: headless_display the Headless_Canvas writes the files {:s}".format(', '.join(output_files)))
+    r_test = 0
+  else:
+    ifh = open("{:s}.svg".format(output_basename), 'r')
+    svg_txt = ifh.read()
+    ifh.close()
+    ifh = open("{:s}_curves.csv".format(output_basename), 'rb')
+    csv_rows = list(csv.reader(ifh))
+    ifh.close()
+    if((svg_txt.count('<polygon ')!=3)or(svg_txt.count('<animate ')!=3)or(not svg_txt.endswith('</svg>\n'))):
+      print("ERR: headless_display the animated SVG file does not contain the three frames")
+      r_test = 0
+    if(csv_rows!=[['x_axis_name', 'plot1_title', 'plot2_title'], ['0.0', '1', '8'], ['0.5', '2', '7'], ['1.0', '3', '3']]):
+      print("ERR: headless_display the CSV file contains {:s}".format(str(csv_rows)))
+      r_test = 0
+    if(sub_read_png("{:s}_frame_0002.png".format(output_basename)) is None):
+      print("ERR: headless_display the PNG file of the last frame is corrupted")
+      r_test = 0
+  shutil.rmtree(hdt_dir)
+  print("headless_display_test1: {:s}".format("OK" if r_test else "FAILED"))
+  return(r_test)
+
+################################################################
+# ******** command line interface ***********
+################################################################
+
+def headless_display_cli(ai_args=""):
+  """ command line interface to run this script in standalone
+  """
+  hd_parser = argparse.ArgumentParser(description='Test the headless_display API.')
+  hd_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
+    help='Run headless_display_test1()')
+  effective_args = design_help.get_effective_args(ai_args)
+  hd_args = hd_parser.parse_args(effective_args)
+  r_hdc = 0
+  print("dbg111: start testing headless_display.py")
+  if(hd_args.sw_test1):
+    r_hdc = headless_display_test1()
+  print("dbg999: end of script")
+  return(r_hdc)
+
+################################################################
+# main
+################################################################
+
+if __name__ == "__main__":
+  #headless_display_cli()
+  headless_display_cli("--test1")
+
@@ -38,6 +38,8 @@ FREECADPATH=['/usr/lib/freecad/lib'] # add the path to the file FreeCAD.so to th
 ################################################################
 
 import sys, os
+#
+import cnc25d_error
 
 ################################################################
 # function
@@ -60,16 +62,14 @@ def importing_freecad():
       if(os.path.isfile("%s/FreeCAD.so"%(p))):
         freecad_path=p
     if(freecad_path==''):
-      print("ERR070: Error, the FreeCAD library path has not been found!")
-      print("Add the path of the directory containing FreeCAD.so to the variable FREECADPATH in the file {:s}".format(__FILE__))
-      sys.exit(2)
+      print("Add the path of the directory containing FreeCAD.so to the variable FREECADPATH in the file {:s}".format(__file__))
+      raise cnc25d_error.Cnc25dBackendError("ERR070: Error, the FreeCAD library path has not been found!")
     #print("dbg101: add FREECADPATH to sys.path")
     sys.path.append(freecad_path)
     try:
       import FreeCAD
     except:
-      print("ERR080: Error, the FreeCAD library can not be imported by cnc25d!")
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dBackendError("ERR080: Error, the FreeCAD library can not be imported by cnc25d!")
 
 ################################################################
 # main : only useful for debug
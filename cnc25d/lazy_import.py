@@ -0,0 +1,247 @@
+# lazy_import.py
+# module-level proxies that import the heavy backends on first use
+# created by agent on 2026/10/16
+#
+# (C) Copyright 2026 agent
+#
+# This file is part of the Cnc25D Python package.
+#
+# Cnc25D is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Cnc25D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cnc25D.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+lazy_import.py provides the class Lazy_Module, a proxy that imports a module (or one attribute of a module) the first time one of its attributes is used or it is called.
+The heavy backends (FreeCAD, Part, Tkinter, matplotlib, svgwrite, dxfwrite) are declared here once, and the cnc25d modules get them with 'from lazy_import import Part'.
+So a script that only writes SVG files never imports FreeCAD nor Tkinter.
+The time spent in each lazy importation is recorded, and import_time() measures the importation of a module in a fresh Python interpreter to check it against import_time_budget.
+"""
+
+################################################################
+# import
+################################################################
+
+import sys
+import os
+import time
+import subprocess
+import collections
+import argparse
+#
+import cnc25d_error
+import design_help # just for get_effective_args()
+
+################################################################
+# global variable
+################################################################
+
+# maximal time (in second) to import cnc25d_api in a fresh interpreter without loading any backend
+import_time_budget = 0.5
+# time spent to load each lazy module, in the loading order
+lazy_load_times = collections.OrderedDict()
+
+################################################################
+# Lazy_Module class
+################################################################
+
+class Lazy_Module(object):
+  """ proxy of the module ai_module_name (or of its attribute ai_attribute) imported on first use
+      with ai_freecad=True, importing_freecad() is called before the importation
+      a dotted module name behaves like 'import a.b': the proxy stands for the package a
+      the module is searched in the cnc25d package first, so the proxy also works for the design modules
+  """
+
+  def __init__(self, ai_module_name, ai_attribute='', ai_freecad=False):
+    self.__dict__['lazy_module_name'] = ai_module_name
+    self.__dict__['lazy_attribute'] = ai_attribute
+    self.__dict__['lazy_freecad'] = ai_freecad
+    self.__dict__['lazy_target'] = None
+
+  def load(self):
+    """ import the module if not done yet and return it (or its attribute)
+    """
+    if(self.lazy_target is None):
+      start_time = time.time()
+      if(self.lazy_freecad):
+        import importing_freecad
+        importing_freecad.importing_freecad()
+      try:
+        target = __import__(self.lazy_module_name, globals(), locals(), [], -1)
+      except ImportError as err:
+        raise cnc25d_error.Cnc25dBackendError("ERR930: Error, the module {:s} can not be imported: {:s}".format(self.lazy_module_name, str(err)))
+      if(self.lazy_attribute!=''):
+        target = getattr(target, self.lazy_attribute)
+      self.__dict__['lazy_target'] = target
+      lazy_load_times[self.name()] = time.time()-start_time
+    return(self.lazy_target)
+
+  def is_loaded(self):
+    """ check if the proxy has already imported its module
+    """
+    return(self.lazy_target is not None)
+
+  def name(self):
+    """ return the name of the proxied module or attribute
+    """
+    r_name = self.lazy_module_name
+    if(self.lazy_attribute!=''):
+      r_name += '.' + self.lazy_attribute
+    return(r_name)
+
+  def __getattr__(self, ai_name):
+    return(getattr(self.load(), ai_name))
+
+  def __setattr__(self, ai_name, ai_value):
+    setattr(self.load(), ai_name, ai_value)
+
+  def __call__(self, *ai_args, **ai_kwargs):
+    return(self.load()(*ai_args, **ai_kwargs))
+
+  def __repr__(self):
+    r_repr = "<Lazy_Module {:s} {:s}>".format(self.name(), ('loaded' if self.is_loaded() else 'not loaded'))
+    return(r_repr)
+
+################################################################
+# backend proxies
+################################################################
+
+FreeCAD = Lazy_Module('FreeCAD', '', True)
+Base = Lazy_Module('FreeCAD', 'Base', True)
+Part = Lazy_Module('Part', '', True)
+Drawing = Lazy_Module('Drawing', '', True)
+importDXF = Lazy_Module('importDXF', '', True)
+Tkinter = Lazy_Module('Tkinter')
+matplotlib = Lazy_Module('matplotlib.pyplot')
+svgwrite = Lazy_Module('svgwrite')
+DXFEngine = Lazy_Module('dxfwrite', 'DXFEngine')
+
+################################################################
+# import time
+################################################################
+
+def import_time_report():
+  """ return a text with the time spent in each lazy importation
+  """
+  r_txt = "lazy importations:\n"
+  for (name, load_time) in lazy_load_times.items():
+    r_txt += "{:<24s} {:0.3f} s\n".format(name, load_time)
+  return(r_txt)
+
+def import_time(ai_module_name='cnc25d_api'):
+  """ measure the time (in second) to import ai_module_name in a fresh Python interpreter
+      return (import_time, loaded_backends) where loaded_backends is the list of the lazy modules loaded by the importation
+  """
+  script = "import time; t = time.time(); import {:s}; t = time.time()-t; import lazy_import; print('import_time: %f' % t); print('loaded_backends: ' + ' '.join(lazy_import.lazy_load_times.keys()))".format(ai_module_name)
+  env = dict(os.environ)
+  env['PYTHONPATH'] = os.pathsep.join([os.path.dirname(os.path.abspath(__file__))] + [ p for p in env.get('PYTHONPATH', '').split(os.pathsep) if(p!='') ])
+  process = subprocess.Popen([sys.executable, '-c', script], stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+  (out, err) = process.communicate()
+  results = dict([ line.split(':', 1) for line in out.split('\n') if(line.startswith('import_time:') or line.startswith('loaded_backends:')) ])
+  if((process.returncode!=0)or(len(results)!=2)):
+    raise cnc25d_error.Cnc25dBackendError("ERR931: Error, the importation of {:s} failed: {:s}".format(ai_module_name, err.strip()))
+  r_time = (float(results['import_time']), results['loaded_backends'].split())
+  return(r_time)
+
+def check_import_time_budget(ai_module_name='cnc25d_api', ai_budget=None):
+  """ check that the importation of ai_module_name stays within ai_budget seconds (default: import_time_budget) and loads no backend
+      return True if the budget is respected
+  """
+  budget = ai_budget
+  if(budget==None):
+    budget = import_time_budget
+  (duration, loaded_backends) = import_time(ai_module_name)
+  r_ok = ((duration<=budget)and(len(loaded_backends)==0))
+  print("import {:s}: {:0.3f} s (budget: {:0.3f} s), backends loaded: {:s}".format(ai_module_name, duration, budget, ', '.join(loaded_backends) if(len(loaded_backends)>0) else 'none'))
+  if(not r_ok):
+    print("WARN935: Warning, the importation of {:s} exceeds its budget".format(ai_module_name))
+  return(r_ok)
+
+################################################################
+# ******** test API ***********
+################################################################
+
+def lazy_import_test1():
+  """ check the proxies on a standard module: importation on first use, attribute proxy, load time record, ERR930
+      and check that importing cnc25d_api in a fresh interpreter loads no backend
+  """
+  r_test = 1
+  if('fractions' in sys.modules): # the test needs a module not imported yet
+    del sys.modules['fractions']
+  lit_module = Lazy_Module('fractions')
+  lit_class = Lazy_Module('fractions', 'Fraction')
+  if(lit_module.is_loaded() or ('fractions' in sys.modules)):
+    print("ERR: lazy_import the module fractions is imported before its first use")
+    r_test = 0
+  if(lit_module.Fraction(1, 3)+lit_class(1, 6)!=lit_class(1, 2)):
+    print("ERR: lazy_import the proxies of fractions compute a wrong sum")
+    r_test = 0
+  if(not (lit_module.is_loaded() and lit_class.is_loaded() and ('fractions' in sys.modules))):
+    print("ERR: lazy_import the module fractions is not imported after its first use")
+    r_test = 0
+  if(lit_class.load() is not sys.modules['fractions'].Fraction):
+    print("ERR: lazy_import the attribute proxy does not stand for fractions.Fraction")
+    r_test = 0
+  if(not (('fractions' in lazy_load_times) and ('fractions.Fraction' in lazy_load_times))):
+    print("ERR: lazy_import the load times of fractions are not recorded")
+    r_test = 0
+  if(not 'fractions.Fraction' in import_time_report()):
+    print("ERR: lazy_import the import time report misses fractions.Fraction")
+    r_test = 0
+  lit_missing = Lazy_Module('cnc25d_missing_module')
+  raised_code = ''
+  try:
+    lit_missing.load()
+  except cnc25d_error.Cnc25dBackendError as err:
+    raised_code = err.code
+  if((raised_code!='ERR930')or lit_missing.is_loaded()):
+    print("ERR: lazy_import the missing module raises '{:s}' instead of ERR930".format(raised_code))
+    r_test = 0
+  (duration, loaded_backends) = import_time('cnc25d_api')
+  if(len(loaded_backends)>0):
+    print("ERR: lazy_import the importation of cnc25d_api loads the backends {:s}".format(', '.join(loaded_backends)))
+    r_test = 0
+  print("import cnc25d_api: {:0.3f} s (budget: {:0.3f} s)".format(duration, import_time_budget))
+  print("lazy_import_test1: {:s}".format("OK" if r_test else "FAILED"))
+  return(r_test)
+
+################################################################
+# ******** command line interface ***********
+################################################################
+
+def lazy_import_cli(ai_args=""):
+  """ command line interface to run this script in standalone
+  """
+  li_parser = argparse.ArgumentParser(description='Test the lazy_import API.')
+  li_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
+    help='Run lazy_import_test1()')
+  li_parser.add_argument('--check_budget','--cb', action='store_true', default=False, dest='sw_check_budget',
+    help='Check the importation time of cnc25d_api against import_time_budget')
+  effective_args = design_help.get_effective_args(ai_args)
+  li_args = li_parser.parse_args(effective_args)
+  r_lic = 0
+  print("dbg111: start testing lazy_import.py")
+  if(li_args.sw_test1):
+    r_lic = lazy_import_test1()
+  if(li_args.sw_check_budget):
+    r_lic = check_import_time_budget()
+  print("dbg999: end of script")
+  return(r_lic)
+
+################################################################
+# main
+################################################################
+
+if __name__ == "__main__":
+  #lazy_import_cli()
+  lazy_import_cli("--test1")
+
@@ -0,0 +1,595 @@
+# mesh_extrusion.py
+# extrude a cnc25d figure into a triangle mesh and write it as binary STL, without FreeCAD
+# created by agent on 2026/10/16
+#
+# (C) Copyright 2026 agent
+#
+# This file is part of the Cnc25D Python package.
+#
+# Cnc25D is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Cnc25D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cnc25D.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+mesh_extrusion.py is a FreeCAD-free alternative to outline_backends.figure_to_freecad_25d_part() for the STL output.
+The arcs of a format-B figure are tessellated with a chord tolerance, the caps are triangulated (the holes are bridged to the outer outline, then the polygon is cut in ears) and the side walls are added.
+The meshes are written in binary STL file, one part after the other.
+As with the face-with-holes construction, the holes must not overlap each other or the outer outline.
+The open outlines (ERR913), the holes overlapping another hole or outside the outer outline (ERR914) and the self-intersecting outlines that the ear clipping can not cut (ERR949) are left to FreeCAD:
+design_output falls back to figure_to_freecad_25d_part() on these errors.
+"""
+
+################################################################
+# python behavior
+################################################################
+
+from __future__ import division # to get float division
+
+################################################################
+# import
+################################################################
+
+import math
+import struct
+import hashlib
+import os
+import tempfile
+import argparse
+import numpy
+#
+import positioning_matrix
+import outline_backends # for sub_overlapping_holes()
+import design_help
+import cnc25d_error
+
+################################################################
+# global variable
+################################################################
+
+stl_chord_tolerance = 0.01 # maximal distance between an arc and its tessellation (in mm)
+# the errors of the figures that FreeCAD can still extrude (open outlines are extruded as wires, overlapping holes are cut with booleans)
+freecad_fallback_codes = ('ERR913', 'ERR914', 'ERR949')
+
+################################################################
+# tessellation
+################################################################
+
+def sub_arc_step(ai_radius, ai_chord_tolerance):
+  """ return the angle step that keeps the chords of a circle of radius ai_radius within ai_chord_tolerance
+  """
+  if(ai_chord_tolerance>=ai_radius):
+    r_step = math.pi/2
+  else:
+    r_step = 2*math.acos(1-ai_chord_tolerance/ai_radius)
+  return(r_step)
+
+def arc_center_and_sweep(ai_start_x, ai_start_y, ai_middle_x, ai_middle_y, ai_end_x, ai_end_y):
+  """ return (center_x, center_y, radius, start_angle, sweep_angle) of the arc going through the start, middle and end points
+      sweep_angle is positive for a counter-clockwise arc. Return None if the three points are aligned
+  """
+  (px, py, mx, my, ex, ey) = (ai_start_x, ai_start_y, ai_middle_x, ai_middle_y, ai_end_x, ai_end_y)
+  det = 2*((mx-px)*(ey-py)-(my-py)*(ex-px))
+  if(det==0):
+    return(None)
+  m2 = (mx-px)**2+(my-py)**2
+  e2 = (ex-px)**2+(ey-py)**2
+  cx = px+((ey-py)*m2-(my-py)*e2)/det
+  cy = py+((mx-px)*e2-(ex-px)*m2)/det
+  radius = math.sqrt((px-cx)**2+(py-cy)**2)
+  a_start = math.atan2(py-cy, px-cx)
+  a_end = math.atan2(ey-cy, ex-cx)
+  if(det>0): # counter-clockwise arc
+    sweep = (a_end-a_start)%(2*math.pi)
+  else:
+    sweep = -1*((a_start-a_end)%(2*math.pi))
+  r_arc = (cx, cy, radius, a_start, sweep)
+  return(r_arc)
+
+def outline_to_polygon(ai_outline, ai_chord_tolerance=stl_chord_tolerance):
+  """ convert a closed format-B outline or a circle into a numpy array (n,2) of points
+      the arcs are tessellated with the chord tolerance ai_chord_tolerance. The last point (equal to the first one) is not repeated
+  """
+  if(not isinstance(ai_outline[0], (list,tuple))): # circle
+    (cx, cy, radius) = ai_outline
+    point_nb = max(8, int(math.ceil(2*math.pi/sub_arc_step(radius, ai_chord_tolerance))))
+    angles = numpy.arange(point_nb)*2*math.pi/point_nb
+    r_polygon = numpy.column_stack((cx+radius*numpy.cos(angles), cy+radius*numpy.sin(angles)))
+    return(r_polygon)
+  if((ai_outline[0][0]!=ai_outline[-1][-2])or(ai_outline[0][1]!=ai_outline[-1][-1])):
+    raise cnc25d_error.Cnc25dBackendError("ERR913: Error, the outline is not closed. It can not be extruded into a mesh")
+  points = []
+  (px, py) = (ai_outline[0][0], ai_outline[0][1])
+  for seg in ai_outline[1:]:
+    (ex, ey) = (seg[-2], seg[-1])
+    points.append((px, py))
+    if(len(seg)==4):
+      arc = arc_center_and_sweep(px, py, seg[0], seg[1], ex, ey)
+      if(arc!=None):
+        (cx, cy, radius, a_start, sweep) = arc
+        seg_nb = max(1, int(math.ceil(abs(sweep)/sub_arc_step(radius, ai_chord_tolerance))))
+        for k in range(1, seg_nb):
+          a = a_start+k*sweep/seg_nb
+          points.append((cx+radius*math.cos(a), cy+radius*math.sin(a)))
+    (px, py) = (ex, ey)
+  r_polygon = numpy.array(points, dtype=numpy.float64)
+  return(r_polygon)
+
+def polygon_area_sum(ai_points, ai_triangles):
+  """ return the sum of the signed areas of the triangles ai_triangles (index triplets in ai_points)
+  """
+  corners = ai_points[ai_triangles]
+  r_area = 0.5*((corners[:,1,0]-corners[:,0,0])*(corners[:,2,1]-corners[:,0,1])-(corners[:,1,1]-corners[:,0,1])*(corners[:,2,0]-corners[:,0,0])).sum()
+  return(r_area)
+
+def polygon_area(ai_polygon):
+  """ return the signed area of the polygon (positive for counter-clockwise)
+  """
+  x = ai_polygon[:,0]
+  y = ai_polygon[:,1]
+  r_area = 0.5*(numpy.dot(x, numpy.roll(y, -1))-numpy.dot(numpy.roll(x, -1), y))
+  return(r_area)
+
+################################################################
+# triangulation
+################################################################
+
+def sub_bridge_hole(ai_outer, ai_hole):
+  """ merge the clockwise hole ai_hole into the counter-clockwise polygon ai_outer (lists of (x,y)) with a bridge from the rightmost hole vertex
+      the bridge end on the outer polygon is chosen visible from the hole vertex (David Eberly method)
+  """
+  m = max(range(len(ai_hole)), key=lambda i: ai_hole[i][0])
+  (mx, my) = ai_hole[m]
+  # ray from M to +x: closest edge intersection
+  best_x = None
+  best_p = None
+  n = len(ai_outer)
+  for i in range(n):
+    (ax, ay) = ai_outer[i]
+    (bx, by) = ai_outer[(i+1)%n]
+    if((ay>my)==(by>my)):
+      continue
+    ix = ax+(my-ay)*(bx-ax)/(by-ay)
+    if((ix>=mx)and((best_x==None)or(ix<best_x))):
+      best_x = ix
+      if(ax>bx):
+        best_p = i
+      else:
+        best_p = (i+1)%n
+  if(best_p==None):
+    raise cnc25d_error.Cnc25dBackendError("ERR914: Error, a hole is not inside the outer outline")
+  # a vertex inside the triangle (M, I, P) would hide P: take the one with the smallest angle to the ray
+  (px, py) = ai_outer[best_p]
+  tri = ((mx, my), (best_x, my), (px, py))
+  best_angle = None
+  for i in range(n):
+    (qx, qy) = ai_outer[i]
+    if(((qx, qy)==(px, py))or(qx<mx)):
+      continue
+    if(sub_point_in_triangle(tri, qx, qy)):
+      angle = abs(math.atan2(qy-my, qx-mx))
+      if((best_angle==None)or(angle<best_angle)or((angle==best_angle)and(qx<ai_outer[best_p][0]))):
+        best_angle = angle
+        best_p = i
+  # when P is a duplicated bridge vertex, take the copy whose sector contains M
+  for i in range(n):
+    if((ai_outer[i]==ai_outer[best_p])and sub_locally_inside(ai_outer[i-1], ai_outer[i], ai_outer[(i+1)%n], (mx, my))):
+      best_p = i
+      break
+  r_polygon = ai_outer[:best_p+1] + ai_hole[m:] + ai_hole[:m+1] + ai_outer[best_p:]
+  return(r_polygon)
+
+def sub_polygon_box(ai_polygon):
+  """ return the bounding box (xmin, ymin, xmax, ymax) of the polygon ai_polygon (numpy array (n,2))
+  """
+  r_box = tuple(ai_polygon.min(axis=0).tolist() + ai_polygon.max(axis=0).tolist())
+  return(r_box)
+
+def sub_edges_cross(ai_polygon_a, ai_polygon_b):
+  """ check if an edge of the polygon ai_polygon_a crosses an edge of the polygon ai_polygon_b (numpy arrays (n,2))
+      the edges that only touch each other are not counted
+  """
+  (a0, a1) = (ai_polygon_a[:,numpy.newaxis,:], numpy.roll(ai_polygon_a, -1, axis=0)[:,numpy.newaxis,:])
+  (b0, b1) = (ai_polygon_b[numpy.newaxis,:,:], numpy.roll(ai_polygon_b, -1, axis=0)[numpy.newaxis,:,:])
+  def sub_cross(ai_o, ai_u, ai_v):
+    """ z-component of the cross product (u-o)x(v-o)
+    """
+    return((ai_u[...,0]-ai_o[...,0])*(ai_v[...,1]-ai_o[...,1])-(ai_u[...,1]-ai_o[...,1])*(ai_v[...,0]-ai_o[...,0]))
+  crossing = (sub_cross(a0, a1, b0)*sub_cross(a0, a1, b1)<0)&(sub_cross(b0, b1, a0)*sub_cross(b0, b1, a1)<0)
+  r_cross = bool(numpy.any(crossing))
+  return(r_cross)
+
+def sub_point_in_polygon(ai_polygon, ai_x, ai_y):
+  """ check if the point (ai_x, ai_y) is inside the polygon ai_polygon (numpy array (n,2)) with the even-odd rule
+  """
+  (x0, y0) = (ai_polygon[:,0], ai_polygon[:,1])
+  (x1, y1) = (numpy.roll(x0, -1), numpy.roll(y0, -1))
+  straddle = ((y0>ai_y)!=(y1>ai_y))
+  with numpy.errstate(divide='ignore', invalid='ignore'):
+    x_cross = x0+(ai_y-y0)*(x1-x0)/(y1-y0)
+  r_inside = bool(numpy.sum(straddle&(x_cross>ai_x))%2==1)
+  return(r_inside)
+
+def check_holes(ai_outer, ai_holes):
+  """ raise ERR914 if a hole overlaps another hole or is not inside the outer polygon
+      each hole is compared with the outer polygon (a hole in a concave part has its box inside the outer box)
+      the bounding boxes select the holes to compare with each other with outline_backends.sub_overlapping_holes()
+  """
+  for (i, hole) in enumerate(ai_holes):
+    if(sub_edges_cross(hole, ai_outer) or (not sub_point_in_polygon(ai_outer, hole[0,0], hole[0,1]))):
+      raise cnc25d_error.Cnc25dBackendError("ERR914: Error, the hole {:d} is not inside the outer outline".format(i+1))
+  hole_boxes = [ sub_polygon_box(hole) for hole in ai_holes ]
+  candidates = sorted(outline_backends.sub_overlapping_holes(sub_polygon_box(ai_outer), hole_boxes))
+  for i in candidates:
+    hole = ai_holes[i]
+    for j in candidates:
+      if(j<=i):
+        continue
+      (box_i, box_j) = (hole_boxes[i], hole_boxes[j])
+      if((box_i[0]>box_j[2])or(box_j[0]>box_i[2])or(box_i[1]>box_j[3])or(box_j[1]>box_i[3])):
+        continue
+      other = ai_holes[j]
+      if(sub_edges_cross(hole, other) or sub_point_in_polygon(other, hole[0,0], hole[0,1]) or sub_point_in_polygon(hole, other[0,0], other[0,1])):
+        raise cnc25d_error.Cnc25dBackendError("ERR914: Error, the holes {:d} and {:d} overlap".format(i+1, j+1))
+  return(0)
+
+def sub_locally_inside(ai_prev, ai_vertex, ai_next, ai_point):
+  """ check if the direction from ai_vertex to ai_point is inside the counter-clockwise polygon at the corner (ai_prev, ai_vertex, ai_next)
+  """
+  left_prev = ((ai_vertex[0]-ai_prev[0])*(ai_point[1]-ai_vertex[1])-(ai_vertex[1]-ai_prev[1])*(ai_point[0]-ai_vertex[0]))>=0
+  left_next = ((ai_next[0]-ai_vertex[0])*(ai_point[1]-ai_vertex[1])-(ai_next[1]-ai_vertex[1])*(ai_point[0]-ai_vertex[0]))>=0
+  convex = ((ai_vertex[0]-ai_prev[0])*(ai_next[1]-ai_vertex[1])-(ai_vertex[1]-ai_prev[1])*(ai_next[0]-ai_vertex[0]))>=0
+  if(convex):
+    r_inside = left_prev and left_next
+  else:
+    r_inside = left_prev or left_next
+  return(r_inside)
+
+def sub_point_in_triangle(ai_triangle, ai_x, ai_y):
+  """ check if the point (ai_x, ai_y) is inside or on the border of the triangle
+  """
+  ((ax, ay), (bx, by), (cx, cy)) = ai_triangle
+  d1 = (bx-ax)*(ai_y-ay)-(by-ay)*(ai_x-ax)
+  d2 = (cx-bx)*(ai_y-by)-(cy-by)*(ai_x-bx)
+  d3 = (ax-cx)*(ai_y-cy)-(ay-cy)*(ai_x-cx)
+  r_in = (((d1>=0)and(d2>=0)and(d3>=0))or((d1<=0)and(d2<=0)and(d3<=0)))
+  return(r_in)
+
+def sub_ear_clipping(ai_points):
+  """ triangulate the counter-clockwise (weakly) simple polygon ai_points (numpy array (n,2))
+      return a list of index triplets
+  """
+  n = ai_points.shape[0]
+  xs = ai_points[:,0]
+  ys = ai_points[:,1]
+  nxt = range(1, n) + [0]
+  prv = [n-1] + range(0, n-1)
+  active = numpy.ones(n, dtype=numpy.bool_)
+  r_triangles = []
+  remaining = n
+  i = 0
+  fail_nb = 0
+  while(remaining>3):
+    a = prv[i]
+    c = nxt[i]
+    cross = (xs[i]-xs[a])*(ys[c]-ys[i])-(ys[i]-ys[a])*(xs[c]-xs[i])
+    # when no ear is found after a complete turn, the ear can touch another vertex (a bridge vertex)
+    # after a second turn, the polygon is self-intersecting: triangulating any vertex would give a wrong cap
+    relax_level = fail_nb//remaining
+    if(relax_level>=2):
+      raise cnc25d_error.Cnc25dBackendError("ERR949: Error, the outline is self-intersecting. It can not be triangulated into a mesh")
+    is_ear = False
+    with_triangle = True
+    if(((xs[i]==xs[a])and(ys[i]==ys[a]))or((xs[i]==xs[c])and(ys[i]==ys[c]))or((xs[a]==xs[c])and(ys[a]==ys[c]))): # zero-length edge or spike
+      is_ear = True
+      with_triangle = False
+    elif(cross==0): # a flat vertex is kept as long as possible, a flat triangle keeps the mesh watertight
+      dot = (xs[i]-xs[a])*(xs[c]-xs[i])+(ys[i]-ys[a])*(ys[c]-ys[i])
+      is_ear = (dot<0)
+    elif(cross>0): # no other vertex of the polygon in the triangle (a, i, c)
+      d1 = (xs[i]-xs[a])*(ys-ys[a])-(ys[i]-ys[a])*(xs-xs[a])
+      d2 = (xs[c]-xs[i])*(ys-ys[i])-(ys[c]-ys[i])*(xs-xs[i])
+      d3 = (xs[a]-xs[c])*(ys-ys[c])-(ys[a]-ys[c])*(xs-xs[c])
+      if(relax_level==1):
+        inside = (d1>0)&(d2>0)&(d3>0)
+      else:
+        inside = (d1>=0)&(d2>=0)&(d3>=0)
+      for k in (a, i, c):
+        inside &= ~((xs==xs[k])&(ys==ys[k]))
+      is_ear = not numpy.any(inside&active)
+      if(is_ear): # a bridge vertex duplicated on a corner of the triangle must not have an edge entering the triangle
+        for (u, v, w) in ((c, a, i), (a, i, c), (i, c, a)):
+          for p in numpy.flatnonzero(active&(xs==xs[v])&(ys==ys[v])):
+            if(p!=v):
+              for q in (prv[p], nxt[p]):
+                dx = xs[q]-xs[v]
+                dy = ys[q]-ys[v]
+                if((((xs[v]-xs[u])*dy-(ys[v]-ys[u])*dx)>0)and(((xs[w]-xs[v])*dy-(ys[w]-ys[v])*dx)>0)):
+                  is_ear = False
+    if(is_ear):
+      if(with_triangle):
+        r_triangles.append((a, i, c))
+      active[i] = False
+      nxt[a] = c
+      prv[c] = a
+      remaining -= 1
+      i = c
+      fail_nb = 0
+    else:
+      i = c
+      fail_nb += 1
+  if(remaining==3):
+    r_triangles.append((prv[i], i, nxt[i]))
+  return(r_triangles)
+
+def triangulate_polygon_with_holes(ai_outer, ai_holes):
+  """ triangulate the polygon ai_outer (numpy array (n,2)) with the holes ai_holes (list of numpy arrays)
+      return (points, triangles): points is a numpy array (n,2) and triangles a numpy int array (m,3) of counter-clockwise triangles
+  """
+  outer = ai_outer
+  if(polygon_area(outer)<0):
+    outer = outer[::-1]
+  polygon = [ tuple(p) for p in outer.tolist() ]
+  holes = []
+  for hole in ai_holes:
+    if(polygon_area(hole)>0):
+      hole = hole[::-1]
+    holes.append([ tuple(p) for p in hole.tolist() ])
+  check_holes(outer, ai_holes)
+  holes.sort(key=lambda h: max([ p[0] for p in h ]), reverse=True)
+  for hole in holes:
+    polygon = sub_bridge_hole(polygon, hole)
+  r_points = numpy.array(polygon, dtype=numpy.float64)
+  r_triangles = numpy.array(sub_ear_clipping(r_points), dtype=numpy.int64).reshape(-1, 3)
+  return((r_points, r_triangles))
+
+################################################################
+# extrusion
+################################################################
+
+def figure_to_mesh(ai_figure, ai_extrude_height, ai_chord_tolerance=stl_chord_tolerance):
+  """ extrude the figure ai_figure (format-B, the first outline is the outer outline, the others are holes) of ai_extrude_height
+      return (vertices, triangles): vertices is a numpy array (n,3) and triangles a numpy int array (m,3) oriented outward
+  """
+  if(len(ai_figure)<1):
+    raise cnc25d_error.Cnc25dBackendError("ERR915: Error, the figure doesn't contain any outlines!")
+  polygons = []
+  for i_ol in ai_figure:
+    if(isinstance(i_ol[0], (list,tuple)) and (len(i_ol[0])!=2)):
+      raise cnc25d_error.Cnc25dBackendError("ERR916: Error, figure_to_mesh() requires format-B outlines. Convert them with cnc_cut_figure() or ideal_figure()")
+    polygons.append(outline_to_polygon(i_ol, ai_chord_tolerance))
+  # the caps
+  (cap_points, cap_triangles) = triangulate_polygon_with_holes(polygons[0], polygons[1:])
+  cap_nb = cap_points.shape[0]
+  vertices = [numpy.column_stack((cap_points, numpy.zeros(cap_nb))), numpy.column_stack((cap_points, numpy.full(cap_nb, ai_extrude_height)))]
+  triangles = [cap_triangles[:,::-1], cap_triangles+cap_nb] # the bottom cap looks down
+  offset = 2*cap_nb
+  # the side walls (counter-clockwise outer outline, clockwise holes: the normals look out of the material)
+  for i in range(len(polygons)):
+    ring = polygons[i]
+    area = polygon_area(ring)
+    if(((i==0)and(area<0))or((i>0)and(area>0))):
+      ring = ring[::-1]
+    ring_nb = ring.shape[0]
+    vertices.append(numpy.column_stack((ring, numpy.zeros(ring_nb))))
+    vertices.append(numpy.column_stack((ring, numpy.full(ring_nb, ai_extrude_height))))
+    b0 = offset+numpy.arange(ring_nb)
+    b1 = offset+(numpy.arange(ring_nb)+1)%ring_nb
+    t0 = b0+ring_nb
+    t1 = b1+ring_nb
+    triangles.append(numpy.column_stack((b0, b1, t1)))
+    triangles.append(numpy.column_stack((b0, t1, t0)))
+    offset += 2*ring_nb
+  r_mesh = (numpy.vstack(vertices), numpy.vstack(triangles))
+  return(r_mesh)
+
+################################################################
+# STL writer
+################################################################
+
+stl_record = numpy.dtype([('normal', '<f4', (3,)), ('vertex', '<f4', (3,3)), ('attribute', '<u2')])
+
+def write_stl_binary(ai_meshes, ai_filename):
+  """ write the meshes ai_meshes (iterable of (vertices, triangles)) in the binary STL file ai_filename
+      the meshes are written one after the other, so an iterator (generator) keeps only one mesh in memory
+  """
+  ofh = open(ai_filename, 'wb')
+  ofh.write(struct.pack('<80sI', 'binary STL generated by Cnc25D', 0))
+  triangle_nb = 0
+  for (vertices, triangles) in ai_meshes:
+    corners = vertices[triangles] # (m,3,3)
+    normals = numpy.cross(corners[:,1]-corners[:,0], corners[:,2]-corners[:,0])
+    lengths = numpy.sqrt((normals**2).sum(axis=1))
+    lengths[lengths==0] = 1
+    records = numpy.zeros(triangles.shape[0], dtype=stl_record)
+    records['normal'] = normals/lengths[:,numpy.newaxis]
+    records['vertex'] = corners
+    records.tofile(ofh)
+    triangle_nb += triangles.shape[0]
+  ofh.seek(80)
+  ofh.write(struct.pack('<I', triangle_nb))
+  ofh.close()
+  return(triangle_nb)
+
+def figure_to_stl(ai_figure, ai_extrude_height, ai_filename, ai_chord_tolerance=stl_chord_tolerance):
+  """ extrude the figure ai_figure and write it in the binary STL file ai_filename
+  """
+  print("Generate with the mesh extruder the STL file {:s}".format(ai_filename))
+  write_stl_binary([figure_to_mesh(ai_figure, ai_extrude_height, ai_chord_tolerance)], ai_filename)
+  return(0)
+
+def sub_assembly_meshes(ai_figure_assembly, ai_chord_tolerance):
+  """ generator of the placed meshes of a 3D assembly configuration. Each distinct part is extruded once
+  """
+  part_meshes = {}
+  for conf in ai_figure_assembly:
+    if(len(conf)!=11):
+      raise cnc25d_error.Cnc25dBackendError("ERR917: Error len of the assembly configuration {:d} must be 11".format(len(conf)))
+    (part_figure, zero_x, zero_y, size_x, size_y, size_z, flip, orientation, translate_x, translate_y, translate_z) = conf
+    part_key = (hashlib.sha1(repr(part_figure)).hexdigest(), size_z)
+    if(not part_key in part_meshes):
+      part_meshes[part_key] = figure_to_mesh(part_figure, size_z, ai_chord_tolerance)
+    (vertices, triangles) = part_meshes[part_key]
+    plank_matrix = numpy.dot(positioning_matrix.place_plank_matrix(size_x, size_y, size_z, flip, orientation, translate_x, translate_y, translate_z), positioning_matrix.translation_matrix(-1*zero_x, -1*zero_y, 0))
+    yield((positioning_matrix.transform_points(plank_matrix, vertices), triangles))
+
+def figures_to_stl_assembly(ai_figure_assembly, ai_filename, ai_chord_tolerance=stl_chord_tolerance):
+  """ extrude and place the figures of the 3D assembly configuration ai_figure_assembly and write them in the binary STL file ai_filename
+      the parts are not fused: their meshes are just written one after the other
+  """
+  if(len(ai_figure_assembly)<1):
+    raise cnc25d_error.Cnc25dBackendError("ERR918: the assembly must contain at least one figure")
+  print("Generate with the mesh extruder the STL file {:s}".format(ai_filename))
+  write_stl_binary(sub_assembly_meshes(ai_figure_assembly, ai_chord_tolerance), ai_filename)
+  return(0)
+
+
+################################################################
+# ******** test API ***********
+################################################################
+
+def mesh_volume(ai_mesh):
+  """ return the signed volume of the mesh (positive if the triangles are oriented outward)
+  """
+  (vertices, triangles) = ai_mesh
+  corners = vertices[triangles]
+  r_volume = numpy.einsum('ij,ij->i', corners[:,0], numpy.cross(corners[:,1], corners[:,2])).sum()/6
+  return(r_volume)
+
+def mesh_open_edge_nb(ai_mesh):
+  """ return the number of directed edges (compared with their coordinates) that are not balanced by an edge in the opposite direction
+      a watertight mesh returns 0
+  """
+  (vertices, triangles) = ai_mesh
+  edge_count = {}
+  for tri in triangles:
+    for k in range(3):
+      p = tuple(numpy.round(vertices[tri[k]], 9))
+      q = tuple(numpy.round(vertices[tri[(k+1)%3]], 9))
+      if(p!=q):
+        edge_count[(p,q)] = edge_count.get((p,q), 0) + 1
+  r_nb = 0
+  for (p,q) in edge_count.keys():
+    r_nb += abs(edge_count[(p,q)] - edge_count.get((q,p), 0))
+  return(r_nb)
+
+def mesh_extrusion_test1():
+  """ check the triangulation, the watertightness and the binary STL writer on a few figures
+  """
+  r_test = 1
+  height = 5.0
+  # concave outer outline with arcs, a circle hole and an outline hole in the concave part
+  mt_outer = [
+    [0,0],
+    [60,0],
+    [60,40],
+    [40,40],
+    [30,30, 20,40],
+    [0,40],
+    [0,0]]
+  mt_hole1 = [10,10,4]
+  mt_hole2 = [
+    [40,5],
+    [50,5],
+    [55,10, 50,15],
+    [40,15],
+    [40,5]]
+  mt_hole3 = [
+    [25,24],
+    [35,24],
+    [35,28],
+    [25,28],
+    [25,24]]
+  test_figures = (
+    ('square', [[[0,0],[10,0],[10,10],[0,10],[0,0]]]),
+    ('circle', [[0,0,7]]),
+    ('outer_and_holes', [mt_outer, mt_hole1, mt_hole2]),
+    ('hole_in_concave_part', [mt_outer, mt_hole1, mt_hole2, mt_hole3]))
+  for (name, figure) in test_figures:
+    polygons = [ outline_to_polygon(ol) for ol in figure ]
+    expected_area = abs(polygon_area(polygons[0])) - sum([ abs(polygon_area(p)) for p in polygons[1:] ])
+    (cap_points, cap_triangles) = triangulate_polygon_with_holes(polygons[0], polygons[1:])
+    cap_area = polygon_area_sum(cap_points, cap_triangles)
+    mesh = figure_to_mesh(figure, height)
+    volume = mesh_volume(mesh)
+    open_edge_nb = mesh_open_edge_nb(mesh)
+    print("mesh_extrusion {:s}: {:d} triangles, cap area {:0.4f} (expected {:0.4f}), volume {:0.4f}, open edges {:d}".format(name, mesh[1].shape[0], cap_area, expected_area, volume, open_edge_nb))
+    if(abs(cap_area-expected_area)>1e-6*expected_area):
+      print("ERR: the triangulation of {:s} doesn't cover the figure".format(name))
+      r_test = 0
+    if(abs(volume-expected_area*height)>1e-6*expected_area*height):
+      print("ERR: the mesh of {:s} is not oriented outward".format(name))
+      r_test = 0
+    if(open_edge_nb!=0):
+      print("ERR: the mesh of {:s} is not watertight".format(name))
+      r_test = 0
+  # binary STL writer
+  (tmp_fd, tmp_stl) = tempfile.mkstemp(suffix='.stl')
+  os.close(tmp_fd)
+  mesh = figure_to_mesh(test_figures[2][1], height)
+  triangle_nb = write_stl_binary([mesh, mesh], tmp_stl)
+  ifh = open(tmp_stl, 'rb')
+  stl_content = ifh.read()
+  ifh.close()
+  os.remove(tmp_stl)
+  records = numpy.frombuffer(stl_content[84:], dtype=stl_record)
+  if((triangle_nb!=2*mesh[1].shape[0])or(len(stl_content)!=84+50*triangle_nb)or(struct.unpack('<I', stl_content[80:84])[0]!=triangle_nb)):
+    print("ERR: the size of the binary STL is wrong")
+    r_test = 0
+  elif(numpy.abs(records['vertex'][:mesh[1].shape[0]]-mesh[0][mesh[1]]).max()>1e-4):
+    print("ERR: the vertices of the binary STL are wrong")
+    r_test = 0
+  # the errors that make design_output fall back to FreeCAD
+  for (name, figure, code) in (
+    ('open_outline', [[[0,0],[10,0],[10,10]]], 'ERR913'),
+    ('hole_outside', [[[0,0],[10,0],[10,10],[0,10],[0,0]], [20,5,2]], 'ERR914'),
+    ('hole_crossing_outer', [[[0,0],[10,0],[10,10],[0,10],[0,0]], [10,5,2]], 'ERR914'),
+    ('overlapping_holes', [[[0,0],[100,0],[100,60],[0,60],[0,0]], [[20,20],[40,20],[40,40],[20,40],[20,20]], [[30,30],[50,30],[50,50],[30,50],[30,30]]], 'ERR914'),
+    ('self_intersecting', [[[0,0],[20,0],[20,10],[10,10],[10,-10],[0,-10],[0,0]]], 'ERR949')):
+    err_code = ''
+    try:
+      figure_to_mesh(figure, height)
+    except cnc25d_error.Cnc25dBackendError as err:
+      err_code = err.code
+    if((err_code!=code)or(not err_code in freecad_fallback_codes)):
+      print("ERR: the figure {:s} raises '{:s}' instead of {:s}".format(name, err_code, code))
+      r_test = 0
+  print("mesh_extrusion_test1: {:s}".format("OK" if r_test else "FAILED"))
+  return(r_test)
+
+################################################################
+# ******** command line interface ***********
+################################################################
+
+def mesh_extrusion_cli(ai_args=""):
+  """ command line interface to run this script in standalone
+  """
+  me_parser = argparse.ArgumentParser(description='Test the mesh_extrusion API.')
+  me_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
+    help='Run mesh_extrusion_test1()')
+  effective_args = design_help.get_effective_args(ai_args)
+  me_args = me_parser.parse_args(effective_args)
+  r_mec = 0
+  print("dbg111: start testing mesh_extrusion.py")
+  if(me_args.sw_test1):
+    r_mec = mesh_extrusion_test1()
+  print("dbg999: end of script")
+  return(r_mec)
+
+################################################################
+# main
+################################################################
+
+if __name__ == "__main__":
+  #mesh_extrusion_cli()
+  mesh_extrusion_cli("--test1")
+
@@ -0,0 +1,243 @@
+# outline_array.py
+# a compact outline representation backed by numpy arrays
+# created by agent on 2026/10/16
+#
+# (C) Copyright 2026 agent
+#
+# This file is part of the Cnc25D Python package.
+#
+# Cnc25D is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Cnc25D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cnc25D.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+outline_array.py provides the class Outline_Array, an alternative representation of the format-A, format-B and format-C outlines.
+The outline is stored in numpy arrays, so the transformations (shift, flip, rotate, reverse) are applied with a single vectorized operation.
+The conversion from and to the list-of-tuples formats is lossless.
+"""
+
+################################################################
+# python behavior
+################################################################
+
+from __future__ import division # to get float division
+
+################################################################
+# import
+################################################################
+
+import math
+import sys
+import numpy
+#
+import cnc_outline
+import cnc25d_error
+
+################################################################
+# Outline_Array class
+################################################################
+
+class Outline_Array():
+  """ An outline (format-A, format-B or format-C, except circle) stored in numpy arrays:
+      end: float array (n,2) of the end points. end[0] is the start point of the outline
+      mid: float array (n,2) of the arc middle points. mid[i] is the middle point of the segment ending at end[i]. mid[0] is not used
+      arc: boolean array (n,) that tells which segment is an arc
+      request: float array (n,) of the router_bit requests (or tangents for format-C). None for format-B
+  """
+
+  def __init__(self, ai_end, ai_mid, ai_arc, ai_request):
+    """ create an Outline_Array from its numpy arrays. Usually, use outline_to_array() instead
+    """
+    self.end = ai_end
+    self.mid = ai_mid
+    self.arc = ai_arc
+    self.request = ai_request
+
+  def __len__(self):
+    return(self.end.shape[0])
+
+  def outline_type(self):
+    """ return the outline type with the code of cnc_outline.check_outline_format()
+    """
+    r_type = 1
+    if(self.request is not None):
+      r_type = 2
+    return(r_type)
+
+  def is_closed(self):
+    """ check if the last point of the outline is the first point
+    """
+    r_closed = ((self.end[0,0]==self.end[-1,0])and(self.end[0,1]==self.end[-1,1]))
+    return(r_closed)
+
+  def copy(self):
+    """ return an independent copy of the Outline_Array
+    """
+    r_request = None
+    if(self.request is not None):
+      r_request = self.request.copy()
+    r_ola = Outline_Array(self.end.copy(), self.mid.copy(), self.arc.copy(), r_request)
+    return(r_ola)
+
+  def shift_xy(self, ai_x_offset, ai_x_coefficient, ai_y_offset, ai_y_coefficient):
+    """ vectorized version of cnc_outline.general_outline_shift_xy()
+        add the offset and multiply by coefficient the coordinates of all points. The outline is reversed if it is flipped.
+    """
+    if((ai_x_coefficient==0)or(ai_y_coefficient==0)):
+      raise cnc25d_error.Cnc25dOutlineError("ERR900: Error, a multiplication coefficient is set to zero: {:0.2f}  {:0.2f}".format(ai_x_coefficient, ai_y_coefficient))
+    if((ai_x_coefficient*ai_y_coefficient)<0):
+      i_ola = self.reverse()
+    else:
+      i_ola = self
+    coef = numpy.array([ai_x_coefficient, ai_y_coefficient], dtype=numpy.float64)
+    offset = numpy.array([ai_x_offset, ai_y_offset], dtype=numpy.float64)
+    r_request = None
+    if(i_ola.request is not None):
+      r_request = i_ola.request.copy()
+    r_ola = Outline_Array(i_ola.end*coef+offset, i_ola.mid*coef+offset, i_ola.arc.copy(), r_request)
+    return(r_ola)
+
+  def rotate(self, ai_ox, ai_oy, ai_rotation_angle):
+    """ vectorized version of cnc_outline.general_outline_rotate()
+        rotate all points of the angle ai_rotation_angle around the center (ai_ox, ai_oy)
+    """
+    cos_a = math.cos(ai_rotation_angle)
+    sin_a = math.sin(ai_rotation_angle)
+    rot = numpy.array([[cos_a, sin_a], [-1*sin_a, cos_a]], dtype=numpy.float64) # transposed matrix for the row-vector product
+    center = numpy.array([ai_ox, ai_oy], dtype=numpy.float64)
+    r_request = None
+    if(self.request is not None):
+      r_request = self.request.copy()
+    r_ola = Outline_Array(numpy.dot(self.end-center, rot)+center, numpy.dot(self.mid-center, rot)+center, self.arc.copy(), r_request)
+    return(r_ola)
+
+  def reverse(self):
+    """ vectorized version of cnc_outline.reverse_outline()
+        the last point becomes the first point. The router_bit request of a closed format-A outline is moved accordingly.
+    """
+    r_end = self.end[::-1].copy()
+    # the segment ending at end[n-2-i] in the reversed outline is the segment ending at end[n-1-i] in the original outline
+    r_mid = numpy.zeros_like(self.mid)
+    r_mid[1:] = self.mid[:0:-1]
+    r_arc = numpy.zeros_like(self.arc)
+    r_arc[1:] = self.arc[:0:-1]
+    r_request = None
+    if(self.request is not None):
+      r_request = self.request[::-1].copy()
+      if(self.is_closed()):
+        if(r_request[0]!=0):
+          print("WARN567: Warning, the last router_bit request of the closed outline is not set to zero: {:0.2f}".format(r_request[0]))
+        r_request[0] = r_request[-1]
+        r_request[-1] = 0
+    r_ola = Outline_Array(r_end, r_mid, r_arc, r_request)
+    return(r_ola)
+
+  def pattern_rotate(self, ai_ox, ai_oy, ai_angle_step, ai_copy_nb):
+    """ return the concatenation of ai_copy_nb copies of the outline, the copy k being rotated of k*ai_angle_step around (ai_ox, ai_oy)
+        all the copies are computed with a single vectorized operation (circular pattern)
+    """
+    angles = ai_angle_step*numpy.arange(ai_copy_nb)
+    cos_a = numpy.cos(angles)[:,numpy.newaxis]
+    sin_a = numpy.sin(angles)[:,numpy.newaxis]
+    r_arrays = []
+    for pts in (self.end, self.mid):
+      ix = (pts[:,0]-ai_ox)[numpy.newaxis,:]
+      iy = (pts[:,1]-ai_oy)[numpy.newaxis,:]
+      new_pts = numpy.empty((ai_copy_nb, pts.shape[0], 2), dtype=numpy.float64)
+      new_pts[:,:,0] = ai_ox+ix*cos_a-iy*sin_a
+      new_pts[:,:,1] = ai_oy+ix*sin_a+iy*cos_a
+      r_arrays.append(new_pts.reshape(-1, 2))
+    r_request = None
+    if(self.request is not None):
+      r_request = numpy.tile(self.request, ai_copy_nb)
+    r_ola = Outline_Array(r_arrays[0], r_arrays[1], numpy.tile(self.arc, ai_copy_nb), r_request)
+    return(r_ola)
+
+  def pattern_shift(self, ai_x_step, ai_y_step, ai_copy_nb):
+    """ return the concatenation of ai_copy_nb copies of the outline, the copy k being translated of k*(ai_x_step, ai_y_step)
+        all the copies are computed with a single vectorized operation (linear pattern)
+    """
+    steps = numpy.arange(ai_copy_nb)[:,numpy.newaxis,numpy.newaxis]*numpy.array([ai_x_step, ai_y_step], dtype=numpy.float64)
+    r_end = (self.end[numpy.newaxis,:,:]+steps).reshape(-1, 2)
+    r_mid = (self.mid[numpy.newaxis,:,:]+steps).reshape(-1, 2)
+    r_request = None
+    if(self.request is not None):
+      r_request = numpy.tile(self.request, ai_copy_nb)
+    r_ola = Outline_Array(r_end, r_mid, numpy.tile(self.arc, ai_copy_nb), r_request)
+    return(r_ola)
+
+  def to_outline(self):
+    """ convert back the Outline_Array into a list of tuples (format-A, format-B or format-C)
+    """
+    end = self.end.tolist()
+    mid = self.mid.tolist()
+    arc = self.arc.tolist()
+    r_outline = []
+    if(self.request is not None):
+      request = self.request.tolist()
+      r_outline.append((end[0][0], end[0][1], request[0]))
+      for i in range(1, len(end)):
+        if(arc[i]):
+          r_outline.append((mid[i][0], mid[i][1], end[i][0], end[i][1], request[i]))
+        else:
+          r_outline.append((end[i][0], end[i][1], request[i]))
+    else:
+      r_outline.append((end[0][0], end[0][1]))
+      for i in range(1, len(end)):
+        if(arc[i]):
+          r_outline.append((mid[i][0], mid[i][1], end[i][0], end[i][1]))
+        else:
+          r_outline.append((end[i][0], end[i][1]))
+    return(r_outline)
+
+################################################################
+# conversion functions
+################################################################
+
+def outline_to_array(ai_outline):
+  """ convert an outline (format-A, format-B or format-C) into an Outline_Array
+      circles are not supported
+  """
+  outline_type = cnc_outline.check_outline_format(ai_outline)
+  if(outline_type==0):
+    raise cnc25d_error.Cnc25dOutlineError("ERR901: Error, a circle can not be converted into an Outline_Array")
+  point_nb = len(ai_outline)
+  r_end = numpy.zeros((point_nb, 2), dtype=numpy.float64)
+  r_mid = numpy.zeros((point_nb, 2), dtype=numpy.float64)
+  r_arc = numpy.zeros(point_nb, dtype=numpy.bool_)
+  r_request = None
+  if(outline_type==2):
+    r_request = numpy.zeros(point_nb, dtype=numpy.float64)
+  line_len = outline_type+1 # 2 for format-B, 3 for format-A
+  for i in range(point_nb):
+    p = ai_outline[i]
+    len_p = len(p)
+    if(len_p==line_len):
+      r_end[i] = (p[0], p[1])
+    elif((len_p==line_len+2)and(i>0)):
+      r_arc[i] = True
+      r_mid[i] = (p[0], p[1])
+      r_end[i] = (p[2], p[3])
+    else:
+      raise cnc25d_error.Cnc25dOutlineError("ERR902: Error, the segment {:d} has an unexpected number of items {:d}".format(i, len_p))
+    if(outline_type==2):
+      r_request[i] = p[-1]
+  r_ola = Outline_Array(r_end, r_mid, r_arc, r_request)
+  return(r_ola)
+
+def array_to_outline(ai_ola):
+  """ convert an Outline_Array back into a list of tuples
+  """
+  r_outline = ai_ola.to_outline()
+  return(r_outline)
+
@@ -36,7 +36,7 @@ from __future__ import division # to get float division
 ################################################################
 
 import importing_freecad
-importing_freecad.importing_freecad()
+#importing_freecad.importing_freecad() # FreeCAD is imported on first use by lazy_import
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -46,18 +46,21 @@ importing_freecad.importing_freecad()
 # import
 ################################################################
 
-import Part
-from FreeCAD import Base
+from lazy_import import Part
+from lazy_import import Base
 import math
 import sys, argparse
-import svgwrite
-from dxfwrite import DXFEngine
-import Tkinter
+import gzip # for the svgz files
+import collections # OrderedDict for the tkinter tessellation cache
+from lazy_import import svgwrite
+from lazy_import import DXFEngine
+from lazy_import import Tkinter
 import time # for time.sleep to help Tkinter to finish properly
 import display_backend
 import cnc_outline # just used in figure_simple_display() for cnc_outline.outline_rotate, closed(), check_outline_format() and ideal_outline()
 import export_2d # just for test enhancement
 import design_help # just for get_effective_args() and mkdir_p
+import cnc25d_error
 
 
 ################################################################
@@ -68,22 +71,41 @@ unit_circle_resolution = 12 #6
 #default_dxf_layer_name = 'CNC25D'
 global_epsilon_length = math.pi/1000
 global_epsilon_angle = math.pi/10000
+svg_stream_precision = 3 # number of decimals of the coordinates written by write_figure_in_svg_stream()
+svg_stream_style = 'fill="none" stroke="black" stroke-width="1"'
+dxf_stream_precision = 6 # number of decimals of the coordinates written by write_figure_in_dxf_stream()
+# tessellated tkinter outlines: (outline, zoom_level) -> tkinter lines
+tkinter_tessellation_cache = collections.OrderedDict()
+tkinter_tessellation_cache_max_size = 512
+tkinter_zoom_level_per_octave = 4 # the pixel scale is rounded up to 2**(zoom_level/tkinter_zoom_level_per_octave)
 
 ################################################################
 # ******** sub-functions for the API ***********
 ################################################################
 
-def complete_circle(ai_center, ai_radius, ai_resolution):
+def chord_angle_step(ai_radius, ai_chord_tolerance):
+  """ return the angle step that keeps the chords of a circle of radius ai_radius within ai_chord_tolerance of the circle
+  """
+  if(ai_chord_tolerance>=ai_radius):
+    r_step = math.pi/2
+  else:
+    r_step = 2*math.acos(1-ai_chord_tolerance/float(ai_radius))
+  return(r_step)
+
+def complete_circle(ai_center, ai_radius, ai_resolution, ai_chord_tolerance=0):
   """ Generate a list of points that creates a circle with the resolution ai_resolution.
       ai_resolution sets the mamximum number of intermediate points to create
+      if ai_chord_tolerance is positive, the number of points is set by the chord tolerance instead of ai_resolution
   """
   r_points = []
   # calculation of the angle resolution:
-  if(ai_resolution<3):
-    print("ERR821: The ai_resolution is smaller than 3. Current ai_resolution = {:d}".format(ai_resolution))
-    sys.exit(2)
-  #print("dbg424: ai_radius:", ai_radius)
-  circle_resolution = int(ai_resolution * ai_radius) # circle resolution increase with the radius
+  if(ai_chord_tolerance>0):
+    circle_resolution = max(4, int(math.ceil(2*math.pi/chord_angle_step(ai_radius, ai_chord_tolerance))))
+  else:
+    if(ai_resolution<3):
+      raise cnc25d_error.Cnc25dBackendError("ERR821: The ai_resolution is smaller than 3. Current ai_resolution = {:d}".format(ai_resolution))
+    #print("dbg424: ai_radius:", ai_radius)
+    circle_resolution = int(ai_resolution * ai_radius) # circle resolution increase with the radius
   angle_resolution = 2*math.pi/circle_resolution
   # create the list of points
   for i in range(circle_resolution):
@@ -110,25 +132,20 @@ def arc_3_points_to_radius_center_angles(ai_start, ai_middle, ai_end):
   #print("dbg747: length_epsilon:", length_epsilon)
   # check
   if((ptax==ptbx)and(ptay==ptby)):
-    print("ERR807: Error, point_A and point_B are identical!")
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dBackendError("ERR807: Error, point_A and point_B are identical!")
   if((ptbx==ptcx)and(ptby==ptcy)):
-    print("ERR808: Error, point_B and point_C are identical!")
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dBackendError("ERR808: Error, point_B and point_C are identical!")
   if((ptax==ptcx)and(ptay==ptcy)):
-    print("ERR809: Error, point_A and point_C are identical!")
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dBackendError("ERR809: Error, point_A and point_C are identical!")
   ## check the documentation for the explanation of the following calculation
   # length of [AB] and [BC]
   lab = math.sqrt((ptbx-ptax)**2+(ptby-ptay)**2)
   lbc = math.sqrt((ptcx-ptbx)**2+(ptcy-ptby)**2)
   if(lab<length_epsilon):
-    print("ERR811: Error, A and B are almost identical")
     print("dbg559: pta={:0.2f} {:0.2f}  ptb={:0.2f} {:0.2f}  ptc={:0.2f} {:0.2f}".format(ptax, ptay, ptbx, ptby, ptcx, ptcy))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dBackendError("ERR811: Error, A and B are almost identical")
   if(lbc<length_epsilon):
-    print("ERR812: Error, B and C are almost identical")
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dBackendError("ERR812: Error, B and C are almost identical")
   # calculation of cos(e), cos(f), sin(e) and sin(f)
   cos_e = (ptbx-ptax)/lab
   cos_f = (ptcx-ptbx)/lbc
@@ -166,11 +183,9 @@ def arc_3_points_to_radius_center_angles(ai_start, ai_middle, ai_end):
   liy = sin_e*cos_f-sin_f*cos_e
   kiy = cos_f*(cos_e*ptmx+sin_e*ptmy)-cos_e*(cos_f*ptnx+sin_f*ptny)
   if(abs(lix)<angle_epsilon):
-    print("ERR813: Error, A, B and C are almost colinear. Arc can not be created!")
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dBackendError("ERR813: Error, A, B and C are almost colinear. Arc can not be created!")
   if(abs(liy)<angle_epsilon):
-    print("ERR814: Error, A, B and C are almost colinear. Arc can not be created!")
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dBackendError("ERR814: Error, A, B and C are almost colinear. Arc can not be created!")
   #print("dbg124: lix:", lix)
   #print("dbg125: kix:", kix)
   #print("dbg126: liy:", liy)
@@ -185,13 +200,11 @@ def arc_3_points_to_radius_center_angles(ai_start, ai_middle, ai_end):
   if(abs(lib-lia)>length_epsilon):
     #print("dbg404: lia:", lia)
     #print("dbg405: lib:", lib)
-    print("ERR815: I is not equidistant from A and B!")
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dBackendError("ERR815: I is not equidistant from A and B!")
   if(abs(lic-lib)>length_epsilon):
     #print("dbg402: lib:", lib)
     #print("dbg403: lic:", lic)
-    print("ERR816: I is not equidistant from B and C!")
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dBackendError("ERR816: I is not equidistant from B and C!")
   # calculation of the angle u=(Ix, IA) , v=(Ix, IB) and w=(Ix, IC)
   u = math.atan2(ptay-ptiy, ptax-ptix)
   v = math.atan2(ptby-ptiy, ptbx-ptix)
@@ -214,9 +227,10 @@ def arc_3_points_to_radius_center_angles(ai_start, ai_middle, ai_end):
   r_a3ptrca = (lia, ptix, ptiy, u, v, w, uv, vw, uw)
   return(r_a3ptrca)
 
-def arc_of_circle(ai_start, ai_middle, ai_end, ai_resolution):
+def arc_of_circle(ai_start, ai_middle, ai_end, ai_resolution, ai_chord_tolerance=0):
   """ From three points (list of 6 floats) creates a polyline (list of 2*n floats) representing the arc of circle defined by the three points
       ai_resolution sets the maximum number of intermediate points to create
+      if ai_chord_tolerance is positive, the number of points is set by the chord tolerance instead of ai_resolution
   """
   ### precision
   #epsilon = math.pi/1000 # can be used to compare radian and sine
@@ -230,12 +244,14 @@ def arc_of_circle(ai_start, ai_middle, ai_end, ai_resolution):
     return(r_polyline)
   ### real arc case
   # calculation of the angle resolution:
-  if(ai_resolution<3):
-    print("ERR821: The ai_resolution is smaller than 3. Current ai_resolution = {:d}".format(ai_resolution))
-    sys.exit(2)
-  #print("dbg414: arc radius: lia:", lia)
-  circle_resolution = ai_resolution * lia # angle resolution increase with the radius
-  ar = 2*math.pi/circle_resolution
+  if(ai_chord_tolerance>0):
+    ar = chord_angle_step(lia, ai_chord_tolerance)
+  else:
+    if(ai_resolution<3):
+      raise cnc25d_error.Cnc25dBackendError("ERR821: The ai_resolution is smaller than 3. Current ai_resolution = {:d}".format(ai_resolution))
+    #print("dbg414: arc radius: lia:", lia)
+    circle_resolution = ai_resolution * lia # angle resolution increase with the radius
+    ar = 2*math.pi/circle_resolution
   # number of intermediate point between A and B and step angle
   abip = int(abs(uv)/ar)
   absa = uv/(abip+1)
@@ -268,10 +284,9 @@ def outline_arc_line_with_freecad(ai_segments, ai_outline_closed):
   fc_outline = []
   for i in range(segment_nb-1):
     if((abs(ai_segments[i][-2]-ai_segments[i+1][-2])<length_epsilon)and(abs(ai_segments[i][-1]-ai_segments[i+1][-1])<length_epsilon)):
-      print("ERR264: Error, point of index {:d} and {:d} are identical. x {:0.5f}  y {:0.5f}".format(i,i+1, ai_segments[i][-2], ai_segments[i][-1]))
       #for j in range(segment_nb):
       #  print("dbg269: pt {:d}  x {:0.3f}  y {:0.3f}".format(j, ai_segments[j][-2], ai_segments[j][-1]))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dBackendError("ERR264: Error, point of index {:d} and {:d} are identical. x {:0.5f}  y {:0.5f}".format(i,i+1, ai_segments[i][-2], ai_segments[i][-1]))
   for i in range(segment_nb):
     segment_type = 'line'
     fc_vectors.append(Base.Vector(ai_segments[i+1][0], ai_segments[i+1][1], constant_z))
@@ -405,7 +420,39 @@ def outline_arc_line_with_dxfwrite(ai_segments, ai_outline_closed):
   r_outline = dxf_outline
   return(r_outline)
 
+def tkinter_tessellation():
+  """ return (zoom_level, chord_tolerance) of the tkinter tessellation
+      when display_backend.tkinter_pixel_scale is set by Two_Canvas, the chord tolerance in model unit comes from the pixel tolerance display_backend.tkinter_chord_tolerance
+      otherwise the arcs are tessellated in model space with unit_circle_resolution (zoom_level None, chord_tolerance 0)
+  """
+  r_tessellation = (None, 0)
+  if(display_backend.tkinter_pixel_scale>0):
+    zoom_level = int(math.ceil(tkinter_zoom_level_per_octave*math.log(display_backend.tkinter_pixel_scale, 2)))
+    pixel_scale = 2**(float(zoom_level)/tkinter_zoom_level_per_octave) # rounded up, so the tolerance is respected
+    r_tessellation = (zoom_level, display_backend.tkinter_chord_tolerance/pixel_scale)
+  return(r_tessellation)
+
+def sub_tkinter_cache(ai_key, ai_function, *ai_args):
+  """ return the tkinter lines of ai_key from the cache, or compute them with ai_function(*ai_args) and store them
+  """
+  if(ai_key in tkinter_tessellation_cache):
+    r_outline = tkinter_tessellation_cache.pop(ai_key)
+  else:
+    r_outline = ai_function(*ai_args)
+    if(len(tkinter_tessellation_cache)>=tkinter_tessellation_cache_max_size):
+      tkinter_tessellation_cache.popitem(last=False) # forget the least recently used outline
+  tkinter_tessellation_cache[ai_key] = r_outline
+  return(r_outline)
+
 def outline_arc_line_with_tkinter(ai_segments, ai_outline_closed):
+  """ Transform the arcs and lines outlines into tkinter lines
+      the result is cached per (outline, zoom level)
+  """
+  (zoom_level, chord_tolerance) = tkinter_tessellation()
+  r_outline = sub_tkinter_cache((tuple(map(tuple, ai_segments)), ai_outline_closed, zoom_level), sub_outline_arc_line_with_tkinter, ai_segments, ai_outline_closed, chord_tolerance)
+  return(r_outline)
+
+def sub_outline_arc_line_with_tkinter(ai_segments, ai_outline_closed, ai_chord_tolerance=0):
   """ Transform the arcs and lines outlines into tkinter lines
   """
   tkline_points = [tuple((ai_segments[0][0], ai_segments[0][1]))]
@@ -432,7 +479,7 @@ def outline_arc_line_with_tkinter(ai_segments, ai_outline_closed):
       tkinter_line = (point_start[0], point_start[1], point_end[0], point_end[1])
       tkline_outline.append(tkinter_line)
     elif(segment_type=='arc'):
-      arc_polyline = arc_of_circle(point_start, point_mid, point_end, unit_circle_resolution)
+      arc_polyline = arc_of_circle(point_start, point_mid, point_end, unit_circle_resolution, ai_chord_tolerance)
       arc_polyline_tk = []
       for i in range(len(arc_polyline)-1):
         arc_polyline_tk.append((arc_polyline[i][0], arc_polyline[i][1], arc_polyline[i+1][0], arc_polyline[i+1][1]))
@@ -442,8 +489,16 @@ def outline_arc_line_with_tkinter(ai_segments, ai_outline_closed):
 
 def outline_circle_with_tkinter(ai_center, ai_radius):
   """ Transform the circle outline into tkinter lines
+      the result is cached per (circle, zoom level)
   """
-  circle_points = complete_circle(ai_center, ai_radius, unit_circle_resolution)
+  (zoom_level, chord_tolerance) = tkinter_tessellation()
+  r_outline = sub_tkinter_cache((ai_center[0], ai_center[1], ai_radius, zoom_level), sub_outline_circle_with_tkinter, ai_center, ai_radius, chord_tolerance)
+  return(r_outline)
+
+def sub_outline_circle_with_tkinter(ai_center, ai_radius, ai_chord_tolerance=0):
+  """ Transform the circle outline into tkinter lines
+  """
+  circle_points = complete_circle(ai_center, ai_radius, unit_circle_resolution, ai_chord_tolerance)
   circle_polyline_tk = []
   for i in range(len(circle_points)-1):
     circle_polyline_tk.append((circle_points[i][0], circle_points[i][1], circle_points[i+1][0], circle_points[i+1][1]))
@@ -458,8 +513,7 @@ def outline_circle(ai_center, ai_radius, ai_backend):
   #r_outline = ''
   # check the radius
   if(ai_radius<=0):
-    print("ERR409: Error, the radius {:0.3f} is negative or null!".format(ai_radius))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dBackendError("ERR409: Error, the radius {:0.3f} is negative or null!".format(ai_radius))
   # select backend
   if(ai_backend=='freecad'):
     r_outline = Part.Circle(Base.Vector(ai_center[0], ai_center[1], 0), Base.Vector(0,0,1), ai_radius).toShape()
@@ -500,14 +554,12 @@ def outline_arc_line(ai_segments, ai_backend):
   #print("dbg205: ai_backend:", ai_backend)
   # check is ai_segments is a list or a tuple
   if(not isinstance(ai_segments, (tuple, list))):
-    print("ERR337: Error, ai_segments must be a list or a tuple")
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dBackendError("ERR337: Error, ai_segments must be a list or a tuple")
   # check if the outline is a circle or a general outline
   if(isinstance(ai_segments[0], (tuple, list))): # general outline
     # checks on ai_segments for general outline
     if(len(ai_segments)<2):
-      print("ERR509: Error, the segment list must contain at least 2 elements. Currently, len(ai_segments) = {:d}".format(len(ai_segments)))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dBackendError("ERR509: Error, the segment list must contain at least 2 elements. Currently, len(ai_segments) = {:d}".format(len(ai_segments)))
     # convert any format into format-B
     if(len(ai_segments[0])==3): # format-A or format-C
       print("WARN231: warning, format-A or format-C used in outline_arc_line() and must be converted in format-B with ideal_outline()")
@@ -515,12 +567,10 @@ def outline_arc_line(ai_segments, ai_backend):
     else:
       outline_B = ai_segments
     if(len(outline_B[0])!=2):
-      print("ERR403: Error, the first element of the segment list must have 2 elements. Currently, len(outline_B[0]) = {:d}".format(len(outline_B[0])))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dBackendError("ERR403: Error, the first element of the segment list must have 2 elements. Currently, len(outline_B[0]) = {:d}".format(len(outline_B[0])))
     for i in range(len(outline_B)):
       if((len(outline_B[i])!=2)and(len(outline_B[i])!=4)):
-        print("ERR405: Error, the length of the segment {:d} must be 2 or 4. Currently len(outline_B[i]) = {:d}".format(i, len(outline_B[i])))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dBackendError("ERR405: Error, the length of the segment {:d} must be 2 or 4. Currently len(outline_B[i]) = {:d}".format(i, len(outline_B[i])))
     # check if the outline is closed
     outline_closed = False
     if((outline_B[0][0]==outline_B[-1][-2])and(outline_B[0][1]==outline_B[-1][-1])):
@@ -537,9 +587,8 @@ def outline_arc_line(ai_segments, ai_backend):
       r_outline = outline_arc_line_with_tkinter(outline_B, outline_closed)
   else: # circle outline
     if(len(ai_segments)!=3):
-      print("ERR658: Error, circle outline must be a list of 3 floats (or int)! Current len: {:d}".format(len(ai_segments)))
       print("dbg368: ai_segments:", ai_segments)
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dBackendError("ERR658: Error, circle outline must be a list of 3 floats (or int)! Current len: {:d}".format(len(ai_segments)))
     r_outline = outline_circle((ai_segments[0], ai_segments[1]), ai_segments[2], ai_backend)
   return(r_outline)
 
@@ -623,12 +672,210 @@ def write_figure_in_dxf(ai_figure, ai_filename):
   object_dxf.save()
   return(0)
 
-def figure_to_freecad_25d_part(ai_figure, ai_extrude_height):
+def outline_arc_line_with_svg_path(ai_segments, ai_outline_closed, ai_precision=svg_stream_precision):
+  """ Generates the d-attribute of a SVG path element (M, L, A and Z commands) from a format-B outline
+      The arc flags are computed with the cross and dot products of the three points of the arc
+  """
+  pt_fmt = "{{:0.{:d}f}},{{:0.{:d}f}}".format(ai_precision, ai_precision)
+  d_cmds = ["M" + pt_fmt.format(ai_segments[0][0], ai_segments[0][1])]
+  (px, py) = (ai_segments[0][0], ai_segments[0][1])
+  for seg in ai_segments[1:]:
+    if(len(seg)==4):
+      (mx, my, ex, ey) = seg
+      # cross product (M-S)x(E-S): positive for a counter-clockwise arc
+      cross = (mx-px)*(ey-py)-(my-py)*(ex-px)
+      sm = math.sqrt((mx-px)**2+(my-py)**2)
+      me = math.sqrt((ex-mx)**2+(ey-my)**2)
+      if(abs(cross)<=1e-9*sm*me): # the three points are colinear
+        d_cmds.append("L" + pt_fmt.format(ex, ey))
+      else:
+        se = math.sqrt((ex-px)**2+(ey-py)**2)
+        radius = sm*me*se/(2*abs(cross))
+        # the arc is larger than a half circle when the angle SME is acute
+        large_arc_flag = 0
+        if(((px-mx)*(ex-mx)+(py-my)*(ey-my))>0):
+          large_arc_flag = 1
+        sweep_flag = 0
+        if(cross>0):
+          sweep_flag = 1
+        d_cmds.append("A{:s} 0 {:d},{:d} {:s}".format(pt_fmt.format(radius, radius), large_arc_flag, sweep_flag, pt_fmt.format(ex, ey)))
+    else:
+      (ex, ey) = seg
+      d_cmds.append("L" + pt_fmt.format(ex, ey))
+    (px, py) = (ex, ey)
+  if(ai_outline_closed):
+    d_cmds.append("Z")
+  r_d = ' '.join(d_cmds)
+  return(r_d)
+
+def write_figure_in_svg_stream(ai_figure, ai_filename, ai_precision=svg_stream_precision, ai_gzip=False):
+  """ Generate the SVG file ai_filename from the figure ai_figure (list of format B outline) without building the svgwrite object tree
+      Each outline is written as one path element directly in the file. If ai_gzip is True or if the suffix is .svgz, the file is gzip-compressed
+  """
+  print("Generate with the streaming writer the SVG file {:s}".format(ai_filename))
+  if(ai_gzip or ai_filename.endswith('.svgz')):
+    ofh = gzip.open(ai_filename, 'wb')
+  else:
+    ofh = open(ai_filename, 'w')
+  ofh.write('<?xml version="1.0" encoding="utf-8" ?>\n')
+  ofh.write('<svg baseProfile="full" height="100%" version="1.1" width="100%" xmlns="http://www.w3.org/2000/svg" xmlns:ev="http://www.w3.org/2001/xml-events" xmlns:xlink="http://www.w3.org/1999/xlink">\n')
+  nb_fmt = "{{:0.{:d}f}}".format(ai_precision)
+  for i in range(len(ai_figure)):
+    i_ol = ai_figure[i]
+    ol_type = cnc_outline.check_outline_format(i_ol)
+    if(ol_type==0): # circle
+      if(i_ol[2]<=0):
+        raise cnc25d_error.Cnc25dBackendError("ERR905: Error, the radius {:0.3f} of the circle {:d} is negative or null!".format(i_ol[2], i))
+      ofh.write('<circle cx="{:s}" cy="{:s}" r="{:s}" {:s} />\n'.format(nb_fmt.format(i_ol[0]), nb_fmt.format(i_ol[1]), nb_fmt.format(i_ol[2]), svg_stream_style))
+    else:
+      if(ol_type==2):
+        print("WARN906: warning, format-A or format-C used in write_figure_in_svg_stream() and must be converted in format-B with ideal_outline()")
+        i_ol = cnc_outline.ideal_outline(i_ol, "write_figure_in_svg_stream")
+      outline_closed = ((i_ol[0][0]==i_ol[-1][-2])and(i_ol[0][1]==i_ol[-1][-1]))
+      ofh.write('<path d="{:s}" {:s} />\n'.format(outline_arc_line_with_svg_path(i_ol, outline_closed, ai_precision), svg_stream_style))
+  ofh.write('</svg>\n')
+  ofh.close()
+  return(0)
+
+def outline_arc_line_with_dxf_bulge(ai_segments, ai_outline_closed):
+  """ Convert a format-B outline into the vertex list of a DXF POLYLINE: a list of (x, y, bulge)
+      The bulge of a vertex describes the segment starting at this vertex: tan(theta/4), theta being the included angle of the arc (positive for counter-clockwise)
+      If the outline is closed, the last point is not repeated and the bulge of the last vertex describes the closing segment
+  """
+  r_vertices = []
+  (px, py) = (ai_segments[0][0], ai_segments[0][1])
+  for seg in ai_segments[1:]:
+    bulge = 0.0
+    if(len(seg)==4):
+      (mx, my, ex, ey) = seg
+      # the included angle theta is 2*(pi-SME), so tan(theta/4) = cot(SME/2)
+      cross = (px-mx)*(ey-my)-(py-my)*(ex-mx)
+      dot = (px-mx)*(ex-mx)+(py-my)*(ey-my)
+      sme = math.atan2(abs(cross), dot)
+      if(sme>0):
+        bulge = 1/math.tan(sme/2)
+        if(cross>0): # (S-M)x(E-M) positive means a clockwise arc
+          bulge = -1*bulge
+    else:
+      (ex, ey) = seg
+    r_vertices.append((px, py, bulge))
+    (px, py) = (ex, ey)
+  if(not ai_outline_closed):
+    r_vertices.append((px, py, 0.0))
+  return(r_vertices)
+
+def write_figure_in_dxf_stream(ai_figure, ai_filename, ai_polyline=True, ai_precision=dxf_stream_precision):
+  """ Generate the DXF R12 file ai_filename from the figure ai_figure (list of format B outline) without dxfwrite
+      If ai_polyline is True (default), each outline is written as one POLYLINE entity with its VERTEX entities. The arcs are described by the bulges of the vertices
+      If ai_polyline is False, each segment is written as a LINE or ARC entity
+  """
+  print("Generate with the streaming writer the DXF file {:s}".format(ai_filename))
+  nb_fmt = "{{:0.{:d}f}}".format(ai_precision)
+  ofh = open(ai_filename, 'w')
+  ofh.write("0\nSECTION\n2\nHEADER\n9\n$ACADVER\n1\nAC1009\n0\nENDSEC\n")
+  ofh.write("0\nSECTION\n2\nENTITIES\n")
+  for i in range(len(ai_figure)):
+    i_ol = ai_figure[i]
+    ol_type = cnc_outline.check_outline_format(i_ol)
+    if(ol_type==0): # circle
+      if(i_ol[2]<=0):
+        raise cnc25d_error.Cnc25dBackendError("ERR907: Error, the radius {:0.3f} of the circle {:d} is negative or null!".format(i_ol[2], i))
+      ofh.write("0\nCIRCLE\n8\n0\n10\n{:s}\n20\n{:s}\n30\n0.0\n40\n{:s}\n".format(nb_fmt.format(i_ol[0]), nb_fmt.format(i_ol[1]), nb_fmt.format(i_ol[2])))
+      continue
+    if(ol_type==2):
+      print("WARN908: warning, format-A or format-C used in write_figure_in_dxf_stream() and must be converted in format-B with ideal_outline()")
+      i_ol = cnc_outline.ideal_outline(i_ol, "write_figure_in_dxf_stream")
+    outline_closed = ((i_ol[0][0]==i_ol[-1][-2])and(i_ol[0][1]==i_ol[-1][-1]))
+    if(ai_polyline):
+      vertices = outline_arc_line_with_dxf_bulge(i_ol, outline_closed)
+      # 66: the VERTEX entities follow, 70: closed polyline flag
+      ofh.write("0\nPOLYLINE\n8\n0\n66\n1\n10\n0.0\n20\n0.0\n30\n0.0\n70\n{:d}\n".format(int(outline_closed)))
+      for (vx, vy, vb) in vertices:
+        ofh.write("0\nVERTEX\n8\n0\n10\n{:s}\n20\n{:s}\n30\n0.0\n".format(nb_fmt.format(vx), nb_fmt.format(vy)))
+        if(vb!=0):
+          ofh.write("42\n{:0.12f}\n".format(vb))
+      ofh.write("0\nSEQEND\n8\n0\n")
+    else:
+      (px, py) = (i_ol[0][0], i_ol[0][1])
+      for seg in i_ol[1:]:
+        (ex, ey) = (seg[-2], seg[-1])
+        lia = 0
+        if(len(seg)==4):
+          (lia, ptix, ptiy, u, v, w, uv, vw, uw) = arc_3_points_to_radius_center_angles((px, py), (seg[0], seg[1]), (ex, ey))
+        if(lia==0): # line or colinear arc
+          ofh.write("0\nLINE\n8\n0\n10\n{:s}\n20\n{:s}\n30\n0.0\n11\n{:s}\n21\n{:s}\n31\n0.0\n".format(nb_fmt.format(px), nb_fmt.format(py), nb_fmt.format(ex), nb_fmt.format(ey)))
+        else:
+          (u2, w2) = (u, u+uw)
+          if(uw<0):
+            (u2, w2) = (w, u)
+          ofh.write("0\nARC\n8\n0\n10\n{:s}\n20\n{:s}\n30\n0.0\n40\n{:s}\n50\n{:s}\n51\n{:s}\n".format(nb_fmt.format(ptix), nb_fmt.format(ptiy), nb_fmt.format(lia), nb_fmt.format(u2*180/math.pi), nb_fmt.format(w2*180/math.pi)))
+        (px, py) = (ex, ey)
+  ofh.write("0\nENDSEC\n0\nEOF\n")
+  ofh.close()
+  return(0)
+
+def outline_bounding_box(ai_outline):
+  """ return the bounding box (xmin, ymin, xmax, ymax) of a format-B outline or of a circle
+      an arc is bounded by the box of its complete circle, so the returned box can be a bit larger than the outline
+  """
+  if(not isinstance(ai_outline[0], (list,tuple))): # circle
+    (cx, cy, radius) = ai_outline
+    return((cx-radius, cy-radius, cx+radius, cy+radius))
+  (px, py) = (ai_outline[0][0], ai_outline[0][1])
+  (xmin, ymin, xmax, ymax) = (px, py, px, py)
+  for seg in ai_outline[1:]:
+    (ex, ey) = (seg[-2], seg[-1])
+    xmin = min(xmin, ex)
+    ymin = min(ymin, ey)
+    xmax = max(xmax, ex)
+    ymax = max(ymax, ey)
+    if(len(seg)==4):
+      (mx, my) = (seg[0], seg[1])
+      # circumcircle of the three points of the arc
+      det = 2*((mx-px)*(ey-py)-(my-py)*(ex-px))
+      if(det!=0):
+        m2 = (mx-px)**2+(my-py)**2
+        e2 = (ex-px)**2+(ey-py)**2
+        cx = px+((ey-py)*m2-(my-py)*e2)/det
+        cy = py+((mx-px)*e2-(ex-px)*m2)/det
+        radius = math.sqrt((cx-px)**2+(cy-py)**2)
+        xmin = min(xmin, cx-radius)
+        ymin = min(ymin, cy-radius)
+        xmax = max(xmax, cx+radius)
+        ymax = max(ymax, cy+radius)
+    (px, py) = (ex, ey)
+  return((xmin, ymin, xmax, ymax))
+
+def sub_overlapping_holes(ai_outer_box, ai_hole_boxes):
+  """ return the set of the hole indexes that may overlap another hole or the outer outline
+      a sweep along the x-axis compares only the holes whose x-ranges intersect
+  """
+  r_overlap = set()
+  for i in range(len(ai_hole_boxes)):
+    (xmin, ymin, xmax, ymax) = ai_hole_boxes[i]
+    if((xmin<=ai_outer_box[0])or(ymin<=ai_outer_box[1])or(xmax>=ai_outer_box[2])or(ymax>=ai_outer_box[3])):
+      r_overlap.add(i)
+  sweep_order = sorted(range(len(ai_hole_boxes)), key=lambda i: ai_hole_boxes[i][0])
+  active = []
+  for i in sweep_order:
+    (xmin, ymin, xmax, ymax) = ai_hole_boxes[i]
+    active = [ j for j in active if ai_hole_boxes[j][2]>=xmin ]
+    for j in active:
+      if((ai_hole_boxes[j][1]<=ymax)and(ymin<=ai_hole_boxes[j][3])):
+        r_overlap.add(i)
+        r_overlap.add(j)
+    active.append(i)
+  return(r_overlap)
+
+def figure_to_freecad_25d_part(ai_figure, ai_extrude_height, ai_face_with_holes=True):
   """ the first outline of the figure ai_figure is the outer line of the part
       the other outlines are holes in the part
       If one outline is not closed, only wire (not face) are extruded
       the height of the extrusion is ai_extrude_height
       It returns a FreeCAD Part object
+      If ai_face_with_holes is True (default), the holes that can not overlap are wires of the face and the part is extruded once. The other holes are cut with boolean operations
+      If the face with holes is not valid (FreeCAD isValid()), all the holes are cut with boolean operations (WARN934)
+      With ai_face_with_holes=False, all the holes are cut with boolean operations. outline_backends_cli('--test2') compares both constructions on your FreeCAD version
       If you want to make more complex fuse and cut combinations, you need to work at the outline level (not figure level)
   """
   # extra length to remove skin during 3D cut operation
@@ -636,8 +883,7 @@ def figure_to_freecad_25d_part(ai_figure, ai_extrude_height):
   # check the number of outlines
   outline_nb = len(ai_figure)
   if(outline_nb<1):
-    print("ERR876: Error, the figure doesn't contain any outlines!")
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dBackendError("ERR876: Error, the figure doesn't contain any outlines!")
   # check if one outline is not closed
   face_nwire = True
   for oli in range(len(ai_figure)):
@@ -649,16 +895,31 @@ def figure_to_freecad_25d_part(ai_figure, ai_extrude_height):
         print("WARN504: Warning, the outline {:d} is not closed! Only wire can be extruded.".format(oli+1))
   # create the FreeCAD part
   if(face_nwire): # generate a real solid part
-    outer_face = Part.Face(Part.Wire(outline_arc_line(ai_figure[0], 'freecad').Edges))
+    outer_wire = Part.Wire(outline_arc_line(ai_figure[0], 'freecad').Edges)
+    boolean_holes = range(1, outline_nb)
+    outer_face = None
+    if(ai_face_with_holes and (outline_nb>1)):
+      overlap = sub_overlapping_holes(outline_bounding_box(ai_figure[0]), [ outline_bounding_box(ol) for ol in ai_figure[1:] ])
+      face_holes = [ i+1 for i in range(outline_nb-1) if not i in overlap ]
+      if(len(face_holes)>0):
+        hole_wires = [ Part.Wire(outline_arc_line(ai_figure[i], 'freecad').Edges) for i in face_holes ]
+        outer_face = Part.Face([outer_wire] + hole_wires)
+        if(outer_face.isValid()):
+          boolean_holes = [ i+1 for i in sorted(overlap) ]
+        else: # for example a hole outside a concave outer outline
+          print("WARN934: Warning, the face with holes is not valid. The holes are cut with boolean operations.")
+          outer_face = None
+    if(outer_face==None):
+      outer_face = Part.Face(outer_wire)
     outer_solid = outer_face.extrude(Base.Vector(0,0,ai_extrude_height)) # straight linear extrusion
-    if(outline_nb>1): # holes need to be cut from outer_solid
+    if(len(boolean_holes)>0): # holes need to be cut from outer_solid
       inner_solid = []
-      for i in range(outline_nb-1):
-        inner_face = Part.Face(Part.Wire(outline_arc_line(ai_figure[i+1], 'freecad').Edges))
+      for i in boolean_holes:
+        inner_face = Part.Face(Part.Wire(outline_arc_line(ai_figure[i], 'freecad').Edges))
         inner_solid.append(inner_face.extrude(Base.Vector(0,0,ai_extrude_height+2*remove_skin_extra))) # straight linear extrusion
       #inner_hole = Part.makeCompound(inner_solid) # not satisfying result with overlap holes
       inner_hole = inner_solid[0]
-      for i in range(outline_nb-2):
+      for i in range(len(inner_solid)-1):
         inner_hole = inner_hole.fuse(inner_solid[i+1])
       inner_hole.translate(Base.Vector(0,0,-remove_skin_extra))
       r_part = outer_solid.cut(inner_hole)
@@ -844,6 +1105,54 @@ def outline_arc_line_test1():
   r_test = 1
   return(r_test)
 
+def face_with_holes_test2():
+  """ compare the single face with holes of figure_to_freecad_25d_part() with the boolean cut of the holes
+      the two parts must be valid solids with the same volume
+  """
+  # square with a circle hole, an outline hole, a hole overlapping the outer outline and two overlapping holes
+  fwh_outer = [
+    [0,0],
+    [100,0],
+    [100,60],
+    [70,60],
+    [60,50, 50,60],
+    [0,60],
+    [0,0]]
+  fwh_hole_square = [
+    [10,10],
+    [30,10],
+    [30,30],
+    [10,30],
+    [10,10]]
+  fwh_hole_arc = [
+    [60,10],
+    [80,10],
+    [90,20, 80,30],
+    [60,30],
+    [60,10]]
+  fwh_hole_in_concave_part = [ # inside the bounding box of the outer outline but out of the material
+    [57,54],
+    [63,54],
+    [63,58],
+    [57,58],
+    [57,54]]
+  fwh_figures = (
+    ('one_circle_hole', [fwh_outer, [20,45,8]]),
+    ('separated_holes', [fwh_outer, fwh_hole_square, fwh_hole_arc, [20,45,8], [45,20,5]]),
+    ('overlapping_holes', [fwh_outer, fwh_hole_square, [30,30,6], fwh_hole_arc]),
+    ('hole_on_the_outer_outline', [fwh_outer, [100,30,10], fwh_hole_square]),
+    ('hole_in_the_concave_part', [fwh_outer, fwh_hole_in_concave_part, fwh_hole_arc]))
+  fwh_height = 10.0
+  r_test = 1
+  for (name, figure) in fwh_figures:
+    boolean_part = figure_to_freecad_25d_part(figure, fwh_height, ai_face_with_holes=False)
+    face_part = figure_to_freecad_25d_part(figure, fwh_height, ai_face_with_holes=True)
+    check_ok = (boolean_part.isValid() and face_part.isValid() and (abs(face_part.Volume-boolean_part.Volume)<=1e-6*boolean_part.Volume) and (len(face_part.Solids)==len(boolean_part.Solids)))
+    print("face_with_holes {:s}: volume {:0.4f} (boolean cut: {:0.4f}), solids {:d} ({:d}), valid {:d} ({:d}): {:s}".format(name, face_part.Volume, boolean_part.Volume, len(face_part.Solids), len(boolean_part.Solids), int(face_part.isValid()), int(boolean_part.isValid()), "OK" if check_ok else "FAILED"))
+    if(not check_ok):
+      r_test = 0
+  return(r_test)
+
 ################################################################
 # ******** command line interface ***********
 ################################################################
@@ -854,12 +1163,16 @@ def outline_backends_cli(ai_args=""):
   ob_parser = argparse.ArgumentParser(description='Test the outline_backends API.')
   ob_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
     help='Run outline_arc_line_test1()')
+  ob_parser.add_argument('--test2','--t2', action='store_true', default=False, dest='sw_test2',
+    help='Run face_with_holes_test2(): compare the face with holes and the boolean cut of figure_to_freecad_25d_part()')
   effective_args = design_help.get_effective_args(ai_args)
   ob_args = ob_parser.parse_args(effective_args)
   r_obc = 0
   print("dbg111: start testing outline_backends.py")
   if(ob_args.sw_test1):
     r_obc = outline_arc_line_test1()
+  if(ob_args.sw_test2):
+    r_obc = face_with_holes_test2()
   print("dbg999: end of script")
   return(r_obc)
 
@@ -868,7 +1181,7 @@ def outline_backends_cli(ai_args=""):
 ################################################################
 
 if __name__ == "__main__":
-  FreeCAD.Console.PrintMessage("outline_backends.py says hello!\n")
+  print("outline_backends.py says hello!")
   # select your script behavior
   #outline_backends_cli()
   outline_backends_cli("--test1")
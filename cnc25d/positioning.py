@@ -29,7 +29,7 @@ positioning.py provides help functions to place 3D parts in an assembly
 ################################################################
 
 import importing_freecad
-importing_freecad.importing_freecad()
+#importing_freecad.importing_freecad() # FreeCAD is imported on first use by lazy_import
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -38,62 +38,33 @@ importing_freecad.importing_freecad()
 # import
 ################################################################
 
-import Part
-from FreeCAD import Base
+from lazy_import import Part
+from lazy_import import Base
 import math
 import sys, argparse
 import design_help # just for get_effective_args()
+import positioning_matrix
+import cnc25d_error
 
 ################################################################
 # Positioning API
 ################################################################
 
+def place_plank_placement(ai_x_length, ai_y_width, ai_z_height, ai_flip, ai_orientation, ai_translate_x, ai_translate_y, ai_translate_z):
+  """ return the FreeCAD Placement that positions a plank like place_plank() does, without touching any shape
+  """
+  plank_matrix = positioning_matrix.place_plank_matrix(ai_x_length, ai_y_width, ai_z_height, ai_flip, ai_orientation, ai_translate_x, ai_translate_y, ai_translate_z)
+  r_placement = Base.Placement(Base.Matrix(*plank_matrix.flatten().tolist()))
+  return(r_placement)
+
 def place_plank(ai_plank_solid, ai_x_length, ai_y_width, ai_z_height, ai_flip, ai_orientation, ai_translate_x, ai_translate_y, ai_translate_z):
   """ After creating a plank, use this function to place it in a cuboid construction
+      the flip, the orientation and the translation are composed in one placement, applied once to the shape
   """
   r_placed_plank = ai_plank_solid
   #r_placed_plank = ai_plank_solid.copy()
-  # flip
-  flip_center_x = ai_x_length/2
-  flip_center_y = ai_y_width/2
-  flip_center_z = ai_z_height/2
-  if(ai_flip=='i'):
-    r_placed_plank.rotate(Base.Vector(flip_center_x, flip_center_y, flip_center_z),Base.Vector(0,0,1),0)
-  elif(ai_flip=='x'):
-    r_placed_plank.rotate(Base.Vector(flip_center_x, flip_center_y, flip_center_z),Base.Vector(1,0,0),180)
-  elif(ai_flip=='y'):
-    r_placed_plank.rotate(Base.Vector(flip_center_x, flip_center_y, flip_center_z),Base.Vector(0,1,0),180)
-  elif(ai_flip=='z'):
-    r_placed_plank.rotate(Base.Vector(flip_center_x, flip_center_y, flip_center_z),Base.Vector(0,0,1),180)
-  else:
-    print("ERR505: Error, the flip value %s doesn't exist! Use only: i,x,y,z."%ai_flip)
-    sys.exit(2)
-  # orientation
-  if(ai_orientation=='xy'):
-    r_placed_plank.rotate(Base.Vector(0, 0, 0),Base.Vector(0,0,1),0)
-    r_placed_plank.translate(Base.Vector(0, 0, 0))
-  elif(ai_orientation=='xz'):
-    r_placed_plank.rotate(Base.Vector(0, 0, 0),Base.Vector(1,0,0),90)
-    r_placed_plank.translate(Base.Vector(0, ai_z_height, 0))
-  elif(ai_orientation=='yx'):
-    r_placed_plank.rotate(Base.Vector(0, 0, 0),Base.Vector(0,0,1),90)
-    r_placed_plank.translate(Base.Vector(ai_y_width, 0, 0))
-  elif(ai_orientation=='yz'):
-    r_placed_plank.rotate(Base.Vector(0, 0, 0),Base.Vector(0,0,1),90)
-    r_placed_plank.rotate(Base.Vector(0, 0, 0),Base.Vector(0,1,0),90)
-    r_placed_plank.translate(Base.Vector(0, 0, 0))
-  elif(ai_orientation=='zx'):
-    r_placed_plank.rotate(Base.Vector(0, 0, 0),Base.Vector(0,1,0),-90)
-    r_placed_plank.rotate(Base.Vector(0, 0, 0),Base.Vector(0,0,1),-90)
-    r_placed_plank.translate(Base.Vector(0, 0, 0))
-  elif(ai_orientation=='zy'):
-    r_placed_plank.rotate(Base.Vector(0, 0, 0),Base.Vector(0,1,0),-90)
-    r_placed_plank.translate(Base.Vector(ai_z_height, 0, 0))
-  else:
-    print("ERR506: Error, the orientation value %s doesn't exist! Use only: xz,xy,yx,yz,zx,zy."%ai_orientation)
-    sys.exit(2)
-  # translation
-  r_placed_plank.translate(Base.Vector(ai_translate_x, ai_translate_y, ai_translate_z))
+  plank_placement = place_plank_placement(ai_x_length, ai_y_width, ai_z_height, ai_flip, ai_orientation, ai_translate_x, ai_translate_y, ai_translate_z)
+  r_placed_plank.Placement = plank_placement.multiply(r_placed_plank.Placement)
   return(r_placed_plank)
 
 ################################################################
@@ -166,7 +137,7 @@ def positioning_cli(ai_args=""):
 
 # with freecad, the script is also main :)
 if __name__ == "__main__":
-  FreeCAD.Console.PrintMessage("dbg109: I'm main\n")
+  print("dbg109: I'm main")
   #positioning_cli()
   positioning_cli("--test1")
 
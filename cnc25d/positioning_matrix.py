@@ -0,0 +1,210 @@
+# positioning_matrix.py
+# the 4x4 transformation matrices of the plank positioning, without FreeCAD
+# created by agent on 2026/10/16
+#
+# (C) Copyright 2026 agent
+#
+# This file is part of the Cnc25D Python package.
+#
+# Cnc25D is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Cnc25D is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Cnc25D.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+positioning_matrix.py computes the transformation of positioning.place_plank() as one 4x4 homogeneous matrix.
+It only uses numpy, so the placements can be computed and batched without FreeCAD.
+"""
+
+################################################################
+# python behavior
+################################################################
+
+from __future__ import division # to get float division
+
+################################################################
+# import
+################################################################
+
+import math
+import argparse
+import numpy
+#
+import design_help # just for get_effective_args()
+import cnc25d_error
+
+################################################################
+# elementary matrices
+################################################################
+
+def translation_matrix(ai_x, ai_y, ai_z):
+  """ return the 4x4 matrix of the translation (ai_x, ai_y, ai_z)
+  """
+  r_matrix = numpy.identity(4)
+  r_matrix[0:3,3] = (ai_x, ai_y, ai_z)
+  return(r_matrix)
+
+def rotation_matrix(ai_center, ai_axis, ai_angle):
+  """ return the 4x4 matrix of the rotation of ai_angle degrees around the axis ai_axis going through the point ai_center
+      same convention as the rotate() method of the FreeCAD shapes
+  """
+  axis = numpy.array(ai_axis, dtype=numpy.float64)
+  axis = axis/numpy.sqrt(numpy.dot(axis, axis))
+  angle = ai_angle*math.pi/180
+  cos_a = math.cos(angle)
+  sin_a = math.sin(angle)
+  cross_axis = numpy.array([[0, -1*axis[2], axis[1]], [axis[2], 0, -1*axis[0]], [-1*axis[1], axis[0], 0]])
+  rot = cos_a*numpy.identity(3) + sin_a*cross_axis + (1-cos_a)*numpy.outer(axis, axis) # Rodrigues formula
+  center = numpy.array(ai_center, dtype=numpy.float64)
+  r_matrix = numpy.identity(4)
+  r_matrix[0:3,0:3] = rot
+  r_matrix[0:3,3] = center - numpy.dot(rot, center)
+  return(r_matrix)
+
+################################################################
+# place_plank matrix
+################################################################
+
+def place_plank_matrix(ai_x_length, ai_y_width, ai_z_height, ai_flip, ai_orientation, ai_translate_x, ai_translate_y, ai_translate_z):
+  """ return the 4x4 matrix that positions a plank like positioning.place_plank() does
+      the flip, the orientation and the translation are composed in a single matrix
+  """
+  # flip
+  flip_center = (ai_x_length/2, ai_y_width/2, ai_z_height/2)
+  if(ai_flip=='i'):
+    r_matrix = numpy.identity(4)
+  elif(ai_flip=='x'):
+    r_matrix = rotation_matrix(flip_center, (1,0,0), 180)
+  elif(ai_flip=='y'):
+    r_matrix = rotation_matrix(flip_center, (0,1,0), 180)
+  elif(ai_flip=='z'):
+    r_matrix = rotation_matrix(flip_center, (0,0,1), 180)
+  else:
+    raise cnc25d_error.Cnc25dBackendError("ERR505: Error, the flip value %s doesn't exist! Use only: i,x,y,z."%ai_flip)
+  # orientation
+  origin = (0, 0, 0)
+  if(ai_orientation=='xy'):
+    orientation_steps = []
+  elif(ai_orientation=='xz'):
+    orientation_steps = [rotation_matrix(origin, (1,0,0), 90), translation_matrix(0, ai_z_height, 0)]
+  elif(ai_orientation=='yx'):
+    orientation_steps = [rotation_matrix(origin, (0,0,1), 90), translation_matrix(ai_y_width, 0, 0)]
+  elif(ai_orientation=='yz'):
+    orientation_steps = [rotation_matrix(origin, (0,0,1), 90), rotation_matrix(origin, (0,1,0), 90)]
+  elif(ai_orientation=='zx'):
+    orientation_steps = [rotation_matrix(origin, (0,1,0), -90), rotation_matrix(origin, (0,0,1), -90)]
+  elif(ai_orientation=='zy'):
+    orientation_steps = [rotation_matrix(origin, (0,1,0), -90), translation_matrix(ai_z_height, 0, 0)]
+  else:
+    raise cnc25d_error.Cnc25dBackendError("ERR506: Error, the orientation value %s doesn't exist! Use only: xz,xy,yx,yz,zx,zy."%ai_orientation)
+  # translation
+  orientation_steps.append(translation_matrix(ai_translate_x, ai_translate_y, ai_translate_z))
+  for step in orientation_steps:
+    r_matrix = numpy.dot(step, r_matrix)
+  return(r_matrix)
+
+def transform_points(ai_matrix, ai_points):
+  """ apply the 4x4 matrix ai_matrix to the array of 3D points ai_points of shape (n,3)
+  """
+  points = numpy.asarray(ai_points, dtype=numpy.float64)
+  r_points = numpy.dot(points, ai_matrix[0:3,0:3].T) + ai_matrix[0:3,3]
+  return(r_points)
+
+################################################################
+# API testing
+################################################################
+
+# expected placement of the point (x, y, z) of a plank of size (X, Y, Z) for each flip and orientation of place_plank()
+test_flip_points = {
+  'i': lambda x, y, z, X, Y, Z: (x, y, z),
+  'x': lambda x, y, z, X, Y, Z: (x, Y-y, Z-z),
+  'y': lambda x, y, z, X, Y, Z: (X-x, y, Z-z),
+  'z': lambda x, y, z, X, Y, Z: (X-x, Y-y, z)}
+test_orientation_points = {
+  'xy': lambda x, y, z, X, Y, Z: (x, y, z),
+  'xz': lambda x, y, z, X, Y, Z: (x, Z-z, y),
+  'yx': lambda x, y, z, X, Y, Z: (Y-y, x, z),
+  'yz': lambda x, y, z, X, Y, Z: (z, x, y),
+  'zx': lambda x, y, z, X, Y, Z: (y, z, x),
+  'zy': lambda x, y, z, X, Y, Z: (Z-z, y, x)}
+
+def positioning_matrix_test1():
+  """ check the elementary matrices and place_plank_matrix() against the expected placement of some points of a plank
+  """
+  r_test = 1
+  # elementary matrices
+  check_list = (
+    ('rotation_z_90', rotation_matrix((0,0,0), (0,0,1), 90), (1,0,0), (0,1,0)),
+    ('rotation_x_90', rotation_matrix((0,0,0), (1,0,0), 90), (0,1,0), (0,0,1)),
+    ('rotation_centered', rotation_matrix((1,1,0), (0,0,1), 180), (2,1,0), (0,1,0)),
+    ('rotation_axis_not_normalized', rotation_matrix((0,0,0), (0,0,5), -90), (1,0,0), (0,-1,0)),
+    ('translation', translation_matrix(1,2,3), (1,1,1), (2,3,4)))
+  for (name, matrix, point, expected) in check_list:
+    if(numpy.abs(transform_points(matrix, [point])[0]-numpy.array(expected)).max()>1e-12):
+      print("ERR: positioning_matrix {:s} maps {:s} to {:s} instead of {:s}".format(name, str(point), str(transform_points(matrix, [point])[0]), str(expected)))
+      r_test = 0
+  # place_plank_matrix
+  (X, Y, Z) = (20.0, 4.0, 2.0)
+  (tx, ty, tz) = (300.0, 30.0, -5.0)
+  points = numpy.array([(0,0,0), (X,Y,Z), (0.1*X,0.2*Y,0.3*Z), (X,0.5*Y,0), (0.7*X,Y,0.9*Z)])
+  for flip in sorted(test_flip_points.keys()):
+    for orientation in sorted(test_orientation_points.keys()):
+      placed = transform_points(place_plank_matrix(X, Y, Z, flip, orientation, tx, ty, tz), points)
+      expected = []
+      for (x, y, z) in points:
+        (fx, fy, fz) = test_flip_points[flip](x, y, z, X, Y, Z)
+        (ox, oy, oz) = test_orientation_points[orientation](fx, fy, fz, X, Y, Z)
+        expected.append((ox+tx, oy+ty, oz+tz))
+      error = numpy.abs(placed-numpy.array(expected)).max()
+      if(error>1e-9):
+        print("ERR: positioning_matrix place_plank_matrix flip {:s} orientation {:s} is wrong by {:0.3e}".format(flip, orientation, error))
+        r_test = 0
+  # the unknown flips and orientations are errors
+  for (flip, orientation, code) in (('u', 'xy', 'ERR505'), ('i', 'xx', 'ERR506')):
+    err_code = ''
+    try:
+      place_plank_matrix(X, Y, Z, flip, orientation, 0, 0, 0)
+    except cnc25d_error.Cnc25dBackendError as err:
+      err_code = err.code
+    if(err_code!=code):
+      print("ERR: positioning_matrix flip {:s} orientation {:s} raises '{:s}' instead of {:s}".format(flip, orientation, err_code, code))
+      r_test = 0
+  print("positioning_matrix_test1: {:s}".format("OK" if r_test else "FAILED"))
+  return(r_test)
+
+################################################################
+# positioning_matrix command line interface
+################################################################
+
+def positioning_matrix_cli(ai_args=""):
+  """ it is the command line interface of positioning_matrix.py when it is used in standalone
+  """
+  pm_parser = argparse.ArgumentParser(description='Test the positioning_matrix API')
+  pm_parser.add_argument('--test1','--t1', action='store_true', default=False, dest='sw_test1',
+    help='Check the matrices of place_plank_matrix().')
+  effective_args = design_help.get_effective_args(ai_args)
+  pm_args = pm_parser.parse_args(effective_args)
+  r_pmc = 0
+  print("dbg111: start testing positioning_matrix.py")
+  if(pm_args.sw_test1):
+    r_pmc = positioning_matrix_test1()
+  print("dbg999: end of script")
+  return(r_pmc)
+
+################################################################
+# main
+################################################################
+
+if __name__ == "__main__":
+  #positioning_matrix_cli()
+  positioning_matrix_cli("--test1")
+
@@ -39,6 +39,8 @@ from __future__ import division # to get float division
 #
 import math
 import sys, argparse
+#
+import cnc25d_error
 
 ################################################################
 # functions to be used by cnc_cut_outline.py
@@ -72,8 +74,7 @@ def arc_center_radius(ai_arc_pt1, ai_arc_pt2, ai_arc_pt3, ai_error_msg_id):
   BC = math.sqrt((CX-BX)**2+(CY-BY)**2)
   AC = math.sqrt((CX-AX)**2+(CY-AY)**2)
   if((AB<radian_epsilon)or(BC<radian_epsilon)or(AC<radian_epsilon)):
-    print("ERR682: Error in {:s}, the three arc points ABC are too closed: AB={:0.2f} BC={:0.2f} AC={:0.2f}".format(ai_error_msg_id, AB, BC, AC))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR682: Error in {:s}, the three arc points ABC are too closed: AB={:0.2f} BC={:0.2f} AC={:0.2f}".format(ai_error_msg_id, AB, BC, AC))
   # calculation of M and N
   MX = (AX+BX)/2
   MY = (AY+BY)/2
@@ -96,8 +97,7 @@ def arc_center_radius(ai_arc_pt1, ai_arc_pt2, ai_arc_pt3, ai_error_msg_id):
   ixk = sin_f*(cos_e*MX+sin_e*MY)-sin_e*(cos_f*NX+sin_f*NY)
   iyk = cos_f*(cos_e*MX+sin_e*MY)-cos_e*(cos_f*NX+sin_f*NY)
   if((abs(ixl)<radian_epsilon)or(abs(iyl)<radian_epsilon)):
-    print("ERR947: Error in {:s}, ixl (= {:0.2f}) or iyl (= {:0.2f}) are too closed to zero!".format(ai_error_msg_id, ixl, iyl))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR947: Error in {:s}, ixl (= {:0.2f}) or iyl (= {:0.2f}) are too closed to zero!".format(ai_error_msg_id, ixl, iyl))
   IX=ixk/ixl
   IY=iyk/iyl
   # check than I is equidistant of A, B and C
@@ -105,12 +105,11 @@ def arc_center_radius(ai_arc_pt1, ai_arc_pt2, ai_arc_pt3, ai_error_msg_id):
   IB = math.sqrt((BX-IX)**2+(BY-IY)**2)
   IC = math.sqrt((CX-IX)**2+(CY-IY)**2)
   if((abs(IB-IA)>radian_epsilon)or(abs(IC-IA)>radian_epsilon)):
-    print("ERR748: Error in {:s}, the calculation of the center of the arc A,B,C is wrong! IA={:0.2f} IB={:0.2f} IC={:0.2f}".format(ai_error_msg_id, IA, IB, IC))
     print("dbg253: A= {:0.2f} {:0.2f}  B= {:0.2f} {:0.2f}  C= {:0.2f} {:0.2f}  I= {:0.2f} {:0.2f}".format(AX,AY,BX,BY,CX,CY,IX,IY))
     print("dbg764: cos_e={:0.2f}  sin_e={:0.2f}  cos_f={:0.2f}  sin_f={:0.2f}".format(cos_e, sin_e, cos_f, sin_f))
     print("dbg765: ixl={:0.2f} ixk={:0.2f} iyl={:0.2f} iyk={:0.2f}".format(ixl, ixk, iyl, iyk))
     print("dbg766: MX={:0.2f} MY={:0.2f} NX={:0.2f} NY={:0.2f}".format(MX,MY,NX,NY))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR748: Error in {:s}, the calculation of the center of the arc A,B,C is wrong! IA={:0.2f} IB={:0.2f} IC={:0.2f}".format(ai_error_msg_id, IA, IB, IC))
   # return
   r_arc_center_radius=(IX, IY, IA)
   return(r_arc_center_radius)
@@ -134,8 +133,7 @@ def arc_center_radius_angles(ai_arc_pt1, ai_arc_pt2, ai_arc_pt3, ai_error_msg_id
   IB = math.sqrt((BX-IX)**2+(BY-IY)**2)
   IC = math.sqrt((CX-IX)**2+(CY-IY)**2)
   if((abs(IA-arc_radius)>radian_epsilon)or(abs(IB-arc_radius)>radian_epsilon)or(abs(IC-arc_radius)>radian_epsilon)):
-    print("ERR841: Error, in {:s}, I is not equidistant from A,B,C. arc_radius={:0.2f} IA={:0.2f} IB={:0.2f} IC={:0.2f}".format(ai_error_msg_id, arc_radius, IA, IB, IC))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR841: Error, in {:s}, I is not equidistant from A,B,C. arc_radius={:0.2f} IA={:0.2f} IB={:0.2f} IC={:0.2f}".format(ai_error_msg_id, arc_radius, IA, IB, IC))
   # calculation of the angle u=(Ix, IA) , v=(Ix, IB), w=(Ix, IC), d=(Ix, ID) and e=(Ix, IE)
   u = math.atan2(AY-IY, AX-IX)
   v = math.atan2(BY-IY, BX-IX)
@@ -169,8 +167,7 @@ def triangulation(ai_A, ai_AC, ai_B, ai_BC, ai_D, ai_D_direction, ai_error_msg_i
   r_status = 0
   # check the arguments
   if((ai_AC<radian_epsilon)or(ai_BC<radian_epsilon)):
-    print("ERR965: Error in {:s}, the length ai_AC (={:0.2f}) or ai_BC (={:0.2f})".format(ai_error_msg_id, ai_AC, ai_BC))
-    sys.exir(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR965: Error in {:s}, the length ai_AC (={:0.2f}) or ai_BC (={:0.2f})".format(ai_error_msg_id, ai_AC, ai_BC))
   # interprete the arguments
   AX = ai_A[0]
   AY = ai_A[1]
@@ -183,8 +180,7 @@ def triangulation(ai_A, ai_AC, ai_B, ai_BC, ai_D, ai_D_direction, ai_error_msg_i
   # calculation of the length c=AB
   c = math.sqrt((BX-AX)**2+(BY-AY)**2)
   if(c<radian_epsilon):
-    print("ERR662: Error in {:s}, the length c (=AB={:0.2f}) is too small!".format(ai_error_msg_id, c))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR662: Error in {:s}, the length c (=AB={:0.2f}) is too small!".format(ai_error_msg_id, c))
   # calculation of the angle A with the law of cosines
   #BAC = math.acos((b**2+c**2-a**2)/(2*b*c))
   cos_BAC = (b**2+c**2-a**2)/(2*b*c)
@@ -227,7 +223,6 @@ def triangulation(ai_A, ai_AC, ai_B, ai_BC, ai_D, ai_D_direction, ai_error_msg_i
   CX2 = BX+a*math.cos(xBC)
   CY2 = BY+a*math.sin(xBC)
   if((abs(CX2-CX)>radian_epsilon)or(abs(CY2-CY)>radian_epsilon)):
-    print("ERR686: Error in {:s}, the coordinate of C seems wrong! CX={:0.2f} CX2={:0.2f} CY={:0.2f} CY2={:0.2f}".format(ai_error_msg_id, CX, CX2, CY, CY2))
     print("dbg545: D {:0.2f} {:0.2f}  ai_D_direction {:0.2f}".format(DX,DY, ai_D_direction))
     print("dbg512: BAC", BAC)
     print("dbg513: xAB", xAB)
@@ -241,7 +236,7 @@ def triangulation(ai_A, ai_AC, ai_B, ai_BC, ai_D, ai_D_direction, ai_error_msg_i
     print("dbg525: ABD", ABD)
     print("dbg526: xBC", xBC)
     print("dbg527: BX {:0.2f}  BY {:0.2f}  a {:0.2f}".format(BX,BY, a))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR686: Error in {:s}, the coordinate of C seems wrong! CX={:0.2f} CX2={:0.2f} CY={:0.2f} CY2={:0.2f}".format(ai_error_msg_id, CX, CX2, CY, CY2))
   r_C = (CX,CY,r_status)
   return(r_C)
 
@@ -258,8 +253,7 @@ def line_equation(ai_A, ai_B, ai_error_msg_id):
   # calculation of the length AB
   lAB = math.sqrt((BX-AX)**2+(BY-AY)**2)
   if(lAB<radian_epsilon):
-    print("ERR261: Error, lAB {:0.3f} is too small".format(lAB))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR261: Error, lAB {:0.3f} is too small".format(lAB))
   # calculation of the inclination of AB
   xAB = math.atan2(BY-AY, BX-AX)
   cos_xAB = (BX-AX)/lAB
@@ -504,7 +498,7 @@ def sub_smooth_corner_line_arc(ai_pre_point, ai_current_point, ai_post_middle, a
       print("dbg693: in {:s}, xAC={:0.2f} R2={:0.2f} ai_router_bit_request={:0.2f}".format(ai_error_msg_id, xAC, R2, ai_router_bit_request))
       #r_outline = [(ai_current_point[0], ai_current_point[1])]
       smooth_status = 2
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR684: Error in {:s}, line_circle_intersection error!".format(ai_error_msg_id))
     else:
       # calculation of U, the projection of S on AC
       (UX, UY) = line_point_projection((AClx, ACly, ACkA), (SX,SY), ai_error_msg_id)
@@ -632,14 +626,12 @@ def sub_enlarge_corner_line_arc(ai_pre_point, ai_current_point, ai_post_middle,
   MKX=0; MKY=0; GX=0; GY=0; HX=0; HY=0; NLX=0; NLY=0; enlarge_type_request_1=0; enlarge_type_request_2=0
   (SX, SY, UX, UY, xSU, xSJ, router_bit_arc_uw, smooth_status) = sub_smooth_corner_line_arc(ai_pre_point, ai_current_point, ai_post_middle, ai_post_point, ai_router_bit_request, ai_error_msg_id)
   if(smooth_status!=1):
-    print("ERR977: Error in {:s}, the sub smooth corner get an error!".format(ai_error_msg_id))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR977: Error in {:s}, the sub smooth corner get an error!".format(ai_error_msg_id))
     enlarge_status = 2
   else:
     #print("dbg553: router_bit_arc_uw:", router_bit_arc_uw)
     if(abs(router_bit_arc_uw)>math.pi):
-      print("ERR877: Error in {:s}, the sub smooth corner is englobed!".format(ai_error_msg_id))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR877: Error in {:s}, the sub smooth corner is englobed!".format(ai_error_msg_id))
       enlarge_status = 2
     elif(abs(router_bit_arc_uw)<radian_epsilon):
       print("WARN878: Warning in {:s}, the corner is too flat to be enlarged with this router_bit radius!")
@@ -652,8 +644,7 @@ def sub_enlarge_corner_line_arc(ai_pre_point, ai_current_point, ai_post_middle,
       (SClx, SCly, SCkS, lSC, xSC) = line_equation((SX,SY), (CX,CY), ai_error_msg_id)
       (FX,FY, line_circle_intersection_status) = line_circle_intersection((SClx, SCly, SCkS), (CX,CY),ai_router_bit_request, (SX,SY), xSC+math.pi, ai_error_msg_id)
       if(line_circle_intersection_status==2):
-        print("ERR739: Error in {:s} with the line_circle_intersection_status!".format(ai_error_msg_id))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR739: Error in {:s} with the line_circle_intersection_status!".format(ai_error_msg_id))
       (GX,GY, SCkG) = line_distance_point((FX,FY), (CX,CY), -1*corner_orientation*ai_router_bit_request, ai_error_msg_id)
       (HX,HY, SCkH) = line_distance_point((FX,FY), (CX,CY),  1*corner_orientation*ai_router_bit_request, ai_error_msg_id)
       #(IX,IY, R1, uw1, u1, w1) = arc_center_radius_angles(ai_pre_point, ai_pre_middle, ai_current_point, ai_error_msg_id)
@@ -665,15 +656,13 @@ def sub_enlarge_corner_line_arc(ai_pre_point, ai_current_point, ai_post_middle,
 
       #print("dbg321: MX={:0.2f}  MY={:0.2f}  line_circle_intersection={:0.2f}".format(MX, MY, line_circle_intersection_status))
       if(line_line_intersection_status==2):
-        print("ERR736: Error in {:s} with the line_line_intersection_status!".format(ai_error_msg_id))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR736: Error in {:s} with the line_line_intersection_status!".format(ai_error_msg_id))
         enlarge_status = 2
       (NX,NY, line_circle_intersection_status) = line_circle_intersection((SClx, SCly, SCkH), (JX,JY),R2, ((HX+SX)/2,(HY+SY)/2), xSC+math.pi, ai_error_msg_id)
       #print("dbg322: NX={:0.2f}  NY={:0.2f}  line_circle_intersection={:0.2f}".format(NX, NY, line_circle_intersection_status))
       if(line_circle_intersection_status==2):
-        print("ERR733: Error in {:s} with the line_circle_intersection_status!".format(ai_error_msg_id))
         #print("dbg513: G={:0.2f} {:0.2f}  H={:0.2f} {:0.2f}".format(GX, GY, HX, HY))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR733: Error in {:s} with the line_circle_intersection_status!".format(ai_error_msg_id))
         enlarge_status = 2
       # check if arc-arc intersection must be calculated
       tmp_MG_deep_x = (MX-GX)*(CX-FX)
@@ -704,16 +693,14 @@ def sub_enlarge_corner_line_arc(ai_pre_point, ai_current_point, ai_post_middle,
         (KX,KY, line_circle_intersection_status) = line_circle_intersection((AClx, ACly, ACkC), (FX,FY),ai_router_bit_request, (GX, GY), xSC+math.pi, ai_error_msg_id)
 
         if(line_circle_intersection==2):
-          print("ERR536: Error in {:s} with the triangulation_status!".format(ai_error_msg_id))
-          sys.exit(2)
+          raise cnc25d_error.Cnc25dOutlineError("ERR536: Error in {:s} with the triangulation_status!".format(ai_error_msg_id))
         MKX = KX
         MKY = KY
         enlarge_type_request_1 = 2
       if(NH_deep>0):
         (LX,LY, triangulation_status) = triangulation((JX,JY),R2, (FX,FY),ai_router_bit_request, (HX,HY), xSC+math.pi, ai_error_msg_id)
         if(triangulation_status==2):
-          print("ERR533: Error in {:s} with the triangulation_status!".format(ai_error_msg_id))
-          sys.exit(2)
+          raise cnc25d_error.Cnc25dOutlineError("ERR533: Error in {:s} with the triangulation_status!".format(ai_error_msg_id))
         NLX = LX
         NLY = LY
         enlarge_type_request_2 = 2
@@ -748,13 +735,11 @@ def sub_enlarge_corner_arc_arc(ai_pre_point, ai_pre_middle, ai_current_point, ai
   (SX, SY, xSI, xSJ, router_bit_arc_uw, smooth_status) = sub_smooth_corner_arc_arc(ai_pre_point, ai_pre_middle, ai_current_point, ai_post_middle, ai_post_point, ai_router_bit_request, ai_error_msg_id)
   enlarge_status = 0
   if(smooth_status==2):
-    print("ERR927: Error in {:s}, the sub smooth corner gets an error!".format(ai_error_msg_id))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR927: Error in {:s}, the sub smooth corner gets an error!".format(ai_error_msg_id))
   else:
     #print("dbg553: router_bit_arc_uw:", router_bit_arc_uw)
     if(abs(router_bit_arc_uw)>math.pi):
-      print("ERR887: Error in {:s}, the sub smooth corner is englobed!".format(ai_error_msg_id))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR887: Error in {:s}, the sub smooth corner is englobed!".format(ai_error_msg_id))
       enlarge_status = 2
     elif(abs(router_bit_arc_uw)<radian_epsilon):
       print("WARN877: Error in {:s}, the corner is too flat to be enlarged with this router_bit radius!".format(ai_error_msg_id))
@@ -767,8 +752,7 @@ def sub_enlarge_corner_arc_arc(ai_pre_point, ai_pre_middle, ai_current_point, ai
       (SClx, SCly, SCkS, lSC, xSC) = line_equation((SX,SY), (CX,CY), ai_error_msg_id)
       (FX,FY, line_circle_intersection_status) = line_circle_intersection((SClx, SCly, SCkS), (CX,CY),ai_router_bit_request, (SX,SY), xSC+math.pi, ai_error_msg_id)
       if(line_circle_intersection_status==2):
-        print("ERR639: Error in {:s} with the line_circle_intersection_status!".format(ai_error_msg_id))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR639: Error in {:s} with the line_circle_intersection_status!".format(ai_error_msg_id))
       (GX,GY, SCkG) = line_distance_point((FX,FY), (CX,CY), -1*corner_orientation*ai_router_bit_request, ai_error_msg_id)
       (HX,HY, SCkH) = line_distance_point((FX,FY), (CX,CY),  1*corner_orientation*ai_router_bit_request, ai_error_msg_id)
       (IX,IY, R1, uw1, u1, w1) = arc_center_radius_angles(ai_pre_point, ai_pre_middle, ai_current_point, ai_error_msg_id)
@@ -776,8 +760,7 @@ def sub_enlarge_corner_arc_arc(ai_pre_point, ai_pre_middle, ai_current_point, ai
       (MX,MY, line_circle_intersection_status) = line_circle_intersection((SClx, SCly, SCkG), (IX,IY),R1, ((GX+SX)/2,(GY+SY)/2), xSC+math.pi, ai_error_msg_id)
       #print("dbg321: MX={:0.2f}  MY={:0.2f}  line_circle_intersection={:0.2f}".format(MX, MY, line_circle_intersection_status))
       if(line_circle_intersection_status==2):
-        print("ERR636: Error in {:s} with the line_circle_intersection_status!".format(ai_error_msg_id))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR636: Error in {:s} with the line_circle_intersection_status!".format(ai_error_msg_id))
       (NX,NY, line_circle_intersection_status) = line_circle_intersection((SClx, SCly, SCkH), (JX,JY),R2, ((HX+SX)/2,(HY+SY)/2), xSC+math.pi, ai_error_msg_id)
       #print("dbg322: NX={:0.2f}  NY={:0.2f}  line_circle_intersection={:0.2f}".format(NX, NY, line_circle_intersection_status))
       if(line_circle_intersection_status==2):
@@ -812,16 +795,14 @@ def sub_enlarge_corner_arc_arc(ai_pre_point, ai_pre_middle, ai_current_point, ai
       if(MG_deep>0):
         (KX,KY, triangulation_status) = triangulation((IX,IY),R1,(FX,FY),ai_router_bit_request,(GX,GY), xSC+math.pi, ai_error_msg_id)
         if(triangulation_status==2):
-          print("ERR536: Error in {:s} with the triangulation_status!".format(ai_error_msg_id))
-          sys.exit(2)
+          raise cnc25d_error.Cnc25dOutlineError("ERR536: Error in {:s} with the triangulation_status!".format(ai_error_msg_id))
         MKX = KX
         MKY = KY
         enlarge_type_request_1 = 2
       if(NH_deep>0):
         (LX,LY, triangulation_status) = triangulation((JX,JY),R2,(FX,FY),ai_router_bit_request,(HX,HY), xSC+math.pi, ai_error_msg_id)
         if(triangulation_status==2):
-          print("ERR533: Error in {:s} with the triangulation_status!".format(ai_error_msg_id))
-          sys.exit(2)
+          raise cnc25d_error.Cnc25dOutlineError("ERR533: Error in {:s} with the triangulation_status!".format(ai_error_msg_id))
         NLX = LX
         NLY = LY
         enlarge_type_request_2 = 2
@@ -858,8 +839,7 @@ def curve_arc(ai_AX, ai_AY, ai_CX, ai_CY, ai_At, ai_router_bit_request, ai_error
   # O intersection of (OI) and (OA). It's the center of the arc
   (OX, OY, line_line_intersection_status) = line_line_intersection((OIlx, OIly, OIk),(OAlx, OAly, OAk), ai_error_msg_id)
   if(line_line_intersection_status==2):
-    print("ERR374: Error in {:s}, the tangent and AC are collinear!".format(ai_error_msg_id))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR374: Error in {:s}, the tangent and AC are collinear!".format(ai_error_msg_id))
   # verification of the distance OA and OC
   lOA = math.sqrt((ai_AX-OX)**2+(ai_AY-OY)**2)
   lOC = math.sqrt((ai_CX-OX)**2+(ai_CY-OY)**2)
@@ -868,8 +848,7 @@ def curve_arc(ai_AX, ai_AY, ai_CX, ai_CY, ai_At, ai_router_bit_request, ai_error
   #print("dbg356: IX={:0.2f}  IY={:0.2f}".format(IX, IY))
   #print("dbg357: OX={:0.2f}  OY={:0.2f}".format(OX, OY))
   if(abs(lOC-lOA)>radian_epsilon):
-    print("ERR375: Error in {:s}, O is not equidistant from A and C! lOA={:0.2f} l_OC={:0.2f}".format(ai_error_msg_id, lOA, lOC))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR375: Error in {:s}, O is not equidistant from A and C! lOA={:0.2f} l_OC={:0.2f}".format(ai_error_msg_id, lOA, lOC))
   if(lOA<ai_router_bit_request):
     print("WARN446: Warning in {:s}, the radius_of_curvature is smaller than the router_bit_request! lOA={:0.2f} rbr={:0.2f}".format(ai_error_msg_id, lOA, ai_router_bit_request))
   # calculation of the angle (Ox, OA)
@@ -919,13 +898,11 @@ def unstable_smooth_outline_b_curve(ai_polyline, ai_initial_tangent, ai_precisio
   point_nb = len(ai_polyline)
   # check the outline point number
   if(point_nb<2):
-    print("ERR209: Error in {:s}, the number of points must be bigger than 2. Currently: {:d}".format(ai_error_msg_id, point_nb))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR209: Error in {:s}, the number of points must be bigger than 2. Currently: {:d}".format(ai_error_msg_id, point_nb))
   # check if the first point is valid
   first_point_len = len(ai_polyline[0])
   if(first_point_len!=2):
-    print("ERR219: Error in {:s}, the first-point of ai_polyline must have exactly 2 elements. Currently: {:d}".format(ai_error_msg_id, first_point_len))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR219: Error in {:s}, the first-point of ai_polyline must have exactly 2 elements. Currently: {:d}".format(ai_error_msg_id, first_point_len))
   # processing initialization
   ti = ai_initial_tangent
   r_outline = []
@@ -937,8 +914,7 @@ def unstable_smooth_outline_b_curve(ai_polyline, ai_initial_tangent, ai_precisio
     # check the validity of the new segment
     segment_len = len(ai_polyline[i+1])
     if(segment_len!=2):
-      print("ERR229: Error in {:s}, the ai_polyline segment length must be exactly 2. Currently: {:d}".format(i_error_msg_id, segment_len))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR229: Error in {:s}, the ai_polyline segment length must be exactly 2. Currently: {:d}".format(i_error_msg_id, segment_len))
     # geometrical data
     AX = ai_polyline[i][0]
     AY = ai_polyline[i][1]
@@ -949,8 +925,7 @@ def unstable_smooth_outline_b_curve(ai_polyline, ai_initial_tangent, ai_precisio
     iAC = math.atan2((CY-AY)/lAC, (CX-AX)/lAC)
     rti = math.fmod(ti-iAC+5*math.pi, 2*math.pi)-math.pi # angle (AC, tangent) between [-pi,pi]
     if(abs(rti)>math.pi-radian_epsilon):
-      print("ERR239: Error in {:s}, AC and the tangent Ti are collinear and in opposite direction. iAC={:0.2f}  ti={:0.2f}".format(i_error_msg_id, iAC, ti))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR239: Error in {:s}, AC and the tangent Ti are collinear and in opposite direction. iAC={:0.2f}  ti={:0.2f}".format(i_error_msg_id, iAC, ti))
     if(abs(rti)>math.pi/3):
       print("WARN249: Warning in {:s}, AC and the tangent Ti are doing a large angle. Add itermediate points to remove this warning. iAC={:0.2f}  ti={:0.2f}".format(i_error_msg_id, iAC, ti))
     if(abs(rti)<radian_epsilon):
@@ -987,13 +962,11 @@ def sub_smooth_outline_c_curve(ai_polyline, ai_precision, ai_router_bit_request,
   point_nb = len(ai_polyline)
   # check the outline point number
   if(point_nb<2):
-    print("ERR609: Error in {:s}, the number of points must be bigger than 2. Currently: {:d}".format(ai_error_msg_id, point_nb))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR609: Error in {:s}, the number of points must be bigger than 2. Currently: {:d}".format(ai_error_msg_id, point_nb))
   # check if the first point is valid
   first_point_len = len(ai_polyline[0])
   if(first_point_len!=3):
-    print("ERR619: Error in {:s}, the first-point of ai_polyline must have exactly 3 elements. Currently: {:d}".format(ai_error_msg_id, first_point_len))
-    sys.exit(2)
+    raise cnc25d_error.Cnc25dOutlineError("ERR619: Error in {:s}, the first-point of ai_polyline must have exactly 3 elements. Currently: {:d}".format(ai_error_msg_id, first_point_len))
   # processing initialization
   r_outline = []
   r_outline.append((ai_polyline[0][0], ai_polyline[0][1])) # first-point
@@ -1004,8 +977,7 @@ def sub_smooth_outline_c_curve(ai_polyline, ai_precision, ai_router_bit_request,
     # check the validity of the new segment
     segment_len = len(ai_polyline[i+1])
     if(segment_len!=3):
-      print("ERR629: Error in {:s}, the ai_polyline segment length must be exactly 3. Currently: {:d}".format(i_error_msg_id, segment_len))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR629: Error in {:s}, the ai_polyline segment length must be exactly 3. Currently: {:d}".format(i_error_msg_id, segment_len))
     # geometrical data
     AX = ai_polyline[i][0]
     AY = ai_polyline[i][1]
@@ -1030,11 +1002,9 @@ def sub_smooth_outline_c_curve(ai_polyline, ai_precision, ai_router_bit_request,
     ECk = -1*(EClx*EX+ECly*EY)
     # check if the segment must be an arc or a line
     if(abs(AtAE)>math.pi/2):
-      print("ERR639: Error in {:s}, the angle between AC and the tangent xAt is larger than pi/2. It doesn't look like a feasible curbe. xAC={:0.2f}  xAt={:0.2f}".format(i_error_msg_id, xAC, xAt))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR639: Error in {:s}, the angle between AC and the tangent xAt is larger than pi/2. It doesn't look like a feasible curbe. xAC={:0.2f}  xAt={:0.2f}".format(i_error_msg_id, xAC, xAt))
     if(abs(EtEA)>math.pi/2):
-      print("ERR638: Error in {:s}, the angle between EC and the tangent et is larger than pi/2. It doesn't look like a feasible curbe. xEC={:0.2f}  xEt={:0.2f}".format(i_error_msg_id, xEC, xEt))
-      sys.exit(2)
+      raise cnc25d_error.Cnc25dOutlineError("ERR638: Error in {:s}, the angle between EC and the tangent et is larger than pi/2. It doesn't look like a feasible curbe. xEC={:0.2f}  xEt={:0.2f}".format(i_error_msg_id, xEC, xEt))
     if(abs(AtAE)>math.pi/3):
       print("WARN649: Warning in {:s}, AC and the tangent xAt are doing a large angle. Add itermediate points to remove this warning. xAC={:0.2f}  xAt={:0.2f}".format(i_error_msg_id, xAC, xAt))
     if(abs(EtEA)>math.pi/3):
@@ -1049,16 +1019,13 @@ def sub_smooth_outline_c_curve(ai_polyline, ai_precision, ai_router_bit_request,
       # C intersection of (AC) and (EC). it is the junction point between the two arcs
       (CX, CY, line_line_intersection_status) = line_line_intersection((AClx, ACly, ACk),(EClx, ECly, ECk), ai_error_msg_id)
       if(line_line_intersection_status==2):
-        print("ERR324: Error in {:s}, AC and EC are collinear!".format(ai_error_msg_id))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR324: Error in {:s}, AC and EC are collinear!".format(ai_error_msg_id))
       (BX, BY, xCt) = curve_arc(AX, AY, CX, CY, xAt, ai_router_bit_request, i_error_msg_id)
       if(abs(math.fmod(xCt-xAE+5*math.pi, 2*math.pi)-math.pi)>radian_epsilon):
-        print("ERR325: Error in {:s}, the first arc tangent in C is not parallel to AE! xCt={:0.2f} xAE={:0.2f}".format(ai_error_msg_id, xCt, xAE))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR325: Error in {:s}, the first arc tangent in C is not parallel to AE! xCt={:0.2f} xAE={:0.2f}".format(ai_error_msg_id, xCt, xAE))
       (DX, DY, xEt2) = curve_arc(CX, CY, EX, EY, xAE, ai_router_bit_request, i_error_msg_id)
       if(abs(math.fmod(xEt2-xEt+5*math.pi, 2*math.pi)-math.pi)>radian_epsilon):
-        print("ERR326: Error in {:s}, the second arc tangent in E is different from xEt! xEt={:0.2f} xEt2={:0.2f}".format(ai_error_msg_id, xEt, xEt2))
-        sys.exit(2)
+        raise cnc25d_error.Cnc25dOutlineError("ERR326: Error in {:s}, the second arc tangent in E is different from xEt! xEt={:0.2f} xEt2={:0.2f}".format(ai_error_msg_id, xEt, xEt2))
       r_outline.append((BX, BY, CX, CY)) # create the first arc-segment
       r_outline.append((DX, DY, EX, EY)) # create the second arc-segment
       #print("dbg048: BX {:0.3f}  BY {:0.3f}  CX {:0.3f}  CY {:0.3f}  DX {:0.3f}  DY {:0.3f}  EX {:0.3f}  EY {:0.3f}".format(BX, BY, CX, CY, DX, DY, EX, EY))
@@ -31,7 +31,7 @@ You can also simulate or view of the split-gearwheel and get a DXF, SVG or BRep
 ################################################################
 
 import cnc25d_api
-cnc25d_api.importing_freecad()
+#cnc25d_api.importing_freecad() # FreeCAD is imported on first use by lazy_import
 
 #print("FreeCAD.Version:", FreeCAD.Version())
 #FreeCAD.Console.PrintMessage("Hello from PrintMessage!\n") # avoid using this method because it is not printed in the FreeCAD GUI
@@ -47,8 +47,8 @@ import sys, argparse
 import re # to detect .dxf or .svg
 #import Tkinter # to display the outline in a small GUI
 #
-import Part
-from FreeCAD import Base
+from lazy_import import Part
+from lazy_import import Base
 # 3rd parties
 #import svgwrite
 #from dxfwrite import DXFEngine
@@ -145,15 +145,12 @@ def split_gearwheel_constraint_check(c):
     c['split_rbr'] = c['cnc_router_bit_radius']
   # c['low_split_type']
   if(not c['low_split_type'] in ('circle', 'line')):
-    print("ERR216: Error, c['low_split_type'] {:s} is not valid!".format(c['low_split_type']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR216: Error, c['low_split_type'] {:s} is not valid!".format(c['low_split_type']))
   # c['high_split_type']
   if(not c['high_split_type'] in ('h', 'a')):
-    print("ERR220: Error, c['high_split_type'] {:s} is not valid!".format(c['high_split_type']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR220: Error, c['high_split_type'] {:s} is not valid!".format(c['high_split_type']))
   if(c['split_nb']<2):
-    print("ERR188: Error, split_nb {:d} must be equal or bigger than 2".format(c['split_nb']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR188: Error, split_nb {:d} must be equal or bigger than 2".format(c['split_nb']))
   #c['portion_angle'] = 2*math.pi/c['split_nb']
   c['portion_angle'] = math.pi/c['split_nb']
   #print("dbg190: c['gear_tooth_nb']:", c['gear_tooth_nb'])
@@ -178,8 +175,7 @@ def split_gearwheel_constraint_check(c):
     g1_ia = gear_profile_parameters['g1_param']['initial_angle']
     g1_tl = gear_profile_parameters['g1_param']['top_land']
     if(c['portion_angle']<(1.1*g1_pma)):
-      print("ERR219: Error, portion_angle {:0.3f} is too small compare to the pi_module_angle {:0.3f}".format(c['portion_angle'], g1_pma))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR219: Error, portion_angle {:0.3f} is too small compare to the pi_module_angle {:0.3f}".format(c['portion_angle'], g1_pma))
     # pre common calculation
     absolute_angle = []
     relative_angle = []
@@ -235,8 +231,7 @@ def split_gearwheel_constraint_check(c):
     #print("dbg276: len(portion_gear_first_end) {:d}  len(portion_gear_last_end) {:d}".format(len(c['portion_gear_first_end']), len(c['portion_gear_last_end'])))
   else: # no gear_profile, just a circle
     if(c['gear_primitive_diameter']<radian_epsilon):
-      print("ERR885: Error, the no-gear-profile circle outline diameter c['gear_primitive_diameter'] {:0.2f} is too small!".format(c['gear_primitive_diameter']))
-      sys.exit(2)
+      raise cnc25d_api.Cnc25dDesignError("ERR885: Error, the no-gear-profile circle outline diameter c['gear_primitive_diameter'] {:0.2f} is too small!".format(c['gear_primitive_diameter']))
     #gear_profile_B = (c['g1_ix'], c['g1_iy'], float(c['gear_primitive_diameter'])/2)
     c['minimal_gear_profile_radius'] = float(c['gear_primitive_diameter'])/2
     c['g1_ix'] = c['center_position_x']
@@ -266,28 +261,22 @@ def split_gearwheel_constraint_check(c):
     c['high_hole_nb']=1
   # radial parameters
   if(c['low_hole_circle_radius']<(c['low_split_radius'] + c['low_hole_radius'])):
-    print("ERR230: Error, low_hole_circle_radius {:0.3f} is too small compare to low_split_radius {:0.3f} and low_hole_radius {:0.3f}".format(c['low_hole_circle_radius'], c['low_split_radius'], c['low_hole_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR230: Error, low_hole_circle_radius {:0.3f} is too small compare to low_split_radius {:0.3f} and low_hole_radius {:0.3f}".format(c['low_hole_circle_radius'], c['low_split_radius'], c['low_hole_radius']))
   if(c['high_hole_circle_radius']<(c['low_hole_circle_radius'] + c['low_hole_radius'] + c['high_hole_radius'])):
-    print("ERR232: Error, high_hole_circle_radius {:0.3f} is too small compare to low_hole_circle_radius {:0.3f}, low_hole_radius {:0.3f} and high_hole_radius {:0.3f}".format(c['high_hole_circle_radius'], c['low_hole_circle_radius'], c['low_hole_radius'], c['high_hole_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR232: Error, high_hole_circle_radius {:0.3f} is too small compare to low_hole_circle_radius {:0.3f}, low_hole_radius {:0.3f} and high_hole_radius {:0.3f}".format(c['high_hole_circle_radius'], c['low_hole_circle_radius'], c['low_hole_radius'], c['high_hole_radius']))
   if(c['high_split_radius']<(c['high_hole_circle_radius'] + c['high_hole_radius'])):
-    print("ERR236: Error, high_split_radius {:0.3f} is too small compare to high_hole_circle_radius {:0.3f} and high_hole_radius {:0.3f}".format(c['high_split_radius'], c['high_hole_circle_radius'], c['high_hole_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR236: Error, high_split_radius {:0.3f} is too small compare to high_hole_circle_radius {:0.3f} and high_hole_radius {:0.3f}".format(c['high_split_radius'], c['high_hole_circle_radius'], c['high_hole_radius']))
   if(c['minimal_gear_profile_radius']<c['high_split_radius']):
-    print("ERR239: Error, minimal_gear_profile_radius {:0.3f} is smaller than high_split_radius {:0.3f}".format(c['minimal_gear_profile_radius'], c['high_split_radius']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR239: Error, minimal_gear_profile_radius {:0.3f} is smaller than high_split_radius {:0.3f}".format(c['minimal_gear_profile_radius'], c['high_split_radius']))
   # angular (or circumference) parameters
   low_hole_diameter_angle = math.asin(float(c['low_hole_radius'])/c['low_hole_circle_radius'])
   c['low_hole_space_angle'] = c['portion_angle']/float(c['low_hole_nb'])
   high_hole_diameter_angle = math.asin(float(c['high_hole_radius'])/c['high_hole_circle_radius'])
   c['high_hole_space_angle'] = c['portion_angle']/float(c['high_hole_nb'])
   if(c['low_hole_space_angle']<(2*low_hole_diameter_angle+radian_epsilon)):
-    print("ERR253: Error, low_hole_nb {:d} or low_hole_diameter {:0.3f} are too big!".format(c['low_hole_nb'], c['low_hole_diameter']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR253: Error, low_hole_nb {:d} or low_hole_diameter {:0.3f} are too big!".format(c['low_hole_nb'], c['low_hole_diameter']))
   if(c['high_hole_space_angle']<(2*high_hole_diameter_angle+radian_epsilon)):
-    print("ERR255: Error, high_hole_nb {:d} or high_hole_diameter {:0.3f} are too big!".format(c['high_hole_nb'], c['high_hole_diameter']))
-    sys.exit(2)
+    raise cnc25d_api.Cnc25dDesignError("ERR255: Error, high_hole_nb {:d} or high_hole_diameter {:0.3f} are too big!".format(c['high_hole_nb'], c['high_hole_diameter']))
   ###
   return(c)
 
@@ -308,8 +297,7 @@ def split_gearwheel_2d_construction(c):
       #print("dbg335:  portion_gear_last_end[i]: {:0.3f}".format(c['portion_gear_last_end'][i]))
       #print("dbg336:  portion_gear_tooth_angle[i]: {:0.3f}".format(c['portion_gear_tooth_angle'][i]))
       if(c['portion_gear_tooth_nb'][i]<1):
-        print("ERR338: Error, for i {:d} portion_gear_tooth_nb {:d} smaller than 1".format(i, c['portion_gear_tooth_nb'][i]))
-        sys.exit(2)
+        raise cnc25d_api.Cnc25dDesignError("ERR338: Error, for i {:d} portion_gear_tooth_nb {:d} smaller than 1".format(i, c['portion_gear_tooth_nb'][i]))
       gp_c = c.copy()
       gp_c['gear_type'] = 'e'
       #gp_c['portion_tooth_nb']    = c['portion_gear_tooth_nb'][i]
@@ -573,10 +561,10 @@ class split_gearwheel(cnc25d_api.bare_design):
 
 # this works with python and freecad :)
 if __name__ == "__main__":
-  FreeCAD.Console.PrintMessage("split_gearwheel.py says hello!\n")
+  print("split_gearwheel.py says hello!")
   my_sgw = split_gearwheel()
   #my_sgw.cli()
-  my_sgw.cli("--gear_tooth_nb 25 --gear_module 10.0 --low_split_diameter 50.0 --cnc_router_bit_radius 3.0 --high_hole_nb 2")
+  cnc25d_api.cli_shim(my_sgw.cli, "--gear_tooth_nb 25 --gear_module 10.0 --low_split_diameter 50.0 --cnc_router_bit_radius 3.0 --high_hole_nb 2")
   #my_sgw.cli("--gear_tooth_nb 17 --gear_module 10.0 --low_split_diameter 50.0 --cnc_router_bit_radius 3.0")
   if(cnc25d_api.interpretor_is_freecad()):
     Part.show(my_sgw.get_fc_obj_3dconf('split_gearwheel_3dconf1'))